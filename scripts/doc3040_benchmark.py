@@ -0,0 +1,261 @@
+"""Observe streaming and sharded Doc3040 write and pre-validation throughput."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from src.regulatory.doc3040 import (
+    Accounting4966,
+    Client,
+    Header,
+    MaturityValue,
+    Operation,
+    PortfolioEclControl,
+    SourcedValue,
+    prevalidate_xml_file,
+    sourced,
+    write_prevalidated_candidate,
+    write_xml_candidate,
+)
+
+CNPJ = "12345678"
+MODALITY = "0203"
+
+
+def _sv[T](value: T, field: str) -> SourcedValue[T]:
+    return sourced(value, system="synthetic_core", field=field, evidence_id=f"BENCH-{field}")
+
+
+def synthetic_header(count: int) -> Header:
+    return Header(
+        reference_month=_sv(date(2026, 7, 1), "reference_month"),
+        reporting_entity_cnpj=_sv(CNPJ, "entity_cnpj"),
+        part=_sv(1, "part"),
+        remittance=_sv(1, "remittance"),
+        file_type=_sv("F", "file_type"),
+        responsible_name=_sv("Pessoa Responsavel", "responsible_name"),
+        responsible_email=_sv("responsavel@example.test", "responsible_email"),
+        responsible_phone=_sv("1133334444", "responsible_phone"),
+        total_clients=_sv(count, "total_clients"),
+        expected_loss_methodology=_sv("C", "methodology"),
+        differentiated_eir_method=_sv("N", "differentiated_eir"),
+        fund_type=None,
+    )
+
+
+def _template() -> Client:
+    accounting = Accounting4966(
+        asset_classification=_sv("1", "asset_classification"),
+        stage=_sv("1", "stage"),
+        instrument_quantity=None,
+        gross_carrying_amount=_sv(Decimal("980"), "gross_carrying_amount"),
+        accumulated_loss=_sv(Decimal("20"), "accumulated_loss"),
+        fair_value=None,
+        effective_interest_rate=_sv(Decimal("12.5"), "eir"),
+        monthly_income=_sv(Decimal("10"), "monthly_income"),
+        stage_one_pd_type=_sv("N", "stage_one_pd_type"),
+        minimum_provision_portfolio=_sv("C1", "minimum_portfolio"),
+        isolated_credit_risk_treatment=_sv("N", "isolated_treatment"),
+        stage_allocations=(),
+        recognized_losses=(),
+    )
+    operation = Operation(
+        detailed_client=None,
+        ipoc=_sv(f"{CNPJ}{MODALITY}100000000000C0", "ipoc"),
+        contract_code=_sv("C0", "contract_code"),
+        modality=_sv(MODALITY, "modality"),
+        cosif_accounts=None,
+        resource_origin=_sv("0101", "resource_origin"),
+        indexer=_sv("01", "indexer"),
+        indexer_percentage=_sv(Decimal("100"), "indexer_percentage"),
+        currency_variation=_sv("790", "currency_variation"),
+        postal_code=_sv("01310100", "postal_code"),
+        effective_annual_rate=_sv(Decimal("12.5"), "effective_annual_rate"),
+        contract_date=_sv(date(2025, 1, 15), "contract_date"),
+        contracted_amount=_sv(Decimal("1000"), "contracted_amount"),
+        nature=_sv("01", "nature"),
+        maturity_date=_sv(date(2027, 1, 15), "maturity_date"),
+        provision=_sv(Decimal("20"), "provision"),
+        days_past_due=None,
+        special_characteristics=None,
+        next_installment_date=None,
+        next_installment_amount=None,
+        installment_count=_sv(24, "installment_count"),
+        maturities=(
+            MaturityValue(vertex=_sv("v110", "v110"), amount=_sv(Decimal("580"), "m110")),
+            MaturityValue(vertex=_sv("v120", "v120"), amount=_sv(Decimal("400"), "m120")),
+        ),
+        guarantees=(),
+        additional_information=(),
+        sicor=None,
+        accounting_4966=accounting,
+    )
+    return Client(
+        code=_sv("00000000000", "client_code"),
+        client_type=_sv("1", "client_type"),
+        authorization=_sv("S", "authorization"),
+        client_size=_sv("1", "client_size"),
+        control_type=None,
+        relationship_start=_sv(date(2020, 1, 15), "relationship_start"),
+        income=_sv(Decimal("5000"), "income"),
+        economic_group=None,
+        foreign_name=None,
+        foreign_id_type=None,
+        foreign_id=None,
+        leader_cnpj=None,
+        country_code=None,
+        operations=(operation,),
+    )
+
+
+def _ipoc(index: int) -> str:
+    return f"{CNPJ}{MODALITY}1{index:011d}C{index}"
+
+
+def synthetic_clients(count: int) -> Iterator[Client]:
+    """Yield PF clients with one reconciled operation each and unique IPOCs."""
+    template = _template()
+    operation = template.operations[0]
+    for index in range(count):
+        yield replace(
+            template,
+            code=_sv(f"{index:011d}", "client_code"),
+            operations=(
+                replace(
+                    operation,
+                    ipoc=_sv(_ipoc(index), "ipoc"),
+                    contract_code=_sv(f"C{index}", "contract_code"),
+                ),
+            ),
+        )
+
+
+def synthetic_controls(count: int) -> tuple[PortfolioEclControl, ...]:
+    return tuple(
+        PortfolioEclControl(_ipoc(index), Decimal("980"), Decimal("20"), "BENCH-ECL")
+        for index in range(count)
+    )
+
+
+class _Timed[T]:
+    """Iterate ``items`` while accumulating the time spent producing them."""
+
+    def __init__(self, items: Iterable[T]) -> None:
+        self._items = iter(items)
+        self.seconds = 0.0
+
+    def __iter__(self) -> Iterator[T]:
+        return self
+
+    def __next__(self) -> T:
+        started = time.perf_counter()
+        try:
+            return next(self._items)
+        finally:
+            self.seconds += time.perf_counter() - started
+
+
+def peak_rss_bytes() -> int | None:
+    """Process high-water mark where the platform exposes it; libxml2 memory included."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def run_case(
+    count: int, directory: Path, archive: bool, workers: int, partition_size: int
+) -> dict[str, object]:
+    path = directory / (f"doc3040-{count}.zip" if archive else f"doc3040-{count}.xml")
+    member = "doc3040.xml" if archive else None
+    clients = _Timed(synthetic_clients(count))
+    started = time.perf_counter()
+    written = write_xml_candidate(synthetic_header(count), clients, path, archive_member=member)
+    write_seconds = time.perf_counter() - started - clients.seconds
+    controls = synthetic_controls(count)
+    started = time.perf_counter()
+    report = prevalidate_xml_file(path, controls, archive_member=member)
+    validate_seconds = time.perf_counter() - started
+    if not report.passed:
+        raise RuntimeError(f"benchmark candidate failed pre-validation: {report.errors[:3]}")
+    sharded_path = directory / f"sharded-{path.name}"
+    clients = _Timed(synthetic_clients(count))
+    started = time.perf_counter()
+    sharded = write_prevalidated_candidate(
+        synthetic_header(count),
+        clients,
+        controls,
+        sharded_path,
+        archive_member=member,
+        partition_size=partition_size,
+        workers=workers,
+    )
+    sharded_seconds = time.perf_counter() - started - clients.seconds
+    if sharded.candidate.sha256 != written.sha256 or sharded.report != report:
+        raise RuntimeError("sharded pipeline diverged from the serial write and pre-validation")
+    mebibytes = written.size_bytes / 2**20
+    return {
+        "clients": count,
+        "archive": archive,
+        "xml_bytes": written.size_bytes,
+        "file_bytes": path.stat().st_size,
+        "client_build_seconds": round(clients.seconds, 6),
+        "write_seconds": round(write_seconds, 6),
+        "write_clients_per_second": round(count / write_seconds, 2),
+        "write_mebibytes_per_second": round(mebibytes / write_seconds, 2),
+        "prevalidate_seconds": round(validate_seconds, 6),
+        "prevalidate_clients_per_second": round(count / validate_seconds, 2),
+        "prevalidate_mebibytes_per_second": round(mebibytes / validate_seconds, 2),
+        "sharded_workers": workers,
+        "sharded_partitions": sharded.partitions,
+        "sharded_seconds": round(sharded_seconds, 6),
+        "sharded_clients_per_second": round(count / sharded_seconds, 2),
+        "serial_to_sharded_speedup": round((write_seconds + validate_seconds) / sharded_seconds, 3),
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--zip", action="store_true", help="write and read a zip member")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--partition-size", type=int, default=1024)
+    arguments = parser.parse_args()
+    if any(size <= 0 for size in arguments.sizes):
+        parser.error("sizes must be positive")
+    if arguments.workers <= 0 or arguments.partition_size <= 0:
+        parser.error("workers and partition size must be positive")
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            run_case(
+                size, Path(directory), arguments.zip, arguments.workers, arguments.partition_size
+            )
+            for size in arguments.sizes
+        ]
+    report = {
+        "runtime": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "cases": cases,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Observe cost of the metrics registry under concurrent writer threads."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from threading import Barrier, Thread
+
+from src.infrastructure.observability.metrics import DEFAULT_SHARDS, MetricsRegistry
+
+ROUTES = ("/health", "/api/v1/ecl/calculate", "/api/v1/ecl/jobs/{job_id}", "/metrics")
+
+
+def run_case(shards: int, threads: int, observations: int) -> dict[str, object]:
+    """Time ``threads`` writers each recording ``observations`` HTTP requests."""
+    registry = MetricsRegistry(environment="benchmark", version="local", shards=shards)
+    barrier = Barrier(threads + 1)
+
+    def writer(index: int) -> None:
+        route = ROUTES[index % len(ROUTES)]
+        barrier.wait()
+        for step in range(observations):
+            registry.observe_http("GET", route, 200, (step % 100) / 1000)
+
+    workers = [Thread(target=writer, args=(index,)) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    total = threads * observations
+    rendered = registry.render()
+    if "risco_http_requests_total{" not in rendered:
+        raise RuntimeError("benchmark registry rendered no requests")
+    return {
+        "shards": shards,
+        "threads": threads,
+        "observations": total,
+        "elapsed_seconds": round(elapsed, 6),
+        "observations_per_second": round(total / elapsed, 2),
+        "nanoseconds_per_observe": round(elapsed / total * 1e9, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--observations", type=int, default=50_000)
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, DEFAULT_SHARDS])
+    arguments = parser.parse_args()
+    if arguments.threads <= 0 or arguments.observations <= 0:
+        parser.error("threads and observations must be positive")
+    report = {
+        "runtime": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "cases": [
+            run_case(shards, arguments.threads, arguments.observations)
+            for shards in arguments.shards
+        ],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import platform
 import sys
+import tempfile
 import time
 import tracemalloc
 from collections.abc import Iterator
@@ -15,8 +17,15 @@ from decimal import Decimal
 from pathlib import Path
 
 from src.application.services import load_scenario_set
-from src.ecl.batch import PartitionedStage1Processor
+from src.ecl.batch import (
+    ExecutionMode,
+    PartitionedStage1Processor,
+    ScenarioEngineMode,
+    read_stage1_parquet,
+    write_stage1_parquet,
+)
 from src.ecl.calculation import Stage1ContractInput, Stage1RiskPeriod
+from src.ecl.discounting import DEFAULT_DISCOUNT_CURVES, DiscountCurveStats
 from src.models.forward_looking import load_macro_risk_policy
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -50,7 +59,28 @@ def synthetic_contracts(count: int, *, profiles: int = 64) -> Iterator[Stage1Con
         )
 
 
-def run_case(size: int, partition_size: int, workers: int) -> dict[str, object]:
+def discount_curve_usage(before: DiscountCurveStats) -> dict[str, object]:
+    """Curve-cache lookups of this process since ``before``; pool workers keep their own."""
+    after = DEFAULT_DISCOUNT_CURVES.stats()
+    hits = after.hits - before.hits
+    misses = after.misses - before.misses
+    return {
+        "scope": "benchmark_process",
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 6) if hits + misses else 0.0,
+        "evictions": after.evictions - before.evictions,
+        "cached_curves": after.curves,
+    }
+
+
+def run_case(
+    size: int,
+    partition_size: int,
+    workers: int,
+    mode: ScenarioEngineMode = ScenarioEngineMode.DECIMAL,
+    execution: ExecutionMode = ExecutionMode.THREAD,
+) -> dict[str, object]:
     scenario_set = load_scenario_set(seed=91)
     macro_policy = load_macro_risk_policy()
     processor = PartitionedStage1Processor(
@@ -58,7 +88,10 @@ def run_case(size: int, partition_size: int, workers: int) -> dict[str, object]:
         macro_policy,
         partition_size=partition_size,
         workers=workers,
+        mode=mode,
+        execution=execution,
     )
+    curves = DEFAULT_DISCOUNT_CURVES.stats()
     tracemalloc.start()
     started = time.perf_counter()
     summary = processor.process(synthetic_contracts(size))
@@ -72,6 +105,74 @@ def run_case(size: int, partition_size: int, workers: int) -> dict[str, object]:
         "elapsed_seconds": round(elapsed, 6),
         "throughput_contracts_per_second": round(size / elapsed, 2),
         "python_peak_memory_bytes": peak_bytes,
+        "discount_curves": discount_curve_usage(curves),
+    }
+
+
+def run_columnar_case(
+    size: int,
+    partition_size: int,
+    workers: int,
+    mode: ScenarioEngineMode = ScenarioEngineMode.DECIMAL,
+) -> dict[str, object]:
+    """Write the synthetic portfolio to Parquet, then time loading and measuring it."""
+    processor = PartitionedStage1Processor(
+        load_scenario_set(seed=91),
+        load_macro_risk_policy(),
+        partition_size=partition_size,
+        workers=workers,
+        mode=mode,
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        contracts_path = Path(directory) / "contracts.parquet"
+        periods_path = Path(directory) / "periods.parquet"
+        write_stage1_parquet(synthetic_contracts(size), contracts_path, periods_path)
+        curves = DEFAULT_DISCOUNT_CURVES.stats()
+        tracemalloc.start()
+        started = time.perf_counter()
+        summary = processor.process_profile_batches(
+            read_stage1_parquet(contracts_path, periods_path, batch_size=partition_size)
+        )
+        elapsed = time.perf_counter() - started
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "contract_count": summary.contract_count,
+        "unique_profile_calculations": summary.unique_profile_calculations,
+        "probability_weighted_ecl": str(summary.probability_weighted_ecl),
+        "stress_ecl": str(summary.stress_ecl),
+        "elapsed_seconds": round(elapsed, 6),
+        "throughput_contracts_per_second": round(size / elapsed, 2),
+        "python_peak_memory_bytes": peak_bytes,
+        "discount_curves": discount_curve_usage(curves),
+    }
+
+
+def run_worker_scaling(
+    size: int,
+    partition_size: int,
+    worker_counts: list[int],
+    mode: ScenarioEngineMode = ScenarioEngineMode.DECIMAL,
+) -> dict[str, object]:
+    """Measure process-pool throughput per worker count against the first count."""
+    runs = [
+        run_case(size, partition_size, workers, mode, ExecutionMode.PROCESS)
+        for workers in worker_counts
+    ]
+    baseline = float(str(runs[0]["throughput_contracts_per_second"]))
+    return {
+        "contract_count": size,
+        "execution_mode": ExecutionMode.PROCESS.value,
+        "runs": [
+            {
+                "workers": workers,
+                "elapsed_seconds": run["elapsed_seconds"],
+                "throughput_contracts_per_second": run["throughput_contracts_per_second"],
+                "speedup": round(float(str(run["throughput_contracts_per_second"])) / baseline, 3),
+                "probability_weighted_ecl": run["probability_weighted_ecl"],
+            }
+            for workers, run in zip(worker_counts, runs, strict=True)
+        ],
     }
 
 
@@ -80,15 +181,64 @@ def main() -> None:
     parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
     parser.add_argument("--partition-size", type=int, default=10_000)
     parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument(
+        "--engine",
+        choices=[mode.value for mode in ScenarioEngineMode],
+        default=ScenarioEngineMode.DECIMAL.value,
+    )
+    parser.add_argument(
+        "--execution",
+        choices=[mode.value for mode in ExecutionMode],
+        default=ExecutionMode.THREAD.value,
+    )
+    parser.add_argument("--scaling-workers", type=int, nargs="*", default=[1, 2, 4])
+    parser.add_argument("--scaling-sizes", type=int, nargs="*", default=[100_000, 1_000_000])
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="also load each size from Parquet through the columnar reader",
+    )
     parser.add_argument("--targets", type=Path, default=DEFAULT_TARGETS)
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
     arguments = parser.parse_args()
     if any(size <= 0 for size in arguments.sizes):
         parser.error("sizes must be positive")
+    if any(workers <= 0 for workers in arguments.scaling_workers):
+        parser.error("scaling workers must be positive")
     targets = json.loads(arguments.targets.read_text(encoding="utf-8"))
     results = [
-        run_case(size, arguments.partition_size, arguments.workers) for size in arguments.sizes
+        run_case(
+            size,
+            arguments.partition_size,
+            arguments.workers,
+            ScenarioEngineMode(arguments.engine),
+            ExecutionMode(arguments.execution),
+        )
+        for size in arguments.sizes
+    ]
+    worker_scaling = [
+        run_worker_scaling(
+            size,
+            arguments.partition_size,
+            arguments.scaling_workers,
+            ScenarioEngineMode(arguments.engine),
+        )
+        for size in arguments.sizes
+        if size in arguments.scaling_sizes and arguments.scaling_workers
     ]
+    columnar = (
+        [
+            run_columnar_case(
+                size,
+                arguments.partition_size,
+                arguments.workers,
+                ScenarioEngineMode(arguments.engine),
+            )
+            for size in arguments.sizes
+        ]
+        if arguments.columnar
+        else []
+    )
     million = next((item for item in results if item["contract_count"] == 1_000_000), None)
     target_result = "not_evaluated"
     if million:
@@ -102,20 +252,29 @@ def main() -> None:
     report = {
         "schema_version": 1,
         "generated_at": datetime.now(UTC).isoformat(),
-        "runtime": {"python": sys.version, "platform": platform.platform()},
+        "runtime": {
+            "python": sys.version,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
         "methodology": {
             "data_classification": "synthetic",
             "risk_profiles": 64,
             "unique_contract_ids": True,
             "partition_size": arguments.partition_size,
             "workers": arguments.workers,
+            "scenario_engine": arguments.engine,
+            "execution_mode": arguments.execution,
             "result_retention": "aggregate_only",
             "memory_measurement": "tracemalloc_python_allocations",
         },
         "targets": targets,
         "target_result": target_result,
         "results": results,
+        "worker_scaling": worker_scaling,
     }
+    if columnar:
+        report["columnar_results"] = columnar
     arguments.output.parent.mkdir(parents=True, exist_ok=True)
     arguments.output.write_text(
         json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
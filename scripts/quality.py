@@ -37,6 +37,8 @@ FORMAT_TARGETS = (
     "scripts/generate_ecl_backtest_report.py",
     "scripts/deploy.py",
     "scripts/performance_benchmark.py",
+    "scripts/metrics_benchmark.py",
+    "scripts/doc3040_benchmark.py",
     "scripts/security_maintenance.py",
     "scripts/e2e_pipeline.py",
     "scripts/export_regulatory_package.py",
@@ -81,6 +83,8 @@ MYPY_TARGETS = (
     "scripts/generate_ecl_backtest_report.py",
     "scripts/deploy.py",
     "scripts/performance_benchmark.py",
+    "scripts/metrics_benchmark.py",
+    "scripts/doc3040_benchmark.py",
     "scripts/security_maintenance.py",
     "scripts/e2e_pipeline.py",
     "scripts/export_regulatory_package.py",
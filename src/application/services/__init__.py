@@ -1,5 +1,12 @@
 """Application services coordinating canonical domain components."""
 
+from .incremental import IncrementalECLRecalculator, IncrementalExecutionSummary
 from .scenarios import ScenarioSnapshotCache, ScenarioSourceSnapshot, load_scenario_set
 
-__all__ = ["ScenarioSnapshotCache", "ScenarioSourceSnapshot", "load_scenario_set"]
+__all__ = [
+    "IncrementalECLRecalculator",
+    "IncrementalExecutionSummary",
+    "ScenarioSnapshotCache",
+    "ScenarioSourceSnapshot",
+    "load_scenario_set",
+]
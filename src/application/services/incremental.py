@@ -0,0 +1,231 @@
+"""Incremental month-over-month ECL executions that carry unchanged profiles forward."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from hashlib import sha256
+
+from ...domain.scenarios import ScenarioSet
+from ...ecl.batch import (
+    PortfolioContract,
+    PortfolioECLProcessor,
+    PortfolioECLRecord,
+    TelemetrySink,
+    contract_stage,
+    iter_partitions,
+    portfolio_profile_hash,
+)
+from ...infrastructure.database import (
+    ECLResultRow,
+    PersistenceConflictError,
+    VersionedRepository,
+)
+from ...models.forward_looking import MacroRiskPolicy
+
+CONTRACT_RESULT_PERIOD = 0
+CONTRACT_RESULT_SCENARIO = "probability_weighted"
+
+
+@dataclass(frozen=True, slots=True)
+class _PriorProfile:
+    probability_weighted_ecl: Decimal
+    stress_ecl: Decimal
+    origin_execution_id: str
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalExecutionSummary:
+    execution_id: str
+    revision: int
+    previous_execution_id: str | None
+    contract_count: int
+    recalculated_contracts: int
+    carried_forward_contracts: int
+    removed_contracts: int
+    unique_profile_calculations: int
+    probability_weighted_ecl: Decimal
+    stress_ecl: Decimal
+    results_hash: str
+
+
+class IncrementalECLRecalculator:
+    """Persist a complete contract-level execution, recomputing only changed profiles.
+
+    Profile keys cover every calculation input and the scenario and macro-policy
+    versions, so a key already measured by the previous execution has the same
+    result. Those contracts are carried forward with the execution that first
+    measured them; every other contract goes through the portfolio processor.
+    The persisted rows, totals and ``results_hash`` therefore equal a full rerun,
+    which is what ``previous_execution_id=None`` performs. ``telemetry`` is passed
+    to the processor, e.g. ``MetricsRegistry.observe_engine_partition``.
+    """
+
+    def __init__(
+        self,
+        repository: VersionedRepository,
+        scenario_set: ScenarioSet,
+        macro_policy: MacroRiskPolicy,
+        *,
+        partition_size: int = 10_000,
+        workers: int = 1,
+        telemetry: TelemetrySink | None = None,
+    ) -> None:
+        self.repository = repository
+        self.scenario_set = scenario_set
+        self.macro_policy = macro_policy
+        self.partition_size = partition_size
+        self.processor = PortfolioECLProcessor(
+            scenario_set,
+            macro_policy,
+            partition_size=partition_size,
+            workers=workers,
+            telemetry=telemetry,
+        )
+
+    def _prior_profiles(self, execution_id: str) -> tuple[dict[str, _PriorProfile], set[str]]:
+        profiles: dict[str, _PriorProfile] = {}
+        contracts: set[str] = set()
+        for row in self.repository.load_ecl_results(
+            execution_id, period=CONTRACT_RESULT_PERIOD, scenario_id=CONTRACT_RESULT_SCENARIO
+        ):
+            payload = row["payload"]
+            contracts.add(row["contract_id"])
+            profiles.setdefault(
+                payload["profile_hash"],
+                _PriorProfile(
+                    Decimal(row["ecl_amount"]),
+                    Decimal(payload["stress_ecl"]),
+                    payload["origin_execution_id"],
+                ),
+            )
+        return profiles, contracts
+
+    def run(
+        self,
+        contracts: Iterable[PortfolioContract],
+        *,
+        execution_key: str,
+        reference_date: date,
+        previous_execution_id: str | None = None,
+        reprocess: bool = False,
+    ) -> IncrementalExecutionSummary:
+        prior, prior_contracts = (
+            self._prior_profiles(previous_execution_id)
+            if previous_execution_id is not None
+            else ({}, set())
+        )
+        execution = self.repository.start_execution(
+            execution_key=execution_key,
+            reference_date=reference_date,
+            lineage={
+                "calculation": "contract_ecl",
+                "previous_execution_id": previous_execution_id,
+                "scenario_version": self.scenario_set.version,
+                "scenario_source_hash": self.scenario_set.source_snapshot_hash,
+                "macro_policy_version": self.macro_policy.policy_version,
+                "macro_policy_hash": self.macro_policy.sha256,
+            },
+            reprocess=reprocess,
+        )
+        execution_id = execution["execution_id"]
+        results_digest = sha256()
+        seen: set[str] = set()
+        recalculated = 0
+        carried_forward = 0
+        unique_calculations = 0
+        weighted_total = Decimal("0")
+        stress_total = Decimal("0")
+
+        for partition in iter_partitions(contracts, self.partition_size):
+            keys = [
+                portfolio_profile_hash(contract, self.scenario_set, self.macro_policy)
+                for contract in partition
+            ]
+            records: list[PortfolioECLRecord] = []
+            summary = self.processor.process(
+                (
+                    contract
+                    for contract, key in zip(partition, keys, strict=True)
+                    if key not in prior
+                ),
+                sink=records.append,
+            )
+            unique_calculations += summary.unique_profile_calculations
+            measured = {record.profile_hash: record for record in records}
+            rows: list[ECLResultRow] = []
+            for contract, key in zip(partition, keys, strict=True):
+                if key in prior:
+                    previous = prior[key]
+                    weighted, stress = previous.probability_weighted_ecl, previous.stress_ecl
+                    origin = previous.origin_execution_id
+                    carried_forward += 1
+                else:
+                    weighted = measured[key].probability_weighted_ecl
+                    stress = measured[key].stress_ecl
+                    origin = execution_id
+                    recalculated += 1
+                stage = contract_stage(contract)
+                seen.add(contract.contract_id)
+                weighted_total += weighted
+                stress_total += stress
+                results_digest.update(
+                    f"{contract.contract_id}|{stage.value}|{key}|{weighted}|{stress}\n".encode()
+                )
+                rows.append(
+                    ECLResultRow(
+                        contract.contract_id,
+                        CONTRACT_RESULT_PERIOD,
+                        CONTRACT_RESULT_SCENARIO,
+                        weighted,
+                        {
+                            "stage": stage.value,
+                            "profile_hash": key,
+                            "stress_ecl": stress,
+                            "origin_execution_id": origin,
+                            "carried_forward": origin != execution_id,
+                        },
+                    )
+                )
+            self.repository.persist_ecl_results(execution_id=execution_id, results=rows)
+
+        contract_count = recalculated + carried_forward
+        persisted = self.repository.database.fetch_one(
+            "SELECT COUNT(*) AS rows FROM calculation_results "
+            "WHERE execution_id = ? AND period = ? AND scenario_id = ?",
+            (execution_id, CONTRACT_RESULT_PERIOD, CONTRACT_RESULT_SCENARIO),
+        )
+        if len(seen) != contract_count or persisted is None or persisted["rows"] != contract_count:
+            raise PersistenceConflictError("Incremental execution does not reconcile to its input")
+        summary_payload = {
+            "previous_execution_id": previous_execution_id,
+            "contract_count": contract_count,
+            "recalculated_contracts": recalculated,
+            "carried_forward_contracts": carried_forward,
+            "removed_contracts": len(prior_contracts - seen),
+            "unique_profile_calculations": unique_calculations,
+            "probability_weighted_ecl": weighted_total,
+            "stress_ecl": stress_total,
+            "results_hash": results_digest.hexdigest(),
+        }
+        self.repository.record_lineage_event(
+            execution_id=execution_id,
+            event_type="ECL_EXECUTION_RECONCILED",
+            payload=summary_payload,
+        )
+        self.repository.complete_execution(execution_id)
+        return IncrementalExecutionSummary(
+            execution_id=execution_id,
+            revision=execution["revision"],
+            previous_execution_id=previous_execution_id,
+            contract_count=contract_count,
+            recalculated_contracts=recalculated,
+            carried_forward_contracts=carried_forward,
+            removed_contracts=len(prior_contracts - seen),
+            unique_profile_calculations=unique_calculations,
+            probability_weighted_ecl=weighted_total,
+            stress_ecl=stress_total,
+            results_hash=results_digest.hexdigest(),
+        )
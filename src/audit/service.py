@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import hashlib
+import threading
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, cast
 from uuid import uuid4
 
 from ..infrastructure.database import DatabaseManager
@@ -30,9 +32,55 @@ class AuditEvent:
     occurred_at: str
 
 
+# Arbitrary application-wide key for the PostgreSQL advisory lock serializing chain appends.
+_CHAIN_LOCK_KEY = 0x41554454
+
+
+@dataclass(slots=True)
+class _PendingEvent:
+    event_id: str
+    actor_id: str
+    actor_role: str | None
+    action: str
+    resource_type: str
+    resource_id: str
+    execution_id: str | None
+    status: str
+    input_hash: str
+    result_hash: str
+    versions_json: str
+    event_json: str
+    occurred_at: str
+    event: AuditEvent | None = None
+    error: Exception | None = None
+
+
 class AuditService:
-    def __init__(self, database: DatabaseManager) -> None:
+    """Append hash-chained events through a group-commit writer.
+
+    Concurrent ``record`` calls are queued; one caller becomes the leader,
+    waits at most ``flush_interval_seconds`` for callers that are still
+    preparing their events, chains the batch in memory from the stored tip and
+    appends it in one transaction under the chain lock. Every caller returns
+    only after its own event is committed.
+    """
+
+    def __init__(
+        self,
+        database: DatabaseManager,
+        *,
+        flush_interval_seconds: float = 0.002,
+        max_batch_size: int = 256,
+    ) -> None:
+        if flush_interval_seconds < 0 or max_batch_size <= 0:
+            raise ValueError("audit flush interval and batch size must be positive")
         self.database = database
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_batch_size = max_batch_size
+        self._condition = threading.Condition()
+        self._pending: list[_PendingEvent] = []
+        self._preparing = 0
+        self._flushing = False
 
     def record(
         self,
@@ -50,40 +98,30 @@ class AuditService:
         execution_id: str | None = None,
         reason: str | None = None,
     ) -> AuditEvent:
-        occurred_at = datetime.now(UTC).isoformat()
-        event_id = str(uuid4())
-        input_digest = payload_hash(canonical_json(input_payload))
-        result_digest = payload_hash(canonical_json(result_payload))
-        versions_json = canonical_json(versions)
-        previous = self.database.fetch_one(
-            "SELECT event_hash FROM audit_events ORDER BY audit_sequence DESC LIMIT 1"
-        )
-        previous_hash = previous["event_hash"] if previous else None
-        event_document = {
-            "event_id": event_id,
-            "actor_id": actor_id,
-            "actor_role": actor_role,
-            "action": action,
-            "resource_type": resource_type,
-            "resource_id": resource_id,
-            "execution_id": execution_id,
-            "status": status,
-            "input_hash": input_digest,
-            "result_hash": result_digest,
-            "versions": versions,
-            "client_ip": client_ip,
-            "reason": reason,
-            "occurred_at": occurred_at,
-        }
-        event_json = canonical_json(event_document)
-        event_hash = hashlib.sha256(f"{previous_hash or ''}:{event_json}".encode()).hexdigest()
-        self.database.execute(
-            "INSERT INTO audit_events "
-            "(event_id, actor_id, actor_role, action, resource_type, resource_id, "
-            "execution_id, status, input_hash, result_hash, versions_json, event_json, "
-            "previous_event_hash, event_hash, occurred_at) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
+        with self._condition:
+            self._preparing += 1
+        try:
+            occurred_at = datetime.now(UTC).isoformat()
+            event_id = str(uuid4())
+            input_digest = payload_hash(canonical_json(input_payload))
+            result_digest = payload_hash(canonical_json(result_payload))
+            event_document = {
+                "event_id": event_id,
+                "actor_id": actor_id,
+                "actor_role": actor_role,
+                "action": action,
+                "resource_type": resource_type,
+                "resource_id": resource_id,
+                "execution_id": execution_id,
+                "status": status,
+                "input_hash": input_digest,
+                "result_hash": result_digest,
+                "versions": versions,
+                "client_ip": client_ip,
+                "reason": reason,
+                "occurred_at": occurred_at,
+            }
+            pending = _PendingEvent(
                 event_id,
                 actor_id,
                 actor_role,
@@ -94,25 +132,120 @@ class AuditService:
                 status,
                 input_digest,
                 result_digest,
-                versions_json,
-                event_json,
-                previous_hash,
-                event_hash,
+                canonical_json(versions),
+                canonical_json(event_document),
                 occurred_at,
-            ),
-        )
-        return AuditEvent(
-            event_id,
-            action,
-            resource_type,
-            resource_id,
-            status,
-            input_digest,
-            result_digest,
-            previous_hash,
-            event_hash,
-            occurred_at,
-        )
+            )
+        except BaseException:
+            with self._condition:
+                self._preparing -= 1
+            raise
+        if self.database.in_unit_of_work:
+            # Joining the caller's transaction must not commit other callers' events.
+            with self._condition:
+                self._preparing -= 1
+            self._append([pending])
+        else:
+            self._group_commit(pending)
+        if pending.error is not None:
+            raise pending.error
+        return cast(AuditEvent, pending.event)
+
+    def _group_commit(self, pending: _PendingEvent) -> None:
+        with self._condition:
+            self._preparing -= 1
+            self._pending.append(pending)
+            self._condition.notify_all()
+            while pending.event is None and pending.error is None:
+                if self._flushing:
+                    self._condition.wait()
+                    continue
+                self._flushing = True
+                deadline = time.monotonic() + self.flush_interval_seconds
+                while len(self._pending) < self.max_batch_size and self._preparing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._pending[: self.max_batch_size]
+                del self._pending[: self.max_batch_size]
+                self._condition.release()
+                try:
+                    self._append(batch)
+                finally:
+                    self._condition.acquire()
+                    self._flushing = False
+                    self._condition.notify_all()
+
+    def _lock_chain(self, connection: Any) -> None:
+        if self.database.settings.backend == "postgresql":
+            connection.cursor().execute("SELECT pg_advisory_xact_lock(%s)", (_CHAIN_LOCK_KEY,))
+        elif not connection.in_transaction:
+            connection.execute("BEGIN IMMEDIATE")
+
+    def _append(self, batch: list[_PendingEvent]) -> None:
+        """Chain a batch from the stored tip and insert it in one locked transaction."""
+        try:
+            with self.database.unit_of_work() as connection:
+                self._lock_chain(connection)
+                tip = self.database.fetch_one(
+                    "SELECT event_hash FROM audit_events ORDER BY audit_sequence DESC LIMIT 1"
+                )
+                previous_hash = tip["event_hash"] if tip else None
+                events: list[AuditEvent] = []
+                rows: list[tuple[Any, ...]] = []
+                for item in batch:
+                    event_hash = hashlib.sha256(
+                        f"{previous_hash or ''}:{item.event_json}".encode()
+                    ).hexdigest()
+                    rows.append(
+                        (
+                            item.event_id,
+                            item.actor_id,
+                            item.actor_role,
+                            item.action,
+                            item.resource_type,
+                            item.resource_id,
+                            item.execution_id,
+                            item.status,
+                            item.input_hash,
+                            item.result_hash,
+                            item.versions_json,
+                            item.event_json,
+                            previous_hash,
+                            event_hash,
+                            item.occurred_at,
+                        )
+                    )
+                    events.append(
+                        AuditEvent(
+                            item.event_id,
+                            item.action,
+                            item.resource_type,
+                            item.resource_id,
+                            item.status,
+                            item.input_hash,
+                            item.result_hash,
+                            previous_hash,
+                            event_hash,
+                            item.occurred_at,
+                        )
+                    )
+                    previous_hash = event_hash
+                self.database.execute_many(
+                    "INSERT INTO audit_events "
+                    "(event_id, actor_id, actor_role, action, resource_type, resource_id, "
+                    "execution_id, status, input_hash, result_hash, versions_json, event_json, "
+                    "previous_event_hash, event_hash, occurred_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except Exception as exc:
+            for item in batch:
+                item.error = exc
+            return
+        for item, event in zip(batch, events, strict=True):
+            item.event = event
 
     def record_override(
         self,
@@ -168,18 +301,62 @@ class AuditService:
             status=status,
         )
 
-    def verify_chain(self) -> int:
-        rows = self.database.fetch_all(
-            "SELECT event_json, previous_event_hash, event_hash "
-            "FROM audit_events ORDER BY audit_sequence"
+    def verify_chain(self, *, full: bool = False) -> int:
+        """Verify the chain and return its length.
+
+        Incremental verification is read-only. It trusts the latest stored
+        checkpoint: only its event is rehashed, so tampering before it goes
+        unnoticed. ``full=True`` is the maintenance path: it rehashes from
+        genesis and, on success, stores a new checkpoint at the verified tip.
+        """
+        checkpoint = (
+            None
+            if full
+            else self.database.fetch_one(
+                "SELECT audit_sequence, event_hash, event_count FROM audit_chain_checkpoints "
+                "ORDER BY checkpoint_id DESC LIMIT 1"
+            )
         )
         previous: str | None = None
+        count = 0
+        sequence = 0
+        if checkpoint is not None:
+            anchor = self.database.fetch_one(
+                "SELECT event_json, previous_event_hash, event_hash FROM audit_events "
+                "WHERE audit_sequence = ?",
+                (checkpoint["audit_sequence"],),
+            )
+            if (
+                anchor is None
+                or anchor["event_hash"] != checkpoint["event_hash"]
+                or anchor["event_hash"]
+                != hashlib.sha256(
+                    f"{anchor['previous_event_hash'] or ''}:{anchor['event_json']}".encode()
+                ).hexdigest()
+            ):
+                raise AuditChainError("audit hash chain is invalid")
+            previous = checkpoint["event_hash"]
+            count = int(checkpoint["event_count"])
+            sequence = int(checkpoint["audit_sequence"])
+        rows = self.database.fetch_all(
+            "SELECT audit_sequence, event_json, previous_event_hash, event_hash "
+            "FROM audit_events WHERE audit_sequence > ? ORDER BY audit_sequence",
+            (sequence,),
+        )
         for row in rows:
             expected = hashlib.sha256(f"{previous or ''}:{row['event_json']}".encode()).hexdigest()
             if row["previous_event_hash"] != previous or row["event_hash"] != expected:
                 raise AuditChainError("audit hash chain is invalid")
             previous = row["event_hash"]
-        return len(rows)
+            sequence = row["audit_sequence"]
+        count += len(rows)
+        if full and rows:
+            self.database.execute(
+                "INSERT INTO audit_chain_checkpoints "
+                "(audit_sequence, event_hash, event_count, verified_at) VALUES (?, ?, ?, ?)",
+                (sequence, previous, count, datetime.now(UTC).isoformat()),
+            )
+        return count
 
     def list_events(self, *, limit: int = 100) -> list[dict[str, Any]]:
         if not 1 <= limit <= 1000:
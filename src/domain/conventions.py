@@ -7,11 +7,16 @@ Business dates are ``date`` objects; event timestamps must be timezone-aware.
 
 from __future__ import annotations
 
+from dataclasses import fields
 from datetime import UTC, datetime
 from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import TYPE_CHECKING
 
 from .exceptions import DomainValidationError, TemporalConsistencyError
 
+if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
 type DecimalInput = Decimal | int | str
 MONEY_QUANTUM = Decimal("0.01")
 RATE_QUANTUM = Decimal("0.00000001")
@@ -63,3 +68,23 @@ def aware_utc(value: datetime, *, field: str) -> datetime:
     if value.tzinfo is None or value.utcoffset() is None:
         raise TemporalConsistencyError(f"{field} must be timezone-aware")
     return value.astimezone(UTC)
+
+
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def prevalidated[T: DataclassInstance](cls: type[T], *values: object) -> T:
+    """Build a frozen slots dataclass from already normalized fields, skipping ``__post_init__``.
+
+    Values are given in field order and must be exactly what the validating
+    constructor would store: ``rate``/``money`` output, stripped labels and
+    checked invariants. Use it only past an ingestion boundary that has
+    validated the data, never for external input.
+    """
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES.setdefault(cls, tuple(item.name for item in fields(cls)))
+    instance = object.__new__(cls)
+    for name, value in zip(names, values, strict=True):
+        object.__setattr__(instance, name, value)
+    return instance
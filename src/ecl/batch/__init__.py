@@ -1,12 +1,61 @@
 """High-volume, bounded-memory ECL processing and execution queues."""
 
-from .processor import BatchECLRecord, BatchSummary, PartitionedStage1Processor
+from .columnar import (
+    STAGE1_CONTRACT_SCHEMA,
+    STAGE1_PERIOD_SCHEMA,
+    read_stage1_parquet,
+    write_stage1_parquet,
+)
+from .persistent_cache import DEFAULT_PROFILE_CACHE_PATH, PersistentResultCache
+from .portfolio import (
+    PortfolioBatchSummary,
+    PortfolioContract,
+    PortfolioECLProcessor,
+    PortfolioECLRecord,
+    StageBatchSummary,
+    contract_stage,
+    portfolio_profile_hash,
+)
+from .processor import (
+    BatchECLRecord,
+    BatchSummary,
+    EnginePhase,
+    ExecutionMode,
+    PartitionedStage1Processor,
+    PartitionTelemetry,
+    ScenarioEngineMode,
+    Stage1ProfileBatch,
+    TelemetrySink,
+    VersionedResultCache,
+    iter_partitions,
+)
 from .queue import BatchQueueFullError, BoundedBatchExecutor
 
 __all__ = [
+    "DEFAULT_PROFILE_CACHE_PATH",
     "BatchECLRecord",
     "BatchQueueFullError",
     "BatchSummary",
     "BoundedBatchExecutor",
+    "EnginePhase",
+    "ExecutionMode",
+    "PartitionTelemetry",
     "PartitionedStage1Processor",
+    "PersistentResultCache",
+    "PortfolioBatchSummary",
+    "PortfolioContract",
+    "PortfolioECLProcessor",
+    "PortfolioECLRecord",
+    "STAGE1_CONTRACT_SCHEMA",
+    "STAGE1_PERIOD_SCHEMA",
+    "ScenarioEngineMode",
+    "Stage1ProfileBatch",
+    "StageBatchSummary",
+    "TelemetrySink",
+    "VersionedResultCache",
+    "contract_stage",
+    "iter_partitions",
+    "portfolio_profile_hash",
+    "read_stage1_parquet",
+    "write_stage1_parquet",
 ]
@@ -0,0 +1,298 @@
+"""SQLite-backed profile result tier shared by runs and worker processes."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from decimal import Decimal
+from pathlib import Path
+from threading import Lock
+
+from ...domain.scenarios import ScenarioSet
+from ...models.forward_looking import MacroRiskPolicy
+from ..calculation import (
+    ResultDetail,
+    ScenarioECLTotals,
+    Stage1ECLResult,
+    Stage2ECLResult,
+    covers_detail,
+)
+from .processor import CachedResult, VersionedResultCache
+
+DEFAULT_PROFILE_CACHE_PATH = Path("var/ecl-profile-cache.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profile_results (
+    profile_hash TEXT PRIMARY KEY,
+    scenario_hash TEXT NOT NULL,
+    macro_policy_hash TEXT NOT NULL,
+    totals_json TEXT NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS profile_results_last_used ON profile_results (last_used);
+CREATE TABLE IF NOT EXISTS profile_cache_state (
+    singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+    entry_count INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO profile_cache_state (singleton, entry_count) VALUES (1, 0);
+"""
+
+
+def scenario_totals(result: CachedResult) -> ScenarioECLTotals:
+    """Reduce any cached stage result to the per-scenario totals the processors consume."""
+    if isinstance(result, ScenarioECLTotals):
+        return result
+    if isinstance(result, Stage1ECLResult | Stage2ECLResult):
+        weighted = result.scenario_ecl
+        return ScenarioECLTotals(
+            tuple((item.scenario_id, item.ecl) for item in weighted.scenario_results),
+            weighted.probability_weighted_ecl,
+            weighted.stress_ecl,
+            weighted.scenario_version,
+            weighted.scenario_source_hash,
+            weighted.macro_policy_version,
+            weighted.macro_policy_hash,
+        )
+    return ScenarioECLTotals(
+        tuple((item.scenario_id, item.ecl) for item in result.scenario_results),
+        result.probability_weighted_ecl,
+        result.stress_ecl,
+        result.scenario_version,
+        result.scenario_source_hash,
+        "",
+        "",
+    )
+
+
+def _encode(totals: ScenarioECLTotals) -> str:
+    return json.dumps(
+        {
+            "scenario_ecl": [[scenario_id, str(ecl)] for scenario_id, ecl in totals.scenario_ecl],
+            "probability_weighted_ecl": str(totals.probability_weighted_ecl),
+            "stress_ecl": str(totals.stress_ecl),
+            "scenario_version": totals.scenario_version,
+            "scenario_source_hash": totals.scenario_source_hash,
+            "macro_policy_version": totals.macro_policy_version,
+            "macro_policy_hash": totals.macro_policy_hash,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def _decode(payload: str) -> ScenarioECLTotals:
+    values = json.loads(payload)
+    return ScenarioECLTotals(
+        tuple((scenario_id, Decimal(ecl)) for scenario_id, ecl in values["scenario_ecl"]),
+        Decimal(values["probability_weighted_ecl"]),
+        Decimal(values["stress_ecl"]),
+        values["scenario_version"],
+        values["scenario_source_hash"],
+        values["macro_policy_version"],
+        values["macro_policy_hash"],
+    )
+
+
+class PersistentResultCache(VersionedResultCache):
+    """In-process LRU backed by a SQLite file that outlives the process.
+
+    The file keeps only scenario totals, encoded as JSON with exact decimal text,
+    never pickled objects. Workers and later runs open the same file in WAL mode.
+    ``get`` and ``put`` only buffer the ``last_used`` touches and new rows;
+    ``flush``, which the processors call once per partition, writes them in one
+    transaction and then trims the file to ``max_entries`` rows, evicting the
+    least recently used. ``flush`` reports file evictions only; entries dropped
+    from the in-process LRU are still on disk. Opening the file never deletes
+    rows: entries of other scenario or macro-policy hashes cannot be hit, because
+    both hashes are part of the profile key, and age out through the LRU or an
+    explicit ``invalidate`` call.
+    """
+
+    def __init__(
+        self,
+        scenario_set: ScenarioSet,
+        macro_policy: MacroRiskPolicy,
+        path: Path = DEFAULT_PROFILE_CACHE_PATH,
+        *,
+        capacity: int = 10_000,
+        max_entries: int = 1_000_000,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        super().__init__(capacity)
+        if max_entries <= 0 or timeout_seconds <= 0:
+            raise ValueError("cache max entries and timeout must be positive")
+        self.scenario_set = scenario_set
+        self.macro_policy = macro_policy
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.timeout_seconds = timeout_seconds
+        self._connection_lock = Lock()
+        self._touched: dict[str, int] = {}
+        self._pending: dict[str, tuple[ScenarioECLTotals, int]] = {}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            self.path, timeout=timeout_seconds, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._finalizer = weakref.finalize(self, self._connection.close)
+        self._connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        with self._connection_lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def invalidate(self) -> int:
+        """Delete entries from other scenario or policy versions and return how many.
+
+        This is a maintenance call; opening the cache never runs it.
+        """
+        with self._write() as connection:
+            removed = connection.execute(
+                "DELETE FROM profile_results WHERE scenario_hash <> ? OR macro_policy_hash <> ?",
+                (self.scenario_set.source_snapshot_hash, self.macro_policy.sha256),
+            ).rowcount
+            connection.execute(
+                "UPDATE profile_cache_state SET entry_count = "
+                "(SELECT COUNT(*) FROM profile_results) WHERE singleton = 1"
+            )
+        return removed
+
+    @property
+    def persisted_entries(self) -> int:
+        with self._connection_lock:
+            row = self._connection.execute(
+                "SELECT entry_count FROM profile_cache_state WHERE singleton = 1"
+            ).fetchone()
+        return int(row[0]) if row else 0
+
+    def get(self, key: str) -> CachedResult | None:
+        value = super().get(key)
+        with self._connection_lock:
+            if key in self._pending:
+                totals, _ = self._pending[key]
+                self._pending[key] = (totals, time.time_ns())
+                return value if value is not None else totals
+            if value is not None:
+                self._touched[key] = time.time_ns()
+                return value
+            row = self._connection.execute(
+                "SELECT totals_json FROM profile_results WHERE profile_hash = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._touched[key] = time.time_ns()
+        totals = _decode(row[0])
+        super().put(key, totals)
+        return totals
+
+    def put(self, key: str, value: CachedResult) -> int:
+        """Buffer ``value`` for the next flush unless it lacks per-scenario results.
+
+        Rows are read back as ``SCENARIOS`` detail, so a ``TOTALS`` result stays in
+        the memory tier only; persisting it would serve an empty scenario breakdown.
+        """
+        super().put(key, value)
+        if isinstance(value, Stage1ECLResult | Stage2ECLResult) and not covers_detail(
+            value.scenario_ecl.detail, ResultDetail.SCENARIOS
+        ):
+            return 0
+        with self._connection_lock:
+            self._touched.pop(key, None)
+            self._pending[key] = (scenario_totals(value), time.time_ns())
+        return 0
+
+    def flush(self) -> int:
+        """Write buffered touches and rows in one transaction and evict at most once."""
+        with self._write() as connection:
+            touched, self._touched = self._touched, {}
+            pending, self._pending = self._pending, {}
+            if not touched and not pending:
+                return 0
+            connection.executemany(
+                "UPDATE profile_results SET last_used = ? WHERE profile_hash = ?",
+                ((used, key) for key, used in touched.items()),
+            )
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT INTO profile_results "
+                "(profile_hash, scenario_hash, macro_policy_hash, totals_json, last_used) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT (profile_hash) DO NOTHING",
+                (
+                    (
+                        key,
+                        self.scenario_set.source_snapshot_hash,
+                        self.macro_policy.sha256,
+                        _encode(totals),
+                        used,
+                    )
+                    for key, (totals, used) in pending.items()
+                ),
+            )
+            inserted = connection.total_changes - before
+            if not inserted:
+                return 0
+            (entry_count,) = connection.execute(
+                "UPDATE profile_cache_state SET entry_count = entry_count + ? "
+                "WHERE singleton = 1 RETURNING entry_count",
+                (inserted,),
+            ).fetchone()
+            excess = entry_count - self.max_entries
+            if excess <= 0:
+                return 0
+            evicted = connection.execute(
+                "DELETE FROM profile_results WHERE profile_hash IN ("
+                "SELECT profile_hash FROM profile_results ORDER BY last_used LIMIT ?)",
+                (excess,),
+            ).rowcount
+            connection.execute(
+                "UPDATE profile_cache_state SET entry_count = entry_count - ? WHERE singleton = 1",
+                (evicted,),
+            )
+        return evicted
+
+    def close(self) -> None:
+        if self._finalizer.alive:
+            self.flush()
+        with self._connection_lock:
+            self._finalizer()
+
+    def __reduce__(self) -> tuple[Callable[..., PersistentResultCache], tuple[object, ...]]:
+        return _reopen, (
+            self.scenario_set,
+            self.macro_policy,
+            self.path,
+            self.capacity,
+            self.max_entries,
+            self.timeout_seconds,
+        )
+
+
+def _reopen(
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+    path: Path,
+    capacity: int,
+    max_entries: int,
+    timeout_seconds: float,
+) -> PersistentResultCache:
+    """Open a worker copy of the file with empty buffers."""
+    return PersistentResultCache(
+        scenario_set,
+        macro_policy,
+        path,
+        capacity=capacity,
+        max_entries=max_entries,
+        timeout_seconds=timeout_seconds,
+    )
@@ -0,0 +1,428 @@
+"""Mixed-stage portfolio processing routed to the Stage 1, 2 and 3 calculators."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from functools import lru_cache
+from itertools import batched
+from time import perf_counter
+
+import numpy as np
+
+from ...domain.scenarios import ScenarioSet
+from ...domain.staging import Stage
+from ...models.forward_looking import MacroRiskPolicy
+from ..calculation import (
+    ResultDetail,
+    Stage1ContractInput,
+    Stage2ContractInput,
+    Stage2RiskPeriod,
+    calculate_stage1_ecl,
+    calculate_stage2_ecl,
+)
+from ..stage3 import (
+    Stage3ContractInput,
+    Stage3ScenarioProjection,
+    calculate_stage3_ecl,
+    calculate_stage3_ecl_block,
+    stage3_block_totals,
+    stage3_cash_flow_block,
+)
+from .processor import (
+    CachedResult,
+    EnginePhase,
+    PartitionTelemetry,
+    TelemetrySink,
+    VersionedResultCache,
+    _cached,
+    _cents_array,
+    _digest,
+    _partition,
+    _profile_hash,
+    _totals,
+)
+
+type PortfolioContract = Stage1ContractInput | Stage2ContractInput | Stage3ContractInput
+
+_STAGE3_BLOCK_SIZE = 1_000
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioECLRecord:
+    contract_id: str
+    stage: Stage
+    probability_weighted_ecl: Decimal
+    stress_ecl: Decimal
+    profile_hash: str
+
+
+@dataclass(frozen=True, slots=True)
+class StageBatchSummary:
+    stage: Stage
+    contract_count: int
+    unique_profile_calculations: int
+    profile_reuses: int
+    probability_weighted_ecl: Decimal
+    stress_ecl: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioBatchSummary:
+    contract_count: int
+    partition_count: int
+    maximum_partition_size: int
+    unique_profile_calculations: int
+    profile_reuses: int
+    probability_weighted_ecl: Decimal
+    stress_ecl: Decimal
+    stages: tuple[StageBatchSummary, ...]
+    scenario_version: str
+    scenario_hash: str
+    macro_policy_version: str
+    macro_policy_hash: str
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+
+
+@lru_cache(maxsize=10_000)
+def _stage2_profile_hash_cached(
+    reporting_date: date,
+    eir: Decimal,
+    contractual_months: int,
+    extension_months: int,
+    extension_probability: Decimal,
+    segment: str,
+    periods: tuple[Stage2RiskPeriod, ...],
+    scenario_version: str,
+    scenario_hash: str,
+    macro_policy_version: str,
+    macro_policy_hash: str,
+) -> str:
+    return _digest(
+        {
+            "stage": Stage.STAGE_2.value,
+            "reporting_date": str(reporting_date),
+            "eir": str(eir),
+            "contractual_months": contractual_months,
+            "extension_months": extension_months,
+            "extension_probability": str(extension_probability),
+            "segment": segment,
+            "periods": [
+                {
+                    "date": period.reference_date.isoformat(),
+                    "hazard": str(period.conditional_hazard),
+                    "lgd": str(period.lifetime_lgd),
+                    "drawn_ead": str(period.scheduled_drawn_ead),
+                    "undrawn": str(period.undrawn_amount),
+                    "ccf": str(period.ccf),
+                    "prepayment": str(period.expected_prepayment_rate),
+                }
+                for period in periods
+            ],
+            "scenario_version": scenario_version,
+            "scenario_hash": scenario_hash,
+            "macro_policy_version": macro_policy_version,
+            "macro_policy_hash": macro_policy_hash,
+        }
+    )
+
+
+@lru_cache(maxsize=10_000)
+def _stage3_profile_hash_cached(
+    reporting_date: date,
+    gross_carrying_amount: Decimal,
+    opening_loss_allowance: Decimal,
+    eir: Decimal,
+    projections: tuple[Stage3ScenarioProjection, ...],
+    scenario_version: str,
+    scenario_hash: str,
+) -> str:
+    """Stage 3 ignores the macro policy, so only the scenario version enters its key."""
+    return _digest(
+        {
+            "stage": Stage.STAGE_3.value,
+            "reporting_date": str(reporting_date),
+            "gross_carrying_amount": str(gross_carrying_amount),
+            "opening_loss_allowance": str(opening_loss_allowance),
+            "eir": str(eir),
+            "projections": [
+                {
+                    "scenario_id": projection.scenario_id,
+                    "periods": [
+                        {
+                            "date": period.reference_date.isoformat(),
+                            "contractual": str(period.contractual_cash_flow),
+                            "borrower_receipt": str(period.expected_borrower_receipt),
+                            "unsecured": str(period.unsecured_recovery),
+                            "collateral": str(period.collateral_recovery),
+                            "guarantee": str(period.guarantee_recovery),
+                            "post_writeoff": str(period.post_writeoff_recovery),
+                            "costs": str(period.collection_costs),
+                            "writeoff": str(period.writeoff_amount),
+                            "cure": period.cure_event,
+                        }
+                        for period in projection.periods
+                    ],
+                }
+                for projection in projections
+            ],
+            "scenario_version": scenario_version,
+            "scenario_hash": scenario_hash,
+        }
+    )
+
+
+def contract_stage(contract: PortfolioContract) -> Stage:
+    if isinstance(contract, Stage1ContractInput):
+        return Stage.STAGE_1
+    if isinstance(contract, Stage2ContractInput):
+        return Stage.STAGE_2
+    if isinstance(contract, Stage3ContractInput):
+        return Stage.STAGE_3
+    raise TypeError(f"unsupported portfolio contract: {type(contract).__name__}")
+
+
+def portfolio_profile_hash(
+    contract: PortfolioContract,
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+) -> str:
+    """Return the versioned content key used to reuse results across identical profiles."""
+    if isinstance(contract, Stage1ContractInput):
+        return _profile_hash(contract, scenario_set, macro_policy)
+    if isinstance(contract, Stage2ContractInput):
+        return _stage2_profile_hash_cached(
+            contract.reporting_date,
+            Decimal(str(contract.original_effective_interest_rate)),
+            contract.contractual_months,
+            contract.expected_extension_months,
+            Decimal(str(contract.expected_extension_probability)),
+            contract.segment,
+            contract.periods,
+            scenario_set.version,
+            scenario_set.source_snapshot_hash,
+            macro_policy.policy_version,
+            macro_policy.sha256,
+        )
+    if isinstance(contract, Stage3ContractInput):
+        return _stage3_profile_hash_cached(
+            contract.reporting_date,
+            Decimal(str(contract.gross_carrying_amount)),
+            Decimal(str(contract.opening_loss_allowance)),
+            Decimal(str(contract.original_effective_interest_rate)),
+            contract.scenario_projections,
+            scenario_set.version,
+            scenario_set.source_snapshot_hash,
+        )
+    raise TypeError(f"unsupported portfolio contract: {type(contract).__name__}")
+
+
+class _StageTotals:
+    __slots__ = ("contract_count", "stress_cents", "unique_calculations", "weighted_cents")
+
+    def __init__(self) -> None:
+        self.contract_count = 0
+        self.unique_calculations = 0
+        self.weighted_cents = 0
+        self.stress_cents = 0
+
+
+class PortfolioECLProcessor:
+    """Measure a mixed-stage month-end portfolio in bounded partitions.
+
+    Each contract is routed to its stage calculator. Results are shared through
+    the same versioned profile cache as the Stage 1 processor, so identical risk
+    profiles are measured once, and only per-stage cent totals are retained.
+    ``detail`` sets what the cache keeps per profile, as in
+    ``PartitionedStage1Processor``; with ``ResultDetail.PERIODS`` Stage 3
+    contracts are measured one by one instead of in blocks. ``telemetry``
+    receives one ``PartitionTelemetry`` per partition.
+    """
+
+    def __init__(
+        self,
+        scenario_set: ScenarioSet,
+        macro_policy: MacroRiskPolicy,
+        *,
+        partition_size: int = 10_000,
+        workers: int = 1,
+        cache: VersionedResultCache | None = None,
+        detail: ResultDetail = ResultDetail.SCENARIOS,
+        telemetry: TelemetrySink | None = None,
+    ) -> None:
+        if partition_size <= 0 or workers <= 0:
+            raise ValueError("partition size and workers must be positive")
+        self.scenario_set = scenario_set
+        self.macro_policy = macro_policy
+        self.partition_size = partition_size
+        self.workers = workers
+        self.cache = cache or VersionedResultCache()
+        self.detail = ResultDetail(detail)
+        self.telemetry = telemetry
+
+    @property
+    def _blocks_stage3(self) -> bool:
+        return self.detail != ResultDetail.PERIODS
+
+    def _calculate(
+        self, items: tuple[tuple[str, PortfolioContract], ...]
+    ) -> list[tuple[str, CachedResult]]:
+        if self._blocks_stage3 and isinstance(items[0][1], Stage3ContractInput):
+            contracts = [
+                contract for _, contract in items if isinstance(contract, Stage3ContractInput)
+            ]
+            result = calculate_stage3_ecl_block(
+                stage3_cash_flow_block(contracts, self.scenario_set), self.scenario_set
+            )
+            return [
+                (key, totals)
+                for (key, _), totals in zip(items, stage3_block_totals(result), strict=True)
+            ]
+        ((key, contract),) = items
+        if isinstance(contract, Stage1ContractInput):
+            stage1 = calculate_stage1_ecl(
+                contract, self.scenario_set, self.macro_policy, detail=self.detail
+            )
+            return [(key, stage1)]
+        if isinstance(contract, Stage2ContractInput):
+            stage2 = calculate_stage2_ecl(
+                contract, self.scenario_set, self.macro_policy, detail=self.detail
+            )
+            return [(key, stage2)]
+        if isinstance(contract, Stage3ContractInput):
+            return [(key, calculate_stage3_ecl(contract, self.scenario_set))]
+        raise TypeError(f"unsupported portfolio contract: {type(contract).__name__}")
+
+    def process(
+        self,
+        contracts: Iterable[PortfolioContract],
+        *,
+        sink: Callable[[PortfolioECLRecord], None] | None = None,
+    ) -> PortfolioBatchSummary:
+        partition_count = 0
+        maximum_partition_size = 0
+        totals = {stage: _StageTotals() for stage in Stage}
+        cache_hits = 0
+        cache_evictions = 0
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ecl-portfolio"
+        ) as pool:
+            for partition in _partition(contracts, self.partition_size):
+                started = perf_counter()
+                partition_count += 1
+                maximum_partition_size = max(maximum_partition_size, len(partition))
+                stages = [contract_stage(contract) for contract in partition]
+                keys = [
+                    portfolio_profile_hash(contract, self.scenario_set, self.macro_policy)
+                    for contract in partition
+                ]
+                hashed = perf_counter()
+                resolved: dict[str, CachedResult] = {}
+                missing: dict[str, PortfolioContract] = {}
+                for key, contract in zip(keys, partition, strict=True):
+                    if key in resolved or key in missing:
+                        continue
+                    cached = _cached(self.cache, key, self.detail)
+                    if cached is None:
+                        missing[key] = contract
+                    else:
+                        resolved[key] = cached
+                partition_hits = len(resolved)
+                cache_hits += partition_hits
+                stage3 = [
+                    item
+                    for item in missing.items()
+                    if self._blocks_stage3 and isinstance(item[1], Stage3ContractInput)
+                ]
+                work: list[tuple[tuple[str, PortfolioContract], ...]] = [
+                    (item,)
+                    for item in missing.items()
+                    if not (self._blocks_stage3 and isinstance(item[1], Stage3ContractInput))
+                ]
+                work.extend(batched(stage3, _STAGE3_BLOCK_SIZE, strict=False))
+                for calculated in pool.map(self._calculate, work):
+                    for key, result in calculated:
+                        resolved[key] = result
+                        cache_evictions += self.cache.put(key, result)
+                        totals[contract_stage(missing[key])].unique_calculations += 1
+                cache_evictions += self.cache.flush()
+
+                calculated_at = perf_counter()
+                weighted_cents = _cents_array(
+                    _totals(resolved[key]).probability_weighted_ecl for key in keys
+                )
+                stress_cents = _cents_array(_totals(resolved[key]).stress_ecl for key in keys)
+                stage_values = np.asarray([stage.value for stage in stages], dtype=np.int64)
+                for stage, accumulator in totals.items():
+                    selected = stage_values == stage.value
+                    accumulator.contract_count += int(selected.sum())
+                    accumulator.weighted_cents += int(weighted_cents[selected].sum(dtype=np.int64))
+                    accumulator.stress_cents += int(stress_cents[selected].sum(dtype=np.int64))
+                reduced = perf_counter()
+                if sink:
+                    for contract, stage, key, weighted, stress in zip(
+                        partition, stages, keys, weighted_cents, stress_cents, strict=True
+                    ):
+                        sink(
+                            PortfolioECLRecord(
+                                contract.contract_id,
+                                stage,
+                                Decimal(int(weighted)) / 100,
+                                Decimal(int(stress)) / 100,
+                                key,
+                            )
+                        )
+                if self.telemetry:
+                    self.telemetry(
+                        PartitionTelemetry(
+                            "portfolio",
+                            len(partition),
+                            partition_hits,
+                            len(missing),
+                            (
+                                (EnginePhase.HASHING, hashed - started),
+                                (EnginePhase.CALCULATION, calculated_at - hashed),
+                                (EnginePhase.REDUCTION, reduced - calculated_at),
+                                (EnginePhase.SINK, perf_counter() - reduced),
+                            ),
+                        )
+                    )
+
+        stage_summaries = tuple(
+            StageBatchSummary(
+                stage=stage,
+                contract_count=accumulator.contract_count,
+                unique_profile_calculations=accumulator.unique_calculations,
+                profile_reuses=max(0, accumulator.contract_count - accumulator.unique_calculations),
+                probability_weighted_ecl=Decimal(accumulator.weighted_cents) / 100,
+                stress_ecl=Decimal(accumulator.stress_cents) / 100,
+            )
+            for stage, accumulator in totals.items()
+        )
+        contract_count = sum(item.contract_count for item in stage_summaries)
+        unique_calculations = sum(item.unique_profile_calculations for item in stage_summaries)
+        return PortfolioBatchSummary(
+            contract_count=contract_count,
+            partition_count=partition_count,
+            maximum_partition_size=maximum_partition_size,
+            unique_profile_calculations=unique_calculations,
+            profile_reuses=max(0, contract_count - unique_calculations),
+            probability_weighted_ecl=sum(
+                (item.probability_weighted_ecl for item in stage_summaries), Decimal("0")
+            ),
+            stress_ecl=sum((item.stress_ecl for item in stage_summaries), Decimal("0")),
+            stages=stage_summaries,
+            scenario_version=self.scenario_set.version,
+            scenario_hash=self.scenario_set.source_snapshot_hash,
+            macro_policy_version=self.macro_policy.policy_version,
+            macro_policy_hash=self.macro_policy.sha256,
+            cache_hits=cache_hits,
+            cache_misses=unique_calculations,
+            cache_evictions=cache_evictions,
+        )
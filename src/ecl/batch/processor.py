@@ -3,27 +3,75 @@
 from __future__ import annotations
 
 import json
-from collections import OrderedDict
-from collections.abc import Callable, Iterable, Iterator
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
-from functools import lru_cache
+from enum import StrEnum
+from functools import lru_cache, partial
 from hashlib import sha256
 from itertools import islice
+from multiprocessing import get_context
 from threading import RLock
+from time import perf_counter
 
 import numpy as np
 
 from ...domain.scenarios import ScenarioSet
 from ...models.forward_looking import MacroRiskPolicy
 from ..calculation import (
+    ProbabilityWeightedScenarioECL,
+    ResultDetail,
+    ScenarioECLTotals,
     Stage1ContractInput,
     Stage1ECLResult,
     Stage1RiskPeriod,
+    Stage2ECLResult,
+    calculate_scenario_ecl_block,
     calculate_stage1_ecl,
+    covers_detail,
+    scenario_ecl_block_totals,
+    stage1_risk_block,
 )
+from ..stage3 import Stage3ECLResult
+
+type CachedResult = Stage1ECLResult | Stage2ECLResult | Stage3ECLResult | ScenarioECLTotals
+
+
+class ScenarioEngineMode(StrEnum):
+    DECIMAL = "decimal"
+    VECTORIZED = "vectorized"
+
+
+class ExecutionMode(StrEnum):
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class EnginePhase(StrEnum):
+    HASHING = "hashing"
+    CALCULATION = "calculation"
+    REDUCTION = "reduction"
+    SINK = "sink"
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionTelemetry:
+    """Work and wall time of one processed partition, emitted after its sink.
+
+    Cache counts are ``None`` for engines without a profile cache.
+    """
+
+    engine: str
+    contracts: int
+    cache_hits: int | None
+    cache_misses: int | None
+    phase_seconds: tuple[tuple[EnginePhase, float], ...]
+
+
+type TelemetrySink = Callable[[PartitionTelemetry], None]
 
 
 @dataclass(frozen=True, slots=True)
@@ -36,6 +84,15 @@ class BatchECLRecord:
 
 @dataclass(frozen=True, slots=True)
 class BatchSummary:
+    """Totals of one run.
+
+    ``unique_profile_calculations`` counts profiles actually computed and equals
+    ``cache_misses``; ``profile_reuses`` is every other contract. With
+    ``ExecutionMode.PROCESS`` each worker keeps its own cache, so one profile may be
+    computed once per worker and these counts can exceed the thread-mode counts for
+    the same input. Monetary totals and records do not depend on the mode.
+    """
+
     contract_count: int
     partition_count: int
     maximum_partition_size: int
@@ -47,41 +104,96 @@ class BatchSummary:
     scenario_hash: str
     macro_policy_version: str
     macro_policy_hash: str
+    engine_mode: ScenarioEngineMode = ScenarioEngineMode.DECIMAL
+    decimal_fallback_rows: int = 0
+    execution_mode: ExecutionMode = ExecutionMode.THREAD
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_evictions: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Stage1ProfileBatch:
+    """One partition of contracts whose identical Stage 1 profiles were merged upstream.
+
+    ``profile_index[i]`` selects the entry of ``profiles`` that measures
+    ``contract_ids[i]``, so a partition costs one input object per distinct
+    profile rather than one per contract and period.
+    """
+
+    contract_ids: tuple[str, ...]
+    profiles: tuple[Stage1ContractInput, ...]
+    profile_index: np.ndarray
+
+    def __post_init__(self) -> None:
+        index = np.asarray(self.profile_index, dtype=np.int64)
+        if index.shape != (len(self.contract_ids),) or not self.contract_ids:
+            raise ValueError("profile batch needs one profile index per contract")
+        if index.min() < 0 or index.max() >= len(self.profiles):
+            raise ValueError("profile index is outside the batch profiles")
+        object.__setattr__(self, "profile_index", index)
+
+    def __len__(self) -> int:
+        return len(self.contract_ids)
 
 
 class VersionedResultCache:
-    """Thread-safe LRU whose content key includes every external calculation version."""
+    """Thread-safe LRU whose content key includes every external calculation version.
+
+    ``put`` returns how many entries it evicted. A pickled cache arrives empty in
+    the receiving process with the same configuration, which is how process
+    workers obtain their own instance.
+    """
 
     def __init__(self, capacity: int = 10_000) -> None:
         if capacity <= 0:
             raise ValueError("cache capacity must be positive")
         self.capacity = capacity
-        self._values: OrderedDict[str, Stage1ECLResult] = OrderedDict()
+        self._values: OrderedDict[str, CachedResult] = OrderedDict()
         self._lock = RLock()
 
-    def get(self, key: str) -> Stage1ECLResult | None:
+    def get(self, key: str) -> CachedResult | None:
         with self._lock:
             value = self._values.get(key)
             if value is not None:
                 self._values.move_to_end(key)
             return value
 
-    def put(self, key: str, value: Stage1ECLResult) -> None:
+    def put(self, key: str, value: CachedResult) -> int:
+        evicted = 0
         with self._lock:
             self._values[key] = value
             self._values.move_to_end(key)
             while len(self._values) > self.capacity:
                 self._values.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def flush(self) -> int:
+        """Write buffered entries to any backing store and return how many it evicted.
 
+        Processors call it once per partition. The in-process cache has nothing to
+        write.
+        """
+        return 0
 
-def _partition(
-    values: Iterable[Stage1ContractInput], size: int
-) -> Iterator[list[Stage1ContractInput]]:
+    def __reduce__(self) -> tuple[Callable[..., VersionedResultCache], tuple[object, ...]]:
+        return type(self), (self.capacity,)
+
+
+def _partition[T](values: Iterable[T], size: int) -> Iterator[list[T]]:
     iterator = iter(values)
     while partition := list(islice(iterator, size)):
         yield partition
 
 
+def iter_partitions[T](values: Iterable[T], size: int) -> Iterator[list[T]]:
+    """Yield consecutive lists of at most ``size`` items without materializing the input."""
+    if size <= 0:
+        raise ValueError("partition size must be positive")
+    return _partition(values, size)
+
+
 def _cents_array(values: Iterable[Decimal]) -> np.ndarray:
     cents = [int(value * 100) for value in values]
     limit = np.iinfo(np.int64).max
@@ -90,6 +202,33 @@ def _cents_array(values: Iterable[Decimal]) -> np.ndarray:
     return np.asarray(cents, dtype=np.int64)
 
 
+def _totals(
+    result: CachedResult,
+) -> ScenarioECLTotals | ProbabilityWeightedScenarioECL | Stage3ECLResult:
+    return result.scenario_ecl if isinstance(result, Stage1ECLResult | Stage2ECLResult) else result
+
+
+def _result_detail(result: CachedResult) -> ResultDetail:
+    if isinstance(result, Stage1ECLResult | Stage2ECLResult):
+        return result.scenario_ecl.detail
+    if isinstance(result, ScenarioECLTotals):
+        return ResultDetail.SCENARIOS
+    return ResultDetail.PERIODS
+
+
+def _cached(cache: VersionedResultCache, key: str, detail: ResultDetail) -> CachedResult | None:
+    """Return the cached result of ``key`` only if it keeps at least ``detail``."""
+    cached = cache.get(key)
+    if cached is None or not covers_detail(_result_detail(cached), detail):
+        return None
+    return cached
+
+
+def _digest(payload: Mapping[str, object]) -> str:
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    return sha256(encoded).hexdigest()
+
+
 @lru_cache(maxsize=10_000)
 def _profile_hash_cached(
     reporting_date: date,
@@ -121,8 +260,7 @@ def _profile_hash_cached(
         "macro_policy_version": macro_policy_version,
         "macro_policy_hash": macro_policy_hash,
     }
-    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
-    return sha256(encoded).hexdigest()
+    return _digest(payload)
 
 
 def _profile_hash(
@@ -142,8 +280,188 @@ def _profile_hash(
     )
 
 
+@dataclass(frozen=True, slots=True)
+class _PartitionMeasurement:
+    contract_ids: tuple[str, ...]
+    keys: tuple[str, ...]
+    weighted_cents: np.ndarray
+    stress_cents: np.ndarray
+    unique_calculations: int
+    decimal_fallback_rows: int
+    cache_hits: int
+    cache_evictions: int
+    hashing_seconds: float
+    calculation_seconds: float
+
+
+type _Mapper = Callable[
+    [Callable[[Stage1ContractInput], Stage1ECLResult], Iterable[Stage1ContractInput]],
+    Iterable[Stage1ECLResult],
+]
+
+
+def _measure_partition(
+    partition: list[Stage1ContractInput],
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+    cache: VersionedResultCache,
+    mode: ScenarioEngineMode,
+    detail: ResultDetail,
+    mapper: _Mapper = map,
+) -> _PartitionMeasurement:
+    started = perf_counter()
+    keys = tuple(_profile_hash(contract, scenario_set, macro_policy) for contract in partition)
+    hashed = perf_counter()
+    resolved: dict[str, CachedResult] = {}
+    missing: dict[str, Stage1ContractInput] = {}
+    for key, contract in zip(keys, partition, strict=True):
+        if key in resolved or key in missing:
+            continue
+        cached = _cached(cache, key, detail)
+        if cached is None:
+            missing[key] = contract
+        else:
+            resolved[key] = cached
+    calculated: list[CachedResult]
+    decimal_fallback_rows = 0
+    if mode == ScenarioEngineMode.VECTORIZED and missing:
+        block = calculate_scenario_ecl_block(
+            stage1_risk_block(list(missing.values())), scenario_set, macro_policy
+        )
+        calculated = list(scenario_ecl_block_totals(block))
+        decimal_fallback_rows = block.decimal_fallback_rows
+    else:
+        calculated = list(
+            mapper(
+                partial(
+                    calculate_stage1_ecl,
+                    scenario_set=scenario_set,
+                    macro_policy=macro_policy,
+                    detail=detail,
+                ),
+                missing.values(),
+            )
+        )
+    cache_evictions = 0
+    for key, result in zip(missing, calculated, strict=True):
+        resolved[key] = result
+        cache_evictions += cache.put(key, result)
+    cache_evictions += cache.flush()
+
+    return _PartitionMeasurement(
+        tuple(contract.contract_id for contract in partition),
+        keys,
+        _cents_array(_totals(resolved[key]).probability_weighted_ecl for key in keys),
+        _cents_array(_totals(resolved[key]).stress_ecl for key in keys),
+        len(missing),
+        decimal_fallback_rows,
+        len(resolved) - len(missing),
+        cache_evictions,
+        hashed - started,
+        perf_counter() - hashed,
+    )
+
+
+def _measure_profile_batch(
+    batch: Stage1ProfileBatch,
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+    cache: VersionedResultCache,
+    mode: ScenarioEngineMode,
+    detail: ResultDetail,
+    mapper: _Mapper = map,
+) -> _PartitionMeasurement:
+    profiles = _measure_partition(
+        list(batch.profiles), scenario_set, macro_policy, cache, mode, detail, mapper
+    )
+    multiplicity = np.bincount(batch.profile_index, minlength=len(batch.profiles))
+    limit = np.iinfo(np.int64).max
+    for cents in (profiles.weighted_cents, profiles.stress_cents):
+        if (
+            sum(
+                abs(int(value)) * int(count)
+                for value, count in zip(cents, multiplicity, strict=True)
+            )
+            > limit
+        ):
+            raise OverflowError("partition monetary total exceeds safe int64 vector range")
+    return _PartitionMeasurement(
+        batch.contract_ids,
+        tuple(np.asarray(profiles.keys, dtype=object)[batch.profile_index]),
+        profiles.weighted_cents[batch.profile_index],
+        profiles.stress_cents[batch.profile_index],
+        profiles.unique_calculations,
+        profiles.decimal_fallback_rows,
+        profiles.cache_hits,
+        profiles.cache_evictions,
+        profiles.hashing_seconds,
+        profiles.calculation_seconds,
+    )
+
+
+type _Partition = list[Stage1ContractInput] | Stage1ProfileBatch
+
+
+def _measure(
+    partition: _Partition,
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+    cache: VersionedResultCache,
+    mode: ScenarioEngineMode,
+    detail: ResultDetail,
+    mapper: _Mapper = map,
+) -> _PartitionMeasurement:
+    if isinstance(partition, Stage1ProfileBatch):
+        return _measure_profile_batch(
+            partition, scenario_set, macro_policy, cache, mode, detail, mapper
+        )
+    return _measure_partition(partition, scenario_set, macro_policy, cache, mode, detail, mapper)
+
+
+_WORKER_STATE: tuple[
+    ScenarioSet, MacroRiskPolicy, VersionedResultCache, ScenarioEngineMode, ResultDetail
+]
+
+
+def _initialize_worker(
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+    cache: VersionedResultCache,
+    mode: ScenarioEngineMode,
+    detail: ResultDetail,
+) -> None:
+    """Receive scenario, policy and an empty copy of the cache once per worker process."""
+    global _WORKER_STATE
+    _WORKER_STATE = (scenario_set, macro_policy, cache, mode, detail)
+
+
+def _measure_worker_partition(partition: _Partition) -> _PartitionMeasurement:
+    scenario_set, macro_policy, cache, mode, detail = _WORKER_STATE
+    return _measure(partition, scenario_set, macro_policy, cache, mode, detail)
+
+
 class PartitionedStage1Processor:
-    """Stream contracts in bounded partitions and retain no per-contract result list."""
+    """Stream contracts in bounded partitions and retain no per-contract result list.
+
+    ``mode`` selects how missing profiles are measured: one Decimal scenario
+    integral per profile, or one batched NumPy pass per partition that falls back
+    to Decimal only for rows whose float products sit too close to a half-cent.
+
+    ``execution`` selects where partitions run. Threads share ``cache`` but
+    serialize on the GIL; processes receive whole partitions, keep one
+    process-local copy of the cache each and return only cent arrays, which the
+    parent reduces in submission order. A ``PersistentResultCache`` lets those
+    copies, and later runs, share results through one file.
+
+    ``detail`` sets what the cache keeps per profile. The default keeps
+    per-scenario totals; ``ResultDetail.PERIODS`` keeps the full Decimal
+    integral, reachable through ``cache.get(record.profile_hash)`` for
+    drill-down, and is not available with the vectorized engine.
+
+    ``telemetry`` receives one ``PartitionTelemetry`` per partition, with
+    hashing and calculation measured where the partition ran and reduction and
+    sink measured in the reducing thread.
+    """
 
     def __init__(
         self,
@@ -153,24 +471,80 @@ class PartitionedStage1Processor:
         partition_size: int = 10_000,
         workers: int = 1,
         cache: VersionedResultCache | None = None,
+        mode: ScenarioEngineMode = ScenarioEngineMode.DECIMAL,
+        execution: ExecutionMode = ExecutionMode.THREAD,
+        detail: ResultDetail = ResultDetail.SCENARIOS,
+        telemetry: TelemetrySink | None = None,
     ) -> None:
         if partition_size <= 0 or workers <= 0:
             raise ValueError("partition size and workers must be positive")
+        if mode == ScenarioEngineMode.VECTORIZED and detail == ResultDetail.PERIODS:
+            raise ValueError("period detail requires the decimal engine")
         self.scenario_set = scenario_set
         self.macro_policy = macro_policy
         self.partition_size = partition_size
         self.workers = workers
         self.cache = cache or VersionedResultCache()
+        self.mode = ScenarioEngineMode(mode)
+        self.execution = ExecutionMode(execution)
+        self.detail = ResultDetail(detail)
+        self.telemetry = telemetry
 
-    def _calculate(self, item: tuple[str, Stage1ContractInput]) -> tuple[str, Stage1ECLResult]:
-        key, contract = item
-        return key, calculate_stage1_ecl(contract, self.scenario_set, self.macro_policy)
+    def _thread_measurements(
+        self, partitions: Iterable[_Partition]
+    ) -> Iterator[_PartitionMeasurement]:
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ecl-partition"
+        ) as pool:
+            for partition in partitions:
+                yield _measure(
+                    partition,
+                    self.scenario_set,
+                    self.macro_policy,
+                    self.cache,
+                    self.mode,
+                    self.detail,
+                    pool.map,
+                )
+
+    def _process_measurements(
+        self, partitions: Iterable[_Partition]
+    ) -> Iterator[_PartitionMeasurement]:
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self.scenario_set, self.macro_policy, self.cache, self.mode, self.detail),
+        ) as pool:
+            pending: deque[Future[_PartitionMeasurement]] = deque()
+            for partition in partitions:
+                pending.append(pool.submit(_measure_worker_partition, partition))
+                if len(pending) >= self.workers * 2:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
     def process(
         self,
         contracts: Iterable[Stage1ContractInput],
         *,
         sink: Callable[[BatchECLRecord], None] | None = None,
+    ) -> BatchSummary:
+        return self._reduce(_partition(contracts, self.partition_size), sink)
+
+    def process_profile_batches(
+        self,
+        batches: Iterable[Stage1ProfileBatch],
+        *,
+        sink: Callable[[BatchECLRecord], None] | None = None,
+    ) -> BatchSummary:
+        """Measure partitions already deduplicated by a columnar loader, as they arrive."""
+        return self._reduce(batches, sink)
+
+    def _reduce(
+        self,
+        partitions: Iterable[_Partition],
+        sink: Callable[[BatchECLRecord], None] | None,
     ) -> BatchSummary:
         contract_count = 0
         partition_count = 0
@@ -178,51 +552,59 @@ class PartitionedStage1Processor:
         unique_calculations = 0
         total_weighted_cents = 0
         total_stress_cents = 0
+        decimal_fallback_rows = 0
+        cache_hits = 0
+        cache_evictions = 0
 
-        with ThreadPoolExecutor(
-            max_workers=self.workers, thread_name_prefix="ecl-partition"
-        ) as pool:
-            for partition in _partition(contracts, self.partition_size):
-                partition_count += 1
-                maximum_partition_size = max(maximum_partition_size, len(partition))
-                keys = [
-                    _profile_hash(contract, self.scenario_set, self.macro_policy)
-                    for contract in partition
-                ]
-                resolved: dict[str, Stage1ECLResult] = {}
-                missing: dict[str, Stage1ContractInput] = {}
-                for key, contract in zip(keys, partition, strict=True):
-                    if key in resolved or key in missing:
-                        continue
-                    cached = self.cache.get(key)
-                    if cached is None:
-                        missing[key] = contract
-                    else:
-                        resolved[key] = cached
-                for key, result in pool.map(self._calculate, missing.items()):
-                    resolved[key] = result
-                    self.cache.put(key, result)
-                    unique_calculations += 1
-
-                weighted_cents = _cents_array(
-                    resolved[key].scenario_ecl.probability_weighted_ecl for key in keys
-                )
-                stress_cents = _cents_array(resolved[key].scenario_ecl.stress_ecl for key in keys)
-                total_weighted_cents += int(weighted_cents.sum(dtype=np.int64))
-                total_stress_cents += int(stress_cents.sum(dtype=np.int64))
-                contract_count += len(partition)
-                if sink:
-                    for contract, key, weighted, stress in zip(
-                        partition, keys, weighted_cents, stress_cents, strict=True
-                    ):
-                        sink(
-                            BatchECLRecord(
-                                contract.contract_id,
-                                Decimal(int(weighted)) / 100,
-                                Decimal(int(stress)) / 100,
-                                key,
-                            )
+        measurements = (
+            self._process_measurements(partitions)
+            if self.execution == ExecutionMode.PROCESS
+            else self._thread_measurements(partitions)
+        )
+        for measurement in measurements:
+            reduced = perf_counter()
+            partition_size = len(measurement.keys)
+            partition_count += 1
+            maximum_partition_size = max(maximum_partition_size, partition_size)
+            unique_calculations += measurement.unique_calculations
+            decimal_fallback_rows += measurement.decimal_fallback_rows
+            cache_hits += measurement.cache_hits
+            cache_evictions += measurement.cache_evictions
+            total_weighted_cents += int(measurement.weighted_cents.sum(dtype=np.int64))
+            total_stress_cents += int(measurement.stress_cents.sum(dtype=np.int64))
+            contract_count += partition_size
+            sunk = perf_counter()
+            if sink:
+                for contract_id, key, weighted, stress in zip(
+                    measurement.contract_ids,
+                    measurement.keys,
+                    measurement.weighted_cents,
+                    measurement.stress_cents,
+                    strict=True,
+                ):
+                    sink(
+                        BatchECLRecord(
+                            contract_id,
+                            Decimal(int(weighted)) / 100,
+                            Decimal(int(stress)) / 100,
+                            key,
                         )
+                    )
+            if self.telemetry:
+                self.telemetry(
+                    PartitionTelemetry(
+                        "stage1",
+                        partition_size,
+                        measurement.cache_hits,
+                        measurement.unique_calculations,
+                        (
+                            (EnginePhase.HASHING, measurement.hashing_seconds),
+                            (EnginePhase.CALCULATION, measurement.calculation_seconds),
+                            (EnginePhase.REDUCTION, sunk - reduced),
+                            (EnginePhase.SINK, perf_counter() - sunk),
+                        ),
+                    )
+                )
 
         return BatchSummary(
             contract_count=contract_count,
@@ -236,4 +618,10 @@ class PartitionedStage1Processor:
             scenario_hash=self.scenario_set.source_snapshot_hash,
             macro_policy_version=self.macro_policy.policy_version,
             macro_policy_hash=self.macro_policy.sha256,
+            engine_mode=self.mode,
+            decimal_fallback_rows=decimal_fallback_rows,
+            execution_mode=self.execution,
+            cache_hits=cache_hits,
+            cache_misses=unique_calculations,
+            cache_evictions=cache_evictions,
         )
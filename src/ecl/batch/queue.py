@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor
-from threading import BoundedSemaphore
+from threading import BoundedSemaphore, Lock
 from typing import Any
 
 
@@ -18,16 +18,31 @@ class BoundedBatchExecutor:
             raise ValueError("workers must be positive and queue capacity non-negative")
         self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ecl-job")
         self._slots = BoundedSemaphore(workers + queue_capacity)
+        self._lock = Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Accepted jobs that are queued or running."""
+        with self._lock:
+            return self._in_flight
+
+    def _release(self, _future: Future[Any] | None = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._slots.release()
 
     def submit(self, function: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
         if not self._slots.acquire(blocking=False):
             raise BatchQueueFullError("batch queue capacity exceeded")
+        with self._lock:
+            self._in_flight += 1
         try:
             future = self._executor.submit(function, *args, **kwargs)
         except Exception:
-            self._slots.release()
+            self._release()
             raise
-        future.add_done_callback(lambda _future: self._slots.release())
+        future.add_done_callback(self._release)
         return future
 
     def shutdown(self) -> None:
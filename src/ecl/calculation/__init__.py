@@ -28,17 +28,23 @@ from .poci import (
 from .scenario_engine import (
     BaselineRiskPeriod,
     ProbabilityWeightedScenarioECL,
+    ResultDetail,
     ScenarioIntegral,
     ScenarioRiskPeriod,
     calculate_probability_weighted_scenario_ecl,
+    covers_detail,
 )
 from .sensitivity import (
+    PortfolioSensitivityReport,
+    PortfolioSensitivityResult,
     ScenarioSensitivityPolicy,
     ScenarioSensitivityReport,
+    SegmentSensitivity,
     SensitivityResult,
     TrajectoryShock,
     WeightSensitivityCase,
     load_scenario_sensitivity_policy,
+    run_portfolio_sensitivities,
     run_scenario_sensitivities,
 )
 from .stage1 import (
@@ -54,6 +60,14 @@ from .stage2 import (
     Stage2RiskPeriod,
     calculate_stage2_ecl,
 )
+from .vectorized import (
+    BaselineRiskBlock,
+    ScenarioECLBlockResult,
+    ScenarioECLTotals,
+    calculate_scenario_ecl_block,
+    scenario_ecl_block_totals,
+    stage1_risk_block,
+)
 
 __all__ = [
     "ECLResult",
@@ -63,6 +77,7 @@ __all__ = [
     "HomogeneityMetric",
     "HomogeneityReport",
     "HomogeneousGroupDefinition",
+    "BaselineRiskBlock",
     "BaselineRiskPeriod",
     "POCICashFlow",
     "POCIClassification",
@@ -70,12 +85,18 @@ __all__ = [
     "POCIScenarioCashFlows",
     "POCIScenarioMeasurement",
     "POCIScenarioResult",
+    "PortfolioSensitivityReport",
+    "PortfolioSensitivityResult",
     "ProbabilityWeightedScenarioECL",
+    "ResultDetail",
     "ScenarioECL",
+    "ScenarioECLBlockResult",
+    "ScenarioECLTotals",
     "ScenarioIntegral",
     "ScenarioRiskPeriod",
     "ScenarioSensitivityPolicy",
     "ScenarioSensitivityReport",
+    "SegmentSensitivity",
     "SensitivityResult",
     "Stage1ContractInput",
     "Stage1ECLResult",
@@ -87,8 +108,10 @@ __all__ = [
     "TrajectoryShock",
     "WeightSensitivityCase",
     "calculate_probability_weighted_scenario_ecl",
+    "calculate_scenario_ecl_block",
     "calculate_stage1_ecl",
     "calculate_stage2_ecl",
+    "covers_detail",
     "build_homogeneous_group_id",
     "classify_poci",
     "credit_adjusted_eir",
@@ -96,7 +119,10 @@ __all__ = [
     "measure_poci_scenarios",
     "load_scenario_sensitivity_policy",
     "load_ecl_grouping_policy",
+    "run_portfolio_sensitivities",
     "run_scenario_sensitivities",
+    "scenario_ecl_block_totals",
+    "stage1_risk_block",
     "route_ecl_measurement",
     "validate_homogeneous_group",
 ]
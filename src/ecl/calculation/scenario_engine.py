@@ -5,16 +5,39 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
 from decimal import ROUND_HALF_EVEN, Decimal
+from enum import StrEnum
 
 from ...domain.conventions import DecimalInput, decimal_from, money, rate
 from ...domain.exceptions import DomainValidationError
 from ...domain.scenarios import ScenarioKind, ScenarioSet
-from ...models.forward_looking import MacroRiskPolicy, calculate_macro_risk_multipliers
+from ...models.forward_looking import MacroRiskPolicy, compile_macro_multiplier_table
 
 MONEY_QUANTUM = Decimal("0.01")
 RATE_QUANTUM = Decimal("0.00000001")
 
 
+class ResultDetail(StrEnum):
+    """How much of the scenario integral a result retains.
+
+    ``TOTALS`` keeps only the weighted and stress ECL, ``SCENARIOS`` adds one
+    ``ScenarioIntegral`` per scenario without periods, and ``PERIODS`` keeps
+    every ``ScenarioRiskPeriod`` for drill-down and audit samples. Totals are
+    identical at every level.
+    """
+
+    TOTALS = "totals"
+    SCENARIOS = "scenarios"
+    PERIODS = "periods"
+
+
+_DETAIL_RANK = {ResultDetail.TOTALS: 0, ResultDetail.SCENARIOS: 1, ResultDetail.PERIODS: 2}
+
+
+def covers_detail(available: ResultDetail, required: ResultDetail) -> bool:
+    """Whether a result kept at ``available`` detail can serve a ``required`` request."""
+    return _DETAIL_RANK[available] >= _DETAIL_RANK[required]
+
+
 @dataclass(frozen=True, slots=True)
 class BaselineRiskPeriod:
     reference_date: date
@@ -74,6 +97,7 @@ class ProbabilityWeightedScenarioECL:
     scenario_source_hash: str
     macro_policy_version: str
     macro_policy_hash: str
+    detail: ResultDetail = ResultDetail.PERIODS
 
 
 def _validate_baseline(baseline: tuple[BaselineRiskPeriod, ...], scenario_set: ScenarioSet) -> None:
@@ -93,72 +117,87 @@ def calculate_probability_weighted_scenario_ecl(
     scenario_set: ScenarioSet,
     segment: str,
     macro_policy: MacroRiskPolicy,
+    *,
+    detail: ResultDetail = ResultDetail.PERIODS,
 ) -> ProbabilityWeightedScenarioECL:
     _validate_baseline(baseline, scenario_set)
+    keep_periods = detail == ResultDetail.PERIODS
+    paths = compile_macro_multiplier_table(scenario_set, macro_policy).factors(segment)
+    # Baseline periods are normalized at construction; read them once for all scenarios.
+    curve = tuple(
+        (
+            base.reference_date,
+            decimal_from(base.conditional_hazard, field="conditional_hazard"),
+            decimal_from(base.lgd, field="lgd"),
+            decimal_from(base.ccf, field="ccf"),
+            decimal_from(base.drawn_ead, field="drawn_ead"),
+            decimal_from(base.undrawn_amount, field="undrawn_amount"),
+            decimal_from(base.discount_factor, field="discount_factor"),
+        )
+        for base in baseline
+    )
     results: list[ScenarioIntegral] = []
-    for trajectory in scenario_set.trajectories:
+    weighted_ecl = Decimal("0")
+    stress_ecl = Decimal("0")
+    for trajectory, path in zip(scenario_set.trajectories, paths, strict=True):
         survival = Decimal("1")
+        ecl = Decimal("0")
         periods: list[ScenarioRiskPeriod] = []
-        for base, macro_point in zip(baseline, trajectory.periods[: len(baseline)], strict=True):
-            factors = calculate_macro_risk_multipliers(
-                trajectory.scenario_id, macro_point, segment, macro_policy
+        for point, factors in zip(curve, path[: len(curve)], strict=True):
+            reference_date, base_hazard, base_lgd, base_ccf, drawn, undrawn, discount = point
+            pd_factor, lgd_factor, ead_factor, ccf_factor = factors
+            hazard = min(Decimal("1"), base_hazard * pd_factor).quantize(
+                RATE_QUANTUM, rounding=ROUND_HALF_EVEN
             )
-            hazard = min(
-                Decimal("1"),
-                decimal_from(base.conditional_hazard, field="conditional_hazard") * factors.pd,
-            ).quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN)
             marginal_pd = (survival * hazard).quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN)
-            adjusted_lgd = min(
-                Decimal("1"), decimal_from(base.lgd, field="lgd") * factors.lgd
-            ).quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN)
-            adjusted_ccf = min(
-                Decimal("1"), decimal_from(base.ccf, field="ccf") * factors.ccf
-            ).quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN)
-            adjusted_ead = (
-                decimal_from(base.drawn_ead, field="drawn_ead") * factors.ead
-                + decimal_from(base.undrawn_amount, field="undrawn_amount") * adjusted_ccf
-            ).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
-            expected_loss = (
-                marginal_pd
-                * adjusted_lgd
-                * adjusted_ead
-                * decimal_from(base.discount_factor, field="discount_factor")
-            ).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
-            periods.append(
-                ScenarioRiskPeriod(
-                    trajectory.scenario_id,
-                    base.reference_date,
-                    survival.quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN),
-                    hazard,
-                    marginal_pd,
-                    adjusted_lgd,
-                    adjusted_ead,
-                    adjusted_ccf,
-                    decimal_from(base.discount_factor, field="discount_factor"),
-                    expected_loss,
-                )
+            adjusted_lgd = min(Decimal("1"), base_lgd * lgd_factor).quantize(
+                RATE_QUANTUM, rounding=ROUND_HALF_EVEN
+            )
+            adjusted_ccf = min(Decimal("1"), base_ccf * ccf_factor).quantize(
+                RATE_QUANTUM, rounding=ROUND_HALF_EVEN
+            )
+            adjusted_ead = (drawn * ead_factor + undrawn * adjusted_ccf).quantize(
+                MONEY_QUANTUM, rounding=ROUND_HALF_EVEN
+            )
+            expected_loss = (marginal_pd * adjusted_lgd * adjusted_ead * discount).quantize(
+                MONEY_QUANTUM, rounding=ROUND_HALF_EVEN
             )
+            ecl += expected_loss
+            if keep_periods:
+                periods.append(
+                    ScenarioRiskPeriod(
+                        trajectory.scenario_id,
+                        reference_date,
+                        survival.quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN),
+                        hazard,
+                        marginal_pd,
+                        adjusted_lgd,
+                        adjusted_ead,
+                        adjusted_ccf,
+                        discount,
+                        expected_loss,
+                    )
+                )
             survival = max(Decimal("0"), survival - marginal_pd)
-        ecl = sum((period.expected_loss for period in periods), Decimal("0")).quantize(
-            MONEY_QUANTUM, rounding=ROUND_HALF_EVEN
-        )
+        ecl = ecl.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
         scenario_weight = decimal_from(trajectory.weight, field="scenario_weight")
         contribution = (ecl * scenario_weight).quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN)
-        results.append(
-            ScenarioIntegral(
-                trajectory.scenario_id,
-                trajectory.kind,
-                scenario_weight,
-                tuple(periods),
-                ecl,
-                contribution,
+        if trajectory.kind == ScenarioKind.STRESS:
+            stress_ecl = ecl
+        else:
+            weighted_ecl += contribution
+        if detail != ResultDetail.TOTALS:
+            results.append(
+                ScenarioIntegral(
+                    trajectory.scenario_id,
+                    trajectory.kind,
+                    scenario_weight,
+                    tuple(periods),
+                    ecl,
+                    contribution,
+                )
             )
-        )
-    weighted_ecl = sum(
-        (result.weighted_contribution for result in results if result.kind != ScenarioKind.STRESS),
-        Decimal("0"),
-    ).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
-    stress_ecl = next(result.ecl for result in results if result.kind == ScenarioKind.STRESS)
+    weighted_ecl = weighted_ecl.quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
     return ProbabilityWeightedScenarioECL(
         tuple(results),
         weighted_ecl,
@@ -167,4 +206,5 @@ def calculate_probability_weighted_scenario_ecl(
         scenario_set.source_snapshot_hash,
         macro_policy.policy_version,
         macro_policy.sha256,
+        ResultDetail(detail),
     )
@@ -8,14 +8,27 @@ from decimal import ROUND_HALF_EVEN, Decimal
 from hashlib import sha256
 from pathlib import Path
 
+import numpy as np
+
 from ...domain.conventions import decimal_from, non_empty, rate
 from ...domain.exceptions import DomainValidationError
 from ...domain.scenarios import MacroTrajectoryPoint, MacroVariable, ScenarioKind, ScenarioSet
 from ...models.forward_looking import MacroRiskPolicy
 from .scenario_engine import (
+    RATE_QUANTUM,
     BaselineRiskPeriod,
     calculate_probability_weighted_scenario_ecl,
 )
+from .vectorized import (
+    INT64_MAX,
+    RATE_SCALE,
+    BaselineRiskBlock,
+    baseline_periods,
+    calculate_scenario_ecl_block,
+    integrate_scenario_trajectories,
+    scaled_units,
+    weighted_scenario_cents,
+)
 
 POLICY_PATH = (
     Path(__file__).resolve().parents[3] / "config" / "scenario_sensitivity" / "2026.07.1.json"
@@ -82,6 +95,36 @@ class ScenarioSensitivityReport:
     policy_hash: str
 
 
+@dataclass(frozen=True, slots=True)
+class SegmentSensitivity:
+    segment: str
+    contract_count: int
+    base_ecl: Decimal
+    probability_weighted_ecl: Decimal
+    delta_from_base: Decimal
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioSensitivityResult:
+    case_id: str
+    kind: str
+    probability_weighted_ecl: Decimal
+    delta_from_base: Decimal
+    segments: tuple[SegmentSensitivity, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class PortfolioSensitivityReport:
+    contract_count: int
+    base_ecl: Decimal
+    stress_ecl: Decimal
+    stress_delta: Decimal
+    results: tuple[PortfolioSensitivityResult, ...]
+    decimal_fallback_rows: int
+    policy_version: str
+    policy_hash: str
+
+
 def load_scenario_sensitivity_policy(path: Path = POLICY_PATH) -> ScenarioSensitivityPolicy:
     raw = path.read_bytes()
     document = json.loads(raw)
@@ -217,3 +260,153 @@ def run_scenario_sensitivities(
         sensitivity_policy.policy_version,
         sensitivity_policy.sha256,
     )
+
+
+def _scenario_weights(scenario_set: ScenarioSet) -> np.ndarray:
+    return np.asarray(
+        [
+            scaled_units(decimal_from(trajectory.weight, field="scenario_weight"), RATE_SCALE)
+            for trajectory in scenario_set.trajectories
+        ],
+        dtype=np.int64,
+    )
+
+
+def _weighted_portfolio_cents(
+    ecl_cents: np.ndarray, scenario_set: ScenarioSet, probabilistic: np.ndarray
+) -> np.ndarray:
+    """Weight exact scenario cents per row; rows beyond ``int64`` are weighted in Decimal."""
+    weights = _scenario_weights(scenario_set)
+    overflow = (ecl_cents > INT64_MAX // RATE_SCALE // len(weights)).any(axis=1)
+    weighted = weighted_scenario_cents(
+        np.where(overflow[:, None], 0, ecl_cents), weights, probabilistic
+    )
+    decimal_weights = [
+        decimal_from(trajectory.weight, field="scenario_weight")
+        for trajectory in scenario_set.trajectories
+    ]
+    for row in np.flatnonzero(overflow):
+        contributions = (
+            (Decimal(int(cents)) / 100 * weight).quantize(RATE_QUANTUM, rounding=ROUND_HALF_EVEN)
+            for cents, weight, included in zip(
+                ecl_cents[row], decimal_weights, probabilistic, strict=True
+            )
+            if included
+        )
+        total = sum(contributions, Decimal("0")).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
+        weighted[row] = scaled_units(total, 100)
+    return weighted
+
+
+def _money(cents: int) -> Decimal:
+    return (Decimal(cents) / 100).quantize(MONEY_QUANTUM)
+
+
+def _segment_totals(cents: np.ndarray, segment_index: np.ndarray, count: int) -> list[int]:
+    if len(cents) and int(np.abs(cents).max()) > INT64_MAX // len(cents):
+        totals = [0] * count
+        for index, value in zip(segment_index.tolist(), cents.tolist(), strict=True):
+            totals[index] += value
+        return totals
+    sums = np.zeros(count, dtype=np.int64)
+    np.add.at(sums, segment_index, cents)
+    return [int(value) for value in sums]
+
+
+def run_portfolio_sensitivities(
+    block: BaselineRiskBlock,
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+    sensitivity_policy: ScenarioSensitivityPolicy,
+) -> PortfolioSensitivityReport:
+    """Run every sensitivity case over a whole block, summing per contract and per segment.
+
+    Totals equal the sum of ``run_scenario_sensitivities`` per contract. Scenario
+    integrals are computed once: weight cases only reweight them, and a trajectory
+    shock integrates just the trajectories it changes in one batched pass.
+    """
+    base = calculate_scenario_ecl_block(block, scenario_set, macro_policy)
+    probabilistic = np.asarray(
+        [trajectory.kind != ScenarioKind.STRESS for trajectory in scenario_set.trajectories]
+    )
+    segment_names = tuple(sorted(set(block.segments)))
+    segment_index = np.asarray(
+        [segment_names.index(segment) for segment in block.segments], dtype=np.int64
+    )
+    counts = np.bincount(segment_index, minlength=len(segment_names)).tolist()
+    base_totals = _segment_totals(
+        base.probability_weighted_cents, segment_index, len(segment_names)
+    )
+    base_ecl = sum(base_totals)
+    fallback_rows = int(base.decimal_fallback.sum())
+
+    cases: list[tuple[str, str, np.ndarray]] = []
+    for case in sensitivity_policy.weight_cases:
+        derived_set = _apply_weights(scenario_set, case)
+        cases.append(
+            (
+                case.case_id,
+                "weight",
+                _weighted_portfolio_cents(base.scenario_ecl_cents, derived_set, probabilistic),
+            )
+        )
+    for shock in sensitivity_policy.trajectory_shocks:
+        derived_set = _apply_shock(scenario_set, shock)
+        columns = [
+            column
+            for column, trajectory in enumerate(scenario_set.trajectories)
+            if trajectory.scenario_id in shock.scenario_ids
+        ]
+        shocked, fallback = integrate_scenario_trajectories(
+            block, derived_set, columns, macro_policy
+        )
+        ecl_cents = base.scenario_ecl_cents.copy()
+        ecl_cents[:, columns] = shocked
+        for row in np.flatnonzero(fallback):
+            exact = calculate_probability_weighted_scenario_ecl(
+                baseline_periods(block, int(row)), derived_set, block.segments[row], macro_policy
+            )
+            ecl_cents[row] = [scaled_units(item.ecl, 100) for item in exact.scenario_results]
+        fallback_rows += int(fallback.sum())
+        cases.append(
+            (
+                shock.case_id,
+                "trajectory",
+                _weighted_portfolio_cents(ecl_cents, scenario_set, probabilistic),
+            )
+        )
+
+    results: list[PortfolioSensitivityResult] = []
+    for case_id, kind, weighted in cases:
+        totals = _segment_totals(weighted, segment_index, len(segment_names))
+        results.append(
+            PortfolioSensitivityResult(
+                case_id,
+                kind,
+                _money(sum(totals)),
+                _money(sum(totals) - base_ecl),
+                tuple(
+                    SegmentSensitivity(
+                        segment,
+                        count,
+                        _money(segment_base),
+                        _money(total),
+                        _money(total - segment_base),
+                    )
+                    for segment, count, segment_base, total in zip(
+                        segment_names, counts, base_totals, totals, strict=True
+                    )
+                ),
+            )
+        )
+    stress_ecl = sum(_segment_totals(base.stress_cents, segment_index, len(segment_names)))
+    return PortfolioSensitivityReport(
+        len(block.segments),
+        _money(base_ecl),
+        _money(stress_ecl),
+        _money(stress_ecl - base_ecl),
+        tuple(results),
+        fallback_rows,
+        sensitivity_policy.policy_version,
+        sensitivity_policy.sha256,
+    )
@@ -6,14 +6,15 @@ from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 
-from ...domain.conventions import DecimalInput, money, non_empty, rate
+from ...domain.conventions import DecimalInput, money, non_empty, prevalidated, rate
 from ...domain.exceptions import DomainValidationError
 from ...domain.scenarios import ScenarioSet
 from ...models.forward_looking import MacroRiskPolicy
-from ..discounting import effective_interest_discount_factor
+from ..discounting import discount_curve
 from .scenario_engine import (
     BaselineRiskPeriod,
     ProbabilityWeightedScenarioECL,
+    ResultDetail,
     calculate_probability_weighted_scenario_ecl,
 )
 
@@ -79,21 +80,29 @@ def calculate_stage1_ecl(
     contract: Stage1ContractInput,
     scenario_set: ScenarioSet,
     macro_policy: MacroRiskPolicy,
+    *,
+    detail: ResultDetail = ResultDetail.PERIODS,
 ) -> Stage1ECLResult:
+    # Periods and curve factors are already normalized; skip re-validating them.
     baseline = tuple(
-        BaselineRiskPeriod(
+        prevalidated(
+            BaselineRiskPeriod,
             period.reference_date,
             period.conditional_hazard,
             period.lifetime_lgd,
             period.drawn_ead,
             period.undrawn_amount,
             period.ccf,
-            effective_interest_discount_factor(contract.original_effective_interest_rate, month),
+            discount_factor,
+        )
+        for period, discount_factor in zip(
+            contract.periods,
+            discount_curve(contract.original_effective_interest_rate, len(contract.periods)),
+            strict=True,
         )
-        for month, period in enumerate(contract.periods, start=1)
     )
     result = calculate_probability_weighted_scenario_ecl(
-        baseline, scenario_set, contract.segment, macro_policy
+        baseline, scenario_set, contract.segment, macro_policy, detail=detail
     )
     return Stage1ECLResult(
         contract.contract_id,
@@ -7,14 +7,23 @@ from datetime import date
 from decimal import ROUND_HALF_EVEN, Decimal
 from enum import StrEnum
 
-from ...domain.conventions import DecimalInput, decimal_from, money, non_empty, rate
+from ...domain.conventions import (
+    MONEY_QUANTUM,
+    DecimalInput,
+    decimal_from,
+    money,
+    non_empty,
+    prevalidated,
+    rate,
+)
 from ...domain.exceptions import DomainValidationError
 from ...domain.scenarios import ScenarioSet
 from ...models.forward_looking import MacroRiskPolicy
-from ..discounting import effective_interest_discount_factor
+from ..discounting import discount_curve
 from .scenario_engine import (
     BaselineRiskPeriod,
     ProbabilityWeightedScenarioECL,
+    ResultDetail,
     calculate_probability_weighted_scenario_ecl,
 )
 
@@ -117,39 +126,50 @@ def calculate_stage2_ecl(
     contract: Stage2ContractInput,
     scenario_set: ScenarioSet,
     macro_policy: MacroRiskPolicy,
+    *,
+    detail: ResultDetail = ResultDetail.PERIODS,
 ) -> Stage2ECLResult:
     behavioral_survival = Decimal("1")
     baseline: list[BaselineRiskPeriod] = []
+    discount_factors = discount_curve(
+        contract.original_effective_interest_rate, len(contract.periods)
+    )
+    if discount_factors[-1] == 0:
+        raise DomainValidationError("discount_factor must be greater than zero")
+    extension_probability = decimal_from(
+        contract.expected_extension_probability, field="expected_extension_probability"
+    )
     for month, period in enumerate(contract.periods, start=1):
         extension_weight = (
-            decimal_from(
-                contract.expected_extension_probability, field="expected_extension_probability"
-            )
-            if month > contract.contractual_months
-            else Decimal("1")
+            extension_probability if month > contract.contractual_months else Decimal("1")
         )
         exposure_weight = (behavioral_survival * extension_weight).quantize(
             RATE_QUANTUM, rounding=ROUND_HALF_EVEN
         )
+        # Periods and curve factors are already normalized; only the weighted
+        # exposures need rounding to cents, as ``money`` would do.
         baseline.append(
-            BaselineRiskPeriod(
+            prevalidated(
+                BaselineRiskPeriod,
                 period.reference_date,
                 period.conditional_hazard,
                 period.lifetime_lgd,
-                decimal_from(period.scheduled_drawn_ead, field="scheduled_drawn_ead")
-                * exposure_weight,
-                decimal_from(period.undrawn_amount, field="undrawn_amount") * exposure_weight,
+                (
+                    decimal_from(period.scheduled_drawn_ead, field="scheduled_drawn_ead")
+                    * exposure_weight
+                ).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN),
+                (
+                    decimal_from(period.undrawn_amount, field="undrawn_amount") * exposure_weight
+                ).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN),
                 period.ccf,
-                effective_interest_discount_factor(
-                    contract.original_effective_interest_rate, month
-                ),
+                discount_factors[month - 1],
             )
         )
         behavioral_survival *= Decimal("1") - decimal_from(
             period.expected_prepayment_rate, field="expected_prepayment_rate"
         )
     scenario_ecl = calculate_probability_weighted_scenario_ecl(
-        tuple(baseline), scenario_set, contract.segment, macro_policy
+        tuple(baseline), scenario_set, contract.segment, macro_policy, detail=detail
     )
     return Stage2ECLResult(
         contract.contract_id,
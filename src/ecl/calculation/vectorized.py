@@ -0,0 +1,364 @@
+"""Batched scenario ECL over aligned (contracts x periods) integer arrays.
+
+Rates are carried as ``int64`` units of ``0.00000001`` and money as ``int64``
+cents, so every rate quantization of the Decimal engine (hazard, marginal PD,
+LGD, CCF and survival) is reproduced exactly with integer ``ROUND_HALF_EVEN``.
+Only the two monetary products (adjusted EAD and discounted loss) are evaluated
+in ``float64``. Their rounding error is bounded by a few ulps, so a cell whose
+value lies within ``FLOAT_TIE_TOLERANCE`` (relative) of a half-cent, or beyond
+the exact ``float64`` integer range, is ambiguous: the whole contract row is
+then recomputed with ``calculate_probability_weighted_scenario_ecl`` and the
+Decimal figures replace the vectorized ones. Rows whose scenario ECL cannot be
+weighted inside ``int64`` take the same fallback.
+
+``INT64_MAX``, ``scaled_units``, ``round_half_even``, ``baseline_periods``,
+``integrate_scenario_trajectories`` and ``weighted_scenario_cents`` are the
+integer helpers shared with the sensitivity engine and the Stage 3 kernel.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+
+from ...domain.conventions import decimal_from
+from ...domain.exceptions import DomainValidationError
+from ...domain.scenarios import ScenarioKind, ScenarioSet
+from ...models.forward_looking import MacroRiskPolicy, compile_macro_multiplier_table
+from ..discounting import DEFAULT_DISCOUNT_CURVES
+from .scenario_engine import BaselineRiskPeriod, calculate_probability_weighted_scenario_ecl
+from .stage1 import Stage1ContractInput
+
+RATE_SCALE = 100_000_000
+FLOAT_TIE_TOLERANCE = float(np.finfo(np.float64).eps) * 64
+FLOAT_EXACT_LIMIT = float(2**52)
+INT64_MAX = int(np.iinfo(np.int64).max)
+_RATE_FIELDS = ("conditional_hazard", "lgd", "ccf", "discount_factor")
+_MONEY_FIELDS = ("drawn_ead", "undrawn_amount")
+
+
+@dataclass(frozen=True, slots=True)
+class BaselineRiskBlock:
+    """Baseline curves of many contracts padded to a common period axis.
+
+    Rate arrays hold ``int64`` units of ``0.00000001`` and money arrays hold
+    ``int64`` cents. Cells at or beyond ``period_counts`` are padding and ignored.
+    """
+
+    reference_dates: tuple[date, ...]
+    segments: tuple[str, ...]
+    period_counts: np.ndarray
+    conditional_hazard: np.ndarray
+    lgd: np.ndarray
+    drawn_ead: np.ndarray
+    undrawn_amount: np.ndarray
+    ccf: np.ndarray
+    discount_factor: np.ndarray
+
+    def __post_init__(self) -> None:
+        shape = (len(self.segments), len(self.reference_dates))
+        if not self.segments or not self.reference_dates:
+            raise DomainValidationError("baseline risk block must not be empty")
+        counts = np.asarray(self.period_counts, dtype=np.int64)
+        if counts.shape != shape[:1] or counts.min() < 1 or counts.max() > shape[1]:
+            raise DomainValidationError("baseline period counts must fit the block horizon")
+        object.__setattr__(self, "period_counts", counts)
+        valid = np.arange(shape[1]) < counts[:, None]
+        for field in (*_RATE_FIELDS, *_MONEY_FIELDS):
+            values = np.asarray(getattr(self, field), dtype=np.int64)
+            if values.shape != shape:
+                raise DomainValidationError(f"{field} block must have shape {shape}")
+            values = np.where(valid, values, 0)
+            if values.min() < 0:
+                raise DomainValidationError(f"{field} must be non-negative")
+            if field in _RATE_FIELDS and values.max() > RATE_SCALE:
+                raise DomainValidationError(f"{field} must be between 0 and 1")
+            object.__setattr__(self, field, values)
+        if (self.discount_factor[valid] == 0).any():
+            raise DomainValidationError("discount_factor must be greater than zero")
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioECLTotals:
+    """Per-scenario and weighted totals of one curve without period detail."""
+
+    scenario_ecl: tuple[tuple[str, Decimal], ...]
+    probability_weighted_ecl: Decimal
+    stress_ecl: Decimal
+    scenario_version: str
+    scenario_source_hash: str
+    macro_policy_version: str
+    macro_policy_hash: str
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioECLBlockResult:
+    scenario_ids: tuple[str, ...]
+    scenario_ecl_cents: np.ndarray
+    probability_weighted_cents: np.ndarray
+    stress_cents: np.ndarray
+    decimal_fallback: np.ndarray
+    scenario_version: str
+    scenario_source_hash: str
+    macro_policy_version: str
+    macro_policy_hash: str
+
+    @property
+    def decimal_fallback_rows(self) -> int:
+        return int(self.decimal_fallback.sum())
+
+
+def scaled_units(value: Decimal, scale: int) -> int:
+    """Return ``value`` as integer units of ``1 / scale``, truncated toward zero."""
+    return int(value * scale)
+
+
+def round_half_even(numerator: np.ndarray, denominator: int) -> np.ndarray:
+    """Divide and round half-even; ``object`` arrays of Python ints are exact at any size."""
+    if numerator.dtype == object:
+        quotient, remainder = numerator // denominator, numerator % denominator
+    else:
+        quotient, remainder = np.divmod(numerator, denominator)
+    twice = remainder * 2
+    rounded: np.ndarray = quotient + (
+        (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+    )
+    return rounded
+
+
+def _round_cents(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Round float cents half-even and flag values too close to a half-cent to trust."""
+    distance = np.abs(values - np.floor(values) - 0.5)
+    ambiguous = (distance <= values * FLOAT_TIE_TOLERANCE) | (values >= FLOAT_EXACT_LIMIT)
+    return np.rint(values).astype(np.int64), ambiguous
+
+
+def _multiplier_table(
+    segments: Sequence[str],
+    scenario_set: ScenarioSet,
+    columns: Sequence[int],
+    macro_policy: MacroRiskPolicy,
+    horizon: int,
+) -> np.ndarray:
+    """Return (segment, scenario, period, component) multipliers in rate units."""
+    compiled = compile_macro_multiplier_table(scenario_set, macro_policy)
+    return np.stack([compiled.units(segment)[list(columns), :horizon] for segment in segments])
+
+
+def baseline_periods(block: BaselineRiskBlock, row: int) -> tuple[BaselineRiskPeriod, ...]:
+    """Rebuild the Decimal baseline of one block row for the Decimal engine fallback."""
+
+    def rate_value(field: str, column: int) -> Decimal:
+        return Decimal(int(getattr(block, field)[row, column])).scaleb(-8)
+
+    def money_value(field: str, column: int) -> Decimal:
+        return Decimal(int(getattr(block, field)[row, column])).scaleb(-2)
+
+    return tuple(
+        BaselineRiskPeriod(
+            block.reference_dates[column],
+            rate_value("conditional_hazard", column),
+            rate_value("lgd", column),
+            money_value("drawn_ead", column),
+            money_value("undrawn_amount", column),
+            rate_value("ccf", column),
+            rate_value("discount_factor", column),
+        )
+        for column in range(int(block.period_counts[row]))
+    )
+
+
+def integrate_scenario_trajectories(
+    block: BaselineRiskBlock,
+    scenario_set: ScenarioSet,
+    columns: Sequence[int],
+    macro_policy: MacroRiskPolicy,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return (rows, columns) ECL cents and the rows whose float products are ambiguous.
+
+    Each trajectory is integrated independently, so a caller may pass any subset
+    of the set's columns; ambiguous rows must be recomputed with the Decimal engine.
+    """
+    horizon = len(block.reference_dates)
+    segment_names = tuple(sorted(set(block.segments)))
+    segment_index = np.asarray(
+        [segment_names.index(segment) for segment in block.segments], dtype=np.int64
+    )
+    table = _multiplier_table(segment_names, scenario_set, columns, macro_policy, horizon)
+    if int(table.max()) > INT64_MAX // RATE_SCALE:
+        raise OverflowError("macro multipliers exceed safe int64 rate range")
+    factors = table[segment_index]
+    rows = len(block.segments)
+    scenarios = len(columns)
+    valid = np.arange(horizon) < block.period_counts[:, None]
+
+    survival = np.full((rows, scenarios), RATE_SCALE, dtype=np.int64)
+    ecl_cents = np.zeros((rows, scenarios), dtype=np.int64)
+    fallback = np.zeros(rows, dtype=bool)
+    for column in range(horizon):
+        pd_factor, lgd_factor, ead_factor, ccf_factor = (
+            factors[:, :, column, component] for component in range(4)
+        )
+        hazard = np.minimum(
+            RATE_SCALE,
+            round_half_even(block.conditional_hazard[:, column, None] * pd_factor, RATE_SCALE),
+        )
+        marginal_pd = round_half_even(survival * hazard, RATE_SCALE)
+        lgd = np.minimum(
+            RATE_SCALE, round_half_even(block.lgd[:, column, None] * lgd_factor, RATE_SCALE)
+        )
+        ccf = np.minimum(
+            RATE_SCALE, round_half_even(block.ccf[:, column, None] * ccf_factor, RATE_SCALE)
+        )
+        ead, ead_ambiguous = _round_cents(
+            (
+                block.drawn_ead[:, column, None].astype(np.float64) * ead_factor
+                + block.undrawn_amount[:, column, None].astype(np.float64) * ccf
+            )
+            / RATE_SCALE
+        )
+        loss, loss_ambiguous = _round_cents(
+            (marginal_pd * lgd).astype(np.float64)
+            * ead.astype(np.float64)
+            * block.discount_factor[:, column, None].astype(np.float64)
+            / float(RATE_SCALE) ** 3
+        )
+        active = valid[:, column, None]
+        ecl_cents += np.where(active, loss, 0)
+        fallback |= (active & (ead_ambiguous | loss_ambiguous)).any(axis=1)
+        survival = np.maximum(0, survival - np.where(active, marginal_pd, 0))
+
+    return ecl_cents, fallback
+
+
+def weighted_scenario_cents(
+    ecl_cents: np.ndarray, weights: np.ndarray, probabilistic: np.ndarray
+) -> np.ndarray:
+    """Weight scenario cents as the Decimal engine does: contributions to 1e-8, total to cents.
+
+    Callers keep ``ecl_cents * weights`` inside ``int64``.
+    """
+    contributions = round_half_even(ecl_cents * weights, 100)
+    weighted: np.ndarray = round_half_even(contributions[:, probabilistic].sum(axis=1), 1_000_000)
+    return weighted
+
+
+def calculate_scenario_ecl_block(
+    block: BaselineRiskBlock,
+    scenario_set: ScenarioSet,
+    macro_policy: MacroRiskPolicy,
+) -> ScenarioECLBlockResult:
+    """Integrate every scenario for every row of ``block`` in one batched pass."""
+    horizon = len(block.reference_dates)
+    scenario_dates = tuple(
+        point.reference_date for point in scenario_set.trajectories[0].periods[:horizon]
+    )
+    if horizon > len(scenario_set.trajectories[0].periods):
+        raise DomainValidationError("baseline risk curve exceeds scenario horizon")
+    if block.reference_dates != scenario_dates:
+        raise DomainValidationError("baseline dates must align with scenario periods")
+
+    ecl_cents, fallback = integrate_scenario_trajectories(
+        block, scenario_set, range(len(scenario_set.trajectories)), macro_policy
+    )
+    scenarios = len(scenario_set.trajectories)
+    kinds = [trajectory.kind for trajectory in scenario_set.trajectories]
+    weights = np.asarray(
+        [
+            scaled_units(decimal_from(trajectory.weight, field="scenario_weight"), RATE_SCALE)
+            for trajectory in scenario_set.trajectories
+        ],
+        dtype=np.int64,
+    )
+    fallback |= (ecl_cents > INT64_MAX // RATE_SCALE // scenarios).any(axis=1)
+    safe_ecl = np.where(fallback[:, None], 0, ecl_cents)
+    probabilistic = np.asarray([kind != ScenarioKind.STRESS for kind in kinds])
+    weighted = weighted_scenario_cents(safe_ecl, weights, probabilistic)
+    stress = ecl_cents[:, kinds.index(ScenarioKind.STRESS)].copy()
+
+    for row in np.flatnonzero(fallback):
+        exact = calculate_probability_weighted_scenario_ecl(
+            baseline_periods(block, int(row)),
+            scenario_set,
+            block.segments[row],
+            macro_policy,
+        )
+        ecl_cents[row] = [scaled_units(item.ecl, 100) for item in exact.scenario_results]
+        weighted[row] = scaled_units(exact.probability_weighted_ecl, 100)
+        stress[row] = scaled_units(exact.stress_ecl, 100)
+
+    return ScenarioECLBlockResult(
+        tuple(trajectory.scenario_id for trajectory in scenario_set.trajectories),
+        ecl_cents,
+        weighted,
+        stress,
+        fallback,
+        scenario_set.version,
+        scenario_set.source_snapshot_hash,
+        macro_policy.policy_version,
+        macro_policy.sha256,
+    )
+
+
+def scenario_ecl_block_totals(result: ScenarioECLBlockResult) -> tuple[ScenarioECLTotals, ...]:
+    return tuple(
+        ScenarioECLTotals(
+            tuple(
+                (scenario_id, Decimal(int(cents)) / 100)
+                for scenario_id, cents in zip(result.scenario_ids, scenario_row, strict=True)
+            ),
+            Decimal(int(weighted)) / 100,
+            Decimal(int(stress)) / 100,
+            result.scenario_version,
+            result.scenario_source_hash,
+            result.macro_policy_version,
+            result.macro_policy_hash,
+        )
+        for scenario_row, weighted, stress in zip(
+            result.scenario_ecl_cents,
+            result.probability_weighted_cents,
+            result.stress_cents,
+            strict=True,
+        )
+    )
+
+
+def stage1_risk_block(contracts: Sequence[Stage1ContractInput]) -> BaselineRiskBlock:
+    """Pack validated Stage 1 contracts into one block sharing a period axis."""
+    if not contracts:
+        raise DomainValidationError("baseline risk block must not be empty")
+    longest = max(contracts, key=lambda contract: len(contract.periods))
+    reference_dates = tuple(period.reference_date for period in longest.periods)
+    horizon = len(reference_dates)
+    columns: dict[str, list[list[int]]] = {field: [] for field in (*_RATE_FIELDS, *_MONEY_FIELDS)}
+    for contract in contracts:
+        periods = contract.periods
+        if tuple(period.reference_date for period in periods) != reference_dates[: len(periods)]:
+            raise DomainValidationError("baseline dates must align with scenario periods")
+        padding = [0] * (horizon - len(periods))
+        columns["discount_factor"].append(
+            DEFAULT_DISCOUNT_CURVES.units(
+                contract.original_effective_interest_rate, len(periods)
+            ).tolist()
+            + padding
+        )
+        for field, attribute, scale in (
+            ("conditional_hazard", "conditional_hazard", RATE_SCALE),
+            ("lgd", "lifetime_lgd", RATE_SCALE),
+            ("ccf", "ccf", RATE_SCALE),
+            ("drawn_ead", "drawn_ead", 100),
+            ("undrawn_amount", "undrawn_amount", 100),
+        ):
+            columns[field].append(
+                [scaled_units(getattr(period, attribute), scale) for period in periods] + padding
+            )
+    return BaselineRiskBlock(
+        reference_dates,
+        tuple(contract.segment for contract in contracts),
+        np.asarray([len(contract.periods) for contract in contracts], dtype=np.int64),
+        **{field: np.asarray(values, dtype=np.int64) for field, values in columns.items()},
+    )
@@ -1,5 +1,13 @@
 """Effective-interest-rate discounting."""
 
+from .curves import DEFAULT_DISCOUNT_CURVES, DiscountCurveCache, DiscountCurveStats, discount_curve
 from .effective_interest import effective_interest_discount_factor, present_value
 
-__all__ = ["effective_interest_discount_factor", "present_value"]
+__all__ = [
+    "DEFAULT_DISCOUNT_CURVES",
+    "DiscountCurveCache",
+    "DiscountCurveStats",
+    "discount_curve",
+    "effective_interest_discount_factor",
+    "present_value",
+]
@@ -0,0 +1,120 @@
+"""Memoized monthly discount curves keyed by quantized original EIR."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from decimal import Decimal
+from threading import Lock
+
+import numpy as np
+
+from ...domain.conventions import DecimalInput, rate
+from ...domain.exceptions import DomainValidationError
+from .effective_interest import QUANTUM, effective_interest_discount_factor
+
+_UNITS = int(1 / QUANTUM)
+
+
+@dataclass(frozen=True, slots=True)
+class DiscountCurveStats:
+    hits: int
+    misses: int
+    evictions: int
+    curves: int
+    cached_months: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _Curve:
+    __slots__ = ("factors", "units")
+
+    def __init__(self, factors: tuple[Decimal, ...]) -> None:
+        self.factors = factors
+        self.units = np.asarray([int(factor * _UNITS) for factor in factors], dtype=np.int64)
+        self.units.setflags(write=False)
+
+
+class DiscountCurveCache:
+    """Bounded LRU of monthly factor vectors, one per quantized annual EIR.
+
+    Month ``m`` of a curve equals ``effective_interest_discount_factor(eir, m)``.
+    A curve is extended when a longer horizon is requested. At most
+    ``max_curves`` rates and ``max_months`` months per rate are kept; longer
+    horizons are computed without being stored.
+    """
+
+    def __init__(self, *, max_curves: int = 512, max_months: int = 600) -> None:
+        if max_curves <= 0 or max_months <= 0:
+            raise ValueError("discount curve cache bounds must be positive")
+        self.max_curves = max_curves
+        self.max_months = max_months
+        self._curves: OrderedDict[Decimal, _Curve] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _curve(self, annual_eir: DecimalInput, months: int) -> _Curve:
+        if months <= 0:
+            raise DomainValidationError("discount curve requires at least one month")
+        eir = rate(annual_eir, field="original_annual_eir")
+        with self._lock:
+            curve = self._curves.get(eir)
+            if curve is not None and len(curve.factors) >= months:
+                self._curves.move_to_end(eir)
+                self._hits += 1
+                return curve
+            self._misses += 1
+            known = curve.factors if curve is not None else ()
+            curve = _Curve(
+                known
+                + tuple(
+                    effective_interest_discount_factor(eir, month)
+                    for month in range(len(known) + 1, months + 1)
+                )
+            )
+            if months > self.max_months:
+                return curve
+            self._curves[eir] = curve
+            self._curves.move_to_end(eir)
+            while len(self._curves) > self.max_curves:
+                self._curves.popitem(last=False)
+                self._evictions += 1
+            return curve
+
+    def factors(self, annual_eir: DecimalInput, months: int) -> tuple[Decimal, ...]:
+        """Return the factors for months ``1..months``."""
+        return self._curve(annual_eir, months).factors[:months]
+
+    def units(self, annual_eir: DecimalInput, months: int) -> np.ndarray:
+        """Return a read-only ``int64`` view of the factors in units of ``0.00000001``."""
+        units: np.ndarray = self._curve(annual_eir, months).units[:months]
+        return units
+
+    def stats(self) -> DiscountCurveStats:
+        with self._lock:
+            return DiscountCurveStats(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._curves),
+                sum(len(curve.factors) for curve in self._curves.values()),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._curves.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+DEFAULT_DISCOUNT_CURVES = DiscountCurveCache()
+
+
+def discount_curve(annual_eir: DecimalInput, months: int) -> tuple[Decimal, ...]:
+    """Factors for months ``1..months`` from the process-wide curve cache."""
+    return DEFAULT_DISCOUNT_CURVES.factors(annual_eir, months)
@@ -8,14 +8,28 @@ from .cash_shortfall import (
     Stage3ScenarioProjection,
     Stage3ScenarioResult,
     calculate_stage3_ecl,
+    validate_stage3_scenarios,
+)
+from .vectorized import (
+    Stage3CashFlowBlock,
+    Stage3ECLBlockResult,
+    calculate_stage3_ecl_block,
+    stage3_block_totals,
+    stage3_cash_flow_block,
 )
 
 __all__ = [
+    "Stage3CashFlowBlock",
     "Stage3CashFlowPeriod",
     "Stage3ContractInput",
+    "Stage3ECLBlockResult",
     "Stage3ECLResult",
     "Stage3MeasuredPeriod",
     "Stage3ScenarioProjection",
     "Stage3ScenarioResult",
     "calculate_stage3_ecl",
+    "calculate_stage3_ecl_block",
+    "stage3_block_totals",
+    "stage3_cash_flow_block",
+    "validate_stage3_scenarios",
 ]
@@ -9,7 +9,7 @@ from decimal import ROUND_HALF_EVEN, Decimal
 from ...domain.conventions import DecimalInput, decimal_from, money, non_empty, rate
 from ...domain.exceptions import DomainValidationError
 from ...domain.scenarios import ScenarioKind, ScenarioSet
-from ..discounting import effective_interest_discount_factor
+from ..discounting import discount_curve
 
 MONEY_QUANTUM = Decimal("0.01")
 CONTRIBUTION_QUANTUM = Decimal("0.00000001")
@@ -134,7 +134,11 @@ class Stage3ECLResult:
     scenario_source_hash: str
 
 
-def _validate_scenarios(contract: Stage3ContractInput, scenario_set: ScenarioSet) -> None:
+def validate_stage3_scenarios(contract: Stage3ContractInput, scenario_set: ScenarioSet) -> None:
+    """Require one projection per scenario, shared cash-flow dates and dates after reporting.
+
+    Both the Decimal calculation and ``stage3_cash_flow_block`` apply it.
+    """
     expected_ids = {trajectory.scenario_id for trajectory in scenario_set.trajectories}
     actual_ids = [projection.scenario_id for projection in contract.scenario_projections]
     if set(actual_ids) != expected_ids or len(actual_ids) != len(set(actual_ids)):
@@ -153,8 +157,12 @@ def _validate_scenarios(contract: Stage3ContractInput, scenario_set: ScenarioSet
 def calculate_stage3_ecl(
     contract: Stage3ContractInput, scenario_set: ScenarioSet
 ) -> Stage3ECLResult:
-    _validate_scenarios(contract, scenario_set)
+    validate_stage3_scenarios(contract, scenario_set)
     trajectories = {item.scenario_id: item for item in scenario_set.trajectories}
+    discount_factors = discount_curve(
+        contract.original_effective_interest_rate,
+        len(contract.scenario_projections[0].periods),
+    )
     results: list[Stage3ScenarioResult] = []
     for projection in contract.scenario_projections:
         trajectory = trajectories[projection.scenario_id]
@@ -176,9 +184,7 @@ def calculate_stage3_ecl(
                 - expected_inflows
                 + costs
             ).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
-            discount = effective_interest_discount_factor(
-                contract.original_effective_interest_rate, month
-            )
+            discount = discount_factors[month - 1]
             discounted = (shortfall * discount).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
             periods.append(
                 Stage3MeasuredPeriod(
@@ -0,0 +1,298 @@
+"""Batched Stage 3 cash-shortfall measurement over (contracts x scenarios x months) arrays.
+
+Every Stage 3 quantity is a sum of cents or a cents-by-rate product, so the
+Decimal engine is reproduced exactly with integer ``ROUND_HALF_EVEN``: cash
+shortfalls are integer cents, discount factors are ``int64`` units of
+``0.00000001`` and each discounted shortfall is one exact integer division.
+Discount factors come from the shared curve cache, once per distinct EIR. Rows
+whose products would not fit ``int64`` are evaluated on Python integers with
+the same arithmetic instead of falling back to Decimal objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import Decimal
+
+import numpy as np
+
+from ...domain.conventions import decimal_from
+from ...domain.exceptions import DomainValidationError
+from ...domain.scenarios import ScenarioKind, ScenarioSet
+from ..calculation.vectorized import (
+    INT64_MAX,
+    RATE_SCALE,
+    ScenarioECLTotals,
+    round_half_even,
+    scaled_units,
+    weighted_scenario_cents,
+)
+from ..discounting import DEFAULT_DISCOUNT_CURVES
+from .cash_shortfall import Stage3ContractInput, validate_stage3_scenarios
+
+_CASH_FLOW_FIELDS = (
+    "contractual_cash_flow",
+    "expected_cash_inflows",
+    "collection_costs",
+    "writeoff_amount",
+)
+_PACKED_FIELDS = (
+    ("contractual_cash_flow", ("contractual_cash_flow",)),
+    (
+        "expected_cash_inflows",
+        (
+            "expected_borrower_receipt",
+            "unsecured_recovery",
+            "collateral_recovery",
+            "guarantee_recovery",
+            "post_writeoff_recovery",
+        ),
+    ),
+    ("collection_costs", ("collection_costs",)),
+    ("writeoff_amount", ("writeoff_amount",)),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Stage3CashFlowBlock:
+    """Scenario projections of many Stage 3 contracts padded to a common month axis.
+
+    Cash-flow arrays have shape ``(contracts, scenarios, months)`` and hold
+    ``int64`` cents; ``expected_cash_inflows`` is the borrower receipt plus the
+    four recovery components. Month index ``m`` is discounted for ``m + 1``
+    months at ``original_effective_interest_rate`` (``int64`` units of
+    ``0.00000001``). Cells at or beyond ``period_counts`` are padding and ignored.
+    Projection rules checked by ``Stage3ScenarioProjection`` (ordered dates,
+    post-write-off recoveries) are the caller's responsibility when the arrays
+    are built directly.
+    """
+
+    contract_ids: tuple[str, ...]
+    scenario_ids: tuple[str, ...]
+    period_counts: np.ndarray
+    original_effective_interest_rate: np.ndarray
+    gross_carrying_amount: np.ndarray
+    opening_loss_allowance: np.ndarray
+    contractual_cash_flow: np.ndarray
+    expected_cash_inflows: np.ndarray
+    collection_costs: np.ndarray
+    writeoff_amount: np.ndarray
+    cure_event: np.ndarray
+
+    def __post_init__(self) -> None:
+        if not self.contract_ids or not self.scenario_ids:
+            raise DomainValidationError("Stage 3 cash-flow block must not be empty")
+        if len(self.scenario_ids) != len(set(self.scenario_ids)):
+            raise DomainValidationError("Stage 3 block scenario ids must be unique")
+        rows = len(self.contract_ids)
+        counts = np.asarray(self.period_counts, dtype=np.int64)
+        cure = np.asarray(self.cure_event, dtype=bool)
+        if cure.ndim != 3 or cure.shape[:2] != (rows, len(self.scenario_ids)):
+            raise DomainValidationError("cure_event block must be (contracts, scenarios, months)")
+        shape = cure.shape
+        if counts.shape != (rows,) or counts.min() < 1 or counts.max() > shape[2]:
+            raise DomainValidationError("Stage 3 period counts must fit the block horizon")
+        valid = (np.arange(shape[2]) < counts[:, None])[:, None, :]
+        for field in _CASH_FLOW_FIELDS:
+            values = np.asarray(getattr(self, field), dtype=np.int64)
+            if values.shape != shape:
+                raise DomainValidationError(f"{field} block must have shape {shape}")
+            values = np.where(valid, values, 0)
+            if values.min() < 0:
+                raise DomainValidationError(f"{field} must be non-negative")
+            object.__setattr__(self, field, values)
+        cure = cure & valid
+        if (cure.sum(axis=2) > 1).any():
+            raise DomainValidationError("Stage 3 scenario permits at most one cure event")
+        eir = np.asarray(self.original_effective_interest_rate, dtype=np.int64)
+        gross = np.asarray(self.gross_carrying_amount, dtype=np.int64)
+        allowance = np.asarray(self.opening_loss_allowance, dtype=np.int64)
+        if eir.shape != (rows,) or gross.shape != (rows,) or allowance.shape != (rows,):
+            raise DomainValidationError("Stage 3 contract arrays must have one value per row")
+        if eir.min() < 0 or eir.max() > RATE_SCALE:
+            raise DomainValidationError("original_effective_interest_rate must be between 0 and 1")
+        if allowance.min() < 0 or (allowance > gross).any():
+            raise DomainValidationError(
+                "opening loss allowance cannot exceed gross carrying amount"
+            )
+        object.__setattr__(self, "period_counts", counts)
+        object.__setattr__(self, "cure_event", cure)
+        object.__setattr__(self, "original_effective_interest_rate", eir)
+        object.__setattr__(self, "gross_carrying_amount", gross)
+        object.__setattr__(self, "opening_loss_allowance", allowance)
+
+
+@dataclass(frozen=True, slots=True)
+class Stage3ECLBlockResult:
+    """Cent results per contract and scenario; period arrays only when detail is requested."""
+
+    contract_ids: tuple[str, ...]
+    scenario_ids: tuple[str, ...]
+    scenario_ecl_cents: np.ndarray
+    probability_weighted_cents: np.ndarray
+    stress_cents: np.ndarray
+    writeoff_cents: np.ndarray
+    cured: np.ndarray
+    net_carrying_cents: np.ndarray
+    monthly_interest_cents: np.ndarray
+    scenario_version: str
+    scenario_source_hash: str
+    discount_factor: np.ndarray | None = None
+    cash_shortfall_cents: np.ndarray | None = None
+    discounted_cash_shortfall_cents: np.ndarray | None = None
+
+    @property
+    def total_writeoff_cents(self) -> np.ndarray:
+        """Write-off cents per scenario summed over every contract."""
+        totals: np.ndarray = self.writeoff_cents.sum(axis=0)
+        return totals
+
+
+def stage3_cash_flow_block(
+    contracts: Sequence[Stage3ContractInput], scenario_set: ScenarioSet
+) -> Stage3CashFlowBlock:
+    """Pack validated contracts, ordering projections as the scenario set does."""
+    if not contracts:
+        raise DomainValidationError("Stage 3 cash-flow block must not be empty")
+    for contract in contracts:
+        validate_stage3_scenarios(contract, scenario_set)
+    scenario_ids = tuple(trajectory.scenario_id for trajectory in scenario_set.trajectories)
+    counts = [len(contract.scenario_projections[0].periods) for contract in contracts]
+    shape = (len(contracts), len(scenario_ids), max(counts))
+    columns = {field: np.zeros(shape, dtype=np.int64) for field in _CASH_FLOW_FIELDS}
+    cure = np.zeros(shape, dtype=bool)
+    for row, contract in enumerate(contracts):
+        projections = {item.scenario_id: item for item in contract.scenario_projections}
+        for column, scenario_id in enumerate(scenario_ids):
+            periods = projections[scenario_id].periods
+            months = len(periods)
+            for field, attributes in _PACKED_FIELDS:
+                columns[field][row, column, :months] = [
+                    sum(scaled_units(getattr(period, attribute), 100) for attribute in attributes)
+                    for period in periods
+                ]
+            cure[row, column, :months] = [period.cure_event for period in periods]
+    contract_columns = {
+        attribute: np.asarray(
+            [scaled_units(getattr(contract, attribute), scale) for contract in contracts],
+            dtype=np.int64,
+        )
+        for attribute, scale in (
+            ("original_effective_interest_rate", RATE_SCALE),
+            ("gross_carrying_amount", 100),
+            ("opening_loss_allowance", 100),
+        )
+    }
+    return Stage3CashFlowBlock(
+        tuple(contract.contract_id for contract in contracts),
+        scenario_ids,
+        np.asarray(counts, dtype=np.int64),
+        cure_event=cure,
+        **contract_columns,
+        **columns,
+    )
+
+
+def _discount_factor_grid(eir_units: np.ndarray, horizon: int) -> np.ndarray:
+    """Return (rows, months) discount factors, looking each distinct EIR up once."""
+    distinct, inverse = np.unique(eir_units, return_inverse=True)
+    table = np.stack(
+        [DEFAULT_DISCOUNT_CURVES.units(Decimal(int(eir)) / RATE_SCALE, horizon) for eir in distinct]
+    )
+    grid: np.ndarray = table[inverse.reshape(-1)]
+    return grid
+
+
+def calculate_stage3_ecl_block(
+    block: Stage3CashFlowBlock, scenario_set: ScenarioSet, *, detail: bool = False
+) -> Stage3ECLBlockResult:
+    """Measure every contract and scenario of ``block`` to the cent in one batched pass."""
+    trajectories = {trajectory.scenario_id: trajectory for trajectory in scenario_set.trajectories}
+    if set(block.scenario_ids) != set(trajectories) or len(block.scenario_ids) != len(trajectories):
+        raise DomainValidationError("Stage 3 projections must cover each scenario exactly once")
+    ordered = [trajectories[scenario_id] for scenario_id in block.scenario_ids]
+    kinds = [trajectory.kind for trajectory in ordered]
+    weights = np.asarray(
+        [
+            scaled_units(decimal_from(trajectory.weight, field="scenario_weight"), RATE_SCALE)
+            for trajectory in ordered
+        ],
+        dtype=np.int64,
+    )
+    probabilistic = np.asarray([kind != ScenarioKind.STRESS for kind in kinds])
+
+    horizon = block.cure_event.shape[2]
+    valid = (np.arange(horizon) < block.period_counts[:, None])[:, None, :]
+    factors = np.where(
+        valid[:, 0, :], _discount_factor_grid(block.original_effective_interest_rate, horizon), 0
+    )
+    outflows = block.contractual_cash_flow + block.collection_costs
+    magnitude = np.maximum(outflows, block.expected_cash_inflows).max(axis=(1, 2))
+    wide_cells = magnitude > INT64_MAX // RATE_SCALE
+    shortfall = outflows - block.expected_cash_inflows
+    discounted = np.zeros(shortfall.shape, dtype=np.int64)
+    narrow = ~wide_cells
+    discounted[narrow] = round_half_even(
+        shortfall[narrow] * factors[narrow][:, None, :], RATE_SCALE
+    )
+    if wide_cells.any():
+        discounted[wide_cells] = round_half_even(
+            shortfall[wide_cells].astype(object) * factors[wide_cells].astype(object)[:, None, :],
+            RATE_SCALE,
+        ).astype(np.int64)
+    ecl = np.maximum(0, discounted.sum(axis=2))
+
+    wide_rows = (ecl > INT64_MAX // RATE_SCALE // len(weights)).any(axis=1)
+    weighted = np.zeros(len(block.contract_ids), dtype=np.int64)
+    weighted[~wide_rows] = weighted_scenario_cents(ecl[~wide_rows], weights, probabilistic)
+    if wide_rows.any():
+        weighted[wide_rows] = weighted_scenario_cents(
+            ecl[wide_rows].astype(object), weights.astype(object), probabilistic
+        ).astype(np.int64)
+
+    net_carrying = block.gross_carrying_amount - block.opening_loss_allowance
+    monthly_interest = round_half_even(
+        net_carrying.astype(object) * block.original_effective_interest_rate.astype(object),
+        12 * RATE_SCALE,
+    ).astype(np.int64)
+    return Stage3ECLBlockResult(
+        block.contract_ids,
+        block.scenario_ids,
+        ecl,
+        weighted,
+        ecl[:, kinds.index(ScenarioKind.STRESS)].copy(),
+        block.writeoff_amount.sum(axis=2),
+        block.cure_event.any(axis=2),
+        net_carrying,
+        monthly_interest,
+        scenario_set.version,
+        scenario_set.source_snapshot_hash,
+        factors if detail else None,
+        shortfall if detail else None,
+        discounted if detail else None,
+    )
+
+
+def stage3_block_totals(result: Stage3ECLBlockResult) -> tuple[ScenarioECLTotals, ...]:
+    """Per-contract scenario totals, as the batch processors cache them."""
+    return tuple(
+        ScenarioECLTotals(
+            tuple(
+                (scenario_id, Decimal(int(cents)) / 100)
+                for scenario_id, cents in zip(result.scenario_ids, scenario_row, strict=True)
+            ),
+            Decimal(int(weighted)) / 100,
+            Decimal(int(stress)) / 100,
+            result.scenario_version,
+            result.scenario_source_hash,
+            "",
+            "",
+        )
+        for scenario_row, weighted, stress in zip(
+            result.scenario_ecl_cents,
+            result.probability_weighted_cents,
+            result.stress_cents,
+            strict=True,
+        )
+    )
@@ -6,11 +6,20 @@ from .manager import (
     MigrationStatus,
     PendingMigrationsError,
 )
-from .repository import PersistenceConflictError, VersionedRepository
+from .pool import ConnectionPoolTimeoutError
+from .repository import (
+    BulkPersistenceSummary,
+    ECLResultRow,
+    PersistenceConflictError,
+    VersionedRepository,
+)
 
 __all__ = [
+    "BulkPersistenceSummary",
+    "ConnectionPoolTimeoutError",
     "DatabaseManager",
     "DatabaseSettings",
+    "ECLResultRow",
     "MigrationStatus",
     "PendingMigrationsError",
     "PersistenceConflictError",
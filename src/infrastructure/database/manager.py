@@ -5,14 +5,17 @@ from __future__ import annotations
 import hashlib
 import os
 import sqlite3
-from collections.abc import Generator, Mapping, Sequence
+import threading
+from collections.abc import Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal
 
 import psycopg2  # type: ignore[import-untyped]
-from psycopg2.extras import RealDictCursor  # type: ignore[import-untyped]
+from psycopg2.extras import RealDictCursor, execute_batch  # type: ignore[import-untyped]
+
+from .pool import QueueConnectionPool, ThreadLocalConnectionPool
 
 DatabaseBackend = Literal["sqlite", "postgresql"]
 
@@ -42,6 +45,15 @@ class DatabaseSettings:
     backend: DatabaseBackend = "sqlite"
     sqlite_path: Path = Path("var/dbrisco.sqlite3")
     postgresql_dsn: str | None = None
+    pool_size: int = 5
+    pool_timeout_seconds: float = 30.0
+    health_check_seconds: float = 30.0
+
+    def __post_init__(self) -> None:
+        if self.pool_size <= 0 or self.pool_timeout_seconds <= 0:
+            raise DatabaseConfigurationError("database pool size and timeout must be positive")
+        if self.health_check_seconds < 0:
+            raise DatabaseConfigurationError("database health-check interval cannot be negative")
 
     @classmethod
     def from_env(cls) -> DatabaseSettings:
@@ -49,21 +61,39 @@ class DatabaseSettings:
         backend = os.getenv("DATABASE_BACKEND", "sqlite").lower()
         if backend not in {"sqlite", "postgresql"}:
             raise DatabaseConfigurationError("DATABASE_BACKEND must be 'sqlite' or 'postgresql'")
+        pool_size = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+        pool_timeout_seconds = float(os.getenv("DATABASE_POOL_TIMEOUT_SECONDS", "30"))
+        health_check_seconds = float(os.getenv("DATABASE_HEALTH_CHECK_SECONDS", "30"))
         if backend == "postgresql":
             dsn = os.getenv("DATABASE_URL")
             if not dsn:
                 raise DatabaseConfigurationError(
                     "DATABASE_URL is required when DATABASE_BACKEND=postgresql"
                 )
-            return cls(backend="postgresql", postgresql_dsn=dsn)
+            return cls(
+                backend="postgresql",
+                postgresql_dsn=dsn,
+                pool_size=pool_size,
+                pool_timeout_seconds=pool_timeout_seconds,
+                health_check_seconds=health_check_seconds,
+            )
         return cls(
             backend="sqlite",
             sqlite_path=Path(os.getenv("DATABASE_SQLITE_PATH", "var/dbrisco.sqlite3")),
+            pool_size=pool_size,
+            pool_timeout_seconds=pool_timeout_seconds,
+            health_check_seconds=health_check_seconds,
         )
 
 
 class DatabaseManager:
-    """Open transactions and apply immutable, checksummed SQL migrations."""
+    """Run pooled units of work and apply immutable, checksummed SQL migrations.
+
+    SQLite keeps one WAL-mode connection per thread; PostgreSQL reuses idle
+    connections across threads. Both pools bound concurrent checkouts by
+    ``pool_size`` and ping connections that were idle longer than the
+    health-check interval before handing them out.
+    """
 
     def __init__(
         self,
@@ -73,32 +103,89 @@ class DatabaseManager:
     ) -> None:
         self.settings = settings or DatabaseSettings.from_env()
         self.migrations_root = migrations_root or Path(__file__).parent / "migrations"
+        self._pool: QueueConnectionPool | ThreadLocalConnectionPool | None = None
+        self._pool_lock = threading.Lock()
+        self._active = threading.local()
 
     def _connect(self) -> Any:
         if self.settings.backend == "sqlite":
             path = self.settings.sqlite_path
             if str(path) != ":memory:":
                 path.parent.mkdir(parents=True, exist_ok=True)
-            connection = sqlite3.connect(path)
+            # Pooled connections are owned by one thread at a time but closed by the pool.
+            connection = sqlite3.connect(path, check_same_thread=False)
             connection.row_factory = sqlite3.Row
             connection.execute("PRAGMA foreign_keys = ON")
+            if str(path) != ":memory:":
+                connection.execute("PRAGMA journal_mode = WAL")
             return connection
         if not self.settings.postgresql_dsn:
             raise DatabaseConfigurationError("PostgreSQL DSN is missing")
         return psycopg2.connect(self.settings.postgresql_dsn, connect_timeout=5)
 
+    def _connection_pool(self) -> QueueConnectionPool | ThreadLocalConnectionPool:
+        with self._pool_lock:
+            if self._pool is None:
+                pool_type = (
+                    ThreadLocalConnectionPool
+                    if self.settings.backend == "sqlite"
+                    else QueueConnectionPool
+                )
+                self._pool = pool_type(
+                    lambda: self._connect(),
+                    size=self.settings.pool_size,
+                    timeout_seconds=self.settings.pool_timeout_seconds,
+                    health_check_seconds=self.settings.health_check_seconds,
+                )
+            return self._pool
+
+    def close(self) -> None:
+        """Close every pooled connection; later calls transparently open a new pool."""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+
+    @property
+    def in_unit_of_work(self) -> bool:
+        """Whether the calling thread is inside an open unit of work."""
+        return getattr(self._active, "connection", None) is not None
+
     @contextmanager
-    def transaction(self) -> Generator[Any]:
-        """Commit a successful unit of work and roll back every exception."""
-        connection = self._connect()
+    def unit_of_work(self) -> Generator[Any]:
+        """Share one pooled connection and one commit across a thread's statements.
+
+        Every ``execute``/``fetch_*``/``transaction`` call issued by the same
+        thread inside the block joins it, so a request or job chunk touching the
+        repository, job store and audit trail commits or rolls back as a whole.
+        Nested units join the outermost one.
+        """
+        active = getattr(self._active, "connection", None)
+        if active is not None:
+            yield active
+            return
+        pool = self._connection_pool()
+        connection = pool.acquire()
+        self._active.connection = connection
+        broken = False
         try:
             yield connection
             connection.commit()
         except Exception:
-            connection.rollback()
+            try:
+                connection.rollback()
+            except Exception:
+                broken = True
             raise
         finally:
-            connection.close()
+            self._active.connection = None
+            pool.release(connection, broken=broken)
+
+    @contextmanager
+    def transaction(self) -> Generator[Any]:
+        """Commit a successful unit of work and roll back every exception."""
+        with self.unit_of_work() as connection:
+            yield connection
 
     def _sql(self, statement: str) -> str:
         if self.settings.backend == "postgresql":
@@ -111,6 +198,19 @@ class DatabaseManager:
             cursor.execute(self._sql(statement), tuple(parameters))
             return int(cursor.rowcount)
 
+    def execute_many(self, statement: str, rows: Iterable[Sequence[Any]]) -> int:
+        """Run one parameterized statement for many rows as a single batched call."""
+        batch = [tuple(row) for row in rows]
+        if not batch:
+            return 0
+        with self.transaction() as connection:
+            cursor = connection.cursor()
+            if self.settings.backend == "postgresql":
+                execute_batch(cursor, self._sql(statement), batch, page_size=len(batch))
+            else:
+                cursor.executemany(statement, batch)
+        return len(batch)
+
     def fetch_one(self, statement: str, parameters: Sequence[Any] = ()) -> dict[str, Any] | None:
         with self.transaction() as connection:
             cursor = (
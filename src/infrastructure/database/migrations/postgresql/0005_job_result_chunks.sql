@@ -0,0 +1,16 @@
+ALTER TABLE calculation_jobs ADD COLUMN total_items INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE calculation_jobs ADD COLUMN processed_items INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE calculation_jobs ADD COLUMN result_chunks INTEGER NOT NULL DEFAULT 0;
+
+CREATE TABLE calculation_job_results (
+    job_id TEXT NOT NULL REFERENCES calculation_jobs(job_id),
+    chunk_index INTEGER NOT NULL CHECK (chunk_index >= 0),
+    first_position INTEGER NOT NULL CHECK (first_position >= 0),
+    result_count INTEGER NOT NULL CHECK (result_count > 0),
+    result_hash TEXT NOT NULL CHECK (length(result_hash) = 64),
+    result_json TEXT NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (job_id, chunk_index)
+);
+
+CREATE INDEX idx_job_results_position ON calculation_job_results(job_id, first_position);
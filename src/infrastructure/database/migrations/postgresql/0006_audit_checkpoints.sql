@@ -0,0 +1,11 @@
+CREATE TABLE audit_chain_checkpoints (
+    checkpoint_id BIGSERIAL PRIMARY KEY,
+    audit_sequence BIGINT NOT NULL REFERENCES audit_events(audit_sequence),
+    event_hash TEXT NOT NULL,
+    event_count BIGINT NOT NULL CHECK (event_count > 0),
+    verified_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE TRIGGER audit_chain_checkpoints_no_update
+BEFORE UPDATE OR DELETE ON audit_chain_checkpoints
+FOR EACH ROW EXECUTE FUNCTION reject_audit_lineage_mutation();
@@ -0,0 +1,17 @@
+CREATE TABLE calculation_result_blobs (
+    blob_hash TEXT PRIMARY KEY CHECK (length(blob_hash) = 64),
+    codec TEXT NOT NULL CHECK (codec = 'ndjson+zstd'),
+    item_count INTEGER NOT NULL CHECK (item_count > 0),
+    decoded_bytes INTEGER NOT NULL CHECK (decoded_bytes > 0),
+    payload BYTEA NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL
+);
+
+ALTER TABLE calculation_job_results ALTER COLUMN result_json DROP NOT NULL;
+ALTER TABLE calculation_job_results
+    ADD COLUMN blob_hash TEXT REFERENCES calculation_result_blobs(blob_hash);
+ALTER TABLE calculation_job_results
+    ADD CONSTRAINT calculation_job_results_single_payload
+    CHECK ((result_json IS NULL) <> (blob_hash IS NULL));
+
+CREATE INDEX idx_job_results_blob ON calculation_job_results(blob_hash);
@@ -0,0 +1,19 @@
+CREATE TABLE audit_chain_checkpoints (
+    checkpoint_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    audit_sequence INTEGER NOT NULL REFERENCES audit_events(audit_sequence),
+    event_hash TEXT NOT NULL,
+    event_count INTEGER NOT NULL CHECK (event_count > 0),
+    verified_at TEXT NOT NULL
+);
+
+CREATE TRIGGER audit_chain_checkpoints_no_update
+BEFORE UPDATE ON audit_chain_checkpoints
+BEGIN
+    SELECT RAISE(ABORT, 'audit checkpoints are immutable');
+END;
+
+CREATE TRIGGER audit_chain_checkpoints_no_delete
+BEFORE DELETE ON audit_chain_checkpoints
+BEGIN
+    SELECT RAISE(ABORT, 'audit checkpoints are immutable');
+END;
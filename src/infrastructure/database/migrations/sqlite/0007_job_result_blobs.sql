@@ -0,0 +1,32 @@
+CREATE TABLE calculation_result_blobs (
+    blob_hash TEXT PRIMARY KEY CHECK (length(blob_hash) = 64),
+    codec TEXT NOT NULL CHECK (codec = 'ndjson+zstd'),
+    item_count INTEGER NOT NULL CHECK (item_count > 0),
+    decoded_bytes INTEGER NOT NULL CHECK (decoded_bytes > 0),
+    payload BLOB NOT NULL,
+    created_at TEXT NOT NULL
+);
+
+CREATE TABLE calculation_job_results_v2 (
+    job_id TEXT NOT NULL REFERENCES calculation_jobs(job_id),
+    chunk_index INTEGER NOT NULL CHECK (chunk_index >= 0),
+    first_position INTEGER NOT NULL CHECK (first_position >= 0),
+    result_count INTEGER NOT NULL CHECK (result_count > 0),
+    result_hash TEXT NOT NULL CHECK (length(result_hash) = 64),
+    result_json TEXT,
+    blob_hash TEXT REFERENCES calculation_result_blobs(blob_hash),
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (job_id, chunk_index),
+    CHECK ((result_json IS NULL) <> (blob_hash IS NULL))
+);
+
+INSERT INTO calculation_job_results_v2
+    (job_id, chunk_index, first_position, result_count, result_hash, result_json, created_at)
+SELECT job_id, chunk_index, first_position, result_count, result_hash, result_json, created_at
+FROM calculation_job_results;
+
+DROP TABLE calculation_job_results;
+ALTER TABLE calculation_job_results_v2 RENAME TO calculation_job_results;
+
+CREATE INDEX idx_job_results_position ON calculation_job_results(job_id, first_position);
+CREATE INDEX idx_job_results_blob ON calculation_job_results(blob_hash);
@@ -0,0 +1,206 @@
+"""Bounded, health-checked connection pools for the supported database backends."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any
+
+type ConnectionFactory = Callable[[], Any]
+
+
+class ConnectionPoolTimeoutError(RuntimeError):
+    """Raised when no pooled connection becomes available within the configured timeout."""
+
+
+def _close_quietly(connection: Any) -> None:
+    with suppress(Exception):
+        connection.close()
+
+
+def _close_all(connections: list[Any], lock: threading.Lock) -> None:
+    with lock:
+        pending = list(connections)
+        connections.clear()
+    for connection in pending:
+        _close_quietly(connection)
+
+
+class _BoundedPool:
+    """Bound concurrent checkouts and ping connections that were idle too long."""
+
+    def __init__(
+        self,
+        factory: ConnectionFactory,
+        *,
+        size: int,
+        timeout_seconds: float,
+        health_check_seconds: float,
+    ) -> None:
+        if size <= 0 or timeout_seconds <= 0 or health_check_seconds < 0:
+            raise ValueError("pool size and timeout must be positive")
+        self.size = size
+        self.timeout_seconds = timeout_seconds
+        self.health_check_seconds = health_check_seconds
+        self._factory = factory
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._connections: list[Any] = []
+        self._last_used: dict[int, float] = {}
+        self._finalizer = weakref.finalize(self, _close_all, self._connections, self._lock)
+
+    def _open(self) -> Any:
+        connection = self._factory()
+        with self._lock:
+            self._connections.append(connection)
+            self._last_used[id(connection)] = time.monotonic()
+        return connection
+
+    def _discard(self, connection: Any) -> None:
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+            self._last_used.pop(id(connection), None)
+        _close_quietly(connection)
+
+    def _healthy(self, connection: Any) -> bool:
+        if getattr(connection, "closed", False):
+            return False
+        idle = time.monotonic() - self._last_used.get(id(connection), 0.0)
+        if idle < self.health_check_seconds:
+            return True
+        try:
+            connection.cursor().execute("SELECT 1")
+        except Exception:
+            return False
+        return True
+
+    def _checkout(self) -> None:
+        if not self._slots.acquire(timeout=self.timeout_seconds):
+            raise ConnectionPoolTimeoutError(
+                f"no database connection available within {self.timeout_seconds}s"
+            )
+
+    def _checkin(self, connection: Any) -> None:
+        with self._lock:
+            self._last_used[id(connection)] = time.monotonic()
+        self._slots.release()
+
+    @property
+    def open_connections(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+class QueueConnectionPool(_BoundedPool):
+    """Reuse idle connections across threads, as required by PostgreSQL servers."""
+
+    def __init__(
+        self,
+        factory: ConnectionFactory,
+        *,
+        size: int,
+        timeout_seconds: float,
+        health_check_seconds: float,
+    ) -> None:
+        super().__init__(
+            factory,
+            size=size,
+            timeout_seconds=timeout_seconds,
+            health_check_seconds=health_check_seconds,
+        )
+        self._idle: list[Any] = []
+
+    def acquire(self) -> Any:
+        self._checkout()
+        try:
+            while True:
+                with self._lock:
+                    connection = self._idle.pop() if self._idle else None
+                if connection is None:
+                    return self._open()
+                if self._healthy(connection):
+                    return connection
+                self._discard(connection)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: Any, *, broken: bool = False) -> None:
+        if broken or getattr(connection, "closed", False):
+            self._discard(connection)
+        else:
+            with self._lock:
+                self._idle.append(connection)
+        self._checkin(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            self._idle.clear()
+        super().close()
+
+
+class ThreadLocalConnectionPool(_BoundedPool):
+    """Keep one connection per thread, as SQLite serializes writers per connection."""
+
+    def __init__(
+        self,
+        factory: ConnectionFactory,
+        *,
+        size: int,
+        timeout_seconds: float,
+        health_check_seconds: float,
+    ) -> None:
+        super().__init__(
+            factory,
+            size=size,
+            timeout_seconds=timeout_seconds,
+            health_check_seconds=health_check_seconds,
+        )
+        self._owners: dict[int, tuple[threading.Thread, Any]] = {}
+
+    def _prune_finished_threads(self) -> None:
+        with self._lock:
+            finished = [
+                ident for ident, (thread, _) in self._owners.items() if not thread.is_alive()
+            ]
+            stale = [self._owners.pop(ident)[1] for ident in finished]
+        for connection in stale:
+            self._discard(connection)
+
+    def acquire(self) -> Any:
+        self._checkout()
+        try:
+            thread = threading.current_thread()
+            with self._lock:
+                owned = self._owners.get(thread.ident or 0)
+            if owned is not None and self._healthy(owned[1]):
+                return owned[1]
+            if owned is not None:
+                self._discard(owned[1])
+            self._prune_finished_threads()
+            connection = self._open()
+            with self._lock:
+                self._owners[thread.ident or 0] = (thread, connection)
+            return connection
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: Any, *, broken: bool = False) -> None:
+        if broken:
+            with self._lock:
+                self._owners.pop(threading.get_ident(), None)
+            self._discard(connection)
+        self._checkin(connection)
+
+    def close(self) -> None:
+        with self._lock:
+            self._owners.clear()
+        super().close()
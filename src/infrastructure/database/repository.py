@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from itertools import batched
 from typing import Any
 
 from .manager import DatabaseManager
 
+BULK_BATCH_SIZE = 500
+
 
 class PersistenceConflictError(RuntimeError):
     """Raised when an immutable identity is reused with different content."""
@@ -39,6 +43,21 @@ def payload_hash(payload_json: str) -> str:
     return hashlib.sha256(payload_json.encode("utf-8")).hexdigest()
 
 
+@dataclass(frozen=True, slots=True)
+class ECLResultRow:
+    contract_id: str
+    period: int
+    scenario_id: str
+    ecl_amount: Decimal
+    payload: Mapping[str, Any]
+
+
+@dataclass(frozen=True, slots=True)
+class BulkPersistenceSummary:
+    inserted: int
+    reused: int
+
+
 class VersionedRepository:
     """Persist immutable inputs and revisioned ECL executions."""
 
@@ -82,6 +101,70 @@ class VersionedRepository:
         )
         return digest
 
+    def _stored_hashes(
+        self,
+        table: str,
+        identity_columns: tuple[str, ...],
+        identities: list[tuple[Any, ...]],
+    ) -> dict[tuple[Any, ...], str]:
+        """Return stored payload hashes for many identities with one row-value lookup."""
+        columns = ", ".join(identity_columns)
+        row = f"({', '.join('?' for _ in identity_columns)})"
+        stored = self.database.fetch_all(
+            f"SELECT {columns}, payload_hash FROM {table} "  # noqa: S608
+            f"WHERE ({columns}) IN (VALUES {', '.join(row for _ in identities)})",
+            tuple(value for identity in identities for value in identity),
+        )
+        return {
+            tuple(item[column] for column in identity_columns): item["payload_hash"]
+            for item in stored
+        }
+
+    def _persist_many(
+        self,
+        table: str,
+        identity_columns: tuple[str, ...],
+        value_columns: tuple[str, ...],
+        records: Iterable[tuple[tuple[Any, ...], tuple[Any, ...], Mapping[str, Any]]],
+        *,
+        conflict_message: str,
+        batch_size: int,
+    ) -> BulkPersistenceSummary:
+        """Insert new immutable rows in batches with the single-row reuse/conflict rules.
+
+        Each batch is serialized and hashed up front, checked against stored hashes
+        in one set-based query and inserted with one batched statement. The whole
+        call is one unit of work, so a conflict anywhere leaves nothing written.
+        """
+        if batch_size <= 0:
+            raise ValueError("batch size must be positive")
+        columns = (*identity_columns, *value_columns, "payload_json", "payload_hash")
+        statement = (
+            f"INSERT INTO {table} ({', '.join(columns)}) "  # noqa: S608
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        total = 0
+        inserted = 0
+        with self.database.unit_of_work():
+            for batch in batched(records, batch_size, strict=False):
+                pending: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+                for identity, values, payload in batch:
+                    serialized = canonical_json(payload)
+                    digest = payload_hash(serialized)
+                    previous = pending.setdefault(
+                        identity, (*identity, *values, serialized, digest)
+                    )
+                    if previous[-1] != digest:
+                        raise PersistenceConflictError(conflict_message)
+                total += len(batch)
+                stored = self._stored_hashes(table, identity_columns, list(pending))
+                if any(stored[key] != pending[key][-1] for key in stored):
+                    raise PersistenceConflictError(conflict_message)
+                inserted += self.database.execute_many(
+                    statement, [row for key, row in pending.items() if key not in stored]
+                )
+        return BulkPersistenceSummary(inserted=inserted, reused=total - inserted)
+
     def persist_contract(
         self, contract_id: str, source_version: str, payload: Mapping[str, Any]
     ) -> str:
@@ -107,6 +190,44 @@ class VersionedRepository:
             payload,
         )
 
+    def persist_contracts(
+        self,
+        contracts: Iterable[tuple[str, str, Mapping[str, Any]]],
+        *,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> BulkPersistenceSummary:
+        """Persist ``(contract_id, source_version, payload)`` items in batches."""
+        return self._persist_many(
+            "operational_contracts",
+            self._IMMUTABLE_IDENTITIES["operational_contracts"],
+            (),
+            (((contract_id, version), (), payload) for contract_id, version, payload in contracts),
+            conflict_message=(
+                "Immutable identity already exists with different content in "
+                "operational_contracts"
+            ),
+            batch_size=batch_size,
+        )
+
+    def persist_models(
+        self,
+        models: Iterable[tuple[str, str, Mapping[str, Any]]],
+        *,
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> BulkPersistenceSummary:
+        """Persist ``(model_id, version, payload)`` items in batches."""
+        return self._persist_many(
+            "model_registry_models",
+            self._IMMUTABLE_IDENTITIES["model_registry_models"],
+            (),
+            (((model_id, version), (), payload) for model_id, version, payload in models),
+            conflict_message=(
+                "Immutable identity already exists with different content in "
+                "model_registry_models"
+            ),
+            batch_size=batch_size,
+        )
+
     def persist_scenario(self, scenario_id: str, version: str, payload: Mapping[str, Any]) -> str:
         return self._persist_immutable(
             "model_registry_scenarios",
@@ -197,6 +318,49 @@ class VersionedRepository:
         )
         return digest
 
+    def persist_ecl_results(
+        self,
+        *,
+        execution_id: str,
+        results: Iterable[ECLResultRow],
+        batch_size: int = BULK_BATCH_SIZE,
+    ) -> BulkPersistenceSummary:
+        """Persist an execution's results in batches with ``persist_ecl_result`` semantics."""
+        return self._persist_many(
+            "calculation_results",
+            ("execution_id", "contract_id", "period", "scenario_id"),
+            ("ecl_amount",),
+            (
+                (
+                    (execution_id, result.contract_id, result.period, result.scenario_id),
+                    (str(result.ecl_amount),),
+                    {**result.payload, "ecl_amount": result.ecl_amount},
+                )
+                for result in results
+            ),
+            conflict_message="ECL result identity already exists with different content",
+            batch_size=batch_size,
+        )
+
+    def load_ecl_results(
+        self, execution_id: str, *, period: int, scenario_id: str
+    ) -> list[dict[str, Any]]:
+        """Return one period/scenario slice of a completed execution with decoded payloads."""
+        execution = self.database.fetch_one(
+            "SELECT status FROM calculation_executions WHERE execution_id = ?",
+            (execution_id,),
+        )
+        if execution is None or execution["status"] != "COMPLETED":
+            raise PersistenceConflictError("Execution results are only read once COMPLETED")
+        rows = self.database.fetch_all(
+            "SELECT contract_id, ecl_amount, payload_json, payload_hash FROM calculation_results "
+            "WHERE execution_id = ? AND period = ? AND scenario_id = ? ORDER BY contract_id",
+            (execution_id, period, scenario_id),
+        )
+        for row in rows:
+            row["payload"] = json.loads(row.pop("payload_json"))
+        return rows
+
     def complete_execution(self, execution_id: str) -> None:
         """Mark an execution complete after every result and lineage event persisted."""
 
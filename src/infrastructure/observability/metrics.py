@@ -2,11 +2,34 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Callable
 from dataclasses import dataclass, field
-from threading import RLock
+from itertools import count
+from threading import Lock, RLock, local
+from typing import Protocol
 
 HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
 JOB_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 15.0, 60.0)
+ENGINE_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0, 30.0)
+DEFAULT_SHARDS = 16
+
+type _Series = tuple[str, tuple[str, ...]]
+
+
+class EnginePartition(Protocol):
+    """Per-partition engine work, as emitted by the ECL batch processors."""
+
+    @property
+    def engine(self) -> str: ...
+    @property
+    def contracts(self) -> int: ...
+    @property
+    def cache_hits(self) -> int | None: ...
+    @property
+    def cache_misses(self) -> int | None: ...
+    @property
+    def phase_seconds(self) -> tuple[tuple[str, float], ...]: ...
 
 
 def _escape(value: str) -> str:
@@ -19,117 +42,243 @@ def _labels(values: tuple[tuple[str, str], ...]) -> str:
 
 @dataclass(slots=True)
 class Histogram:
+    """Per-bucket counts; the last slot holds values above every boundary.
+
+    ``observe`` touches a single slot found by bisection. Prometheus cumulative
+    buckets are derived only when rendering.
+    """
+
     buckets: tuple[float, ...]
     counts: list[int] = field(init=False)
     count: int = 0
     total: float = 0.0
 
     def __post_init__(self) -> None:
-        self.counts = [0 for _ in self.buckets]
+        self.counts = [0] * (len(self.buckets) + 1)
 
     def observe(self, value: float) -> None:
         self.count += 1
         self.total += value
-        for index, boundary in enumerate(self.buckets):
-            if value <= boundary:
-                self.counts[index] += 1
+        self.counts[bisect_left(self.buckets, value)] += 1
+
+    def merge(self, other: Histogram) -> None:
+        self.count += other.count
+        self.total += other.total
+        for index, value in enumerate(other.counts):
+            self.counts[index] += value
+
+    def cumulative(self) -> list[int]:
+        """Counts of observations ``<=`` each boundary, in boundary order."""
+        running = 0
+        result = []
+        for value in self.counts[:-1]:
+            running += value
+            result.append(running)
+        return result
+
+
+class _Shard:
+    """Accumulators written by the threads assigned to one shard."""
+
+    __slots__ = ("counters", "histograms", "lock")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.counters: dict[_Series, int] = {}
+        self.histograms: dict[_Series, Histogram] = {}
+
+    def add(self, series: _Series, amount: int) -> None:
+        self.counters[series] = self.counters.get(series, 0) + amount
+
+    def observe(self, series: _Series, buckets: tuple[float, ...], value: float) -> None:
+        histogram = self.histograms.get(series)
+        if histogram is None:
+            histogram = self.histograms[series] = Histogram(buckets)
+        histogram.observe(value)
 
 
 class MetricsRegistry:
-    """Thread-safe registry with only route-template and status-class labels."""
+    """Thread-safe registry with only route-template and status-class labels.
+
+    Engine series are labelled by engine and phase names fixed in code, and
+    gauges registered with ``register_gauge`` carry no labels.
+
+    Writers never share one lock: each thread is bound round-robin to one of
+    ``shards`` accumulators, whose lock is contended only by the threads of
+    that shard and by scrapes. ``render`` merges the shards.
+    """
 
-    def __init__(self, *, environment: str, version: str) -> None:
+    def __init__(self, *, environment: str, version: str, shards: int = DEFAULT_SHARDS) -> None:
+        if shards <= 0:
+            raise ValueError("metrics shards must be positive")
         self.environment = environment
         self.version = version
+        self._shards = tuple(_Shard() for _ in range(shards))
+        self._assignments = count()
+        self._local = local()
         self._lock = RLock()
-        self._http_count: dict[tuple[str, str, str], int] = {}
-        self._http_duration: dict[tuple[str, str], Histogram] = {}
-        self._job_count: dict[tuple[str, str], int] = {}
-        self._job_duration: dict[tuple[str, str], Histogram] = {}
-        self._jobs_in_progress: dict[str, int] = {}
+        self._gauges: dict[str, tuple[str, Callable[[], float]]] = {}
+
+    def _shard(self) -> _Shard:
+        shard: _Shard | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._shards[next(self._assignments) % len(self._shards)]
+            self._local.shard = shard
+        return shard
 
     def observe_http(self, method: str, route: str, status_code: int, duration: float) -> None:
         status_class = f"{status_code // 100}xx"
-        with self._lock:
-            key = (method, route, status_class)
-            self._http_count[key] = self._http_count.get(key, 0) + 1
-            histogram = self._http_duration.setdefault((method, route), Histogram(HTTP_BUCKETS))
-            histogram.observe(duration)
+        shard = self._shard()
+        with shard.lock:
+            shard.add(("http_requests", (method, route, status_class)), 1)
+            shard.observe(("http_duration", (method, route)), HTTP_BUCKETS, duration)
 
     def job_started(self, job_type: str) -> None:
-        with self._lock:
-            self._jobs_in_progress[job_type] = self._jobs_in_progress.get(job_type, 0) + 1
+        shard = self._shard()
+        with shard.lock:
+            shard.add(("jobs_in_progress", (job_type,)), 1)
 
     def job_finished(self, job_type: str, status: str, duration: float) -> None:
+        shard = self._shard()
+        with shard.lock:
+            shard.add(("jobs", (job_type, status)), 1)
+            shard.observe(("job_duration", (job_type, status)), JOB_BUCKETS, duration)
+            shard.add(("jobs_in_progress", (job_type,)), -1)
+
+    def observe_engine_partition(self, partition: EnginePartition) -> None:
+        """Record one processed partition; usable directly as a processor ``telemetry``."""
+        engine = partition.engine
+        shard = self._shard()
+        with shard.lock:
+            shard.add(("engine_contracts", (engine,)), partition.contracts)
+            shard.add(("engine_partitions", (engine,)), 1)
+            for result, amount in (
+                ("hit", partition.cache_hits),
+                ("miss", partition.cache_misses),
+            ):
+                if amount:
+                    shard.add(("engine_cache", (engine, result)), amount)
+            for phase, seconds in partition.phase_seconds:
+                shard.observe(("engine_phases", (engine, str(phase))), ENGINE_BUCKETS, seconds)
+
+    def register_gauge(self, name: str, help_text: str, read: Callable[[], float]) -> None:
+        """Expose an unlabelled gauge whose value is read at every scrape."""
         with self._lock:
-            key = (job_type, status)
-            self._job_count[key] = self._job_count.get(key, 0) + 1
-            self._job_duration.setdefault(key, Histogram(JOB_BUCKETS)).observe(duration)
-            self._jobs_in_progress[job_type] = max(0, self._jobs_in_progress.get(job_type, 1) - 1)
+            self._gauges[name] = (help_text, read)
+
+    def _merge(self) -> tuple[dict[_Series, int], dict[_Series, Histogram]]:
+        counters: dict[_Series, int] = {}
+        histograms: dict[_Series, Histogram] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for series, value in shard.counters.items():
+                    counters[series] = counters.get(series, 0) + value
+                for series, histogram in shard.histograms.items():
+                    merged = histograms.get(series)
+                    if merged is None:
+                        merged = histograms[series] = Histogram(histogram.buckets)
+                    merged.merge(histogram)
+        return counters, histograms
+
+    @staticmethod
+    def _family[T](values: dict[_Series, T], family: str) -> dict[tuple[str, ...], T]:
+        return {labels: value for (name, labels), value in values.items() if name == family}
+
+    @staticmethod
+    def _render_counter(
+        name: str,
+        values: dict[tuple[str, ...], int],
+        label_names: tuple[str, ...],
+    ) -> list[str]:
+        return [
+            f"{name}{_labels(tuple(zip(label_names, key, strict=True)))} {value}"
+            for key, value in sorted(values.items())
+        ]
 
     def _render_histogram(
         self,
         name: str,
-        values: dict[tuple[str, str], Histogram],
-        label_names: tuple[str, str],
+        values: dict[tuple[str, ...], Histogram],
+        label_names: tuple[str, ...],
     ) -> list[str]:
         lines = [f"# TYPE {name} histogram"]
         for key in sorted(values):
             histogram = values[key]
             base = tuple(zip(label_names, key, strict=True))
-            for boundary, count in zip(histogram.buckets, histogram.counts, strict=True):
-                lines.append(f'{name}_bucket{_labels((*base, ("le", str(boundary))))} {count}')
+            for boundary, cumulative in zip(histogram.buckets, histogram.cumulative(), strict=True):
+                lines.append(f'{name}_bucket{_labels((*base, ("le", str(boundary))))} {cumulative}')
             lines.append(f'{name}_bucket{_labels((*base, ("le", "+Inf")))} {histogram.count}')
             lines.append(f"{name}_sum{_labels(base)} {histogram.total:.9f}")
             lines.append(f"{name}_count{_labels(base)} {histogram.count}")
         return lines
 
     def render(self) -> str:
+        counters, histograms = self._merge()
+        in_progress = {
+            key: max(0, value) for key, value in self._family(counters, "jobs_in_progress").items()
+        }
+        lines = [
+            "# HELP risco_application_info Immutable build and environment identity.",
+            "# TYPE risco_application_info gauge",
+            "risco_application_info"
+            f'{{environment="{_escape(self.environment)}",'
+            f'version="{_escape(self.version)}"}} 1',
+            "# HELP risco_http_requests_total Completed HTTP requests.",
+            "# TYPE risco_http_requests_total counter",
+            *self._render_counter(
+                "risco_http_requests_total",
+                self._family(counters, "http_requests"),
+                ("method", "route", "status_class"),
+            ),
+            *self._render_histogram(
+                "risco_http_request_duration_seconds",
+                self._family(histograms, "http_duration"),
+                ("method", "route"),
+            ),
+            "# HELP risco_jobs_total Completed background jobs.",
+            "# TYPE risco_jobs_total counter",
+            *self._render_counter(
+                "risco_jobs_total", self._family(counters, "jobs"), ("job_type", "status")
+            ),
+            *self._render_histogram(
+                "risco_job_duration_seconds",
+                self._family(histograms, "job_duration"),
+                ("job_type", "status"),
+            ),
+            "# HELP risco_jobs_in_progress Current background jobs.",
+            "# TYPE risco_jobs_in_progress gauge",
+            *self._render_counter("risco_jobs_in_progress", in_progress, ("job_type",)),
+            "# HELP risco_engine_contracts_total Contracts measured by ECL batch engines.",
+            "# TYPE risco_engine_contracts_total counter",
+            *self._render_counter(
+                "risco_engine_contracts_total",
+                self._family(counters, "engine_contracts"),
+                ("engine",),
+            ),
+            "# HELP risco_engine_partitions_total Partitions reduced by ECL batch engines.",
+            "# TYPE risco_engine_partitions_total counter",
+            *self._render_counter(
+                "risco_engine_partitions_total",
+                self._family(counters, "engine_partitions"),
+                ("engine",),
+            ),
+            "# HELP risco_engine_profile_cache_lookups_total Profile cache lookups.",
+            "# TYPE risco_engine_profile_cache_lookups_total counter",
+            *self._render_counter(
+                "risco_engine_profile_cache_lookups_total",
+                self._family(counters, "engine_cache"),
+                ("engine", "result"),
+            ),
+            *self._render_histogram(
+                "risco_engine_phase_duration_seconds",
+                self._family(histograms, "engine_phases"),
+                ("engine", "phase"),
+            ),
+        ]
         with self._lock:
-            lines = [
-                "# HELP risco_application_info Immutable build and environment identity.",
-                "# TYPE risco_application_info gauge",
-                "risco_application_info"
-                f'{{environment="{_escape(self.environment)}",'
-                f'version="{_escape(self.version)}"}} 1',
-                "# HELP risco_http_requests_total Completed HTTP requests.",
-                "# TYPE risco_http_requests_total counter",
-            ]
-            for (method, route, status_class), count in sorted(self._http_count.items()):
-                labels = _labels(
-                    (("method", method), ("route", route), ("status_class", status_class))
-                )
-                lines.append(f"risco_http_requests_total{labels} {count}")
-            lines.extend(
-                self._render_histogram(
-                    "risco_http_request_duration_seconds",
-                    self._http_duration,
-                    ("method", "route"),
-                )
-            )
-            lines.extend(
-                [
-                    "# HELP risco_jobs_total Completed background jobs.",
-                    "# TYPE risco_jobs_total counter",
-                ]
-            )
-            for (job_type, status), count in sorted(self._job_count.items()):
-                labels = _labels((("job_type", job_type), ("status", status)))
-                lines.append(f"risco_jobs_total{labels} {count}")
-            lines.extend(
-                self._render_histogram(
-                    "risco_job_duration_seconds",
-                    self._job_duration,
-                    ("job_type", "status"),
-                )
-            )
+            gauges = sorted(self._gauges.items())
+        for name, (help_text, read) in gauges:
             lines.extend(
-                [
-                    "# HELP risco_jobs_in_progress Current background jobs.",
-                    "# TYPE risco_jobs_in_progress gauge",
-                ]
+                [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {float(read())}"]
             )
-            for job_type, count in sorted(self._jobs_in_progress.items()):
-                labels = _labels((("job_type", job_type),))
-                lines.append(f"risco_jobs_in_progress{labels} {count}")
-            return "\n".join(lines) + "\n"
+        return "\n".join(lines) + "\n"
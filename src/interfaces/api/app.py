@@ -4,20 +4,30 @@ import hashlib
 import json
 import logging
 import os
+import shutil
 import time
-from collections.abc import AsyncIterator, Awaitable, Callable
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Annotated, Any, cast
+from uuid import uuid4
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from starlette.responses import Response
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response, StreamingResponse
 
 from ...agent import AgentQuery, AgentResponse, GroundedEvidenceAgent
 from ...agent.evidence import ExecutionNotFoundError
 from ...audit import AuditService
-from ...ecl.batch import BatchQueueFullError, BoundedBatchExecutor
+from ...ecl.batch import (
+    BatchQueueFullError,
+    BoundedBatchExecutor,
+    EnginePhase,
+    PartitionTelemetry,
+    iter_partitions,
+)
+from ...ecl.discounting import DEFAULT_DISCOUNT_CURVES
 from ...infrastructure.database import DatabaseManager, DatabaseSettings, VersionedRepository
 from ...infrastructure.database.repository import canonical_json
 from ...infrastructure.database.startup import prepare_database
@@ -25,7 +35,7 @@ from ...infrastructure.observability.context import job_context
 from ...infrastructure.observability.middleware import configure_observability
 from ...security.auth import AuthenticationError, AuthService, Principal
 from ...security.confirmations import ConfirmationError, ConfirmationService
-from ...security.rate_limit import RateLimiter, RateLimitExceeded
+from ...security.rate_limit import RateLimiter, RateLimitExceeded, SQLiteTokenBucketStore
 from ...security.rbac import Permission, is_allowed
 from ...security.settings import SecuritySettings
 from .jobs import JobStore
@@ -33,6 +43,7 @@ from .schemas import (
     ECLCalculationRequest,
     ECLCalculationResponse,
     JobAcceptedResponse,
+    JobResultsPage,
     JobStatusResponse,
     PortfolioRequest,
 )
@@ -47,6 +58,54 @@ from .service import CanonicalECLApiService
 logger = logging.getLogger(__name__)
 
 
+def read_portfolio_upload(path: Path) -> Iterator[ECLCalculationRequest]:
+    """Yield the calculations of a spooled NDJSON upload one line at a time."""
+    with path.open("rb") as lines:
+        for line in lines:
+            if line.strip():
+                yield ECLCalculationRequest.model_validate_json(line)
+
+
+def count_portfolio_upload(path: Path, maximum: int) -> int:
+    """Validate every line of a spooled upload and return how many calculations it holds."""
+    count = 0
+    with path.open("rb") as lines:
+        for number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                ECLCalculationRequest.model_validate_json(line)
+            except ValueError as exc:
+                raise ValueError(f"line {number}: {exc}") from exc
+            count += 1
+            if count > maximum:
+                raise ValueError(f"upload exceeds {maximum} calculations")
+    if not count:
+        raise ValueError("upload contains no calculations")
+    return count
+
+
+def remove_abandoned_uploads(root: Path, older_than: float) -> int:
+    """Delete spool files last written before ``older_than`` and directories idle since.
+
+    Each process spools under its own directory of ``root``; this only reclaims the
+    files of processes that stopped without cleaning up, so a starting worker never
+    removes the uploads of a live one.
+    """
+    removed = 0
+    for directory in root.glob("*/"):
+        with suppress(FileNotFoundError):
+            idle = directory.stat().st_mtime < older_than
+            for upload in directory.glob("*.ndjson"):
+                if upload.stat().st_mtime < older_than:
+                    upload.unlink()
+                    removed += 1
+            if idle:
+                with suppress(OSError):
+                    directory.rmdir()
+    return removed
+
+
 def create_app(
     settings: DatabaseSettings | None = None,
     security_settings: SecuritySettings | None = None,
@@ -57,9 +116,15 @@ def create_app(
     auth = AuthService(database, security_configuration)
     audit = AuditService(database)
     confirmations = ConfirmationService(database, security_configuration)
+    rate_limit_store = (
+        SQLiteTokenBucketStore(security_configuration.rate_limit_store_path)
+        if security_configuration.rate_limit_store_path
+        else None
+    )
     limiter = RateLimiter(
         security_configuration.rate_limit_requests,
         security_configuration.rate_limit_window_seconds,
+        store=rate_limit_store,
     )
     service = CanonicalECLApiService(VersionedRepository(database))
     evidence_agent = GroundedEvidenceAgent(database)
@@ -69,11 +134,22 @@ def create_app(
         workers=int(os.getenv("BATCH_QUEUE_WORKERS", "2")),
         queue_capacity=int(os.getenv("BATCH_QUEUE_CAPACITY", "32")),
     )
+    result_chunk_size = int(os.getenv("BATCH_RESULT_CHUNK_SIZE", "100"))
+    upload_root = Path(os.getenv("BATCH_UPLOAD_DIR", "var/portfolio-uploads"))
+    upload_max_items = int(os.getenv("BATCH_UPLOAD_MAX_ITEMS", "1000000"))
+    upload_max_bytes = int(os.getenv("BATCH_UPLOAD_MAX_BYTES", str(2 << 30)))
+    upload_retention_seconds = int(os.getenv("BATCH_UPLOAD_RETENTION_SECONDS", "86400"))
+    upload_directory = upload_root / f"{os.getpid()}-{uuid4().hex}"
+    remove_abandoned_uploads(upload_root, time.time() - upload_retention_seconds)
 
     @asynccontextmanager
     async def lifespan(_application: FastAPI) -> AsyncIterator[None]:
         yield
         batch_queue.shutdown()
+        shutil.rmtree(upload_directory, ignore_errors=True)
+        database.close()
+        if rate_limit_store is not None:
+            rate_limit_store.close()
 
     application = FastAPI(
         title="Risco Bancário — API canônica",
@@ -84,6 +160,16 @@ def create_app(
     application.state.auth_service = auth
     application.state.batch_queue = batch_queue
     metrics = configure_observability(application)
+    metrics.register_gauge(
+        "risco_batch_queue_in_flight",
+        "Accepted batch jobs queued or running.",
+        lambda: batch_queue.in_flight,
+    )
+    metrics.register_gauge(
+        "risco_engine_discount_curve_cache_hit_ratio",
+        "Hit ratio of the process-wide discount curve cache.",
+        lambda: DEFAULT_DISCOUNT_CURVES.stats().hit_rate,
+    )
 
     @application.middleware("http")
     async def security_headers(
@@ -292,7 +378,11 @@ def create_app(
         return result
 
     def process_portfolio(
-        job_id: str, requests: list[ECLCalculationRequest], actor_id: str, actor_role: str
+        job_id: str,
+        requests: Iterable[ECLCalculationRequest],
+        total: int,
+        actor_id: str,
+        actor_role: str,
     ) -> None:
         started = time.perf_counter()
         metrics.job_started("ecl_portfolio")
@@ -304,24 +394,55 @@ def create_app(
                     extra={
                         "event": "job.started",
                         "job_type": "ecl_portfolio",
-                        "contract_count": len(requests),
+                        "contract_count": total,
                     },
                 )
-                results = [
-                    service.calculate(request).model_dump(mode="json") for request in requests
-                ]
+                processed = 0
+                chunk_count = 0
+                chunk_hashes = hashlib.sha256()
+                for chunk_index, partition in enumerate(
+                    iter_partitions(requests, result_chunk_size)
+                ):
+                    chunk_started = time.perf_counter()
+                    prepared = [service.prepare(request) for request in partition]
+                    calculated = time.perf_counter()
+                    with database.unit_of_work():
+                        results = [
+                            service.persist(calculation).model_dump(mode="json")
+                            for calculation in prepared
+                        ]
+                        chunk_hash = jobs.append_results(job_id, chunk_index, processed, results)
+                    metrics.observe_engine_partition(
+                        PartitionTelemetry(
+                            "api_portfolio",
+                            len(results),
+                            None,
+                            None,
+                            (
+                                (EnginePhase.CALCULATION, calculated - chunk_started),
+                                (EnginePhase.SINK, time.perf_counter() - calculated),
+                            ),
+                        )
+                    )
+                    chunk_hashes.update(chunk_hash.encode())
+                    processed += len(results)
+                    chunk_count = chunk_index + 1
                 audit.record(
                     actor_id=actor_id,
                     actor_role=actor_role,
                     action="ECL_PORTFOLIO_COMPLETED",
                     resource_type="job",
                     resource_id=job_id,
-                    input_payload={"contracts": len(requests)},
-                    result_payload={"results": results},
+                    input_payload={"contracts": total},
+                    result_payload={
+                        "processed_items": processed,
+                        "result_chunks": chunk_count,
+                        "chunk_hashes_sha256": chunk_hashes.hexdigest(),
+                    },
                     versions={"api": "v1"},
                     status="SUCCEEDED",
                 )
-                jobs.succeeded(job_id, results)
+                jobs.succeeded(job_id)
             except Exception:
                 metrics.job_finished("ecl_portfolio", "failed", time.perf_counter() - started)
                 logger.exception(
@@ -330,7 +451,7 @@ def create_app(
                         "event": "job.failed",
                         "job_type": "ecl_portfolio",
                         "job_status": "failed",
-                        "contract_count": len(requests),
+                        "contract_count": total,
                         "duration_seconds": time.perf_counter() - started,
                     },
                 )
@@ -341,7 +462,7 @@ def create_app(
                     action="ECL_PORTFOLIO_COMPLETED",
                     resource_type="job",
                     resource_id=job_id,
-                    input_payload={"contracts": len(requests)},
+                    input_payload={"contracts": total},
                     result_payload={"error_code": "CALCULATION_FAILED"},
                     versions={"api": "v1"},
                     status="FAILED",
@@ -354,25 +475,22 @@ def create_app(
                         "event": "job.completed",
                         "job_type": "ecl_portfolio",
                         "job_status": "succeeded",
-                        "contract_count": len(requests),
+                        "contract_count": total,
                         "duration_seconds": time.perf_counter() - started,
                     },
                 )
 
-    @application.post(
-        "/api/v1/ecl/portfolio",
-        response_model=JobAcceptedResponse,
-        status_code=status.HTTP_202_ACCEPTED,
-        tags=["ecl"],
-    )
-    def calculate_portfolio(
-        request: PortfolioRequest,
-        confirmation_id: Annotated[str, Header(alias="X-Confirmation-Id")],
-        principal: PortfolioPrincipal,
-        http_request: Request,
-    ) -> JobAcceptedResponse:
-        request_json = canonical_json(request.model_dump(mode="json"))
-        request_hash = hashlib.sha256(request_json.encode()).hexdigest()
+    def process_portfolio_upload(
+        job_id: str, path: Path, total: int, actor_id: str, actor_role: str
+    ) -> None:
+        try:
+            process_portfolio(job_id, read_portfolio_upload(path), total, actor_id, actor_role)
+        finally:
+            path.unlink(missing_ok=True)
+
+    def consume_portfolio_confirmation(
+        confirmation_id: str, principal: Principal, request_hash: str, client_ip: str | None
+    ) -> None:
         try:
             confirmations.consume(
                 confirmation_id,
@@ -391,7 +509,7 @@ def create_app(
                 result_payload={"accepted": False},
                 versions={"security": "v1"},
                 status="DENIED",
-                client_ip=http_request.client.host if http_request.client else None,
+                client_ip=client_ip,
             )
             raise HTTPException(status_code=409, detail="critical confirmation invalid") from exc
         audit.record(
@@ -404,28 +522,34 @@ def create_app(
             result_payload={"accepted": True},
             versions={"security": "v1"},
             status="SUCCEEDED",
-            client_ip=http_request.client.host if http_request.client else None,
+            client_ip=client_ip,
         )
-        job_id = jobs.create(request_json)
+
+    def enqueue_portfolio(
+        request_json: str,
+        submitted_payload: dict[str, Any],
+        total: int,
+        principal: Principal,
+        client_ip: str | None,
+        worker: Callable[..., None],
+        source: object,
+    ) -> JobAcceptedResponse:
+        job_id = jobs.create(request_json, total)
         audit.record(
             actor_id=principal.user_id,
             actor_role=principal.role.value,
             action="ECL_PORTFOLIO_SUBMITTED",
             resource_type="job",
             resource_id=job_id,
-            input_payload=request.model_dump(mode="json"),
+            input_payload=submitted_payload,
             result_payload={"status": "PENDING"},
             versions={"api": "v1"},
             status="SUCCEEDED",
-            client_ip=http_request.client.host if http_request.client else None,
+            client_ip=client_ip,
         )
         try:
             batch_queue.submit(
-                process_portfolio,
-                job_id,
-                request.calculations,
-                principal.user_id,
-                principal.role.value,
+                worker, job_id, source, total, principal.user_id, principal.role.value
             )
         except BatchQueueFullError as exc:
             jobs.failed(job_id, "QUEUE_CAPACITY_EXCEEDED")
@@ -435,11 +559,11 @@ def create_app(
                 action="ECL_PORTFOLIO_QUEUE_REJECTED",
                 resource_type="job",
                 resource_id=job_id,
-                input_payload={"contracts": len(request.calculations)},
+                input_payload={"contracts": total},
                 result_payload={"error_code": "QUEUE_CAPACITY_EXCEEDED"},
                 versions={"api": "v1"},
                 status="FAILED",
-                client_ip=http_request.client.host if http_request.client else None,
+                client_ip=client_ip,
             )
             raise HTTPException(status_code=503, detail="batch queue capacity exceeded") from exc
         return JobAcceptedResponse(
@@ -448,6 +572,102 @@ def create_app(
             status_url=f"/api/v1/ecl/jobs/{job_id}",
         )
 
+    @application.post(
+        "/api/v1/ecl/portfolio",
+        response_model=JobAcceptedResponse,
+        status_code=status.HTTP_202_ACCEPTED,
+        tags=["ecl"],
+    )
+    def calculate_portfolio(
+        request: PortfolioRequest,
+        confirmation_id: Annotated[str, Header(alias="X-Confirmation-Id")],
+        principal: PortfolioPrincipal,
+        http_request: Request,
+    ) -> JobAcceptedResponse:
+        request_json = canonical_json(request.model_dump(mode="json"))
+        request_hash = hashlib.sha256(request_json.encode()).hexdigest()
+        client_ip = http_request.client.host if http_request.client else None
+        consume_portfolio_confirmation(confirmation_id, principal, request_hash, client_ip)
+        return enqueue_portfolio(
+            request_json,
+            request.model_dump(mode="json"),
+            len(request.calculations),
+            principal,
+            client_ip,
+            process_portfolio,
+            request.calculations,
+        )
+
+    def accept_portfolio_upload(
+        path: Path,
+        request_hash: str,
+        size_bytes: int,
+        confirmation_id: str,
+        principal: Principal,
+        client_ip: str | None,
+    ) -> JobAcceptedResponse:
+        try:
+            total = count_portfolio_upload(path, upload_max_items)
+        except ValueError as exc:
+            raise HTTPException(status_code=422, detail=str(exc)) from exc
+        consume_portfolio_confirmation(confirmation_id, principal, request_hash, client_ip)
+        reference = {"upload_sha256": request_hash, "bytes": size_bytes, "calculations": total}
+        return enqueue_portfolio(
+            canonical_json(reference),
+            reference,
+            total,
+            principal,
+            client_ip,
+            process_portfolio_upload,
+            path,
+        )
+
+    @application.post(
+        "/api/v1/ecl/portfolio.ndjson",
+        response_model=JobAcceptedResponse,
+        status_code=status.HTTP_202_ACCEPTED,
+        tags=["ecl"],
+    )
+    async def calculate_portfolio_upload(
+        confirmation_id: Annotated[str, Header(alias="X-Confirmation-Id")],
+        principal: PortfolioPrincipal,
+        http_request: Request,
+    ) -> JobAcceptedResponse:
+        """Accept one calculation per NDJSON line, spooled to disk as it arrives.
+
+        The confirmation payload hash is the SHA-256 of the exact request body. The
+        job reads the spool file line by line, so neither the request nor the job
+        holds the whole portfolio in memory. A body above ``BATCH_UPLOAD_MAX_BYTES``
+        is cut off with ``413`` as soon as it crosses the limit.
+        """
+        upload_directory.mkdir(parents=True, exist_ok=True)
+        path = upload_directory / f"{uuid4()}.ndjson"
+        digest = hashlib.sha256()
+        size_bytes = 0
+        try:
+            with path.open("wb") as spool:
+                async for block in http_request.stream():
+                    size_bytes += len(block)
+                    if size_bytes > upload_max_bytes:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"upload exceeds {upload_max_bytes} bytes",
+                        )
+                    digest.update(block)
+                    await run_in_threadpool(spool.write, block)
+            return await run_in_threadpool(
+                accept_portfolio_upload,
+                path,
+                digest.hexdigest(),
+                size_bytes,
+                confirmation_id,
+                principal,
+                http_request.client.host if http_request.client else None,
+            )
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
     @application.get("/api/v1/ecl/jobs/{job_id}", response_model=JobStatusResponse, tags=["ecl"])
     def job_status(
         job_id: str,
@@ -456,15 +676,55 @@ def create_app(
         row = jobs.get(job_id)
         if row is None:
             raise HTTPException(status_code=404, detail="job not found")
-        result = json.loads(row["result_json"]) if row["result_json"] else None
+        result = jobs.legacy_result(job_id) if row["has_legacy_result"] else None
         return JobStatusResponse(
             job_id=row["job_id"],
             status=row["status"],
             request_hash=row["request_hash"],
             result=result,
             error_code=row["error_code"],
+            total_items=row["total_items"],
+            processed_items=row["processed_items"],
+            result_chunks=row["result_chunks"],
+            results_url=f"/api/v1/ecl/jobs/{job_id}/results",
+        )
+
+    @application.get(
+        "/api/v1/ecl/jobs/{job_id}/results", response_model=JobResultsPage, tags=["ecl"]
+    )
+    def job_results(
+        job_id: str,
+        _principal: PortfolioPrincipal,
+        offset: Annotated[int, Query(ge=0)] = 0,
+        limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+    ) -> JobResultsPage:
+        row = jobs.get(job_id)
+        if row is None:
+            raise HTTPException(status_code=404, detail="job not found")
+        items = [
+            ECLCalculationResponse.model_validate(item)
+            for item in jobs.results_page(job_id, offset, limit)
+        ]
+        position = offset + len(items)
+        pending = row["status"] in {"PENDING", "RUNNING"}
+        return JobResultsPage(
+            job_id=row["job_id"],
+            status=row["status"],
+            offset=offset,
+            limit=limit,
+            total_items=row["total_items"],
+            processed_items=row["processed_items"],
+            items=items,
+            next_offset=position if position < row["processed_items"] or pending else None,
         )
 
+    @application.get("/api/v1/ecl/jobs/{job_id}/results.ndjson", tags=["ecl"])
+    def job_results_stream(job_id: str, _principal: PortfolioPrincipal) -> StreamingResponse:
+        if jobs.get(job_id) is None:
+            raise HTTPException(status_code=404, detail="job not found")
+
+        return StreamingResponse(jobs.iter_result_lines(job_id), media_type="application/x-ndjson")
+
     @application.get("/api/v1/ecl/executions/{execution_id}", tags=["evidence"])
     def execution_evidence(
         execution_id: str,
@@ -4,27 +4,56 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
+import pyarrow as pa  # type: ignore[import-untyped]
+
 from ...infrastructure.database import DatabaseManager
 
+RESULT_CODEC = "ndjson+zstd"
+_ZSTD = pa.Codec("zstd", compression_level=3)
+
+
+def encode_result_chunk(results: list[dict[str, Any]]) -> tuple[str, bytes, bytes]:
+    """Return the content hash, NDJSON text and zstd payload of one result chunk."""
+    ndjson = b"".join(
+        json.dumps(result, separators=(",", ":")).encode() + b"\n" for result in results
+    )
+    return hashlib.sha256(ndjson).hexdigest(), ndjson, _ZSTD.compress(ndjson, asbytes=True)
+
+
+def _chunk_lines(chunk: dict[str, Any]) -> list[bytes]:
+    """Decode one stored chunk into NDJSON lines, inline legacy JSON included."""
+    if chunk["result_json"] is not None:
+        return [
+            json.dumps(result, separators=(",", ":")).encode() + b"\n"
+            for result in json.loads(chunk["result_json"])
+        ]
+    ndjson: bytes = _ZSTD.decompress(
+        bytes(chunk["payload"]), decompressed_size=chunk["decoded_bytes"], asbytes=True
+    )
+    return ndjson.splitlines(keepends=True)
+
 
 class JobStore:
     def __init__(self, database: DatabaseManager) -> None:
         self.database = database
 
-    def create(self, request_json: str) -> str:
+    def create(self, request_json: str, total_items: int = 0) -> str:
         job_id = str(uuid4())
         self.database.execute(
             "INSERT INTO calculation_jobs "
-            "(job_id, status, request_hash, request_json, created_at) VALUES (?, ?, ?, ?, ?)",
+            "(job_id, status, request_hash, request_json, total_items, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
             (
                 job_id,
                 "PENDING",
                 hashlib.sha256(request_json.encode()).hexdigest(),
                 request_json,
+                total_items,
                 datetime.now(UTC).isoformat(),
             ),
         )
@@ -36,11 +65,54 @@ class JobStore:
             ("RUNNING", datetime.now(UTC).isoformat(), job_id),
         )
 
-    def succeeded(self, job_id: str, result: list[dict[str, Any]]) -> None:
+    def append_results(
+        self,
+        job_id: str,
+        chunk_index: int,
+        first_position: int,
+        results: list[dict[str, Any]],
+    ) -> str:
+        """Persist one ordered result chunk and advance progress in the same unit of work.
+
+        The chunk is stored once, compressed, under the SHA-256 of its NDJSON text;
+        the chunk row only references that hash.
+        """
+        if not results:
+            raise ValueError("result chunk must not be empty")
+        result_hash, ndjson, payload = encode_result_chunk(results)
+        created_at = datetime.now(UTC).isoformat()
+        with self.database.unit_of_work():
+            self.database.execute(
+                "INSERT INTO calculation_result_blobs "
+                "(blob_hash, codec, item_count, decoded_bytes, payload, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (blob_hash) DO NOTHING",
+                (result_hash, RESULT_CODEC, len(results), len(ndjson), payload, created_at),
+            )
+            self.database.execute(
+                "INSERT INTO calculation_job_results "
+                "(job_id, chunk_index, first_position, result_count, result_hash, blob_hash, "
+                "created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job_id,
+                    chunk_index,
+                    first_position,
+                    len(results),
+                    result_hash,
+                    result_hash,
+                    created_at,
+                ),
+            )
+            self.database.execute(
+                "UPDATE calculation_jobs SET processed_items = ?, result_chunks = ? "
+                "WHERE job_id = ?",
+                (first_position + len(results), chunk_index + 1, job_id),
+            )
+        return result_hash
+
+    def succeeded(self, job_id: str) -> None:
         self.database.execute(
-            "UPDATE calculation_jobs SET status = ?, result_json = ?, finished_at = ? "
-            "WHERE job_id = ?",
-            ("SUCCEEDED", json.dumps(result), datetime.now(UTC).isoformat(), job_id),
+            "UPDATE calculation_jobs SET status = ?, finished_at = ? WHERE job_id = ?",
+            ("SUCCEEDED", datetime.now(UTC).isoformat(), job_id),
         )
 
     def failed(self, job_id: str, error_code: str) -> None:
@@ -65,8 +137,53 @@ class JobStore:
         )
 
     def get(self, job_id: str) -> dict[str, Any] | None:
+        """Return status and progress without reading any result payload."""
         return self.database.fetch_one(
-            "SELECT job_id, status, request_hash, result_json, error_code "
+            "SELECT job_id, status, request_hash, result_json IS NOT NULL AS has_legacy_result, "
+            "error_code, total_items, processed_items, result_chunks "
             "FROM calculation_jobs WHERE job_id = ?",
             (job_id,),
         )
+
+    def legacy_result(self, job_id: str) -> Any:
+        """Return the whole inline result kept by jobs that predate result chunks."""
+        row = self.database.fetch_one(
+            "SELECT result_json FROM calculation_jobs WHERE job_id = ?", (job_id,)
+        )
+        return json.loads(row["result_json"]) if row and row["result_json"] else None
+
+    def results_page(self, job_id: str, offset: int, limit: int) -> list[dict[str, Any]]:
+        """Return persisted results by position, decoding only the chunks that cover the page."""
+        chunks = self.database.fetch_all(
+            "SELECT chunk.first_position, chunk.result_json, blob.decoded_bytes, blob.payload "
+            "FROM calculation_job_results chunk "
+            "LEFT JOIN calculation_result_blobs blob ON blob.blob_hash = chunk.blob_hash "
+            "WHERE chunk.job_id = ? AND chunk.first_position < ? "
+            "AND chunk.first_position + chunk.result_count > ? "
+            "ORDER BY chunk.first_position",
+            (job_id, offset + limit, offset),
+        )
+        page: list[dict[str, Any]] = []
+        for chunk in chunks:
+            start = max(0, offset - chunk["first_position"])
+            lines = _chunk_lines(chunk)[start : start + limit - len(page)]
+            page.extend(json.loads(line) for line in lines)
+        return page
+
+    def iter_result_lines(self, job_id: str) -> Iterator[bytes]:
+        """Yield persisted results as NDJSON lines, holding one chunk in memory at a time."""
+        chunk_index = 0
+        while chunk := self.database.fetch_one(
+            "SELECT chunk.result_json, blob.decoded_bytes, blob.payload "
+            "FROM calculation_job_results chunk "
+            "LEFT JOIN calculation_result_blobs blob ON blob.blob_hash = chunk.blob_hash "
+            "WHERE chunk.job_id = ? AND chunk.chunk_index = ?",
+            (job_id, chunk_index),
+        ):
+            yield from _chunk_lines(chunk)
+            chunk_index += 1
+
+    def iter_results(self, job_id: str) -> Iterator[dict[str, Any]]:
+        """Yield persisted results in order while holding one chunk in memory at a time."""
+        for line in self.iter_result_lines(job_id):
+            yield json.loads(line)
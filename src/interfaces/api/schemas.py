@@ -134,3 +134,18 @@ class JobStatusResponse(StrictModel):
     request_hash: str
     result: list[ECLCalculationResponse] | None = None
     error_code: str | None = None
+    total_items: int = 0
+    processed_items: int = 0
+    result_chunks: int = 0
+    results_url: str
+
+
+class JobResultsPage(StrictModel):
+    job_id: str
+    status: Literal["PENDING", "RUNNING", "SUCCEEDED", "FAILED"]
+    offset: int
+    limit: int
+    total_items: int
+    processed_items: int
+    items: list[ECLCalculationResponse]
+    next_offset: int | None = None
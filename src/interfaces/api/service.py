@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from ...domain.scenarios import (
@@ -14,9 +15,10 @@ from ...domain.scenarios import (
 )
 from ...ecl.calculation.scenario_engine import (
     BaselineRiskPeriod,
+    ProbabilityWeightedScenarioECL,
     calculate_probability_weighted_scenario_ecl,
 )
-from ...infrastructure.database import VersionedRepository
+from ...infrastructure.database import ECLResultRow, VersionedRepository
 from ...models.forward_looking import load_macro_risk_policy
 from .schemas import (
     ECLCalculationRequest,
@@ -26,6 +28,16 @@ from .schemas import (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class PreparedECLCalculation:
+    """Calculated request whose lineage and results have not been persisted yet."""
+
+    request: ECLCalculationRequest
+    calculation: ProbabilityWeightedScenarioECL
+    scenarios: tuple[ScenarioResult, ...]
+    result_rows: tuple[ECLResultRow, ...]
+
+
 class CanonicalECLApiService:
     """Translate validated API payloads into canonical domain calculations."""
 
@@ -63,6 +75,13 @@ class CanonicalECLApiService:
         )
 
     def calculate(self, request: ECLCalculationRequest) -> ECLCalculationResponse:
+        """Calculate one request and persist its lineage and results as one unit of work."""
+        prepared = self.prepare(request)
+        with self.repository.database.unit_of_work():
+            return self.persist(prepared)
+
+    def prepare(self, request: ECLCalculationRequest) -> PreparedECLCalculation:
+        """Calculate one request without touching the repository."""
         scenario_set = self._scenario_set(request)
         baseline = tuple(
             BaselineRiskPeriod(
@@ -79,6 +98,68 @@ class CanonicalECLApiService:
         calculation = calculate_probability_weighted_scenario_ecl(
             baseline, scenario_set, request.segment, self.macro_policy
         )
+        scenario_responses: list[ScenarioResult] = []
+        result_rows: list[ECLResultRow] = []
+        for scenario in calculation.scenario_results:
+            period_responses = [
+                PeriodResult(
+                    reference_date=period.reference_date,
+                    survival_at_start=period.survival_at_start,
+                    marginal_pd=period.marginal_pd,
+                    lgd=period.lgd,
+                    ead=period.ead,
+                    ccf=period.ccf,
+                    discount_factor=period.discount_factor,
+                    expected_loss=period.expected_loss,
+                )
+                for period in scenario.periods
+            ]
+            scenario_responses.append(
+                ScenarioResult(
+                    scenario_id=scenario.scenario_id,
+                    kind=scenario.kind.value,
+                    weight=scenario.weight,
+                    ecl=scenario.ecl,
+                    weighted_contribution=scenario.weighted_contribution,
+                    periods=period_responses,
+                )
+            )
+            for index, period in enumerate(scenario.periods, start=1):
+                result_rows.append(
+                    ECLResultRow(
+                        contract_id=request.contract_id,
+                        period=index,
+                        scenario_id=scenario.scenario_id,
+                        ecl_amount=period.expected_loss,
+                        payload={
+                            "stage": request.stage,
+                            "stage_assessment": request.stage_assessment.model_dump(mode="json"),
+                            "scenario_kind": scenario.kind.value,
+                            "scenario_weight": scenario.weight,
+                            "reference_date": period.reference_date,
+                            "survival_at_start": period.survival_at_start,
+                            "marginal_pd": period.marginal_pd,
+                            "lgd": period.lgd,
+                            "ead": period.ead,
+                            "ccf": period.ccf,
+                            "discount_factor": period.discount_factor,
+                            "expected_loss": period.expected_loss,
+                            "adjustments": {
+                                "status": "NOT_APPLIED",
+                                "management_overlay": None,
+                                "regulatory_floor": None,
+                                "reported_ecl": None,
+                            },
+                        },
+                    )
+                )
+        return PreparedECLCalculation(
+            request, calculation, tuple(scenario_responses), tuple(result_rows)
+        )
+
+    def persist(self, prepared: PreparedECLCalculation) -> ECLCalculationResponse:
+        """Persist a prepared calculation; callers own the surrounding unit of work."""
+        request, calculation = prepared.request, prepared.calculation
         request_document = request.model_dump(mode="json")
         contract_hash = self.repository.persist_contract(
             request.contract_id,
@@ -95,8 +176,10 @@ class CanonicalECLApiService:
         self.repository.persist_scenario(
             "scenario-set", request.scenario_version, {"scenarios": request_document["scenarios"]}
         )
-        for model_id, version in sorted(request.model_versions.items()):
-            self.repository.persist_model(model_id, version, {"version": version})
+        self.repository.persist_models(
+            (model_id, version, {"version": version})
+            for model_id, version in sorted(request.model_versions.items())
+        )
         lineage: dict[str, Any] = {
             "contract_hash": contract_hash,
             "scenario_version": calculation.scenario_version,
@@ -114,59 +197,9 @@ class CanonicalECLApiService:
             lineage=lineage,
             reprocess=request.reprocess,
         )
-        scenario_responses: list[ScenarioResult] = []
-        for scenario in calculation.scenario_results:
-            period_responses = [
-                PeriodResult(
-                    reference_date=period.reference_date,
-                    survival_at_start=period.survival_at_start,
-                    marginal_pd=period.marginal_pd,
-                    lgd=period.lgd,
-                    ead=period.ead,
-                    ccf=period.ccf,
-                    discount_factor=period.discount_factor,
-                    expected_loss=period.expected_loss,
-                )
-                for period in scenario.periods
-            ]
-            scenario_responses.append(
-                ScenarioResult(
-                    scenario_id=scenario.scenario_id,
-                    kind=scenario.kind.value,
-                    weight=scenario.weight,
-                    ecl=scenario.ecl,
-                    weighted_contribution=scenario.weighted_contribution,
-                    periods=period_responses,
-                )
-            )
-            for index, period in enumerate(scenario.periods, start=1):
-                self.repository.persist_ecl_result(
-                    execution_id=execution["execution_id"],
-                    contract_id=request.contract_id,
-                    period=index,
-                    scenario_id=scenario.scenario_id,
-                    ecl_amount=period.expected_loss,
-                    payload={
-                        "stage": request.stage,
-                        "stage_assessment": request.stage_assessment.model_dump(mode="json"),
-                        "scenario_kind": scenario.kind.value,
-                        "scenario_weight": scenario.weight,
-                        "reference_date": period.reference_date,
-                        "survival_at_start": period.survival_at_start,
-                        "marginal_pd": period.marginal_pd,
-                        "lgd": period.lgd,
-                        "ead": period.ead,
-                        "ccf": period.ccf,
-                        "discount_factor": period.discount_factor,
-                        "expected_loss": period.expected_loss,
-                        "adjustments": {
-                            "status": "NOT_APPLIED",
-                            "management_overlay": None,
-                            "regulatory_floor": None,
-                            "reported_ecl": None,
-                        },
-                    },
-                )
+        self.repository.persist_ecl_results(
+            execution_id=execution["execution_id"], results=prepared.result_rows
+        )
         self.repository.record_lineage_event(
             execution_id=execution["execution_id"],
             event_type="ECL_CALCULATED",
@@ -185,7 +218,7 @@ class CanonicalECLApiService:
             stage_assessment=request.stage_assessment,
             probability_weighted_ecl=calculation.probability_weighted_ecl,
             stress_ecl=calculation.stress_ecl,
-            scenarios=scenario_responses,
+            scenarios=list(prepared.scenarios),
             lineage_hash=execution["lineage_hash"],
             scenario_version=calculation.scenario_version,
             macro_policy_version=calculation.macro_policy_version,
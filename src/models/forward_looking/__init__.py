@@ -1,17 +1,25 @@
 """Forward-looking macroeconomic risk relations."""
 
 from .relations import (
+    MacroMultiplierTable,
+    MacroMultiplierTableStats,
     MacroRiskMultipliers,
     MacroRiskPolicy,
     build_macro_risk_paths,
     calculate_macro_risk_multipliers,
+    compile_macro_multiplier_table,
     load_macro_risk_policy,
+    macro_multiplier_table_stats,
 )
 
 __all__ = [
+    "MacroMultiplierTable",
+    "MacroMultiplierTableStats",
     "MacroRiskMultipliers",
     "MacroRiskPolicy",
     "build_macro_risk_paths",
     "calculate_macro_risk_multipliers",
+    "compile_macro_multiplier_table",
     "load_macro_risk_policy",
+    "macro_multiplier_table_stats",
 ]
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import json
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import date
 from decimal import ROUND_HALF_EVEN, Decimal
 from functools import lru_cache
 from hashlib import sha256
 from pathlib import Path
+from threading import Lock
 from typing import Any
 
+import numpy as np
+
 from ...domain.conventions import decimal_from
 from ...domain.exceptions import DomainValidationError
 from ...domain.scenarios import MacroTrajectoryPoint, ScenarioSet
@@ -20,6 +24,10 @@ POLICY_PATH = (
 )
 QUANTUM = Decimal("0.00000001")
 COMPONENTS = ("pd", "lgd", "ead", "ccf")
+MULTIPLIER_TABLE_CACHE_SIZE = 64
+_UNITS = int(1 / QUANTUM)
+
+type ComponentMultipliers = tuple[Decimal, Decimal, Decimal, Decimal]
 
 
 @dataclass(frozen=True, slots=True)
@@ -116,13 +124,9 @@ def _component_multiplier(
     )
 
 
-@lru_cache(maxsize=256)
-def calculate_macro_risk_multipliers(
-    scenario_id: str,
-    point: MacroTrajectoryPoint,
-    segment: str,
-    policy: MacroRiskPolicy,
-) -> MacroRiskMultipliers:
+def _point_multipliers(
+    point: MacroTrajectoryPoint, segment: str, policy: MacroRiskPolicy
+) -> ComponentMultipliers:
     variables = {
         variable.name: decimal_from(variable.value, field=variable.name)
         for variable in point.variables
@@ -135,28 +139,155 @@ def calculate_macro_risk_multipliers(
         scalars = dict(dict(policy.segment_scalars)[segment])
     except KeyError as exc:
         raise DomainValidationError(f"unknown macro risk segment: {segment}") from exc
-    multipliers = {
-        name: _component_multiplier(
+    pd, lgd, ead, ccf = (
+        _component_multiplier(
             variables=variables,
             anchors=anchors,
             relation=relation,
             segment_scalar=scalars[name],
         )
         for name, relation in policy.components
-    }
+    )
+    return pd, lgd, ead, ccf
+
+
+@lru_cache(maxsize=256)
+def calculate_macro_risk_multipliers(
+    scenario_id: str,
+    point: MacroTrajectoryPoint,
+    segment: str,
+    policy: MacroRiskPolicy,
+) -> MacroRiskMultipliers:
     return MacroRiskMultipliers(
         scenario_id,
         point.reference_date,
         segment,
-        multipliers["pd"],
-        multipliers["lgd"],
-        multipliers["ead"],
-        multipliers["ccf"],
+        *_point_multipliers(point, segment, policy),
         policy.policy_version,
         policy.sha256,
     )
 
 
+class MacroMultiplierTable:
+    """Dense (scenario, month, segment) multipliers of one scenario set under one policy.
+
+    A segment slice is materialized on first use, for every scenario and month,
+    and then served by index: ``factors(segment)[scenario][month]`` holds the
+    ``(pd, lgd, ead, ccf)`` Decimals and ``units(segment)`` the same values as a
+    read-only ``(scenario, month, component)`` ``int64`` array in units of
+    ``0.00000001``. Values equal ``calculate_macro_risk_multipliers``.
+    """
+
+    __slots__ = ("_lock", "_slices", "_trajectories", "policy", "scenario_ids")
+
+    def __init__(self, scenario_set: ScenarioSet, policy: MacroRiskPolicy) -> None:
+        self.scenario_ids = tuple(
+            trajectory.scenario_id for trajectory in scenario_set.trajectories
+        )
+        self.policy = policy
+        self._trajectories = tuple(trajectory.periods for trajectory in scenario_set.trajectories)
+        self._slices: dict[str, tuple[tuple[tuple[ComponentMultipliers, ...], ...], np.ndarray]] = (
+            {}
+        )
+        self._lock = Lock()
+
+    def _slice(
+        self, segment: str
+    ) -> tuple[tuple[tuple[ComponentMultipliers, ...], ...], np.ndarray]:
+        cached = self._slices.get(segment)
+        if cached is not None:
+            return cached
+        with self._lock:
+            cached = self._slices.get(segment)
+            if cached is None:
+                factors = tuple(
+                    tuple(_point_multipliers(point, segment, self.policy) for point in periods)
+                    for periods in self._trajectories
+                )
+                units = np.asarray(
+                    [[[int(value * _UNITS) for value in row] for row in path] for path in factors],
+                    dtype=np.int64,
+                )
+                units.setflags(write=False)
+                cached = self._slices[segment] = (factors, units)
+            return cached
+
+    def factors(self, segment: str) -> tuple[tuple[ComponentMultipliers, ...], ...]:
+        return self._slice(segment)[0]
+
+    def units(self, segment: str) -> np.ndarray:
+        return self._slice(segment)[1]
+
+    def matches(self, scenario_set: ScenarioSet, policy: MacroRiskPolicy) -> bool:
+        """True when built from the same trajectory periods and policy objects."""
+        return (
+            policy is self.policy
+            and len(scenario_set.trajectories) == len(self._trajectories)
+            and all(
+                trajectory.scenario_id == scenario_id and trajectory.periods is periods
+                for trajectory, scenario_id, periods in zip(
+                    scenario_set.trajectories, self.scenario_ids, self._trajectories, strict=True
+                )
+            )
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MacroMultiplierTableStats:
+    hits: int
+    misses: int
+    tables: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+_tables: OrderedDict[tuple[object, ...], MacroMultiplierTable] = OrderedDict()
+_tables_lock = Lock()
+_table_lookups = {"hits": 0, "misses": 0}
+
+
+def compile_macro_multiplier_table(
+    scenario_set: ScenarioSet, policy: MacroRiskPolicy
+) -> MacroMultiplierTable:
+    """Return the shared multiplier table of ``scenario_set`` under ``policy``.
+
+    Tables are keyed by object identity of the policy and of each trajectory's
+    periods, so lookups never hash Decimal content and derived sets that keep the
+    original trajectories (such as weight sensitivities) reuse the same table.
+    Each table keeps its sources alive while cached, so identities stay valid.
+    """
+    key = (
+        id(policy),
+        *(
+            (trajectory.scenario_id, id(trajectory.periods))
+            for trajectory in scenario_set.trajectories
+        ),
+    )
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is not None and table.matches(scenario_set, policy):
+            _tables.move_to_end(key)
+            _table_lookups["hits"] += 1
+            return table
+        _table_lookups["misses"] += 1
+        table = MacroMultiplierTable(scenario_set, policy)
+        _tables[key] = table
+        while len(_tables) > MULTIPLIER_TABLE_CACHE_SIZE:
+            _tables.popitem(last=False)
+        return table
+
+
+def macro_multiplier_table_stats() -> MacroMultiplierTableStats:
+    """Process-wide lookups of ``compile_macro_multiplier_table`` since start-up."""
+    with _tables_lock:
+        return MacroMultiplierTableStats(
+            _table_lookups["hits"], _table_lookups["misses"], len(_tables)
+        )
+
+
 def build_macro_risk_paths(
     scenario_set: ScenarioSet,
     segment: str,
@@ -9,6 +9,7 @@ from .contract import (
     ConnectedIpoc,
     ConnectedIpocGroup,
     Doc3040Input,
+    DocumentTally,
     FieldSpec,
     Guarantee,
     Header,
@@ -25,7 +26,18 @@ from .contract import (
     iter_sourced_values,
     sourced,
 )
-from .generator import XmlCandidate, compose_ipoc, generate_xml_candidate
+from .generator import (
+    DOCUMENT_CLOSING,
+    XmlCandidate,
+    XmlCandidateFile,
+    compose_ipoc,
+    document_head,
+    generate_xml_candidate,
+    render_client,
+    render_tail,
+    write_candidate_chunks,
+    write_xml_candidate,
+)
 from .layout_registry import (
     DEFAULT_REGISTRY_DIR,
     ArtifactRef,
@@ -41,13 +53,18 @@ from .layout_registry import (
     load_official_xsd,
     verify_artifact_file,
 )
+from .sharding import PrevalidatedCandidateFile, write_prevalidated_candidate
 from .validation import (
     DEFAULT_DOMAIN_FILE,
     IssueSeverity,
     PortfolioEclControl,
+    PrevalidationMerge,
     PrevalidationReport,
+    ShardIssues,
     ValidationIssue,
+    prevalidate_shard,
     prevalidate_xml,
+    prevalidate_xml_file,
 )
 
 __all__ = [
@@ -59,6 +76,7 @@ __all__ = [
     "ConnectedIpoc",
     "ConnectedIpocGroup",
     "Doc3040Input",
+    "DocumentTally",
     "FieldSpec",
     "Guarantee",
     "Header",
@@ -87,13 +105,26 @@ __all__ = [
     "load_derived_xsd",
     "load_official_xsd",
     "verify_artifact_file",
+    "DOCUMENT_CLOSING",
     "XmlCandidate",
+    "XmlCandidateFile",
     "compose_ipoc",
+    "document_head",
     "generate_xml_candidate",
+    "render_client",
+    "render_tail",
+    "write_candidate_chunks",
+    "write_xml_candidate",
+    "PrevalidatedCandidateFile",
+    "write_prevalidated_candidate",
     "DEFAULT_DOMAIN_FILE",
     "IssueSeverity",
     "PortfolioEclControl",
+    "PrevalidationMerge",
     "PrevalidationReport",
+    "ShardIssues",
     "ValidationIssue",
+    "prevalidate_shard",
     "prevalidate_xml",
+    "prevalidate_xml_file",
 ]
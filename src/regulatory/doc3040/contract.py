@@ -7,8 +7,10 @@ optional or conditional field must be passed explicitly as a sourced value or
 
 from __future__ import annotations
 
+import hashlib
 import re
-from dataclasses import dataclass, fields, is_dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field, fields, is_dataclass
 from datetime import date
 from decimal import Decimal
 from enum import StrEnum
@@ -700,28 +702,61 @@ class Doc3040Input:
     connected_ipoc_groups: tuple[ConnectedIpocGroup, ...]
 
     def __post_init__(self) -> None:
-        if not self.clients and not self.aggregations:
-            raise DomainValidationError("Doc3040 requires individualized clients or aggregations")
-        codes = [_v(x.code) for x in self.clients]
-        if len(codes) != len(set(codes)):
+        tally = DocumentTally(self.header)
+        for client in self.clients:
+            tally.add(client)
+        tally.close(self.aggregations, self.connected_ipoc_groups)
+
+
+def _digest(value: str) -> bytes:
+    return hashlib.blake2b(value.encode(), digest_size=16).digest()
+
+
+@dataclass(slots=True)
+class DocumentTally:
+    """The cross-client rules of ``Doc3040Input``, applied one client at a time.
+
+    ``Doc3040Input`` and the streaming writers share it. Client codes and IPOCs
+    are kept as 16-byte BLAKE2b digests, about 90 bytes per entry in a set, so
+    memory still grows with the number of operations but not with IPOC length.
+    """
+
+    header: Header
+    client_codes: set[bytes] = field(default_factory=set)
+    ipocs: set[bytes] = field(default_factory=set)
+    total_operations: int = 0
+
+    def add(self, client: Client) -> None:
+        code = _digest(_v(client.code))
+        if code in self.client_codes:
             raise DomainValidationError("client codes must be unique")
-        if not self.aggregations and _v(self.header.total_clients) != len(set(codes)):
+        if _v(client.relationship_start) >= _v(self.header.reference_month):
+            raise TemporalConsistencyError("relationship_start must precede reference_month")
+        for operation in client.operations:
+            ipoc = _digest(_v(operation.ipoc))
+            if ipoc in self.ipocs:
+                raise DomainValidationError("operation IPOCs must be unique")
+            self.ipocs.add(ipoc)
+        self.client_codes.add(code)
+        self.total_operations += len(client.operations)
+
+    def close(
+        self, aggregations: Sequence[Aggregation], groups: Sequence[ConnectedIpocGroup]
+    ) -> None:
+        if not self.client_codes and not aggregations:
+            raise DomainValidationError("Doc3040 requires individualized clients or aggregations")
+        total_clients = _v(self.header.total_clients)
+        if not aggregations and total_clients != len(self.client_codes):
             raise DomainValidationError(
                 "total_clients must reconcile to distinct individualized clients"
             )
-        if self.aggregations and _v(self.header.total_clients) < len(set(codes)):
+        if aggregations and total_clients < len(self.client_codes):
             raise DomainValidationError(
                 "total_clients cannot be lower than distinct individualized clients"
             )
-        ipocs = [_v(op.ipoc) for client in self.clients for op in client.operations]
-        if len(ipocs) != len(set(ipocs)):
-            raise DomainValidationError("operation IPOCs must be unique")
-        for group in self.connected_ipoc_groups:
-            if set(_v(x.ipoc) for x in group.ipocs) - set(ipocs):
+        for group in groups:
+            if {_digest(_v(x.ipoc)) for x in group.ipocs} - self.ipocs:
                 raise DomainValidationError("connected IPOCs must exist in document operations")
-        month = _v(self.header.reference_month)
-        if any(_v(c.relationship_start) >= month for c in self.clients):
-            raise TemporalConsistencyError("relationship_start must precede reference_month")
 
 
 def catalog_fields_for(model: type[object]) -> tuple[FieldSpec, ...]:
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import hashlib
-from collections.abc import Callable
+import zipfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import date
 from decimal import ROUND_HALF_EVEN, Decimal
-from typing import Any
+from pathlib import Path
+from typing import IO, Any
 from xml.etree import ElementTree as ET
 
 from ...domain.exceptions import DomainValidationError
@@ -16,7 +19,9 @@ from .contract import (
     AdditionalInformation,
     Aggregation,
     Client,
+    ConnectedIpocGroup,
     Doc3040Input,
+    DocumentTally,
     Guarantee,
     Header,
     MaturityValue,
@@ -40,6 +45,27 @@ class XmlCandidate:
     total_operations: int
 
 
+@dataclass(frozen=True, slots=True)
+class XmlCandidateFile:
+    path: Path
+    archive_member: str | None
+    size_bytes: int
+    sha256: str
+    layout_version: str
+    interface_label: str
+    validation_status: str
+    total_clients: int
+    total_operations: int
+
+
+_DECLARATION = b"<?xml version='1.0' encoding='utf-8'?>\n"
+DOCUMENT_CLOSING = b"\n</Doc3040>"
+_INDENT = "  "
+_SEPARATOR = b"\n" + _INDENT.encode()
+# Fixed zip entry metadata keeps the archive bytes reproducible across hosts.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
 def _v[T](item: SourcedValue[T]) -> T:
     return item.value
 
@@ -218,8 +244,8 @@ def _operation(parent: ET.Element, header: Header, client: Client, value: Operat
         _accounting(element, value.accounting_4966)
 
 
-def _client(parent: ET.Element, header: Header, value: Client) -> None:
-    element = ET.SubElement(parent, "Cli")
+def _client(header: Header, value: Client) -> ET.Element:
+    element = ET.Element("Cli")
     element.set("Cd", _v(value.code))
     element.set("Tp", _v(value.client_type))
     element.set("Autorzc", _v(value.authorization))
@@ -235,10 +261,11 @@ def _client(parent: ET.Element, header: Header, value: Client) -> None:
     _set_optional(element, "IdPais", value.country_code)
     for operation in value.operations:
         _operation(element, header, value, operation)
+    return element
 
 
-def _aggregation(parent: ET.Element, value: Aggregation) -> None:
-    element = ET.SubElement(parent, "Agreg")
+def _aggregation(value: Aggregation) -> ET.Element:
+    element = ET.Element("Agreg")
     for attribute, item in (
         ("NatuOp", value.nature),
         ("Mod", value.modality),
@@ -256,10 +283,17 @@ def _aggregation(parent: ET.Element, value: Aggregation) -> None:
     element.set("QtdOp", str(_v(value.operation_count)))
     element.set("QtdCli", str(_v(value.client_count)))
     _maturities(element, value.maturities)
+    return element
+
+
+def _connected_group(value: ConnectedIpocGroup) -> ET.Element:
+    element = ET.Element("ConIpocs")
+    for connected in value.ipocs:
+        ET.SubElement(element, "ipocCon", {"ipoc": _v(connected.ipoc)})
+    return element
 
 
-def _root(contract: Doc3040Input) -> ET.Element:
-    header = contract.header
+def _start_tag(header: Header) -> bytes:
     element = ET.Element("Doc3040")
     element.set("DtBase", _month(_v(header.reference_month)))
     element.set("CNPJ", _v(header.reporting_entity_cnpj))
@@ -273,15 +307,64 @@ def _root(contract: Doc3040Input) -> ET.Element:
     _set_optional(element, "MetodApPE", header.expected_loss_methodology)
     _set_optional(element, "MetodDifTJE", header.differentiated_eir_method)
     _set_optional(element, "TpFundo", header.fund_type)
-    for client in contract.clients:
-        _client(element, header, client)
-    for aggregation in contract.aggregations:
-        _aggregation(element, aggregation)
-    for group in contract.connected_ipoc_groups:
-        group_element = ET.SubElement(element, "ConIpocs")
-        for connected in group.ipocs:
-            ET.SubElement(group_element, "ipocCon", {"ipoc": _v(connected.ipoc)})
-    return element
+    empty: bytes = ET.tostring(element, encoding="utf-8", xml_declaration=False)
+    return empty.removesuffix(b" />") + b">"
+
+
+def _fragment(element: ET.Element) -> bytes:
+    """Serialize one ``Doc3040`` child exactly as ``ET.indent`` lays it out in place."""
+
+    ET.indent(element, space=_INDENT, level=1)
+    content: bytes = ET.tostring(
+        element, encoding="utf-8", xml_declaration=False, short_empty_elements=True
+    )
+    return content
+
+
+def document_head(header: Header) -> bytes:
+    """Return the XML declaration and ``Doc3040`` start tag that precede the first child."""
+    return _DECLARATION + _start_tag(header)
+
+
+def render_client(header: Header, client: Client) -> bytes:
+    """Return one indented ``Cli`` with the line break that precedes it in the document."""
+    return _SEPARATOR + _fragment(_client(header, client))
+
+
+def render_tail(aggregations: Sequence[Aggregation], groups: Sequence[ConnectedIpocGroup]) -> bytes:
+    """Return the ``Agreg`` and ``ConIpocs`` elements that follow the clients."""
+    return b"".join(
+        _SEPARATOR + _fragment(element)
+        for element in (
+            *(_aggregation(aggregation) for aggregation in aggregations),
+            *(_connected_group(group) for group in groups),
+        )
+    )
+
+
+def _document_chunks(
+    header: Header,
+    clients: Iterable[Client],
+    aggregations: Sequence[Aggregation],
+    groups: Sequence[ConnectedIpocGroup],
+    tally: DocumentTally,
+) -> Iterator[bytes]:
+    """Yield the indented document with at most one client's elements alive."""
+
+    yield document_head(header)
+    for client in clients:
+        tally.add(client)
+        yield render_client(header, client)
+    yield render_tail(aggregations, groups)
+    tally.close(aggregations, groups)
+    yield DOCUMENT_CLOSING
+
+
+def _selected_layout(header: Header, layout: LayoutVersion | None) -> LayoutVersion:
+    selected = layout or layout_for_reference_month(_v(header.reference_month))
+    if not (selected.effective_from <= _v(header.reference_month) < selected.effective_to):
+        raise DomainValidationError("selected layout does not cover the contract reference month")
+    return selected
 
 
 def generate_xml_candidate(
@@ -289,11 +372,17 @@ def generate_xml_candidate(
 ) -> XmlCandidate:
     """Render a deterministic candidate; this does not claim XSD/critic validity."""
 
-    selected = layout or layout_for_reference_month(_v(contract.header.reference_month))
-    if not (selected.effective_from <= _v(contract.header.reference_month) < selected.effective_to):
-        raise DomainValidationError("selected layout does not cover the contract reference month")
-    ET.indent(root := _root(contract), space="  ")
-    content = ET.tostring(root, encoding="utf-8", xml_declaration=True, short_empty_elements=True)
+    selected = _selected_layout(contract.header, layout)
+    tally = DocumentTally(contract.header)
+    content = b"".join(
+        _document_chunks(
+            contract.header,
+            contract.clients,
+            contract.aggregations,
+            contract.connected_ipoc_groups,
+            tally,
+        )
+    )
     return XmlCandidate(
         content=content,
         sha256=hashlib.sha256(content).hexdigest(),
@@ -301,5 +390,97 @@ def generate_xml_candidate(
         interface_label="pre-validator",
         validation_status="XSD_AND_CRITICS_PENDING",
         total_clients=_v(contract.header.total_clients),
-        total_operations=sum(len(client.operations) for client in contract.clients),
+        total_operations=tally.total_operations,
+    )
+
+
+def _write_chunks(
+    chunks: Iterable[bytes], path: Path, archive_member: str | None
+) -> tuple[int, str]:
+    """Write ``chunks`` through ``<path>.tmp`` and return the XML size and SHA-256."""
+
+    digest = hashlib.sha256()
+    size_bytes = 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(f"{path.suffix}.tmp")
+    try:
+        with ExitStack() as stack:
+            sink: IO[bytes]
+            if archive_member is None:
+                sink = stack.enter_context(temporary.open("wb"))
+            else:
+                archive = stack.enter_context(zipfile.ZipFile(temporary, "w"))
+                member = zipfile.ZipInfo(archive_member, date_time=_ZIP_DATE_TIME)
+                member.compress_type = zipfile.ZIP_DEFLATED
+                member.create_system = 3
+                member.external_attr = 0o644 << 16
+                sink = stack.enter_context(archive.open(member, "w", force_zip64=True))
+            for chunk in chunks:
+                digest.update(chunk)
+                sink.write(chunk)
+                size_bytes += len(chunk)
+        temporary.replace(path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return size_bytes, digest.hexdigest()
+
+
+def write_candidate_chunks(
+    header: Header,
+    chunks: Iterable[bytes],
+    tally: DocumentTally,
+    path: Path,
+    *,
+    layout: LayoutVersion | None = None,
+    archive_member: str | None = None,
+) -> XmlCandidateFile:
+    """Write document ``chunks`` as ``write_xml_candidate`` does and describe the file.
+
+    ``chunks`` must apply every client to ``tally`` and close it before ending;
+    the serial and the partitioned writers both build theirs from
+    ``document_head``, ``render_client``, ``render_tail`` and ``DOCUMENT_CLOSING``.
+    """
+
+    selected = _selected_layout(header, layout)
+    path = Path(path)
+    size_bytes, sha256 = _write_chunks(chunks, path, archive_member)
+    return XmlCandidateFile(
+        path=path,
+        archive_member=archive_member,
+        size_bytes=size_bytes,
+        sha256=sha256,
+        layout_version=selected.version,
+        interface_label="pre-validator",
+        validation_status="XSD_AND_CRITICS_PENDING",
+        total_clients=_v(header.total_clients),
+        total_operations=tally.total_operations,
+    )
+
+
+def write_xml_candidate(
+    header: Header,
+    clients: Iterable[Client],
+    path: Path,
+    *,
+    aggregations: Sequence[Aggregation] = (),
+    connected_ipoc_groups: Sequence[ConnectedIpocGroup] = (),
+    layout: LayoutVersion | None = None,
+    archive_member: str | None = None,
+) -> XmlCandidateFile:
+    """Stream the candidate to ``path`` holding one client's elements at a time.
+
+    Bytes and SHA-256 equal ``generate_xml_candidate`` for the same input, and the
+    same document rules apply as clients arrive. With ``archive_member`` the XML is
+    deflated into that member of a zip archive at ``path``; the digest still covers
+    the XML. ``path`` is only replaced once the whole document was written.
+    """
+
+    tally = DocumentTally(header)
+    return write_candidate_chunks(
+        header,
+        _document_chunks(header, clients, aggregations, connected_ipoc_groups, tally),
+        tally,
+        path,
+        layout=layout,
+        archive_member=archive_member,
     )
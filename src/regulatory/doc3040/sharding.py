@@ -0,0 +1,231 @@
+"""Client-partitioned Doc3040 generation and pre-validation over a process pool."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+
+from ...domain.exceptions import DomainValidationError, TemporalConsistencyError
+from .contract import Aggregation, Client, ConnectedIpocGroup, DocumentTally, Header
+from .generator import (
+    DOCUMENT_CLOSING,
+    XmlCandidateFile,
+    document_head,
+    render_client,
+    render_tail,
+    write_candidate_chunks,
+)
+from .layout_registry import LayoutVersion
+from .validation import (
+    DEFAULT_DOMAIN_FILE,
+    PortfolioEclControl,
+    PrevalidationMerge,
+    PrevalidationReport,
+    ShardIssues,
+    prevalidate_shard,
+    prevalidate_xml_file,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class PrevalidatedCandidateFile:
+    candidate: XmlCandidateFile
+    report: PrevalidationReport
+    partitions: int
+
+
+@dataclass(frozen=True, slots=True)
+class _Shard:
+    """Rendered fragments of consecutive clients and their shard-relative issues.
+
+    A rendering error is returned with the client's index rather than raised, so
+    the merge can apply the document rules of the clients before it first and
+    fail exactly where the serial writer fails.
+    """
+
+    content: bytes
+    issues: ShardIssues | None
+    failed_at: int | None = None
+    error: DomainValidationError | TemporalConsistencyError | None = None
+
+
+def _render_shard(
+    header: Header,
+    clients: Sequence[Client],
+    controls: tuple[PortfolioEclControl, ...],
+    domain_path: Path,
+    validate: bool,
+) -> _Shard:
+    fragments: list[bytes] = []
+    for index, client in enumerate(clients):
+        try:
+            fragments.append(render_client(header, client))
+        except (DomainValidationError, TemporalConsistencyError) as exc:
+            return _Shard(b"", None, index, exc)
+    content = b"".join(fragments)
+    if not validate:
+        return _Shard(content, None)
+    document = document_head(header) + content + DOCUMENT_CLOSING
+    return _Shard(content, prevalidate_shard(document, controls, domain_path))
+
+
+def _render_tail(
+    header: Header,
+    aggregations: Sequence[Aggregation],
+    groups: Sequence[ConnectedIpocGroup],
+    domain_path: Path,
+    validate: bool,
+) -> _Shard:
+    content = render_tail(aggregations, groups)
+    if not validate:
+        return _Shard(content, None)
+    document = document_head(header) + content + DOCUMENT_CLOSING
+    return _Shard(content, prevalidate_shard(document, (), domain_path))
+
+
+_WORKER_STATE: tuple[Header, Path, bool]
+
+
+def _initialize_worker(header: Header, domain_path: Path, validate: bool) -> None:
+    """Receive the header and validation settings once per worker process."""
+    global _WORKER_STATE
+    _WORKER_STATE = (header, domain_path, validate)
+
+
+def _render_worker_shard(
+    clients: list[Client], controls: tuple[PortfolioEclControl, ...]
+) -> _Shard:
+    header, domain_path, validate = _WORKER_STATE
+    return _render_shard(header, clients, controls, domain_path, validate)
+
+
+def _partition[T](values: Iterable[T], size: int) -> Iterator[list[T]]:
+    iterator = iter(values)
+    while partition := list(islice(iterator, size)):
+        yield partition
+
+
+def _shard_controls(
+    clients: Sequence[Client], controls: Mapping[str, PortfolioEclControl]
+) -> tuple[PortfolioEclControl, ...]:
+    return tuple(
+        control
+        for client in clients
+        for operation in client.operations
+        if (control := controls.get(operation.ipoc.value)) is not None
+    )
+
+
+@dataclass(slots=True)
+class _ShardMerge:
+    """Fold shards in client order into the document rules and one issue stream."""
+
+    tally: DocumentTally
+    prevalidation: PrevalidationMerge | None
+    lines: int = 0
+    partitions: int = 0
+
+    def add(self, clients: Sequence[Client], shard: _Shard) -> bytes:
+        for index, client in enumerate(clients):
+            self.tally.add(client)
+            if index == shard.failed_at and shard.error is not None:
+                raise shard.error
+        if self.prevalidation is not None:
+            if shard.issues is None:
+                self.prevalidation = None
+            else:
+                self.prevalidation.merge(shard.issues, self.lines)
+        self.lines += shard.content.count(b"\n")
+        self.partitions += bool(clients)
+        return shard.content
+
+
+def write_prevalidated_candidate(
+    header: Header,
+    clients: Iterable[Client],
+    controls: tuple[PortfolioEclControl, ...],
+    path: Path,
+    *,
+    aggregations: Sequence[Aggregation] = (),
+    connected_ipoc_groups: Sequence[ConnectedIpocGroup] = (),
+    layout: LayoutVersion | None = None,
+    archive_member: str | None = None,
+    domain_path: Path = DEFAULT_DOMAIN_FILE,
+    partition_size: int = 1024,
+    workers: int = 1,
+) -> PrevalidatedCandidateFile:
+    """Write and pre-validate the candidate with client partitions rendered in parallel.
+
+    Each worker renders and pre-validates one partition of ``Cli`` fragments. The
+    parent merges partitions in submission order: it applies the document rules,
+    streams the bytes to ``path`` and folds issues with their lines and ``Cli[n]``
+    positions moved to the whole document. File, digest and report equal
+    ``write_xml_candidate`` followed by ``prevalidate_xml_file``. When a shard cannot
+    be scanned on its own, the written file is pre-validated in a single pass.
+    """
+
+    if partition_size <= 0 or workers <= 0:
+        raise ValueError("partition size and workers must be positive")
+    control_map = {control.ipoc: control for control in controls}
+    head = document_head(header)
+    prevalidation = PrevalidationMerge.open(head + DOCUMENT_CLOSING, controls, domain_path)
+    merge = _ShardMerge(DocumentTally(header), prevalidation)
+    partitions = _partition(clients, partition_size)
+
+    def shards() -> Iterator[tuple[list[Client], _Shard]]:
+        validate = prevalidation is not None
+        if workers == 1:
+            for partition in partitions:
+                shard_controls = _shard_controls(partition, control_map)
+                shard = _render_shard(header, partition, shard_controls, domain_path, validate)
+                yield partition, shard
+            return
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(header, domain_path, validate),
+        ) as pool:
+            pending: deque[tuple[list[Client], Future[_Shard]]] = deque()
+            for partition in partitions:
+                shard_controls = _shard_controls(partition, control_map)
+                future = pool.submit(_render_worker_shard, partition, shard_controls)
+                pending.append((partition, future))
+                if len(pending) >= workers * 2:
+                    submitted, future = pending.popleft()
+                    yield submitted, future.result()
+            while pending:
+                submitted, future = pending.popleft()
+                yield submitted, future.result()
+
+    def chunks() -> Iterator[bytes]:
+        yield head
+        for partition, shard in shards():
+            yield merge.add(partition, shard)
+        tail = _render_tail(
+            header,
+            aggregations,
+            connected_ipoc_groups,
+            domain_path,
+            merge.prevalidation is not None,
+        )
+        yield merge.add((), tail)
+        merge.tally.close(aggregations, connected_ipoc_groups)
+        yield DOCUMENT_CLOSING
+
+    candidate = write_candidate_chunks(
+        header, chunks(), merge.tally, path, layout=layout, archive_member=archive_member
+    )
+    report = (
+        merge.prevalidation.report()
+        if merge.prevalidation is not None
+        else prevalidate_xml_file(
+            candidate.path, controls, archive_member=archive_member, domain_path=domain_path
+        )
+    )
+    return PrevalidatedCandidateFile(candidate, report, merge.partitions)
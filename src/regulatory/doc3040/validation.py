@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import io
 import json
+import threading
+import zipfile
+from collections import Counter
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import date
 from decimal import Decimal, InvalidOperation
 from enum import StrEnum
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import IO
 
 from lxml import etree  # type: ignore[import-untyped]
 
@@ -17,6 +24,11 @@ from .layout_registry import LayoutVersion, layout_for_reference_month, load_der
 
 DEFAULT_DOMAIN_FILE = Path("config/regulatory/doc3040/domains/2026.07-supported-subset.json")
 
+# lxml validators keep their error log on the instance, so threads never share one.
+_SCHEMAS = threading.local()
+# Top-level elements validated per schema call; one call per element costs twice as much.
+_VALIDATION_BATCH = 64
+
 
 class IssueSeverity(StrEnum):
     WARNING = "warning"
@@ -94,10 +106,25 @@ def _parse_month(root: etree._Element) -> date:
 
 
 def _load_domains(layout: LayoutVersion, path: Path) -> tuple[str, Mapping[str, frozenset[str]]]:
+    stat = path.stat()
+    return _read_domains(
+        path.resolve(),
+        stat.st_mtime_ns,
+        stat.st_size,
+        layout.version,
+        layout.artifact("layout_and_domains").sha256,
+    )
+
+
+@lru_cache(maxsize=16)
+def _read_domains(
+    path: Path, mtime_ns: int, size: int, layout_version: str, source_hash: str
+) -> tuple[str, Mapping[str, frozenset[str]]]:
+    """Parse one domain file version; the stat fields only key the cache."""
+
     payload = json.loads(path.read_text(encoding="utf-8"))
-    if payload.get("layout_version") != layout.version:
+    if payload.get("layout_version") != layout_version:
         raise DomainValidationError("domain set does not match selected layout version")
-    source_hash = layout.artifact("layout_and_domains").sha256
     if payload.get("derived_from_layout_sha256") != source_hash:
         raise DomainValidationError("domain set is not bound to the selected official layout hash")
     raw_values = payload.get("values")
@@ -108,7 +135,20 @@ def _load_domains(layout: LayoutVersion, path: Path) -> tuple[str, Mapping[str,
         if not isinstance(raw, list) or not raw or not all(isinstance(item, str) for item in raw):
             raise DomainValidationError(f"domain {name} must be a non-empty string list")
         values[name] = frozenset(raw)
-    return str(payload["domain_set_id"]), values
+    return str(payload["domain_set_id"]), MappingProxyType(values)
+
+
+def _derived_schema(layout: LayoutVersion) -> etree.XMLSchema:
+    schemas: dict[tuple[str, str | None], etree.XMLSchema] | None = getattr(
+        _SCHEMAS, "by_layout", None
+    )
+    if schemas is None:
+        schemas = _SCHEMAS.by_layout = {}
+    key = (layout.version, layout.derived_xsd.sha256 if layout.derived_xsd else None)
+    schema = schemas.get(key)
+    if schema is None:
+        schema = schemas[key] = etree.XMLSchema(etree.fromstring(load_derived_xsd(layout)))
+    return schema
 
 
 def _check_domain(
@@ -145,7 +185,7 @@ def _check_domain(
         )
 
 
-def _validate_domains(
+def _root_domains(
     root: etree._Element, domains: Mapping[str, frozenset[str]]
 ) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
@@ -155,78 +195,90 @@ def _validate_domains(
         ("MetodDifTJE", "yes_no", False),
     ):
         _check_domain(issues, root, attribute, domain, domains, required=required)
-    for client in root.findall("Cli"):
-        _check_domain(issues, client, "Tp", "client_type", domains, required=True)
-        _check_domain(issues, client, "Autorzc", "authorization", domains, required=True)
-        size_domain = "pj_size" if client.get("Tp") == "2" else "pf_size"
-        _check_domain(issues, client, "PorteCli", size_domain, domains, required=True)
-        _check_domain(issues, client, "TpCtrl", "control_type", domains)
-        for operation in client.findall("Op"):
-            for attribute, domain in (
-                ("Mod", "modality_supported"),
-                ("OrigemRec", "resource_origin_supported"),
-                ("Indx", "indexer"),
-                ("VarCamb", "currency_variation"),
-                ("NatuOp", "nature"),
-            ):
-                _check_domain(issues, operation, attribute, domain, domains, required=True)
-            for maturity in operation.findall("Venc"):
-                for vertex in maturity.attrib:
-                    if vertex not in domains["maturity_vertex"]:
-                        issues.append(
-                            _issue(
-                                "LOCAL-DOMAIN",
-                                IssueSeverity.ERROR,
-                                f"unsupported maturity vertex {vertex}",
-                                maturity,
-                                vertex,
-                            )
-                        )
-            for guarantee in operation.findall("Gar"):
-                for attribute, domain in (
-                    ("Tp", "guarantee_type_supported"),
-                    ("SitGar", "guarantee_status"),
-                    ("TpVlrGar", "guarantee_value_type"),
-                    ("Compart", "guarantee_sharing"),
-                ):
-                    _check_domain(issues, guarantee, attribute, domain, domains)
-            for information in operation.findall("Inf"):
-                _check_domain(
-                    issues,
-                    information,
-                    "Tp",
-                    "additional_information_supported",
-                    domains,
-                    required=True,
-                )
-            sicor = operation.find("Sicor")
-            if sicor is not None:
-                _check_domain(issues, sicor, "Situacao", "sicor_status", domains, required=True)
-            accounting = operation.find("ContInstFinRes4966")
-            if accounting is not None:
-                for attribute, domain in (
-                    ("ClasAtFin", "asset_classification"),
-                    ("EstInstFin", "stage"),
-                    ("PdEst1", "yes_no"),
-                    ("CartProvMin", "minimum_provision_portfolio"),
-                    ("TratRisc", "yes_no"),
-                ):
-                    _check_domain(issues, accounting, attribute, domain, domains)
-                for stage in accounting.findall("Estagio"):
-                    _check_domain(issues, stage, "Motivo", "stage_reason", domains, required=True)
-                for loss in accounting.findall("Perda"):
-                    _check_domain(issues, loss, "MotPerda", "loss_reason", domains, required=True)
-    for aggregate in root.findall("Agreg"):
+    return issues
+
+
+def _client_domains(
+    client: etree._Element, domains: Mapping[str, frozenset[str]]
+) -> list[ValidationIssue]:
+    issues: list[ValidationIssue] = []
+    _check_domain(issues, client, "Tp", "client_type", domains, required=True)
+    _check_domain(issues, client, "Autorzc", "authorization", domains, required=True)
+    size_domain = "pj_size" if client.get("Tp") == "2" else "pf_size"
+    _check_domain(issues, client, "PorteCli", size_domain, domains, required=True)
+    _check_domain(issues, client, "TpCtrl", "control_type", domains)
+    for operation in client.findall("Op"):
         for attribute, domain in (
-            ("NatuOp", "nature"),
             ("Mod", "modality_supported"),
             ("OrigemRec", "resource_origin_supported"),
-            ("VincME", "yes_no"),
-            ("FaixaVlr", "value_band"),
-            ("TpCli", "client_type"),
-            ("TpCtrl", "control_type"),
+            ("Indx", "indexer"),
+            ("VarCamb", "currency_variation"),
+            ("NatuOp", "nature"),
         ):
-            _check_domain(issues, aggregate, attribute, domain, domains)
+            _check_domain(issues, operation, attribute, domain, domains, required=True)
+        for maturity in operation.findall("Venc"):
+            for vertex in maturity.attrib:
+                if vertex not in domains["maturity_vertex"]:
+                    issues.append(
+                        _issue(
+                            "LOCAL-DOMAIN",
+                            IssueSeverity.ERROR,
+                            f"unsupported maturity vertex {vertex}",
+                            maturity,
+                            vertex,
+                        )
+                    )
+        for guarantee in operation.findall("Gar"):
+            for attribute, domain in (
+                ("Tp", "guarantee_type_supported"),
+                ("SitGar", "guarantee_status"),
+                ("TpVlrGar", "guarantee_value_type"),
+                ("Compart", "guarantee_sharing"),
+            ):
+                _check_domain(issues, guarantee, attribute, domain, domains)
+        for information in operation.findall("Inf"):
+            _check_domain(
+                issues,
+                information,
+                "Tp",
+                "additional_information_supported",
+                domains,
+                required=True,
+            )
+        sicor = operation.find("Sicor")
+        if sicor is not None:
+            _check_domain(issues, sicor, "Situacao", "sicor_status", domains, required=True)
+        accounting = operation.find("ContInstFinRes4966")
+        if accounting is not None:
+            for attribute, domain in (
+                ("ClasAtFin", "asset_classification"),
+                ("EstInstFin", "stage"),
+                ("PdEst1", "yes_no"),
+                ("CartProvMin", "minimum_provision_portfolio"),
+                ("TratRisc", "yes_no"),
+            ):
+                _check_domain(issues, accounting, attribute, domain, domains)
+            for stage in accounting.findall("Estagio"):
+                _check_domain(issues, stage, "Motivo", "stage_reason", domains, required=True)
+            for loss in accounting.findall("Perda"):
+                _check_domain(issues, loss, "MotPerda", "loss_reason", domains, required=True)
+    return issues
+
+
+def _aggregate_domains(
+    aggregate: etree._Element, domains: Mapping[str, frozenset[str]]
+) -> list[ValidationIssue]:
+    issues: list[ValidationIssue] = []
+    for attribute, domain in (
+        ("NatuOp", "nature"),
+        ("Mod", "modality_supported"),
+        ("OrigemRec", "resource_origin_supported"),
+        ("VincME", "yes_no"),
+        ("FaixaVlr", "value_band"),
+        ("TpCli", "client_type"),
+        ("TpCtrl", "control_type"),
+    ):
+        _check_domain(issues, aggregate, attribute, domain, domains)
     return issues
 
 
@@ -235,9 +287,10 @@ def _decimal(element: etree._Element, attribute: str) -> Decimal | None:
     if raw is None:
         return None
     try:
-        return Decimal(raw)
+        value = Decimal(raw)
     except InvalidOperation:
         return None
+    return value if value.is_finite() else None
 
 
 def _reported_ipoc(root: etree._Element, client: etree._Element, operation: etree._Element) -> str:
@@ -259,162 +312,427 @@ def _reported_ipoc(root: etree._Element, client: etree._Element, operation: etre
     )
 
 
-def _validate_semantics(
-    root: etree._Element, controls: tuple[PortfolioEclControl, ...]
+def _client_semantics(
+    root: etree._Element,
+    client: etree._Element,
+    controls: Mapping[str, PortfolioEclControl],
+    seen_ipocs: set[str],
 ) -> list[ValidationIssue]:
     issues: list[ValidationIssue] = []
-    clients = root.findall("Cli")
-    aggregates = root.findall("Agreg")
-    if not aggregates and root.get("TotalCli") != str(
-        len({client.get("Cd") for client in clients})
-    ):
-        issues.append(
-            _issue(
-                "LOCAL-TOTAL-CLIENTS",
-                IssueSeverity.ERROR,
-                "TotalCli does not reconcile to distinct individualized clients",
-                root,
-                "TotalCli",
+    seen_contracts: set[tuple[str | None, str | None]] = set()
+    for operation in client.findall("Op"):
+        ipoc = operation.get("IPOC", "")
+        if ipoc in seen_ipocs:
+            issues.append(
+                _issue(
+                    "LOCAL-IPOC-UNIQUE",
+                    IssueSeverity.ERROR,
+                    "duplicate IPOC",
+                    operation,
+                    "IPOC",
+                )
             )
-        )
-    control_map = {control.ipoc: control for control in controls}
-    if len(control_map) != len(controls):
-        raise DomainValidationError("portfolio controls must have unique IPOCs")
-    seen_ipocs: set[str] = set()
-    for client in clients:
-        seen_contracts: set[tuple[str | None, str | None]] = set()
-        for operation in client.findall("Op"):
-            ipoc = operation.get("IPOC", "")
-            if ipoc in seen_ipocs:
-                issues.append(
-                    _issue(
-                        "LOCAL-IPOC-UNIQUE",
-                        IssueSeverity.ERROR,
-                        "duplicate IPOC",
-                        operation,
-                        "IPOC",
-                    )
+        seen_ipocs.add(ipoc)
+        contract_key = (operation.get("Mod"), operation.get("Contrt"))
+        if contract_key in seen_contracts:
+            issues.append(
+                _issue(
+                    "LOCAL-CONTRACT-UNIQUE",
+                    IssueSeverity.ERROR,
+                    "duplicate contract for client and modality",
+                    operation,
+                    "Contrt",
                 )
-            seen_ipocs.add(ipoc)
-            contract_key = (operation.get("Mod"), operation.get("Contrt"))
-            if contract_key in seen_contracts:
-                issues.append(
-                    _issue(
-                        "LOCAL-CONTRACT-UNIQUE",
-                        IssueSeverity.ERROR,
-                        "duplicate contract for client and modality",
-                        operation,
-                        "Contrt",
-                    )
+            )
+        seen_contracts.add(contract_key)
+        expected_ipoc = _reported_ipoc(root, client, operation)
+        if ipoc != expected_ipoc:
+            issues.append(
+                _issue(
+                    "LOCAL-IPOC-COMPONENTS",
+                    IssueSeverity.ERROR,
+                    f"IPOC components imply {expected_ipoc}",
+                    operation,
+                    "IPOC",
                 )
-            seen_contracts.add(contract_key)
-            expected_ipoc = _reported_ipoc(root, client, operation)
-            if ipoc != expected_ipoc:
-                issues.append(
-                    _issue(
-                        "LOCAL-IPOC-COMPONENTS",
-                        IssueSeverity.ERROR,
-                        f"IPOC components imply {expected_ipoc}",
-                        operation,
-                        "IPOC",
-                    )
+            )
+        control = controls.get(ipoc)
+        if control is None:
+            issues.append(
+                _issue(
+                    "LOCAL-PORTFOLIO-CONTROL",
+                    IssueSeverity.BLOCKER,
+                    "missing portfolio/ECL control",
+                    operation,
+                    "IPOC",
                 )
-            control = control_map.get(ipoc)
-            if control is None:
-                issues.append(
-                    _issue(
-                        "LOCAL-PORTFOLIO-CONTROL",
-                        IssueSeverity.BLOCKER,
-                        "missing portfolio/ECL control",
-                        operation,
-                        "IPOC",
-                    )
+            )
+            continue
+        accounting = operation.find("ContInstFinRes4966")
+        if accounting is None:
+            issues.append(
+                _issue(
+                    "LOCAL-ECL-BLOCK",
+                    IssueSeverity.ERROR,
+                    "missing ContInstFinRes4966 for portfolio reconciliation",
+                    operation,
+                    "ContInstFinRes4966",
                 )
-                continue
-            accounting = operation.find("ContInstFinRes4966")
-            if accounting is None:
-                issues.append(
-                    _issue(
-                        "LOCAL-ECL-BLOCK",
-                        IssueSeverity.ERROR,
-                        "missing ContInstFinRes4966 for portfolio reconciliation",
-                        operation,
-                        "ContInstFinRes4966",
-                    )
+            )
+            continue
+        gross = _decimal(accounting, "VlrContBr")
+        loss = _decimal(accounting, "VlrPerdaAcum")
+        if gross != control.gross_carrying_amount:
+            issues.append(
+                _issue(
+                    "LOCAL-PORTFOLIO-GROSS",
+                    IssueSeverity.ERROR,
+                    f"VlrContBr does not reconcile to control {control.evidence_id}",
+                    accounting,
+                    "VlrContBr",
                 )
-                continue
-            gross = _decimal(accounting, "VlrContBr")
-            loss = _decimal(accounting, "VlrPerdaAcum")
-            if gross != control.gross_carrying_amount:
-                issues.append(
-                    _issue(
-                        "LOCAL-PORTFOLIO-GROSS",
-                        IssueSeverity.ERROR,
-                        f"VlrContBr does not reconcile to control {control.evidence_id}",
-                        accounting,
-                        "VlrContBr",
-                    )
+            )
+        if loss != control.ecl_amount:
+            issues.append(
+                _issue(
+                    "LOCAL-PORTFOLIO-ECL",
+                    IssueSeverity.ERROR,
+                    f"VlrPerdaAcum does not reconcile to control {control.evidence_id}",
+                    accounting,
+                    "VlrPerdaAcum",
                 )
-            if loss != control.ecl_amount:
-                issues.append(
-                    _issue(
-                        "LOCAL-PORTFOLIO-ECL",
-                        IssueSeverity.ERROR,
-                        f"VlrPerdaAcum does not reconcile to control {control.evidence_id}",
-                        accounting,
-                        "VlrPerdaAcum",
-                    )
+            )
+        if gross is not None and loss is not None and loss > gross:
+            issues.append(
+                _issue(
+                    "LOCAL-ECL-BOUND",
+                    IssueSeverity.ERROR,
+                    "accumulated loss exceeds gross carrying amount",
+                    accounting,
+                    "VlrPerdaAcum",
                 )
-            if gross is not None and loss is not None and loss > gross:
-                issues.append(
-                    _issue(
-                        "LOCAL-ECL-BOUND",
-                        IssueSeverity.ERROR,
-                        "accumulated loss exceeds gross carrying amount",
-                        accounting,
-                        "VlrPerdaAcum",
-                    )
+            )
+        amounts = [
+            _decimal(maturity, vertex)
+            for maturity in operation.findall("Venc")
+            for vertex in maturity.attrib
+        ]
+        # The derived XSD skips Venc attributes, so a non-numeric vertex fails here.
+        maturity_total = sum((amount for amount in amounts if amount is not None), Decimal("0"))
+        if gross is not None and (None in amounts or maturity_total != gross):
+            issues.append(
+                _issue(
+                    "LOCAL-MATURITY-TOTAL",
+                    IssueSeverity.ERROR,
+                    "maturity vertices do not reconcile to gross carrying amount "
+                    "in the supported perimeter",
+                    operation.find("Venc"),
+                    "Venc",
                 )
-            maturity_total = sum(
-                (
-                    Decimal(raw)
-                    for maturity in operation.findall("Venc")
-                    for raw in maturity.attrib.values()
-                ),
-                Decimal("0"),
             )
-            if gross is not None and maturity_total != gross:
-                issues.append(
-                    _issue(
-                        "LOCAL-MATURITY-TOTAL",
-                        IssueSeverity.ERROR,
-                        "maturity vertices do not reconcile to gross carrying amount "
-                        "in the supported perimeter",
-                        operation.find("Venc"),
-                        "Venc",
-                    )
+    return issues
+
+
+@dataclass(frozen=True, slots=True)
+class ShardIssues:
+    """Picklable outcome of one shard, with lines and ordinals relative to that shard."""
+
+    xsd_issues: tuple[ValidationIssue, ...]
+    client_domain_issues: tuple[tuple[ValidationIssue, int], ...]
+    aggregate_domain_issues: tuple[tuple[ValidationIssue, int], ...]
+    semantic_issues: tuple[tuple[ValidationIssue, int], ...]
+    client_codes: frozenset[str | None]
+    seen_ipocs: frozenset[str]
+    counts: Mapping[str, int]
+
+
+def _shifted(issue: ValidationIssue, lines: int) -> ValidationIssue:
+    return issue if issue.line is None else replace(issue, line=issue.line + lines)
+
+
+@dataclass(slots=True)
+class _StreamState:
+    """Issues and cross-client state of one pass, kept in the report's issue order.
+
+    ``iterparse`` may already hold later siblings when a top-level element ends, so
+    each one is checked alone under ``detached``, an empty element named like the
+    root. It then waits in ``shell``, a copy of the root attributes, for the next
+    batched XSD validation. Issues carry the element's ordinal so paths get the
+    ``[n]`` index ``getpath`` gives once the sibling count is known at the end.
+    """
+
+    root: etree._Element
+    layout: LayoutVersion
+    domain_set_id: str
+    domains: Mapping[str, frozenset[str]]
+    schema: etree.XMLSchema
+    controls: Mapping[str, PortfolioEclControl]
+    detached: etree._Element = field(init=False)
+    shell: etree._Element = field(init=False)
+    root_path: str = field(init=False)
+    xsd_issues: list[ValidationIssue] = field(default_factory=list)
+    root_xsd_errors: set[str] = field(default_factory=set)
+    client_domain_issues: list[tuple[ValidationIssue, int]] = field(default_factory=list)
+    aggregate_domain_issues: list[tuple[ValidationIssue, int]] = field(default_factory=list)
+    semantic_issues: list[tuple[ValidationIssue, int]] = field(default_factory=list)
+    client_codes: set[str | None] = field(default_factory=set)
+    seen_ipocs: set[str] = field(default_factory=set)
+    counts: Counter[str] = field(default_factory=Counter)
+
+    def __post_init__(self) -> None:
+        self.detached = etree.Element(self.root.tag)
+        self.shell = etree.Element(self.root.tag, dict(self.root.attrib))
+        self.shell.text = self.root.text
+        self.root_path = self.root.getroottree().getpath(self.root)
+
+    def _validate_structure(self) -> None:
+        self.schema.validate(self.shell)
+        for error in self.schema.error_log:
+            line = error.line
+            if error.path == self.root_path:
+                # Root errors repeat for every element and belong to the real root line.
+                if error.message in self.root_xsd_errors:
+                    continue
+                self.root_xsd_errors.add(error.message)
+                line = self.root.sourceline
+            self.xsd_issues.append(
+                ValidationIssue("DERIVED-XSD", IssueSeverity.ERROR, error.message, line, None, "/")
+            )
+        del self.shell[:]
+
+    def add(self, element: etree._Element) -> None:
+        self.counts[element.tag] += 1
+        ordinal = self.counts[element.tag]
+        self.detached.append(element)
+        if element.tag == "Cli":
+            self.client_codes.add(element.get("Cd"))
+            self.client_domain_issues.extend(
+                (issue, ordinal) for issue in _client_domains(element, self.domains)
+            )
+            self.semantic_issues.extend(
+                (issue, ordinal)
+                for issue in _client_semantics(self.root, element, self.controls, self.seen_ipocs)
+            )
+        elif element.tag == "Agreg":
+            self.aggregate_domain_issues.extend(
+                (issue, ordinal) for issue in _aggregate_domains(element, self.domains)
+            )
+        self.shell.append(element)
+        if len(self.shell) >= _VALIDATION_BATCH:
+            self._validate_structure()
+
+    def shard_issues(self) -> ShardIssues:
+        if len(self.shell):
+            self._validate_structure()
+        return ShardIssues(
+            tuple(self.xsd_issues),
+            tuple(self.client_domain_issues),
+            tuple(self.aggregate_domain_issues),
+            tuple(self.semantic_issues),
+            frozenset(self.client_codes),
+            frozenset(self.seen_ipocs),
+            dict(self.counts),
+        )
+
+    def merge(self, shard: ShardIssues, lines: int) -> None:
+        """Append a shard whose first element follows ``lines`` newlines of earlier shards.
+
+        Shards share this root's start tag, so root errors stay on its line and are
+        kept once, as a single pass would keep them.
+        """
+
+        for issue in shard.xsd_issues:
+            if issue.line == self.root.sourceline:
+                if issue.message in self.root_xsd_errors:
+                    continue
+                self.root_xsd_errors.add(issue.message)
+                self.xsd_issues.append(issue)
+            else:
+                self.xsd_issues.append(_shifted(issue, lines))
+        clients, aggregates = self.counts["Cli"], self.counts["Agreg"]
+        self.client_domain_issues.extend(
+            (_shifted(issue, lines), ordinal + clients)
+            for issue, ordinal in shard.client_domain_issues
+        )
+        self.aggregate_domain_issues.extend(
+            (_shifted(issue, lines), ordinal + aggregates)
+            for issue, ordinal in shard.aggregate_domain_issues
+        )
+        self.semantic_issues.extend(
+            (_shifted(issue, lines), ordinal + clients) for issue, ordinal in shard.semantic_issues
+        )
+        self.client_codes |= shard.client_codes
+        self.seen_ipocs |= shard.seen_ipocs
+        self.counts.update(shard.counts)
+
+    def _placed(self, issue: ValidationIssue, ordinal: int) -> ValidationIssue:
+        prefix = f"{self.root_path}/"
+        tag, separator, rest = issue.path.removeprefix(prefix).partition("/")
+        if not issue.path.startswith(prefix) or self.counts[tag] < 2:
+            return issue
+        return replace(issue, path=f"{prefix}{tag}[{ordinal}]{separator}{rest}")
+
+    def report(self, control_count: int) -> PrevalidationReport:
+        if len(self.controls) != control_count:
+            raise DomainValidationError("portfolio controls must have unique IPOCs")
+        if len(self.shell) or not self.counts:
+            self._validate_structure()
+        root = self.root
+        issues = [*self.xsd_issues, *_root_domains(root, self.domains)]
+        for located in (self.client_domain_issues, self.aggregate_domain_issues):
+            issues.extend(self._placed(issue, ordinal) for issue, ordinal in located)
+        if not self.counts["Agreg"] and root.get("TotalCli") != str(len(self.client_codes)):
+            issues.append(
+                _issue(
+                    "LOCAL-TOTAL-CLIENTS",
+                    IssueSeverity.ERROR,
+                    "TotalCli does not reconcile to distinct individualized clients",
+                    root,
+                    "TotalCli",
+                )
+            )
+        issues.extend(self._placed(issue, ordinal) for issue, ordinal in self.semantic_issues)
+        for ipoc in sorted(set(self.controls) - self.seen_ipocs):
+            issues.append(
+                _issue(
+                    "LOCAL-CONTROL-ORPHAN",
+                    IssueSeverity.ERROR,
+                    f"portfolio control {ipoc} has no XML operation",
+                    root,
+                    "IPOC",
                 )
-    unexpected_controls = set(control_map) - seen_ipocs
-    for ipoc in sorted(unexpected_controls):
+            )
         issues.append(
             _issue(
-                "LOCAL-CONTROL-ORPHAN",
-                IssueSeverity.ERROR,
-                f"portfolio control {ipoc} has no XML operation",
+                "BCB-CRITICS-NOT-EXECUTED",
+                IssueSeverity.WARNING,
+                "official BCB critic workbook is versioned but this run executes only "
+                "the local supported semantic subset",
+                root,
+            )
+        )
+        issues.append(
+            _issue(
+                "OFFICIAL-XSD-NOT-AVAILABLE",
+                IssueSeverity.WARNING,
+                self.layout.xsd_status,
                 root,
-                "IPOC",
             )
         )
-    issues.append(
-        _issue(
-            "BCB-CRITICS-NOT-EXECUTED",
-            IssueSeverity.WARNING,
-            "official BCB critic workbook is versioned but this run executes only "
-            "the local supported semantic subset",
-            root,
+        passed = not any(
+            issue.severity in {IssueSeverity.ERROR, IssueSeverity.BLOCKER} for issue in issues
         )
+        return PrevalidationReport(
+            self.layout.version,
+            self.domain_set_id,
+            passed,
+            "PREVALIDATED_DERIVED_XSD" if passed else "REJECTED",
+            not self.xsd_issues,
+            False,
+            False,
+            tuple(issues),
+        )
+
+
+def _rejected(issue: ValidationIssue) -> PrevalidationReport:
+    return PrevalidationReport(
+        "unresolved", "unresolved", False, "REJECTED", False, False, False, (issue,)
     )
-    return issues
+
+
+def _scan(
+    source: IO[bytes], controls: Mapping[str, PortfolioEclControl], domain_path: Path
+) -> _StreamState | PrevalidationReport:
+    """Check each top-level element as it ends, then drop it from the tree."""
+
+    root: etree._Element | None = None
+    state: _StreamState | None = None
+    failure: ValidationIssue | None = None
+    try:
+        for _, element in etree.iterparse(
+            source,
+            events=("end",),
+            resolve_entities=False,
+            no_network=True,
+            remove_blank_text=False,
+        ):
+            if root is None:
+                root = element.getroottree().getroot()
+                try:
+                    layout = layout_for_reference_month(_parse_month(root))
+                    domain_set_id, domains = _load_domains(layout, domain_path)
+                except DomainValidationError as exc:
+                    failure = _issue(
+                        "LAYOUT-RESOLUTION", IssueSeverity.BLOCKER, str(exc), root, "DtBase"
+                    )
+                else:
+                    state = _StreamState(
+                        root, layout, domain_set_id, domains, _derived_schema(layout), controls
+                    )
+            if element.getparent() is not root:
+                continue
+            while element.getprevious() is not None:
+                del root[0]
+            root.remove(element)
+            if state is not None:
+                state.add(element)
+    except etree.XMLSyntaxError as exc:
+        return _rejected(
+            ValidationIssue("XML-PARSE", IssueSeverity.BLOCKER, str(exc), exc.lineno, None, "/")
+        )
+    if failure is not None:
+        return _rejected(failure)
+    if state is None:
+        raise DomainValidationError("Doc3040 candidate has no root element")
+    return state
+
+
+def _prevalidate(
+    source: IO[bytes], controls: tuple[PortfolioEclControl, ...], domain_path: Path
+) -> PrevalidationReport:
+    scanned = _scan(source, {control.ipoc: control for control in controls}, domain_path)
+    if isinstance(scanned, PrevalidationReport):
+        return scanned
+    return scanned.report(len(controls))
+
+
+def prevalidate_shard(
+    content: bytes, controls: tuple[PortfolioEclControl, ...], domain_path: Path
+) -> ShardIssues | None:
+    """Scan one shard document; ``None`` when it does not parse or resolve a layout."""
+
+    scanned = _scan(
+        io.BytesIO(content), {control.ipoc: control for control in controls}, domain_path
+    )
+    return None if isinstance(scanned, PrevalidationReport) else scanned.shard_issues()
+
+
+@dataclass(slots=True)
+class PrevalidationMerge:
+    """Fold ``prevalidate_shard`` outcomes, in document order, into one pass's report.
+
+    ``open`` scans the document without children whose start tag every shard shares
+    and returns ``None`` when it does not parse or resolve a layout.
+    """
+
+    state: _StreamState
+    control_count: int
+
+    @classmethod
+    def open(
+        cls, empty_document: bytes, controls: tuple[PortfolioEclControl, ...], domain_path: Path
+    ) -> PrevalidationMerge | None:
+        scanned = _scan(
+            io.BytesIO(empty_document), {control.ipoc: control for control in controls}, domain_path
+        )
+        return None if isinstance(scanned, PrevalidationReport) else cls(scanned, len(controls))
+
+    def merge(self, shard: ShardIssues, lines: int) -> None:
+        """Append a shard whose first element follows ``lines`` newlines of earlier shards."""
+        self.state.merge(shard, lines)
+
+    def report(self) -> PrevalidationReport:
+        return self.state.report(self.control_count)
 
 
 def prevalidate_xml(
@@ -423,52 +741,20 @@ def prevalidate_xml(
     *,
     domain_path: Path = DEFAULT_DOMAIN_FILE,
 ) -> PrevalidationReport:
-    parser = etree.XMLParser(resolve_entities=False, no_network=True, remove_blank_text=False)
-    try:
-        root = etree.fromstring(content, parser)
-    except etree.XMLSyntaxError as exc:
-        issue = ValidationIssue("XML-PARSE", IssueSeverity.BLOCKER, str(exc), exc.lineno, None, "/")
-        return PrevalidationReport(
-            "unresolved", "unresolved", False, "REJECTED", False, False, False, (issue,)
-        )
-    try:
-        layout = layout_for_reference_month(_parse_month(root))
-        domain_set_id, domains = _load_domains(layout, domain_path)
-    except DomainValidationError as exc:
-        issue = _issue("LAYOUT-RESOLUTION", IssueSeverity.BLOCKER, str(exc), root, "DtBase")
-        return PrevalidationReport(
-            "unresolved", "unresolved", False, "REJECTED", False, False, False, (issue,)
-        )
-    issues: list[ValidationIssue] = []
-    schema = etree.XMLSchema(etree.fromstring(load_derived_xsd(layout)))
-    derived_xsd_passed = schema.validate(root)
-    if not derived_xsd_passed:
-        for error in schema.error_log:
-            issues.append(
-                ValidationIssue(
-                    "DERIVED-XSD", IssueSeverity.ERROR, error.message, error.line, None, "/"
-                )
-            )
-    issues.extend(_validate_domains(root, domains))
-    issues.extend(_validate_semantics(root, controls))
-    issues.append(
-        _issue(
-            "OFFICIAL-XSD-NOT-AVAILABLE",
-            IssueSeverity.WARNING,
-            layout.xsd_status,
-            root,
-        )
-    )
-    passed = not any(
-        issue.severity in {IssueSeverity.ERROR, IssueSeverity.BLOCKER} for issue in issues
-    )
-    return PrevalidationReport(
-        layout.version,
-        domain_set_id,
-        passed,
-        "PREVALIDATED_DERIVED_XSD" if passed else "REJECTED",
-        derived_xsd_passed,
-        False,
-        False,
-        tuple(issues),
-    )
+    return _prevalidate(io.BytesIO(content), controls, domain_path)
+
+
+def prevalidate_xml_file(
+    path: Path,
+    controls: tuple[PortfolioEclControl, ...],
+    *,
+    archive_member: str | None = None,
+    domain_path: Path = DEFAULT_DOMAIN_FILE,
+) -> PrevalidationReport:
+    """Stream a candidate from disk, or from one member of a zip archive."""
+
+    if archive_member is None:
+        with Path(path).open("rb") as source:
+            return _prevalidate(source, controls, domain_path)
+    with zipfile.ZipFile(path) as archive, archive.open(archive_member) as source:
+        return _prevalidate(source, controls, domain_path)
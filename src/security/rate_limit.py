@@ -1,33 +1,206 @@
-"""Small in-process fixed-window limiter for the local API boundary."""
+"""Token-bucket limiter for the API boundary with in-process or shared state."""
 
 from __future__ import annotations
 
-from collections import defaultdict, deque
+import sqlite3
+import threading
+import time
+import weakref
 from collections.abc import Callable
-from threading import Lock
-from time import monotonic
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Protocol
+
+DEFAULT_STRIPES = 16
+_MIN_SWEEP_KEYS = 1_024
 
 
 class RateLimitExceeded(RuntimeError):
     pass
 
 
+class TokenBucketStore(Protocol):
+    """Atomic take-one-token operation over buckets keyed by caller identity."""
+
+    clock: Callable[[], float]
+
+    def take(self, key: str, capacity: float, refill_per_second: float, now: float) -> bool:
+        """Refill the bucket up to ``now``, then spend one token if available."""
+        ...
+
+
+def _refill(
+    tokens: float, updated_at: float, capacity: float, refill_per_second: float, now: float
+) -> float:
+    return min(capacity, tokens + max(0.0, now - updated_at) * refill_per_second)
+
+
+@dataclass(slots=True)
+class _Stripe:
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # key -> (tokens, updated_at, full_at); a full bucket equals an absent one.
+    buckets: dict[str, tuple[float, float, float]] = field(default_factory=dict)
+    sweep_at: int = _MIN_SWEEP_KEYS
+
+
+class MemoryTokenBucketStore:
+    """Buckets for one process, split into stripes with one lock each.
+
+    Each key holds three floats whatever its request rate. A stripe drops the
+    buckets that have refilled to capacity whenever its key count doubles since
+    the last sweep, so idle keys cost amortized O(1) to evict.
+    """
+
+    def __init__(
+        self, stripes: int = DEFAULT_STRIPES, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if stripes <= 0:
+            raise ValueError("rate-limit store stripes must be positive")
+        self.clock = clock
+        self._stripes = tuple(_Stripe() for _ in range(stripes))
+
+    def __len__(self) -> int:
+        return sum(len(stripe.buckets) for stripe in self._stripes)
+
+    def take(self, key: str, capacity: float, refill_per_second: float, now: float) -> bool:
+        stripe = self._stripes[hash(key) % len(self._stripes)]
+        with stripe.lock:
+            current = stripe.buckets.get(key)
+            tokens = (
+                capacity
+                if current is None
+                else _refill(*current[:2], capacity, refill_per_second, now)
+            )
+            if tokens < 1:
+                return False
+            tokens -= 1
+            updated_at = now if current is None else max(current[1], now)
+            stripe.buckets[key] = (
+                tokens,
+                updated_at,
+                updated_at + (capacity - tokens) / refill_per_second,
+            )
+            if len(stripe.buckets) >= stripe.sweep_at:
+                stripe.buckets = {
+                    bucket: state for bucket, state in stripe.buckets.items() if state[2] > now
+                }
+                stripe.sweep_at = max(_MIN_SWEEP_KEYS, 2 * len(stripe.buckets))
+        return True
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+    bucket_key TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    full_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rate_limit_buckets_full_at ON rate_limit_buckets (full_at);
+"""
+
+_TAKE = """
+INSERT INTO rate_limit_buckets (bucket_key, tokens, updated_at, full_at)
+VALUES (:key, :capacity - 1, :now, :now + 1 / :rate)
+ON CONFLICT (bucket_key) DO UPDATE SET
+    tokens = min(:capacity, tokens + max(0, :now - updated_at) * :rate) - 1,
+    updated_at = max(updated_at, :now),
+    full_at = max(updated_at, :now)
+        + (1 + :capacity - min(:capacity, tokens + max(0, :now - updated_at) * :rate)) / :rate
+WHERE min(:capacity, tokens + max(0, :now - updated_at) * :rate) >= 1
+RETURNING tokens
+"""
+
+
+class SQLiteTokenBucketStore:
+    """Buckets in a SQLite file shared by every worker process of the API.
+
+    Each take is one atomic upsert on the thread's own connection, so there is
+    no Python lock and SQLite serializes only the short write. Processes share
+    the wall clock because monotonic clocks are not comparable across them.
+    Every ``sweep_every`` takes on a connection, full buckets are deleted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        timeout_seconds: float = 5.0,
+        sweep_every: int = 4_096,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if timeout_seconds <= 0 or sweep_every <= 0:
+            raise ValueError("rate-limit store timeout and sweep interval must be positive")
+        self.path = Path(path)
+        self.timeout_seconds = timeout_seconds
+        self.sweep_every = sweep_every
+        self.clock = clock
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _close_all, self._connections)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                self.path,
+                timeout=self.timeout_seconds,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connections_lock:
+                self._connections.append(connection)
+            self._local.connection = connection
+            self._local.takes = 0
+        return connection
+
+    def take(self, key: str, capacity: float, refill_per_second: float, now: float) -> bool:
+        connection = self._connection()
+        row = connection.execute(
+            _TAKE, {"key": key, "capacity": capacity, "rate": refill_per_second, "now": now}
+        ).fetchone()
+        self._local.takes += 1
+        if self._local.takes % self.sweep_every == 0:
+            connection.execute("DELETE FROM rate_limit_buckets WHERE full_at <= ?", (now,))
+        return row is not None
+
+    def __len__(self) -> int:
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM rate_limit_buckets").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            self._finalizer()
+
+
+def _close_all(connections: list[sqlite3.Connection]) -> None:
+    for connection in connections:
+        connection.close()
+    connections.clear()
+
+
 class RateLimiter:
+    """Allow bursts of ``requests`` per key, refilled evenly over ``window_seconds``."""
+
     def __init__(
-        self, requests: int, window_seconds: int, clock: Callable[[], float] = monotonic
+        self,
+        requests: int,
+        window_seconds: int,
+        clock: Callable[[], float] | None = None,
+        store: TokenBucketStore | None = None,
     ) -> None:
+        if requests <= 0 or window_seconds <= 0:
+            raise ValueError("rate-limit requests and window must be positive")
         self.requests = requests
         self.window_seconds = window_seconds
-        self.clock = clock
-        self._events: dict[str, deque[float]] = defaultdict(deque)
-        self._lock = Lock()
+        self.store = store if store is not None else MemoryTokenBucketStore()
+        self.clock = clock if clock is not None else self.store.clock
+        self._refill_per_second = requests / window_seconds
 
     def check(self, key: str) -> None:
-        now = self.clock()
-        with self._lock:
-            events = self._events[key]
-            while events and events[0] <= now - self.window_seconds:
-                events.popleft()
-            if len(events) >= self.requests:
-                raise RateLimitExceeded("rate limit exceeded")
-            events.append(now)
+        if not self.store.take(key, self.requests, self._refill_per_second, self.clock()):
+            raise RateLimitExceeded("rate limit exceeded")
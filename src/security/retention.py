@@ -69,8 +69,19 @@ def purge_ephemeral_records(
         "DELETE FROM security_confirmations WHERE expires_at < ?",
         (confirmation_cutoff,),
     )
-    jobs = database.execute(
-        "DELETE FROM calculation_jobs WHERE status IN (?, ?) AND finished_at < ?",
-        ("SUCCEEDED", "FAILED", job_cutoff),
-    )
+    with database.unit_of_work():
+        database.execute(
+            "DELETE FROM calculation_job_results WHERE job_id IN ("
+            "SELECT job_id FROM calculation_jobs WHERE status IN (?, ?) AND finished_at < ?)",
+            ("SUCCEEDED", "FAILED", job_cutoff),
+        )
+        jobs = database.execute(
+            "DELETE FROM calculation_jobs WHERE status IN (?, ?) AND finished_at < ?",
+            ("SUCCEEDED", "FAILED", job_cutoff),
+        )
+        database.execute(
+            "DELETE FROM calculation_result_blobs WHERE NOT EXISTS ("
+            "SELECT 1 FROM calculation_job_results chunk "
+            "WHERE chunk.blob_hash = calculation_result_blobs.blob_hash)"
+        )
     return RetentionResult(sessions, confirmations, jobs, policy.policy_version)
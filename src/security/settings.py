@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from pathlib import Path
 
 
 class SecurityConfigurationError(ValueError):
@@ -19,6 +20,7 @@ class SecuritySettings:
     confirmation_minutes: int = 5
     rate_limit_requests: int = 30
     rate_limit_window_seconds: int = 60
+    rate_limit_store_path: Path | None = None
 
     def __post_init__(self) -> None:
         if len(self.jwt_secret.encode()) < 32:
@@ -33,6 +35,7 @@ class SecuritySettings:
         secret = os.getenv("JWT_SECRET")
         if not secret:
             raise SecurityConfigurationError("JWT_SECRET is required")
+        store_path = os.getenv("RATE_LIMIT_STORE_PATH")
         return cls(
             jwt_secret=secret,
             issuer=os.getenv("JWT_ISSUER", "risco-bancario"),
@@ -41,4 +44,5 @@ class SecuritySettings:
             confirmation_minutes=int(os.getenv("CONFIRMATION_MINUTES", "5")),
             rate_limit_requests=int(os.getenv("RATE_LIMIT_REQUESTS", "30")),
             rate_limit_window_seconds=int(os.getenv("RATE_LIMIT_WINDOW_SECONDS", "60")),
+            rate_limit_store_path=Path(store_path) if store_path else None,
         )
@@ -2,22 +2,38 @@
 
 from .ecl_ledger import (
     ContractECLAdjustment,
+    ContractInclusionProof,
     DimensionReconciliation,
     ECLExecutionLedger,
+    ECLLedgerCommitment,
     ECLLedgerEntry,
     ECLReconciliationReport,
     PeriodReconciliation,
     ScenarioReconciliation,
     create_ecl_execution_ledger,
+    read_ecl_ledger_adjustments,
+    read_ecl_ledger_entries,
+    stream_ecl_execution_ledger,
+    verify_contract_inclusion,
 )
+from .merkle import MerkleInclusionProof, MerkleTree, verify_merkle_proof
 
 __all__ = [
     "ContractECLAdjustment",
+    "ContractInclusionProof",
     "DimensionReconciliation",
     "ECLExecutionLedger",
+    "ECLLedgerCommitment",
     "ECLLedgerEntry",
     "ECLReconciliationReport",
+    "MerkleInclusionProof",
+    "MerkleTree",
     "PeriodReconciliation",
     "ScenarioReconciliation",
     "create_ecl_execution_ledger",
+    "read_ecl_ledger_adjustments",
+    "read_ecl_ledger_entries",
+    "stream_ecl_execution_ledger",
+    "verify_contract_inclusion",
+    "verify_merkle_proof",
 ]
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import csv
 import json
-from dataclasses import asdict, dataclass
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, fields
 from datetime import date, datetime
 from decimal import ROUND_HALF_EVEN, Decimal
 from hashlib import sha256
+from itertools import groupby
+from operator import attrgetter
+from pathlib import Path
+from typing import Any, cast
 
 from ...domain.conventions import DecimalInput, aware_utc, decimal_from, money, non_empty, rate
 from ...domain.exceptions import DomainValidationError
+from .merkle import MerkleInclusionProof, MerkleTree, merkle_leaf_hash, verify_merkle_proof
 
 MONEY_QUANTUM = Decimal("0.01")
 CONTRIBUTION_QUANTUM = Decimal("0.00000001")
@@ -110,117 +118,252 @@ class ECLExecutionLedger:
     configuration_version: str
     configuration_hash: str
     previous_ledger_hash: str | None
+    entries_root: str
+    merkle_tree: MerkleTree
     ledger_hash: str
 
+    def inclusion_proof(self, contract_id: str) -> ContractInclusionProof:
+        """Prove one contract's entries and adjustment against ``entries_root``."""
+        key = attrgetter("contract_id")
+        index = bisect_left(self.adjustments, contract_id, key=key)
+        if index == len(self.adjustments) or self.adjustments[index].contract_id != contract_id:
+            raise DomainValidationError("contract is not part of the ECL ledger")
+        first = bisect_left(self.entries, contract_id, key=key)
+        last = bisect_right(self.entries, contract_id, lo=first, key=key)
+        return ContractInclusionProof(
+            self.adjustments[index], self.entries[first:last], self.merkle_tree.proof(index)
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ContractInclusionProof:
+    """One contract's ledger figures with the sibling path to ``entries_root``."""
+
+    adjustment: ContractECLAdjustment
+    entries: tuple[ECLLedgerEntry, ...]
+    proof: MerkleInclusionProof
+
+
+@dataclass(frozen=True, slots=True)
+class ECLLedgerCommitment:
+    """Ledger header produced from streamed entries without retaining them.
+
+    ``reconciliation.contract_totals`` is empty: each contract's entries and
+    adjustment are committed in its leaf under ``entries_root`` instead.
+    ``ledger_hash`` equals the hash of the in-memory ledger built from the same
+    content.
+    """
+
+    execution_id: str
+    reference_date: date
+    created_at: datetime
+    entry_count: int
+    contract_count: int
+    reconciliation: ECLReconciliationReport
+    model_version: str
+    configuration_version: str
+    configuration_hash: str
+    previous_ledger_hash: str | None
+    entries_root: str
+    merkle_tree: MerkleTree
+    ledger_hash: str
+
+    def inclusion_proof(
+        self,
+        leaf_index: int,
+        entries: Iterable[ECLLedgerEntry],
+        adjustment: ContractECLAdjustment,
+    ) -> ContractInclusionProof:
+        """Prove a contract re-read from the source, at its position in contract order."""
+        proof = self.merkle_tree.proof(leaf_index)
+        contract_entries = _contract_entries(entries)
+        leaf = merkle_leaf_hash(_contract_leaf(contract_entries, adjustment))
+        if leaf != self.merkle_tree.leaf_hash(leaf_index):
+            raise DomainValidationError("contract does not match the committed ledger leaf")
+        return ContractInclusionProof(adjustment, contract_entries, proof)
+
 
-def _money_sum(values: tuple[Decimal, ...]) -> Decimal:
+def _money_sum(values: Iterable[Decimal]) -> Decimal:
     return sum(values, Decimal("0")).quantize(MONEY_QUANTUM, rounding=ROUND_HALF_EVEN)
 
 
-def _dimension_total(
-    key: str, adjustments: tuple[ContractECLAdjustment, ...]
-) -> DimensionReconciliation:
-    return DimensionReconciliation(
-        key,
-        _money_sum(
-            tuple(decimal_from(item.economic_ecl, field="economic_ecl") for item in adjustments)
-        ),
-        _money_sum(
-            tuple(decimal_from(item.management_overlay, field="overlay") for item in adjustments)
-        ),
-        _money_sum(
-            tuple(decimal_from(item.regulatory_floor, field="floor") for item in adjustments)
-        ),
-        _money_sum(tuple(decimal_from(item.final_ecl, field="final_ecl") for item in adjustments)),
-    )
+def _contract_entries(entries: Iterable[ECLLedgerEntry]) -> tuple[ECLLedgerEntry, ...]:
+    return tuple(sorted(entries, key=lambda item: (item.scenario_id, item.period_date)))
+
+
+def _contract_leaf(entries: Sequence[ECLLedgerEntry], adjustment: ContractECLAdjustment) -> bytes:
+    return json.dumps(
+        [
+            [
+                adjustment.contract_id,
+                str(adjustment.economic_ecl),
+                str(adjustment.management_overlay),
+                str(adjustment.regulatory_floor),
+                str(adjustment.final_ecl),
+            ],
+            [
+                [
+                    item.client_id,
+                    item.product_code,
+                    item.period_date.isoformat(),
+                    item.scenario_id,
+                    str(item.scenario_weight),
+                    str(item.period_ecl),
+                ]
+                for item in entries
+            ],
+        ],
+        separators=(",", ":"),
+    ).encode()
+
 
+def _add_dimension(totals: dict[str, list[Decimal]], key: str, item: ContractECLAdjustment) -> None:
+    values = totals.setdefault(key, [Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0")])
+    values[0] += cast(Decimal, item.economic_ecl)
+    values[1] += cast(Decimal, item.management_overlay)
+    values[2] += cast(Decimal, item.regulatory_floor)
+    values[3] += cast(Decimal, item.final_ecl)
 
-def _build_reconciliation(
-    entries: tuple[ECLLedgerEntry, ...], adjustments: tuple[ContractECLAdjustment, ...]
-) -> ECLReconciliationReport:
-    period_dates = sorted({item.period_date for item in entries})
-    period_totals = tuple(
-        PeriodReconciliation(
-            period_date,
-            _money_sum(
-                tuple(
-                    item.weighted_period_ecl for item in entries if item.period_date == period_date
+
+def _dimension_total(key: str, values: list[Decimal]) -> DimensionReconciliation:
+    return DimensionReconciliation(key, *(_money_sum((value,)) for value in values))
+
+
+class _LedgerAccumulator:
+    """Validate, reconcile and commit contracts fed once each, in contract order.
+
+    Period, scenario, client and product totals live in dictionaries keyed by
+    the dimension, so each entry is read once regardless of ledger size.
+    """
+
+    def __init__(self, reference_date: date, *, retain_contract_totals: bool) -> None:
+        self.reference_date = reference_date
+        self.retain_contract_totals = retain_contract_totals
+        self.entry_count = 0
+        self.contract_count = 0
+        self._weights: dict[str, Decimal] = {}
+        self._scenario_ids: frozenset[str] | None = None
+        self._periods: dict[date, Decimal] = {}
+        self._scenarios: dict[str, list[Decimal]] = {}
+        self._clients: dict[str, list[Decimal]] = {}
+        self._products: dict[str, list[Decimal]] = {}
+        self._portfolio: dict[str, list[Decimal]] = {}
+        self._contracts: list[DimensionReconciliation] = []
+        self._unreconciled_contracts = 0
+        self._leaf_hashes = bytearray()
+
+    def add_contract(
+        self, entries: Sequence[ECLLedgerEntry], adjustment: ContractECLAdjustment
+    ) -> None:
+        metadata = (entries[0].client_id, entries[0].product_code)
+        keys: set[tuple[str, date]] = set()
+        measured = Decimal("0")
+        for item in entries:
+            if item.period_date <= self.reference_date:
+                raise DomainValidationError("ECL ledger periods must follow reference date")
+            key = (item.scenario_id, item.period_date)
+            if key in keys:
+                raise DomainValidationError("ECL ledger entries must be unique")
+            keys.add(key)
+            if (item.client_id, item.product_code) != metadata:
+                raise DomainValidationError(
+                    "contract metadata must be stable across ledger entries"
                 )
-            ),
+            weight = cast(Decimal, item.scenario_weight)
+            if self._weights.setdefault(item.scenario_id, weight) != weight:
+                raise DomainValidationError("scenario weight must be consistent across ledger")
+            period_ecl = cast(Decimal, item.period_ecl)
+            weighted = item.weighted_period_ecl
+            measured += weighted
+            self._periods[item.period_date] = (
+                self._periods.get(item.period_date, Decimal("0")) + weighted
+            )
+            scenario = self._scenarios.setdefault(item.scenario_id, [Decimal("0"), Decimal("0")])
+            scenario[0] += period_ecl
+            scenario[1] += weighted
+        scenario_ids = frozenset(scenario_id for scenario_id, _ in keys)
+        if self._scenario_ids is None:
+            self._scenario_ids = scenario_ids
+        elif scenario_ids != self._scenario_ids:
+            raise DomainValidationError("each contract must cover every ledger scenario")
+        # Reported after the weight sum, which may be the cause of the difference.
+        self._unreconciled_contracts += _money_sum((measured,)) != adjustment.economic_ecl
+        _add_dimension(self._clients, metadata[0], adjustment)
+        _add_dimension(self._products, metadata[1], adjustment)
+        _add_dimension(self._portfolio, "portfolio", adjustment)
+        if self.retain_contract_totals:
+            contract: dict[str, list[Decimal]] = {}
+            _add_dimension(contract, adjustment.contract_id, adjustment)
+            self._contracts.append(
+                _dimension_total(adjustment.contract_id, contract[adjustment.contract_id])
+            )
+        self._leaf_hashes += merkle_leaf_hash(_contract_leaf(entries, adjustment))
+        self.entry_count += len(entries)
+        self.contract_count += 1
+
+    def merkle_tree(self) -> MerkleTree:
+        return MerkleTree.from_leaf_hashes(bytes(self._leaf_hashes))
+
+    def report(self) -> ECLReconciliationReport:
+        if not self.contract_count:
+            raise DomainValidationError("ECL ledger requires entries and adjustments")
+        if sum(self._weights.values(), Decimal("0")) != Decimal("1"):
+            raise DomainValidationError("ledger scenario weights must sum to one")
+        if self._unreconciled_contracts:
+            raise DomainValidationError("contract economic ECL does not reconcile to periods")
+        period_totals = tuple(
+            PeriodReconciliation(period_date, _money_sum((total,)))
+            for period_date, total in sorted(self._periods.items())
         )
-        for period_date in period_dates
-    )
-    scenario_ids = sorted({item.scenario_id for item in entries})
-    scenario_totals: list[ScenarioReconciliation] = []
-    for scenario_id in scenario_ids:
-        scenario_entries = tuple(item for item in entries if item.scenario_id == scenario_id)
-        weight = decimal_from(scenario_entries[0].scenario_weight, field="scenario_weight")
-        scenario_ecl = _money_sum(
-            tuple(decimal_from(item.period_ecl, field="period_ecl") for item in scenario_entries)
+        scenario_totals = tuple(
+            ScenarioReconciliation(
+                scenario_id, self._weights[scenario_id], _money_sum((ecl,)), _money_sum((weighted,))
+            )
+            for scenario_id, (ecl, weighted) in sorted(self._scenarios.items())
         )
-        weighted_ecl = _money_sum(tuple(item.weighted_period_ecl for item in scenario_entries))
-        scenario_totals.append(
-            ScenarioReconciliation(scenario_id, weight, scenario_ecl, weighted_ecl)
+        portfolio = _dimension_total("portfolio", self._portfolio["portfolio"])
+        # Contract totals are the adjustments themselves; the portfolio is their running sum.
+        reconciled = (
+            _money_sum(item.weighted_ecl for item in scenario_totals) == portfolio.economic_ecl
+            and _money_sum(item.weighted_ecl for item in period_totals) == portfolio.economic_ecl
         )
-    metadata = {
-        contract_id: next(item for item in entries if item.contract_id == contract_id)
-        for contract_id in {item.contract_id for item in entries}
-    }
-    adjustment_map = {item.contract_id: item for item in adjustments}
-    contract_totals = tuple(
-        _dimension_total(contract_id, (adjustment_map[contract_id],))
-        for contract_id in sorted(adjustment_map)
-    )
-
-    def aggregate_by(attribute: str) -> tuple[DimensionReconciliation, ...]:
-        keys = sorted({str(getattr(item, attribute)) for item in metadata.values()})
-        return tuple(
-            _dimension_total(
-                key,
-                tuple(
-                    adjustment_map[contract_id]
-                    for contract_id, item in metadata.items()
-                    if str(getattr(item, attribute)) == key
-                ),
-            )
-            for key in keys
+        return ECLReconciliationReport(
+            period_totals,
+            scenario_totals,
+            tuple(self._contracts),
+            tuple(_dimension_total(key, values) for key, values in sorted(self._clients.items())),
+            tuple(_dimension_total(key, values) for key, values in sorted(self._products.items())),
+            portfolio,
+            reconciled,
         )
 
-    client_totals = aggregate_by("client_id")
-    product_totals = aggregate_by("product_code")
-    portfolio = _dimension_total("portfolio", adjustments)
-    scenario_weighted_total = _money_sum(tuple(item.weighted_ecl for item in scenario_totals))
-    period_weighted_total = _money_sum(tuple(item.weighted_ecl for item in period_totals))
-    reconciled = (
-        scenario_weighted_total == portfolio.economic_ecl
-        and period_weighted_total == portfolio.economic_ecl
-        and _money_sum(tuple(item.economic_ecl for item in contract_totals))
-        == portfolio.economic_ecl
-        and _money_sum(tuple(item.final_ecl for item in contract_totals)) == portfolio.final_ecl
-    )
-    return ECLReconciliationReport(
-        period_totals,
-        tuple(scenario_totals),
-        contract_totals,
-        client_totals,
-        product_totals,
-        portfolio,
-        reconciled,
-    )
+
+def _contract_groups(
+    entries: Iterable[ECLLedgerEntry], adjustments: Iterable[ContractECLAdjustment]
+) -> Iterator[tuple[tuple[ECLLedgerEntry, ...], ContractECLAdjustment]]:
+    """Join entries grouped by contract with adjustments, both in ascending contract order."""
+    pending = iter(adjustments)
+    previous: str | None = None
+    for contract_id, group in groupby(entries, key=attrgetter("contract_id")):
+        if previous is not None and contract_id <= previous:
+            raise DomainValidationError("ledger stream must be ordered by contract")
+        adjustment = next(pending, None)
+        if adjustment is None or adjustment.contract_id != contract_id:
+            raise DomainValidationError("ledger requires one adjustment for every contract")
+        previous = contract_id
+        yield _contract_entries(group), adjustment
+    if next(pending, None) is not None:
+        raise DomainValidationError("ledger requires one adjustment for every contract")
 
 
-def create_ecl_execution_ledger(
-    *,
+def _validate_header(
     execution_id: str,
-    reference_date: date,
     created_at: datetime,
-    entries: tuple[ECLLedgerEntry, ...],
-    adjustments: tuple[ContractECLAdjustment, ...],
     model_version: str,
     configuration_version: str,
     configuration_hash: str,
-    previous_ledger_hash: str | None = None,
-) -> ECLExecutionLedger:
+    previous_ledger_hash: str | None,
+) -> tuple[str, datetime]:
     normalized_execution_id = non_empty(execution_id, field="execution_id")
     normalized_created_at = aware_utc(created_at, field="created_at")
     for value, field in (
@@ -229,68 +372,78 @@ def create_ecl_execution_ledger(
         (configuration_hash, "configuration_hash"),
     ):
         non_empty(value, field=field)
-    if not entries or not adjustments:
-        raise DomainValidationError("ECL ledger requires entries and adjustments")
-    if any(item.period_date <= reference_date for item in entries):
-        raise DomainValidationError("ECL ledger periods must follow reference date")
     if previous_ledger_hash is not None and (
         len(previous_ledger_hash) != 64
         or any(character not in "0123456789abcdef" for character in previous_ledger_hash)
     ):
         raise DomainValidationError("previous ledger hash must be SHA-256")
+    return normalized_execution_id, normalized_created_at
+
+
+def _ledger_hash(
+    accumulator: _LedgerAccumulator,
+    reconciliation: ECLReconciliationReport,
+    entries_root: str,
+    **header: Any,
+) -> str:
+    report = asdict(reconciliation)
+    del report["contract_totals"]
+    payload = {
+        **header,
+        "entry_count": accumulator.entry_count,
+        "contract_count": accumulator.contract_count,
+        "entries_root": entries_root,
+        "reconciliation": report,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return sha256(encoded).hexdigest()
+
+
+def create_ecl_execution_ledger(
+    *,
+    execution_id: str,
+    reference_date: date,
+    created_at: datetime,
+    entries: tuple[ECLLedgerEntry, ...],
+    adjustments: tuple[ContractECLAdjustment, ...],
+    model_version: str,
+    configuration_version: str,
+    configuration_hash: str,
+    previous_ledger_hash: str | None = None,
+) -> ECLExecutionLedger:
+    normalized_execution_id, normalized_created_at = _validate_header(
+        execution_id,
+        created_at,
+        model_version,
+        configuration_version,
+        configuration_hash,
+        previous_ledger_hash,
+    )
+    if not entries or not adjustments:
+        raise DomainValidationError("ECL ledger requires entries and adjustments")
     sorted_entries = tuple(
         sorted(entries, key=lambda item: (item.contract_id, item.scenario_id, item.period_date))
     )
-    keys = [(item.contract_id, item.scenario_id, item.period_date) for item in sorted_entries]
-    if len(keys) != len(set(keys)):
-        raise DomainValidationError("ECL ledger entries must be unique")
-    scenario_weights: dict[str, Decimal] = {}
-    for item in sorted_entries:
-        weight = decimal_from(item.scenario_weight, field="scenario_weight")
-        if item.scenario_id in scenario_weights and scenario_weights[item.scenario_id] != weight:
-            raise DomainValidationError("scenario weight must be consistent across ledger")
-        scenario_weights[item.scenario_id] = weight
-    if sum(scenario_weights.values(), Decimal("0")) != Decimal("1"):
-        raise DomainValidationError("ledger scenario weights must sum to one")
-    scenario_ids = set(scenario_weights)
-    for contract_id in {item.contract_id for item in sorted_entries}:
-        contract_entries = tuple(item for item in sorted_entries if item.contract_id == contract_id)
-        if {item.scenario_id for item in contract_entries} != scenario_ids:
-            raise DomainValidationError("each contract must cover every ledger scenario")
-        if len({(item.client_id, item.product_code) for item in contract_entries}) != 1:
-            raise DomainValidationError("contract metadata must be stable across ledger entries")
     sorted_adjustments = tuple(sorted(adjustments, key=lambda item: item.contract_id))
-    adjustment_ids = [item.contract_id for item in sorted_adjustments]
-    contract_ids = {item.contract_id for item in sorted_entries}
-    if set(adjustment_ids) != contract_ids or len(adjustment_ids) != len(set(adjustment_ids)):
-        raise DomainValidationError("ledger requires one adjustment for every contract")
-    for adjustment in sorted_adjustments:
-        measured = _money_sum(
-            tuple(
-                item.weighted_period_ecl
-                for item in sorted_entries
-                if item.contract_id == adjustment.contract_id
-            )
-        )
-        if measured != adjustment.economic_ecl:
-            raise DomainValidationError("contract economic ECL does not reconcile to periods")
-    reconciliation = _build_reconciliation(sorted_entries, sorted_adjustments)
+    accumulator = _LedgerAccumulator(reference_date, retain_contract_totals=True)
+    for contract_entries, adjustment in _contract_groups(sorted_entries, sorted_adjustments):
+        accumulator.add_contract(contract_entries, adjustment)
+    reconciliation = accumulator.report()
     if not reconciliation.reconciled:
         raise DomainValidationError("ECL execution failed multi-level reconciliation")
-    payload = {
-        "execution_id": normalized_execution_id,
-        "reference_date": reference_date,
-        "created_at": normalized_created_at,
-        "entries": [asdict(item) for item in sorted_entries],
-        "adjustments": [asdict(item) for item in sorted_adjustments],
-        "reconciliation": asdict(reconciliation),
-        "model_version": model_version,
-        "configuration_version": configuration_version,
-        "configuration_hash": configuration_hash,
-        "previous_ledger_hash": previous_ledger_hash,
-    }
-    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
-    ledger_hash = sha256(encoded).hexdigest()
+    merkle_tree = accumulator.merkle_tree()
+    ledger_hash = _ledger_hash(
+        accumulator,
+        reconciliation,
+        merkle_tree.root,
+        execution_id=normalized_execution_id,
+        reference_date=reference_date,
+        created_at=normalized_created_at,
+        model_version=model_version,
+        configuration_version=configuration_version,
+        configuration_hash=configuration_hash,
+        previous_ledger_hash=previous_ledger_hash,
+    )
     return ECLExecutionLedger(
         normalized_execution_id,
         reference_date,
@@ -302,5 +455,116 @@ def create_ecl_execution_ledger(
         configuration_version,
         configuration_hash,
         previous_ledger_hash,
+        merkle_tree.root,
+        merkle_tree,
         ledger_hash,
     )
+
+
+def stream_ecl_execution_ledger(
+    *,
+    execution_id: str,
+    reference_date: date,
+    created_at: datetime,
+    entries: Iterable[ECLLedgerEntry],
+    adjustments: Iterable[ContractECLAdjustment],
+    model_version: str,
+    configuration_version: str,
+    configuration_hash: str,
+    previous_ledger_hash: str | None = None,
+) -> ECLLedgerCommitment:
+    """Reconcile and commit a ledger in one pass, holding one contract at a time.
+
+    Entries must arrive grouped by contract and adjustments one per contract,
+    both in ascending ``contract_id`` order; entries within a contract may come
+    in any order. Memory grows with distinct periods, scenarios, clients and
+    products, not with the number of entries.
+    """
+    normalized_execution_id, normalized_created_at = _validate_header(
+        execution_id,
+        created_at,
+        model_version,
+        configuration_version,
+        configuration_hash,
+        previous_ledger_hash,
+    )
+    accumulator = _LedgerAccumulator(reference_date, retain_contract_totals=False)
+    for contract_entries, adjustment in _contract_groups(entries, adjustments):
+        accumulator.add_contract(contract_entries, adjustment)
+    reconciliation = accumulator.report()
+    if not reconciliation.reconciled:
+        raise DomainValidationError("ECL execution failed multi-level reconciliation")
+    merkle_tree = accumulator.merkle_tree()
+    ledger_hash = _ledger_hash(
+        accumulator,
+        reconciliation,
+        merkle_tree.root,
+        execution_id=normalized_execution_id,
+        reference_date=reference_date,
+        created_at=normalized_created_at,
+        model_version=model_version,
+        configuration_version=configuration_version,
+        configuration_hash=configuration_hash,
+        previous_ledger_hash=previous_ledger_hash,
+    )
+    return ECLLedgerCommitment(
+        normalized_execution_id,
+        reference_date,
+        normalized_created_at,
+        accumulator.entry_count,
+        accumulator.contract_count,
+        reconciliation,
+        model_version,
+        configuration_version,
+        configuration_hash,
+        previous_ledger_hash,
+        merkle_tree.root,
+        merkle_tree,
+        ledger_hash,
+    )
+
+
+def _read_rows(path: Path, columns: tuple[str, ...]) -> Iterator[dict[str, str]]:
+    with Path(path).open(encoding="utf-8", newline="") as handle:
+        reader = csv.DictReader(handle)
+        if tuple(reader.fieldnames or ()) != columns:
+            raise DomainValidationError(f"ledger file columns must be {', '.join(columns)}")
+        yield from reader
+
+
+def _iso_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except ValueError as exc:
+        raise DomainValidationError("period_date must be an ISO date") from exc
+
+
+def read_ecl_ledger_entries(path: Path) -> Iterator[ECLLedgerEntry]:
+    """Stream ledger entries from a UTF-8 CSV whose header lists the entry fields."""
+    columns = tuple(field.name for field in fields(ECLLedgerEntry))
+    for row in _read_rows(path, columns):
+        yield ECLLedgerEntry(
+            row["contract_id"],
+            row["client_id"],
+            row["product_code"],
+            _iso_date(row["period_date"]),
+            row["scenario_id"],
+            row["scenario_weight"],
+            row["period_ecl"],
+        )
+
+
+def read_ecl_ledger_adjustments(path: Path) -> Iterator[ContractECLAdjustment]:
+    """Stream contract adjustments from a UTF-8 CSV whose header lists their fields."""
+    columns = tuple(field.name for field in fields(ContractECLAdjustment))
+    for row in _read_rows(path, columns):
+        yield ContractECLAdjustment(*(row[column] for column in columns))
+
+
+def verify_contract_inclusion(proof: ContractInclusionProof, entries_root: str) -> bool:
+    """Check one contract's figures against a ledger root without the other contracts."""
+    contract_id = proof.adjustment.contract_id
+    if not proof.entries or any(item.contract_id != contract_id for item in proof.entries):
+        return False
+    leaf = _contract_leaf(_contract_entries(proof.entries), proof.adjustment)
+    return verify_merkle_proof(leaf, proof.proof, entries_root)
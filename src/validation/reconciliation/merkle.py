@@ -0,0 +1,104 @@
+"""RFC 6962 Merkle tree with compact node storage and inclusion proofs."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from hashlib import sha256
+
+from ...domain.exceptions import DomainValidationError
+
+DIGEST_SIZE = 32
+EMPTY_ROOT = sha256(b"").hexdigest()
+
+
+def merkle_leaf_hash(data: bytes) -> bytes:
+    return sha256(b"\x00" + data).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return sha256(b"\x01" + left + right).digest()
+
+
+@dataclass(frozen=True, slots=True)
+class MerkleInclusionProof:
+    leaf_index: int
+    tree_size: int
+    path: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class MerkleTree:
+    """Every level of the tree, leaves first, as concatenated 32-byte digests.
+
+    Pairing nodes level by level and promoting an unpaired last node yields the
+    RFC 6962 tree shape, so roots and proofs interoperate with that format.
+    """
+
+    levels: tuple[bytes, ...]
+
+    @classmethod
+    def from_leaf_hashes(cls, leaf_hashes: bytes) -> MerkleTree:
+        if len(leaf_hashes) % DIGEST_SIZE:
+            raise DomainValidationError("Merkle leaf hashes must be 32-byte digests")
+        levels = [bytes(leaf_hashes)]
+        while len(levels[-1]) > DIGEST_SIZE:
+            level = levels[-1]
+            parents = bytearray()
+            for offset in range(0, len(level) - DIGEST_SIZE, 2 * DIGEST_SIZE):
+                parents += _node_hash(
+                    level[offset : offset + DIGEST_SIZE],
+                    level[offset + DIGEST_SIZE : offset + 2 * DIGEST_SIZE],
+                )
+            if (len(level) // DIGEST_SIZE) % 2:
+                parents += level[-DIGEST_SIZE:]
+            levels.append(bytes(parents))
+        return cls(tuple(levels))
+
+    @classmethod
+    def from_leaves(cls, leaves: Iterable[bytes]) -> MerkleTree:
+        return cls.from_leaf_hashes(b"".join(merkle_leaf_hash(leaf) for leaf in leaves))
+
+    @property
+    def size(self) -> int:
+        return len(self.levels[0]) // DIGEST_SIZE
+
+    @property
+    def root(self) -> str:
+        return self.levels[-1].hex() if self.size else EMPTY_ROOT
+
+    def leaf_hash(self, leaf_index: int) -> bytes:
+        if not 0 <= leaf_index < self.size:
+            raise DomainValidationError("Merkle leaf index is outside the tree")
+        return self.levels[0][leaf_index * DIGEST_SIZE : (leaf_index + 1) * DIGEST_SIZE]
+
+    def proof(self, leaf_index: int) -> MerkleInclusionProof:
+        """Return the O(log n) sibling path from one leaf to the root."""
+        self.leaf_hash(leaf_index)
+        path: list[str] = []
+        index = leaf_index
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling * DIGEST_SIZE < len(level):
+                path.append(level[sibling * DIGEST_SIZE : (sibling + 1) * DIGEST_SIZE].hex())
+            index //= 2
+        return MerkleInclusionProof(leaf_index, self.size, tuple(path))
+
+
+def verify_merkle_proof(leaf: bytes, proof: MerkleInclusionProof, root: str) -> bool:
+    """Recompute the root from one leaf's data and its sibling path."""
+    if not 0 <= proof.leaf_index < proof.tree_size:
+        return False
+    node = merkle_leaf_hash(leaf)
+    index, width = proof.leaf_index, proof.tree_size
+    siblings = iter(proof.path)
+    try:
+        while width > 1:
+            if index % 2:
+                node = _node_hash(bytes.fromhex(next(siblings)), node)
+            elif index + 1 < width:
+                node = _node_hash(node, bytes.fromhex(next(siblings)))
+            index, width = index // 2, (width + 1) // 2
+    except (StopIteration, ValueError):
+        return False
+    return next(siblings, None) is None and node.hex() == root
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from scripts.performance_benchmark import synthetic_contracts
+from src.application.services import IncrementalECLRecalculator, load_scenario_set
+from src.ecl.batch import PartitionTelemetry, TelemetrySink
+from src.infrastructure.database import (
+    DatabaseManager,
+    DatabaseSettings,
+    PersistenceConflictError,
+    VersionedRepository,
+)
+from src.models.forward_looking import load_macro_risk_policy
+
+
+@pytest.fixture
+def repository(tmp_path: Path) -> VersionedRepository:
+    database = DatabaseManager(
+        DatabaseSettings(backend="sqlite", sqlite_path=tmp_path / "risk.sqlite3")
+    )
+    database.apply_migrations()
+    return VersionedRepository(database)
+
+
+def _recalculator(
+    repository: VersionedRepository, telemetry: TelemetrySink | None = None
+) -> IncrementalECLRecalculator:
+    return IncrementalECLRecalculator(
+        repository,
+        load_scenario_set(seed=91),
+        load_macro_risk_policy(),
+        partition_size=7,
+        workers=2,
+        telemetry=telemetry,
+    )
+
+
+def test_incremental_run_carries_forward_and_matches_full_rerun(
+    repository: VersionedRepository,
+) -> None:
+    partitions: list[PartitionTelemetry] = []
+    recalculator = _recalculator(repository, partitions.append)
+    january = list(synthetic_contracts(40, profiles=8))
+    first = recalculator.run(january, execution_key="2026-01", reference_date=date(2026, 1, 31))
+    assert (first.recalculated_contracts, first.carried_forward_contracts) == (40, 0)
+    assert first.unique_profile_calculations == 8
+    assert {partition.engine for partition in partitions} == {"portfolio"}
+    assert sum(partition.contracts for partition in partitions) == 40
+    assert sum(partition.cache_misses or 0 for partition in partitions) == 8
+
+    changed_periods = tuple(
+        replace(period, drawn_ead=period.drawn_ead + Decimal("50")) for period in january[3].periods
+    )
+    february = [
+        *january[:3],
+        replace(january[3], periods=changed_periods),
+        *january[4:39],
+        replace(january[0], contract_id="CTR-NEW-000000001"),
+    ]
+    incremental = recalculator.run(
+        february,
+        execution_key="2026-02",
+        reference_date=date(2026, 2, 28),
+        previous_execution_id=first.execution_id,
+    )
+    assert incremental.contract_count == 40
+    assert incremental.recalculated_contracts == 1
+    assert incremental.carried_forward_contracts == 39
+    assert incremental.removed_contracts == 1
+    assert incremental.unique_profile_calculations == 1
+
+    full = _recalculator(repository).run(
+        february, execution_key="2026-02-full", reference_date=date(2026, 2, 28)
+    )
+    assert full.recalculated_contracts == 40
+    assert incremental.results_hash == full.results_hash
+    assert incremental.probability_weighted_ecl == full.probability_weighted_ecl
+    assert incremental.stress_ecl == full.stress_ecl
+
+    rows = repository.load_ecl_results(
+        incremental.execution_id, period=0, scenario_id="probability_weighted"
+    )
+    full_rows = repository.load_ecl_results(
+        full.execution_id, period=0, scenario_id="probability_weighted"
+    )
+    assert [(row["contract_id"], row["ecl_amount"]) for row in rows] == [
+        (row["contract_id"], row["ecl_amount"]) for row in full_rows
+    ]
+    origins = {row["contract_id"]: row["payload"]["origin_execution_id"] for row in rows}
+    assert origins[january[3].contract_id] == incremental.execution_id
+    assert origins["CTR-NEW-000000001"] == first.execution_id
+    assert origins[january[10].contract_id] == first.execution_id
+    execution = repository.database.fetch_one(
+        "SELECT status, lineage_json FROM calculation_executions WHERE execution_id = ?",
+        (incremental.execution_id,),
+    )
+    assert execution is not None and execution["status"] == "COMPLETED"
+    assert first.execution_id in execution["lineage_json"]
+
+
+def test_incremental_run_requires_a_completed_previous_execution(
+    repository: VersionedRepository,
+) -> None:
+    pending = repository.start_execution(
+        execution_key="pending", reference_date=date(2026, 1, 31), lineage={"hash": "a"}
+    )
+    with pytest.raises(PersistenceConflictError, match="COMPLETED"):
+        _recalculator(repository).run(
+            synthetic_contracts(3),
+            execution_key="2026-02",
+            reference_date=date(2026, 2, 28),
+            previous_execution_id=pending["execution_id"],
+        )
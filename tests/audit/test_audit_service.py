@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
 
 import pytest
 
-from src.audit import AuditChainError, AuditService
+from src.audit import AuditChainError, AuditEvent, AuditService
 from src.infrastructure.database import DatabaseManager, DatabaseSettings, VersionedRepository
 
 
@@ -182,3 +184,90 @@ def test_audit_listing_limit_fails_closed(database: DatabaseManager, limit: int)
 
 def test_audit_listing_accepts_valid_limit(database: DatabaseManager) -> None:
     assert AuditService(database).list_events(limit=1) == []
+
+
+def _record(service: AuditService, action: str) -> AuditEvent:
+    return service.record(
+        actor_id="worker",
+        actor_role="MANAGER",
+        action=action,
+        resource_type="job",
+        resource_id=action,
+        input_payload={"action": action},
+        result_payload={},
+        versions={},
+        status="SUCCEEDED",
+    )
+
+
+def test_concurrent_writers_are_group_committed_into_one_chain(
+    database: DatabaseManager, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    service = AuditService(database, flush_interval_seconds=0.01, max_batch_size=16)
+    batch_sizes: list[int] = []
+    execute_many = database.execute_many
+
+    def counted(statement: str, rows: list[tuple[object, ...]]) -> int:
+        batch_sizes.append(len(rows))
+        return execute_many(statement, rows)
+
+    monkeypatch.setattr(database, "execute_many", counted)
+    start = threading.Barrier(8)
+
+    def worker(index: int) -> list[AuditEvent]:
+        start.wait()
+        return [_record(service, f"W{index}-{item}") for item in range(20)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        events = [event for batch in pool.map(worker, range(8)) for event in batch]
+
+    assert len({event.event_hash for event in events}) == 160
+    assert sum(batch_sizes) == 160 and max(batch_sizes) <= 16
+    assert len(batch_sizes) < 160
+    assert service.verify_chain(full=True) == 160
+    previous = database.fetch_all("SELECT previous_event_hash FROM audit_events")
+    assert len({row["previous_event_hash"] for row in previous}) == 160
+
+
+def test_incremental_verification_is_read_only_and_full_rehash_checkpoints_and_detects_tampering(
+    database: DatabaseManager,
+) -> None:
+    service = AuditService(database)
+    first = _record(service, "FIRST")
+    _record(service, "SECOND")
+    assert service.verify_chain(full=True) == 2
+    _record(service, "THIRD")
+    assert service.verify_chain() == 3
+    assert service.verify_chain() == 3
+    checkpoint_query = "SELECT event_count FROM audit_chain_checkpoints ORDER BY checkpoint_id"
+    assert database.fetch_all(checkpoint_query) == [{"event_count": 2}]
+    assert service.verify_chain(full=True) == 3
+    assert database.fetch_all(checkpoint_query) == [{"event_count": 2}, {"event_count": 3}]
+
+    database.execute("DROP TRIGGER audit_events_no_update")
+    database.execute(
+        "UPDATE audit_events SET event_json = ? WHERE event_id = ?", ("{}", first.event_id)
+    )
+    assert service.verify_chain() == 3
+    with pytest.raises(AuditChainError, match="invalid"):
+        service.verify_chain(full=True)
+    database.execute("UPDATE audit_events SET event_json = ? WHERE action = ?", ("{}", "THIRD"))
+    with pytest.raises(AuditChainError, match="invalid"):
+        service.verify_chain()
+
+
+def test_event_recorded_inside_unit_of_work_follows_its_outcome(
+    database: DatabaseManager,
+) -> None:
+    service = AuditService(database)
+    with pytest.raises(RuntimeError, match="rollback"):
+        with database.unit_of_work():
+            _record(service, "DISCARDED")
+            raise RuntimeError("rollback")
+    with database.unit_of_work():
+        kept = _record(service, "KEPT")
+
+    assert kept.previous_event_hash is None
+    assert service.verify_chain() == 1
+    with pytest.raises(ValueError, match="batch size"):
+        AuditService(database, max_batch_size=0)
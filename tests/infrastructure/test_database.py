@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import hashlib
 import sqlite3
+import threading
 from datetime import UTC, date, datetime
 from decimal import Decimal
 from pathlib import Path
 
 import pytest
 
+from src.infrastructure.database import ConnectionPoolTimeoutError
 from src.infrastructure.database.manager import (
     DatabaseConfigurationError,
     DatabaseManager,
@@ -15,7 +17,10 @@ from src.infrastructure.database.manager import (
     MigrationIntegrityError,
     PendingMigrationsError,
 )
+from src.infrastructure.database.pool import QueueConnectionPool, ThreadLocalConnectionPool
 from src.infrastructure.database.repository import (
+    BulkPersistenceSummary,
+    ECLResultRow,
     PersistenceConflictError,
     VersionedRepository,
     canonical_json,
@@ -28,7 +33,15 @@ def database(tmp_path: Path) -> DatabaseManager:
     manager = DatabaseManager(
         DatabaseSettings(backend="sqlite", sqlite_path=tmp_path / "risk.sqlite3")
     )
-    assert manager.apply_migrations() == ("0001", "0002", "0003", "0004")
+    assert manager.apply_migrations() == (
+        "0001",
+        "0002",
+        "0003",
+        "0004",
+        "0005",
+        "0006",
+        "0007",
+    )
     return manager
 
 
@@ -199,6 +212,14 @@ def test_postgresql_migration_paths_use_native_cursor(
     assert manager.migration_status().applied == ("0001",)
     assert manager.fetch_one("SELECT ?", (1,)) == {"value": 1}
     assert manager.fetch_all("SELECT ?", (1,)) == [{"value": 1}]
+    batches: list[tuple[str, list[tuple[object, ...]]]] = []
+    monkeypatch.setattr(
+        "src.infrastructure.database.manager.execute_batch",
+        lambda _cursor, statement, rows, page_size: batches.append((statement, rows)),
+    )
+    assert manager.execute_many("INSERT INTO example VALUES (?)", [[1], [2]]) == 2
+    assert manager.execute_many("INSERT INTO example VALUES (?)", []) == 0
+    assert batches == [("INSERT INTO example VALUES (%s)", [(1,), (2,)])]
 
     sentinel = object()
     monkeypatch.setattr(
@@ -338,6 +359,69 @@ def test_ecl_result_preserves_decimal_and_is_idempotent(
         )
 
 
+def test_bulk_ecl_results_match_single_row_guarantees(
+    repository: VersionedRepository,
+    database: DatabaseManager,
+) -> None:
+    execution = repository.start_execution(
+        execution_key="bulk", reference_date=date(2026, 6, 30), lineage={"hash": "a"}
+    )
+    rows = [
+        ECLResultRow(f"C-{index}", period, "baseline", Decimal(f"{index}.{period}1"), {"p": period})
+        for index in range(7)
+        for period in (1, 2)
+    ]
+    single = repository.persist_ecl_result(
+        execution_id=execution["execution_id"],
+        contract_id="C-0",
+        period=1,
+        scenario_id="baseline",
+        ecl_amount=Decimal("0.11"),
+        payload={"p": 1},
+    )
+
+    summary = repository.persist_ecl_results(
+        execution_id=execution["execution_id"], results=[*rows, rows[3]], batch_size=4
+    )
+    assert summary == BulkPersistenceSummary(inserted=13, reused=2)
+    assert repository.persist_ecl_results(
+        execution_id=execution["execution_id"], results=rows, batch_size=5
+    ) == BulkPersistenceSummary(inserted=0, reused=14)
+    stored = database.fetch_one(
+        "SELECT ecl_amount, payload_hash FROM calculation_results "
+        "WHERE contract_id = ? AND period = ?",
+        ("C-0", 1),
+    )
+    assert stored == {"ecl_amount": "0.11", "payload_hash": single}
+
+    changed = ECLResultRow("C-9", 1, "baseline", Decimal("9.11"), {"p": 1})
+    conflicting = ECLResultRow("C-6", 2, "baseline", Decimal("6.22"), {"p": 2})
+    with pytest.raises(PersistenceConflictError, match="different content"):
+        repository.persist_ecl_results(
+            execution_id=execution["execution_id"], results=[changed, conflicting], batch_size=1
+        )
+    with pytest.raises(PersistenceConflictError, match="different content"):
+        repository.persist_ecl_results(
+            execution_id=execution["execution_id"],
+            results=[changed, ECLResultRow("C-9", 1, "baseline", Decimal("9.12"), {"p": 1})],
+        )
+    assert database.fetch_one("SELECT COUNT(*) AS rows FROM calculation_results") == {"rows": 14}
+    with pytest.raises(ValueError, match="batch size"):
+        repository.persist_ecl_results(
+            execution_id=execution["execution_id"], results=rows, batch_size=0
+        )
+
+    assert repository.persist_contracts(
+        [("C-1", "v1", {"balance": Decimal("1.00")}), ("C-2", "v1", {"balance": "2"})]
+    ) == BulkPersistenceSummary(inserted=2, reused=0)
+    assert repository.persist_contract("C-1", "v1", {"balance": Decimal("1.00")})
+    with pytest.raises(PersistenceConflictError, match="operational_contracts"):
+        repository.persist_contracts([("C-2", "v1", {"balance": "3"})])
+    assert repository.persist_models(
+        [("PD", "1.0.0", {"version": "1.0.0"})] * 2
+    ) == BulkPersistenceSummary(inserted=1, reused=1)
+
+
 def test_audit_lineage_event_is_immutable(
     repository: VersionedRepository,
     database: DatabaseManager,
@@ -396,3 +480,89 @@ def test_repository_internal_and_completion_failures(
         )
         == event_id
     )
+
+
+def test_unit_of_work_shares_one_pooled_connection_and_rolls_back(
+    database: DatabaseManager,
+) -> None:
+    assert database.fetch_one("PRAGMA journal_mode") == {"journal_mode": "wal"}
+    with database.unit_of_work() as connection:
+        with database.transaction() as nested:
+            assert nested is connection
+        database.execute(
+            "INSERT INTO calculation_jobs (job_id, status, request_hash, request_json, "
+            "created_at) VALUES (?, ?, ?, ?, ?)",
+            ("kept", "PENDING", "a" * 64, "{}", "2026-07-01"),
+        )
+    with pytest.raises(RuntimeError, match="abort"):
+        with database.unit_of_work():
+            database.execute(
+                "INSERT INTO calculation_jobs (job_id, status, request_hash, request_json, "
+                "created_at) VALUES (?, ?, ?, ?, ?)",
+                ("discarded", "PENDING", "a" * 64, "{}", "2026-07-01"),
+            )
+            raise RuntimeError("abort")
+
+    jobs = database.fetch_all("SELECT job_id FROM calculation_jobs ORDER BY job_id")
+    assert jobs == [{"job_id": "kept"}]
+    pool = database._connection_pool()
+    assert pool.open_connections == 1
+
+    opened: list[object] = []
+    worker = threading.Thread(target=lambda: opened.append(database.fetch_one("SELECT 1 AS v")))
+    worker.start()
+    worker.join()
+    assert opened == [{"v": 1}] and pool.open_connections == 2
+    database.close()
+    assert pool.open_connections == 0
+    assert database.fetch_one("SELECT COUNT(*) AS jobs FROM calculation_jobs") == {"jobs": 1}
+
+
+def test_connection_pools_bound_checkouts_and_replace_unhealthy_connections(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class Connection:
+        def __init__(self) -> None:
+            self.closed = 0
+
+        def close(self) -> None:
+            self.closed = 1
+
+    pool = QueueConnectionPool(Connection, size=1, timeout_seconds=0.01, health_check_seconds=60)
+    first = pool.acquire()
+    with pytest.raises(ConnectionPoolTimeoutError, match="no database connection"):
+        pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    first.closed = 1
+    pool.release(first)
+    replacement = pool.acquire()
+    assert replacement is not first and pool.open_connections == 1
+    pool.release(replacement, broken=True)
+    assert replacement.closed and pool.open_connections == 0
+    pinged = QueueConnectionPool(Connection, size=1, timeout_seconds=1, health_check_seconds=0)
+    stale = pinged.acquire()
+    pinged.release(stale)
+    assert pinged.acquire() is not stale and stale.closed
+
+    local = ThreadLocalConnectionPool(
+        Connection, size=2, timeout_seconds=0.01, health_check_seconds=60
+    )
+    owned = local.acquire()
+    local.release(owned)
+    assert local.acquire() is owned
+    local.release(owned)
+    local.close()
+    assert owned.closed
+    with pytest.raises(ValueError, match="pool size"):
+        QueueConnectionPool(Connection, size=0, timeout_seconds=1, health_check_seconds=0)
+
+    with pytest.raises(DatabaseConfigurationError, match="pool size"):
+        DatabaseSettings(pool_size=0)
+    with pytest.raises(DatabaseConfigurationError, match="health-check"):
+        DatabaseSettings(health_check_seconds=-1)
+    monkeypatch.setenv("DATABASE_BACKEND", "sqlite")
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "8")
+    monkeypatch.setenv("DATABASE_POOL_TIMEOUT_SECONDS", "2.5")
+    settings = DatabaseSettings.from_env()
+    assert (settings.pool_size, settings.pool_timeout_seconds) == (8, 2.5)
@@ -106,8 +106,9 @@ def test_validate_mode_is_read_only_and_requires_current_schema(tmp_path: Path)
         prepare_database(database, "validate")
     assert not (tmp_path / "risk.sqlite3").exists() or database.migration_status().applied == ()
 
-    assert prepare_database(database, "apply") == ("0001", "0002", "0003", "0004")
-    assert prepare_database(database, "validate") == ("0001", "0002", "0003", "0004")
+    expected = ("0001", "0002", "0003", "0004", "0005", "0006", "0007")
+    assert prepare_database(database, "apply") == expected
+    assert prepare_database(database, "validate") == expected
 
 
 def test_demo_rejects_automatic_or_disabled_migrations(
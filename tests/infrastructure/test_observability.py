@@ -4,18 +4,25 @@ import json
 import logging
 import sys
 from pathlib import Path
+from threading import Barrier, Thread
 
+import pytest
 import yaml
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from scripts.metrics_benchmark import run_case as run_metrics_case
+from scripts.performance_benchmark import synthetic_contracts
+from src.application.services import load_scenario_set
+from src.ecl.batch import PartitionedStage1Processor, PortfolioECLProcessor
 from src.infrastructure.database import DatabaseSettings
 from src.infrastructure.logging import JsonFormatter, setup_json_logging
 from src.infrastructure.observability import middleware as middleware_module
 from src.infrastructure.observability.context import job_context, request_context
-from src.infrastructure.observability.metrics import MetricsRegistry
+from src.infrastructure.observability.metrics import Histogram, MetricsRegistry
 from src.infrastructure.observability.middleware import configure_observability
 from src.interfaces.api import create_app
+from src.models.forward_looking import load_macro_risk_policy
 from src.security.settings import SecuritySettings
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -83,6 +90,82 @@ def test_metrics_use_bounded_labels_and_prometheus_histograms() -> None:
     assert 'risco_jobs_in_progress{job_type="ecl_portfolio"} 0' in rendered
 
 
+def test_histogram_bisects_into_one_slot_and_renders_cumulative_buckets() -> None:
+    histogram = Histogram((0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 2.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 0, 1]
+    assert histogram.cumulative() == [2, 3, 3]
+
+    metrics = MetricsRegistry(environment="test", version="abc")
+    for value in (0.004, 0.005, 0.3, 7.0):
+        metrics.observe_http("GET", "/health", 200, value)
+    rendered = metrics.render()
+    base = 'risco_http_request_duration_seconds_bucket{method="GET",route="/health",le='
+    assert f'{base}"0.005"}} 2' in rendered
+    assert f'{base}"0.25"}} 2' in rendered
+    assert f'{base}"0.5"}} 3' in rendered
+    assert f'{base}"5.0"}} 3' in rendered
+    assert f'{base}"+Inf"}} 4' in rendered
+
+
+def test_sharded_registry_merges_concurrent_writers_at_scrape() -> None:
+    metrics = MetricsRegistry(environment="test", version="abc", shards=4)
+    barrier = Barrier(16)
+
+    def writer() -> None:
+        barrier.wait()
+        for _ in range(500):
+            metrics.observe_http("POST", "/api/v1/ecl/calculate", 201, 0.02)
+        metrics.job_started("ecl_portfolio")
+        metrics.job_finished("ecl_portfolio", "succeeded", 0.2)
+
+    threads = [Thread(target=writer) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    rendered = metrics.render()
+
+    assert (
+        'risco_http_requests_total{method="POST",route="/api/v1/ecl/calculate",'
+        'status_class="2xx"} 8000'
+    ) in rendered
+    assert 'risco_jobs_total{job_type="ecl_portfolio",status="succeeded"} 16' in rendered
+    assert 'risco_jobs_in_progress{job_type="ecl_portfolio"} 0' in rendered
+    with pytest.raises(ValueError, match="shards"):
+        MetricsRegistry(environment="test", version="abc", shards=0)
+    case = run_metrics_case(shards=4, threads=4, observations=100)
+    assert case["observations"] == 400 and case["nanoseconds_per_observe"] > 0
+
+
+def test_engine_partitions_feed_bounded_engine_series_and_gauges() -> None:
+    metrics = MetricsRegistry(environment="test", version="abc")
+    scenario_set, policy = load_scenario_set(seed=91), load_macro_risk_policy()
+    contracts = list(synthetic_contracts(50, profiles=3))
+    PartitionedStage1Processor(
+        scenario_set, policy, partition_size=20, telemetry=metrics.observe_engine_partition
+    ).process(contracts)
+    PortfolioECLProcessor(
+        scenario_set, policy, partition_size=25, telemetry=metrics.observe_engine_partition
+    ).process(contracts)
+    metrics.register_gauge("risco_batch_queue_in_flight", "Accepted batch jobs.", lambda: 3)
+    rendered = metrics.render()
+
+    assert 'risco_engine_contracts_total{engine="stage1"} 50' in rendered
+    assert 'risco_engine_partitions_total{engine="stage1"} 3' in rendered
+    assert 'risco_engine_partitions_total{engine="portfolio"} 2' in rendered
+    assert 'risco_engine_profile_cache_lookups_total{engine="stage1",result="miss"} 3' in rendered
+    assert 'risco_engine_profile_cache_lookups_total{engine="stage1",result="hit"} 6' in rendered
+    for phase in ("hashing", "calculation", "reduction", "sink"):
+        assert (
+            f'risco_engine_phase_duration_seconds_count{{engine="portfolio",phase="{phase}"}} 2'
+            in rendered
+        )
+    assert "# TYPE risco_batch_queue_in_flight gauge\nrisco_batch_queue_in_flight 3.0" in rendered
+    assert "contract" not in rendered.replace("risco_engine_contracts_total", "")
+
+
 def test_api_exposes_metrics_and_request_correlation(tmp_path: Path) -> None:
     app = create_app(
         DatabaseSettings(sqlite_path=tmp_path / "api.sqlite3"),
@@ -98,6 +181,9 @@ def test_api_exposes_metrics_and_request_correlation(tmp_path: Path) -> None:
     assert metrics.status_code == 200
     assert 'route="/health"' in metrics.text
     assert "risco_application_info" in metrics.text
+    assert "risco_batch_queue_in_flight 0.0" in metrics.text
+    assert "risco_engine_discount_curve_cache_hit_ratio " in metrics.text
+    assert "macro_multiplier" not in metrics.text
 
 
 def test_observability_records_failed_requests_and_optional_request_id(
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+import os
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
@@ -221,6 +225,7 @@ def test_portfolio_job_is_persisted_and_processed(tmp_path: Path) -> None:
             if time.monotonic() >= deadline:
                 raise AssertionError("portfolio job did not complete before the test deadline")
             time.sleep(0.01)
+        results_response = api.get(status_response.json()["results_url"])
         metrics_response = api.get("/metrics")
 
     assert accepted.status_code == 202
@@ -228,11 +233,173 @@ def test_portfolio_job_is_persisted_and_processed(tmp_path: Path) -> None:
     status_body = status_response.json()
     assert status_body["status"] == "SUCCEEDED"
     assert len(status_body["request_hash"]) == 64
-    assert status_body["result"][0]["probability_weighted_ecl"] == "4.00"
+    assert status_body["result"] is None
+    assert (status_body["total_items"], status_body["processed_items"]) == (1, 1)
+    assert status_body["result_chunks"] == 1
+    assert results_response.json()["items"][0]["probability_weighted_ecl"] == "4.00"
+    assert results_response.json()["next_offset"] is None
     assert (
         'risco_jobs_total{job_type="ecl_portfolio",status="succeeded"} 1' in metrics_response.text
     )
     assert 'risco_jobs_in_progress{job_type="ecl_portfolio"} 0' in metrics_response.text
+    assert 'risco_engine_contracts_total{engine="api_portfolio"} 1' in metrics_response.text
+    assert 'lookups_total{engine="api_portfolio"' not in metrics_response.text
+
+
+def test_portfolio_results_are_chunked_paginated_and_streamed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("BATCH_RESULT_CHUNK_SIZE", "2")
+    open_units: list[int] = [0]
+    prepared_inside_unit: list[bool] = []
+    unit_of_work = DatabaseManager.unit_of_work
+    prepare = CanonicalECLApiService.prepare
+
+    @contextmanager
+    def tracked_unit_of_work(self: DatabaseManager) -> Iterator[Any]:
+        open_units[0] += 1
+        try:
+            with unit_of_work(self) as connection:
+                yield connection
+        finally:
+            open_units[0] -= 1
+
+    def tracked_prepare(self: CanonicalECLApiService, request: ECLCalculationRequest) -> Any:
+        prepared_inside_unit.append(open_units[0] > 0)
+        return prepare(self, request)
+
+    monkeypatch.setattr(DatabaseManager, "unit_of_work", tracked_unit_of_work)
+    monkeypatch.setattr(CanonicalECLApiService, "prepare", tracked_prepare)
+    calculations = []
+    for index in range(5):
+        payload = calculation_payload(execution_key=f"chunked:{index}:2026-06-30")
+        payload["contract_id"] = f"C-API-CHUNK-{index}"
+        calculations.append(payload)
+    portfolio = {"calculations": calculations}
+    with client(tmp_path) as api:
+        canonical = PortfolioRequest.model_validate(portfolio).model_dump(mode="json")
+        request_hash = hashlib.sha256(canonical_json(canonical).encode()).hexdigest()
+        confirmation = api.post(
+            "/api/v1/security/confirmations",
+            json={"action": "ecl:calculate:portfolio", "payload_hash": request_hash},
+        ).json()
+        accepted = api.post(
+            "/api/v1/ecl/portfolio",
+            json=portfolio,
+            headers={"X-Confirmation-Id": confirmation["confirmation_id"]},
+        )
+        deadline = time.monotonic() + 5
+        while True:
+            status_response = api.get(accepted.json()["status_url"])
+            if status_response.json()["status"] in {"SUCCEEDED", "FAILED"}:
+                break
+            if time.monotonic() >= deadline:
+                raise AssertionError("portfolio job did not complete before the test deadline")
+            time.sleep(0.01)
+        results_url = status_response.json()["results_url"]
+        first_page = api.get(results_url, params={"offset": 1, "limit": 3}).json()
+        last_page = api.get(results_url, params={"offset": 4, "limit": 3}).json()
+        stream = api.get(f"{results_url}.ndjson")
+        missing = api.get("/api/v1/ecl/jobs/missing/results")
+
+    status_body = status_response.json()
+    assert status_body["status"] == "SUCCEEDED"
+    assert (status_body["total_items"], status_body["processed_items"]) == (5, 5)
+    assert status_body["result_chunks"] == 3
+    assert [item["contract_id"] for item in first_page["items"]] == [
+        "C-API-CHUNK-1",
+        "C-API-CHUNK-2",
+        "C-API-CHUNK-3",
+    ]
+    assert first_page["next_offset"] == 4
+    assert [item["contract_id"] for item in last_page["items"]] == ["C-API-CHUNK-4"]
+    assert last_page["next_offset"] is None
+    assert stream.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in stream.text.splitlines()]
+    assert [line["contract_id"] for line in lines] == [f"C-API-CHUNK-{i}" for i in range(5)]
+    assert missing.status_code == 404
+    assert prepared_inside_unit == [False] * 5
+
+
+def test_portfolio_ndjson_upload_is_spooled_confirmed_and_processed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    spool = tmp_path / "uploads"
+    monkeypatch.setenv("BATCH_UPLOAD_DIR", str(spool))
+    monkeypatch.setenv("BATCH_RESULT_CHUNK_SIZE", "2")
+    lines = []
+    for index in range(3):
+        payload = calculation_payload(execution_key=f"upload:{index}:2026-06-30")
+        payload["contract_id"] = f"C-API-UPLOAD-{index}"
+        lines.append(json.dumps(payload))
+    body = ("\n".join(lines) + "\n\n").encode()
+    monkeypatch.setenv("BATCH_UPLOAD_MAX_BYTES", str(len(body)))
+    abandoned = spool / "stopped-worker" / "abandoned.ndjson"
+    running = spool / "live-worker" / "running.ndjson"
+    for upload in (abandoned, running):
+        upload.parent.mkdir(parents=True)
+        upload.write_bytes(body)
+    two_days_ago = time.time() - 2 * 86400
+    os.utime(abandoned, (two_days_ago, two_days_ago))
+    os.utime(abandoned.parent, (two_days_ago, two_days_ago))
+    invalid = (lines[0] + '\n{"contract_id": "C-BROKEN"}\n').encode()
+    with client(tmp_path) as api:
+
+        def confirm(content: bytes) -> dict[str, str]:
+            confirmation = api.post(
+                "/api/v1/security/confirmations",
+                json={
+                    "action": "ecl:calculate:portfolio",
+                    "payload_hash": hashlib.sha256(content).hexdigest(),
+                },
+            ).json()
+            return {"X-Confirmation-Id": confirmation["confirmation_id"]}
+
+        rejected = api.post(
+            "/api/v1/ecl/portfolio.ndjson", content=invalid, headers=confirm(invalid)
+        )
+        denied = api.post("/api/v1/ecl/portfolio.ndjson", content=body, headers=confirm(invalid))
+        oversized = api.post(
+            "/api/v1/ecl/portfolio.ndjson", content=body + b"\n", headers=confirm(body + b"\n")
+        )
+        spooled_during_run = sorted(path.parent.name for path in spool.glob("*/*.ndjson"))
+        accepted = api.post("/api/v1/ecl/portfolio.ndjson", content=body, headers=confirm(body))
+        deadline = time.monotonic() + 5
+        while True:
+            status_response = api.get(accepted.json()["status_url"])
+            if status_response.json()["status"] in {"SUCCEEDED", "FAILED"}:
+                break
+            if time.monotonic() >= deadline:
+                raise AssertionError("uploaded portfolio job did not complete before the deadline")
+            time.sleep(0.01)
+        stream = api.get(f"{status_response.json()['results_url']}.ndjson")
+
+    assert rejected.status_code == 422
+    assert rejected.json()["detail"].startswith("line 2:")
+    assert denied.status_code == 409
+    assert oversized.status_code == 413
+    assert spooled_during_run == ["live-worker"]
+    assert accepted.status_code == 202
+    status_body = status_response.json()
+    assert status_body["status"] == "SUCCEEDED"
+    assert (status_body["total_items"], status_body["processed_items"]) == (3, 3)
+    assert (
+        status_body["request_hash"]
+        == hashlib.sha256(
+            canonical_json(
+                {
+                    "bytes": len(body),
+                    "calculations": 3,
+                    "upload_sha256": hashlib.sha256(body).hexdigest(),
+                }
+            ).encode()
+        ).hexdigest()
+    )
+    assert [json.loads(line)["contract_id"] for line in stream.text.splitlines()] == [
+        f"C-API-UPLOAD-{index}" for index in range(3)
+    ]
+    assert list(spool.glob("*/*.ndjson")) == [running]
+    assert [path.name for path in spool.iterdir()] == ["live-worker"]
 
 
 def test_unknown_fields_and_invalid_stage_one_horizon_are_rejected(tmp_path: Path) -> None:
@@ -402,7 +569,7 @@ def test_individual_value_error_and_missing_agent_evidence(
     with client(tmp_path) as api:
         monkeypatch.setattr(
             CanonicalECLApiService,
-            "calculate",
+            "prepare",
             lambda *_args, **_kwargs: (_ for _ in ()).throw(ValueError("invalid calculation")),
         )
         invalid = api.post("/api/v1/ecl/individual", json=calculation_payload())
@@ -461,7 +628,7 @@ def test_portfolio_confirmation_queue_and_worker_failures(
         ).json()
         monkeypatch.setattr(
             CanonicalECLApiService,
-            "calculate",
+            "prepare",
             lambda *_args, **_kwargs: (_ for _ in ()).throw(RuntimeError("worker failed")),
         )
         accepted = api.post(
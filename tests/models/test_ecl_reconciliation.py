@@ -1,6 +1,9 @@
-from dataclasses import FrozenInstanceError, replace
+import csv
+from dataclasses import FrozenInstanceError, fields, replace
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from hashlib import sha256
+from pathlib import Path
 
 import pytest
 
@@ -8,7 +11,14 @@ from src.domain.exceptions import DomainValidationError, TemporalConsistencyErro
 from src.validation.reconciliation import (
     ContractECLAdjustment,
     ECLLedgerEntry,
+    MerkleInclusionProof,
+    MerkleTree,
     create_ecl_execution_ledger,
+    read_ecl_ledger_adjustments,
+    read_ecl_ledger_entries,
+    stream_ecl_execution_ledger,
+    verify_contract_inclusion,
+    verify_merkle_proof,
 )
 
 
@@ -148,3 +158,111 @@ def test_ledger_requires_aware_timestamp_and_valid_previous_hash() -> None:
         )
     with pytest.raises(DomainValidationError, match="previous ledger hash"):
         _ledger(previous_hash="invalid")
+
+
+def _stream(entries, adjustments, previous_hash: str | None = None):
+    return stream_ecl_execution_ledger(
+        execution_id="RUN-001",
+        reference_date=date(2025, 12, 31),
+        created_at=datetime(2026, 1, 2, 12, tzinfo=UTC),
+        entries=entries,
+        adjustments=adjustments,
+        model_version="ecl-0.1.0",
+        configuration_version="2026.07.1",
+        configuration_hash="a" * 64,
+        previous_ledger_hash=previous_hash,
+    )
+
+
+def _write_csv(path: Path, rows: tuple[object, ...]) -> Path:
+    columns = [field.name for field in fields(rows[0])]  # type: ignore[arg-type]
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(columns)
+        writer.writerows([getattr(row, column) for column in columns] for row in rows)
+    return path
+
+
+def test_streamed_ledger_from_files_matches_in_memory_commitment(tmp_path: Path) -> None:
+    ledger = _ledger()
+    within_contract_reversed = (_entries()[1], _entries()[0], _entries()[3], _entries()[2])
+    streamed = _stream(
+        read_ecl_ledger_entries(_write_csv(tmp_path / "entries.csv", within_contract_reversed)),
+        read_ecl_ledger_adjustments(_write_csv(tmp_path / "adjustments.csv", _adjustments())),
+    )
+
+    assert streamed.ledger_hash == ledger.ledger_hash
+    assert streamed.entries_root == ledger.entries_root
+    assert (streamed.entry_count, streamed.contract_count) == (4, 2)
+    assert streamed.reconciliation.contract_totals == ()
+    assert streamed.reconciliation == replace(ledger.reconciliation, contract_totals=())
+    moved = tuple(replace(item, client_id="CLI-9") for item in _entries()[:2]) + _entries()[2:]
+    assert _ledger(entries=moved).entries_root != ledger.entries_root
+
+
+def test_streamed_ledger_requires_contract_order_and_matching_adjustments() -> None:
+    interleaved = (_entries()[0], _entries()[2], _entries()[1], _entries()[3])
+    with pytest.raises(DomainValidationError, match="ordered by contract"):
+        _stream(iter(interleaved), iter(_adjustments()))
+    with pytest.raises(DomainValidationError, match="one adjustment for every contract"):
+        _stream(iter(_entries()), iter(_adjustments()[:1]))
+    with pytest.raises(DomainValidationError, match="one adjustment for every contract"):
+        _stream(iter(_entries()), iter(tuple(reversed(_adjustments()))))
+    with pytest.raises(DomainValidationError, match="requires entries and adjustments"):
+        _stream(iter(()), iter(()))
+
+
+def _rfc6962_root(leaves: list[bytes]) -> bytes:
+    if len(leaves) == 1:
+        return sha256(b"\x00" + leaves[0]).digest()
+    split = 1
+    while split * 2 < len(leaves):
+        split *= 2
+    return sha256(b"\x01" + _rfc6962_root(leaves[:split]) + _rfc6962_root(leaves[split:])).digest()
+
+
+def test_merkle_tree_matches_rfc6962_and_proofs_are_logarithmic() -> None:
+    for size in range(1, 34):
+        leaves = [f"leaf-{index}".encode() for index in range(size)]
+        tree = MerkleTree.from_leaves(leaves)
+        assert tree.root == _rfc6962_root(leaves).hex()
+        assert sum(len(level) for level in tree.levels) < 32 * 2 * size + 32 * 6
+        for index, leaf in enumerate(leaves):
+            proof = tree.proof(index)
+            assert len(proof.path) <= (size - 1).bit_length()
+            assert verify_merkle_proof(leaf, proof, tree.root)
+            assert not verify_merkle_proof(b"forged", proof, tree.root)
+            truncated = MerkleInclusionProof(index, size, proof.path[:-1])
+            assert size == 1 or not verify_merkle_proof(leaf, truncated, tree.root)
+    with pytest.raises(DomainValidationError, match="outside the tree"):
+        MerkleTree.from_leaves([b"only"]).proof(1)
+
+
+def test_contract_inclusion_proof_verifies_against_ledger_root_only() -> None:
+    ledger = _ledger()
+    proof = ledger.inclusion_proof("CTR-2")
+
+    assert proof.adjustment.contract_id == "CTR-2"
+    assert [item.scenario_id for item in proof.entries] == ["base", "downside"]
+    assert verify_contract_inclusion(proof, ledger.entries_root)
+    tampered = replace(
+        proof, adjustment=replace(proof.adjustment, management_overlay="0", final_ecl="36")
+    )
+    assert not verify_contract_inclusion(tampered, ledger.entries_root)
+    assert not verify_contract_inclusion(
+        replace(proof, entries=proof.entries[:1]), ledger.entries_root
+    )
+    other = ledger.inclusion_proof("CTR-1")
+    assert not verify_contract_inclusion(replace(proof, proof=other.proof), ledger.entries_root)
+    with pytest.raises(DomainValidationError, match="not part of the ECL ledger"):
+        ledger.inclusion_proof("CTR-9")
+
+
+def test_streamed_commitment_proves_contract_re_read_from_source() -> None:
+    streamed = _stream(iter(_entries()), iter(_adjustments()))
+    proof = streamed.inclusion_proof(1, reversed(_entries()[2:]), _adjustments()[1])
+
+    assert proof == _ledger().inclusion_proof("CTR-2")
+    assert verify_contract_inclusion(proof, streamed.entries_root)
+    with pytest.raises(DomainValidationError, match="committed ledger leaf"):
+        streamed.inclusion_proof(0, _entries()[2:], _adjustments()[1])
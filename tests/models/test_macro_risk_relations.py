@@ -12,7 +12,9 @@ from src.domain.scenarios import MacroTrajectoryPoint, MacroVariable
 from src.models.forward_looking import (
     build_macro_risk_paths,
     calculate_macro_risk_multipliers,
+    compile_macro_multiplier_table,
     load_macro_risk_policy,
+    macro_multiplier_table_stats,
 )
 
 
@@ -57,6 +59,42 @@ def test_paths_cover_every_period_component_and_scenario() -> None:
     assert all(item.pd > 0 and item.lgd > 0 and item.ead > 0 and item.ccf > 0 for item in paths)
 
 
+def test_compiled_table_matches_point_multipliers_and_is_shared() -> None:
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    table = compile_macro_multiplier_table(scenario_set, policy)
+    paths = build_macro_risk_paths(scenario_set, "revolving", policy)
+    assert [row for path in table.factors("revolving") for row in path] == [
+        (item.pd, item.lgd, item.ead, item.ccf) for item in paths
+    ]
+    assert table.units("revolving").shape == (4, 60, 4)
+    assert table.units("revolving")[2, 59, 3] == int(paths[179].ccf * 10**8)
+    assert table.factors("revolving") is table.factors("revolving")
+
+    reweighted = replace(
+        scenario_set,
+        trajectories=tuple(
+            replace(trajectory, name=f"{trajectory.name} v2")
+            for trajectory in scenario_set.trajectories
+        ),
+    )
+    before = macro_multiplier_table_stats()
+    assert compile_macro_multiplier_table(reweighted, policy) is table
+    after = macro_multiplier_table_stats()
+    assert (after.hits, after.misses) == (before.hits + 1, before.misses)
+    assert 0 < after.hit_rate <= 1
+    shifted = replace(
+        scenario_set,
+        trajectories=tuple(
+            replace(trajectory, periods=trajectory.periods[:1] + trajectory.periods[1:])
+            for trajectory in scenario_set.trajectories
+        ),
+    )
+    assert compile_macro_multiplier_table(shifted, policy) is not table
+    with pytest.raises(DomainValidationError, match="unknown macro risk segment"):
+        table.units("unknown")
+
+
 def test_terminal_severity_orders_all_risk_components() -> None:
     scenario_set = load_scenario_set(seed=91)
     paths = build_macro_risk_paths(scenario_set, "portfolio", load_macro_risk_policy())
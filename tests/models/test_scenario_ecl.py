@@ -9,7 +9,9 @@ from src.domain.exceptions import DomainValidationError
 from src.domain.scenarios import MacroTrajectoryPoint, MacroVariable, ScenarioKind
 from src.ecl.calculation import (
     BaselineRiskPeriod,
+    ResultDetail,
     calculate_probability_weighted_scenario_ecl,
+    covers_detail,
 )
 from src.models.forward_looking import load_macro_risk_policy
 
@@ -146,3 +148,28 @@ def test_empty_misaligned_and_overlong_baselines_are_rejected() -> None:
 def test_baseline_discount_factor_must_be_positive() -> None:
     with pytest.raises(DomainValidationError, match="greater than zero"):
         BaselineRiskPeriod(date(2026, 1, 1), "0.10", "0.50", "100", "0", "0", "0")
+
+
+def test_detail_levels_keep_totals_and_drop_only_requested_detail() -> None:
+    scenario_set, policy = load_scenario_set(seed=91), load_macro_risk_policy()
+    full = calculate_probability_weighted_scenario_ecl(
+        _baseline(3), scenario_set, "portfolio", policy
+    )
+    scenarios = calculate_probability_weighted_scenario_ecl(
+        _baseline(3), scenario_set, "portfolio", policy, detail=ResultDetail.SCENARIOS
+    )
+    totals = calculate_probability_weighted_scenario_ecl(
+        _baseline(3), scenario_set, "portfolio", policy, detail="totals"
+    )
+
+    assert full.detail == ResultDetail.PERIODS
+    assert all(len(item.periods) == 3 for item in full.scenario_results)
+    assert scenarios.scenario_results == tuple(
+        replace(item, periods=()) for item in full.scenario_results
+    )
+    assert totals.scenario_results == () and totals.detail == ResultDetail.TOTALS
+    for result in (scenarios, totals):
+        assert result.probability_weighted_ecl == full.probability_weighted_ecl
+        assert result.stress_ecl == full.stress_ecl
+    assert covers_detail(ResultDetail.PERIODS, ResultDetail.TOTALS)
+    assert not covers_detail(ResultDetail.SCENARIOS, ResultDetail.PERIODS)
@@ -5,13 +5,18 @@ from decimal import Decimal
 import pytest
 
 from src.application.services import load_scenario_set
+from src.domain.conventions import prevalidated
 from src.domain.exceptions import DomainValidationError
 from src.ecl.calculation import (
     Stage1ContractInput,
     Stage1RiskPeriod,
     calculate_stage1_ecl,
 )
-from src.ecl.discounting import effective_interest_discount_factor, present_value
+from src.ecl.discounting import (
+    DiscountCurveCache,
+    effective_interest_discount_factor,
+    present_value,
+)
 from src.models.forward_looking import load_macro_risk_policy
 
 
@@ -47,6 +52,29 @@ def test_original_eir_discount_factor_matches_manual_annual_point() -> None:
     assert present_value("112", effective_interest_discount_factor("0.12", 12)) == Decimal("100.00")
 
 
+def test_discount_curve_cache_memoizes_bounded_vectors_per_quantized_eir() -> None:
+    cache = DiscountCurveCache(max_curves=2, max_months=24)
+    assert cache.factors("0.12", 12) == tuple(
+        effective_interest_discount_factor("0.12", month) for month in range(1, 13)
+    )
+    assert cache.factors(Decimal("0.120000001"), 6) == cache.factors("0.12", 12)[:6]
+    assert cache.units("0.12", 18).tolist() == [
+        int(effective_interest_discount_factor("0.12", month) * 10**8) for month in range(1, 19)
+    ]
+    assert not cache.units("0.12", 3).flags.writeable
+    cache.factors("0.05", 30)
+    cache.factors("0.07", 1)
+    cache.factors("0.09", 1)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (3, 5, 1)
+    assert (stats.curves, stats.cached_months) == (2, 2)
+    assert stats.hit_rate == 3 / 8
+    with pytest.raises(DomainValidationError, match="at least one month"):
+        cache.factors("0.12", 0)
+    cache.clear()
+    assert cache.stats() == type(stats)(0, 0, 0, 0, 0)
+
+
 def test_stage1_restricts_default_events_to_next_twelve_months() -> None:
     periods = _periods() + (
         Stage1RiskPeriod(date(2027, 1, 1), "0.01", "0.40", "400", "200", "0.50"),
@@ -119,3 +147,33 @@ def test_stage1_rejects_periods_out_of_chronological_order() -> None:
     periods = _periods(2)
     with pytest.raises(DomainValidationError, match="chronologically ordered"):
         replace(_contract(months=2), periods=tuple(reversed(periods)))
+
+
+def test_prevalidated_inputs_match_validating_constructors_and_results() -> None:
+    contract = _contract()
+    trusted = prevalidated(
+        Stage1ContractInput,
+        contract.contract_id,
+        contract.reporting_date,
+        contract.original_effective_interest_rate,
+        tuple(
+            prevalidated(
+                Stage1RiskPeriod,
+                period.reference_date,
+                period.conditional_hazard,
+                period.lifetime_lgd,
+                period.drawn_ead,
+                period.undrawn_amount,
+                period.ccf,
+            )
+            for period in contract.periods
+        ),
+        contract.segment,
+    )
+    assert trusted == contract and hash(trusted) == hash(contract)
+    scenario_set, policy = load_scenario_set(seed=91), load_macro_risk_policy()
+    assert calculate_stage1_ecl(trusted, scenario_set, policy) == calculate_stage1_ecl(
+        contract, scenario_set, policy
+    )
+    with pytest.raises(ValueError):
+        prevalidated(Stage1RiskPeriod, date(2026, 1, 1), Decimal("0.01"))
@@ -1,7 +1,9 @@
 from dataclasses import replace
 from datetime import date
 from decimal import Decimal
+from random import Random
 
+import numpy as np
 import pytest
 
 from src.application.services import load_scenario_set
@@ -11,6 +13,9 @@ from src.ecl.stage3 import (
     Stage3ContractInput,
     Stage3ScenarioProjection,
     calculate_stage3_ecl,
+    calculate_stage3_ecl_block,
+    stage3_block_totals,
+    stage3_cash_flow_block,
 )
 
 SCENARIOS = ("upside", "base", "downside", "stress")
@@ -161,3 +166,125 @@ def test_stage3_projection_and_contract_boundaries_fail_closed() -> None:
     invalid_reporting_date = replace(_contract(_projections()), reporting_date=reporting_date)
     with pytest.raises(DomainValidationError, match="must follow reporting date"):
         calculate_stage3_ecl(invalid_reporting_date, load_scenario_set(seed=91))
+
+
+def _random_contracts(count: int, seed: int = 3) -> list[Stage3ContractInput]:
+    random = Random(seed)
+    contracts = []
+    for index in range(count):
+        months = random.randint(1, 36)
+        scale = 10**12 if index == 0 else 10**6
+        projections = []
+        for scenario_id in random.sample(SCENARIOS, len(SCENARIOS)):
+            writeoff_month = random.choice((None, random.randint(1, months)))
+            cure_month = random.choice((None, random.randint(1, months)))
+            periods = tuple(
+                Stage3CashFlowPeriod(
+                    date(2026 + (month - 1) // 12, (month - 1) % 12 + 1, 1),
+                    Decimal(random.randint(0, scale)) / 100,
+                    Decimal(random.randint(0, scale)) / 100,
+                    Decimal(random.randint(0, scale // 4)) / 100,
+                    Decimal(random.randint(0, scale // 4)) / 100,
+                    guarantee_recovery=Decimal(random.randint(0, scale // 4)) / 100,
+                    post_writeoff_recovery=(
+                        Decimal(random.randint(0, scale // 8)) / 100
+                        if writeoff_month and month > writeoff_month
+                        else Decimal("0")
+                    ),
+                    collection_costs=Decimal(random.randint(0, scale // 10)) / 100,
+                    writeoff_amount=(
+                        Decimal(random.randint(1, scale)) / 100
+                        if month == writeoff_month
+                        else Decimal("0")
+                    ),
+                    cure_event=month == cure_month,
+                )
+                for month in range(1, months + 1)
+            )
+            projections.append(Stage3ScenarioProjection(scenario_id, periods))
+        gross = Decimal(random.randint(0, 10**8)) / 100
+        contracts.append(
+            Stage3ContractInput(
+                f"CTR-S3-{index:04d}",
+                date(2025, 12, 31),
+                gross,
+                (gross * Decimal(random.randint(0, 100)) / 100).quantize(Decimal("0.01")),
+                Decimal(random.choice((0, 7, 12, 19, 35))) / 100,
+                tuple(projections),
+            )
+        )
+    return contracts
+
+
+def test_stage3_block_matches_decimal_engine_to_the_cent() -> None:
+    contracts = _random_contracts(80)
+    scenario_set = load_scenario_set(seed=91)
+    block = stage3_cash_flow_block(contracts, scenario_set)
+    summary = calculate_stage3_ecl_block(block, scenario_set)
+    detailed = calculate_stage3_ecl_block(block, scenario_set, detail=True)
+    assert summary.discount_factor is None and summary.cash_shortfall_cents is None
+    assert detailed.scenario_ids == tuple(item.scenario_id for item in scenario_set.trajectories)
+
+    writeoff = np.zeros(len(detailed.scenario_ids), dtype=np.int64)
+    for row, (contract, totals) in enumerate(
+        zip(contracts, stage3_block_totals(summary), strict=True)
+    ):
+        expected = calculate_stage3_ecl(contract, scenario_set)
+        by_scenario = {item.scenario_id: item for item in expected.scenario_results}
+        assert totals.probability_weighted_ecl == expected.probability_weighted_ecl
+        assert totals.stress_ecl == expected.stress_ecl
+        assert dict(totals.scenario_ecl) == {key: item.ecl for key, item in by_scenario.items()}
+        assert summary.net_carrying_cents[row] == expected.net_carrying_amount * 100
+        assert summary.monthly_interest_cents[row] == expected.monthly_interest_revenue * 100
+        for column, scenario_id in enumerate(detailed.scenario_ids):
+            scenario = by_scenario[scenario_id]
+            assert summary.writeoff_cents[row, column] == scenario.total_writeoff * 100
+            assert bool(summary.cured[row, column]) is scenario.cured
+            writeoff[column] += int(scenario.total_writeoff * 100)
+            months = len(scenario.periods)
+            assert detailed.cash_shortfall_cents is not None
+            assert detailed.discounted_cash_shortfall_cents is not None
+            assert detailed.discount_factor is not None
+            assert detailed.cash_shortfall_cents[row, column, :months].tolist() == [
+                int(period.cash_shortfall * 100) for period in scenario.periods
+            ]
+            assert detailed.discounted_cash_shortfall_cents[row, column, :months].tolist() == [
+                int(period.discounted_cash_shortfall * 100) for period in scenario.periods
+            ]
+            assert detailed.discount_factor[row, :months].tolist() == [
+                int(period.discount_factor * 10**8) for period in scenario.periods
+            ]
+    assert summary.total_writeoff_cents.tolist() == writeoff.tolist()
+
+
+def test_stage3_block_rejects_incomplete_scenarios_and_invalid_arrays() -> None:
+    scenario_set = load_scenario_set(seed=91)
+    block = stage3_cash_flow_block([_contract(_projections())], scenario_set)
+    with pytest.raises(DomainValidationError, match="each scenario"):
+        calculate_stage3_ecl_block(replace(block, scenario_ids=("a", "b", "c", "d")), scenario_set)
+    with pytest.raises(DomainValidationError, match="each scenario"):
+        stage3_cash_flow_block([_contract(_projections()[:-1])], scenario_set)
+    with pytest.raises(DomainValidationError, match="must be non-negative"):
+        replace(block, collection_costs=-block.collection_costs - 1)
+    with pytest.raises(DomainValidationError, match="cannot exceed"):
+        replace(block, opening_loss_allowance=block.gross_carrying_amount + 1)
+    two_months = tuple(
+        Stage3ScenarioProjection(
+            scenario_id,
+            (
+                Stage3CashFlowPeriod(date(2026, 1, 1), "100"),
+                Stage3CashFlowPeriod(date(2026, 2, 1), "100"),
+            ),
+        )
+        for scenario_id in SCENARIOS
+    )
+    longer = stage3_cash_flow_block([_contract(two_months)], scenario_set)
+    with pytest.raises(DomainValidationError, match="one cure"):
+        replace(longer, cure_event=np.ones((1, 4, 2), dtype=bool))
+    assert (
+        not replace(longer, period_counts=[1], cure_event=np.ones((1, 4, 2)))
+        .cure_event[..., 1]
+        .any()
+    )
+    with pytest.raises(DomainValidationError, match="must not be empty"):
+        stage3_cash_flow_block([], scenario_set)
@@ -0,0 +1,219 @@
+from dataclasses import replace
+from datetime import date
+from decimal import Decimal
+from random import Random
+
+import numpy as np
+import pytest
+
+from src.application.services import load_scenario_set
+from src.domain.exceptions import DomainValidationError
+from src.domain.scenarios import MacroTrajectoryPoint, MacroVariable
+from src.ecl.calculation import (
+    BaselineRiskBlock,
+    BaselineRiskPeriod,
+    ScenarioSensitivityReport,
+    Stage1ContractInput,
+    Stage1RiskPeriod,
+    calculate_probability_weighted_scenario_ecl,
+    calculate_scenario_ecl_block,
+    calculate_stage1_ecl,
+    load_scenario_sensitivity_policy,
+    run_portfolio_sensitivities,
+    run_scenario_sensitivities,
+    scenario_ecl_block_totals,
+    stage1_risk_block,
+)
+from src.ecl.discounting import effective_interest_discount_factor
+from src.models.forward_looking import load_macro_risk_policy
+
+SEGMENTS = ("portfolio", "secured", "revolving", "off_balance")
+
+
+def _random_contracts(count: int, seed: int = 7) -> list[Stage1ContractInput]:
+    random = Random(seed)
+    return [
+        Stage1ContractInput(
+            f"CTR-VEC-{index:05d}",
+            date(2025, 12, 31),
+            Decimal(random.choice((8, 12, 18, 24))) / 100,
+            tuple(
+                Stage1RiskPeriod(
+                    date(2026, month, 1),
+                    Decimal(random.randint(0, 5 * 10**7)) / 10**8,
+                    Decimal(random.randint(0, 10**8)) / 10**8,
+                    Decimal(random.randint(0, 10**9)) / 100,
+                    Decimal(random.randint(0, 10**7)) / 100,
+                    Decimal(random.randint(0, 10**8)) / 10**8,
+                )
+                for month in range(1, random.randint(1, 12) + 1)
+            ),
+            random.choice(SEGMENTS),
+        )
+        for index in range(count)
+    ]
+
+
+def _neutral_scenario_set():
+    scenario_set = load_scenario_set(seed=91)
+    anchors = (
+        MacroVariable("gdp_growth", "2.20"),
+        MacroVariable("inflation", "4.50"),
+        MacroVariable("policy_rate", "9.00"),
+        MacroVariable("unemployment", "7.50"),
+        MacroVariable("household_debt", "49.00"),
+        MacroVariable("risk_pressure", "0.00"),
+    )
+    return replace(
+        scenario_set,
+        trajectories=tuple(
+            replace(trajectory, periods=(MacroTrajectoryPoint(date(2026, 1, 1), anchors),))
+            for trajectory in scenario_set.trajectories
+        ),
+    )
+
+
+def test_vectorized_block_matches_decimal_engine_to_the_cent() -> None:
+    contracts = _random_contracts(400)
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    result = calculate_scenario_ecl_block(stage1_risk_block(contracts), scenario_set, policy)
+    totals = scenario_ecl_block_totals(result)
+
+    for contract, total in zip(contracts, totals, strict=True):
+        exact = calculate_stage1_ecl(contract, scenario_set, policy).scenario_ecl
+        assert total.probability_weighted_ecl == exact.probability_weighted_ecl
+        assert total.stress_ecl == exact.stress_ecl
+        assert total.scenario_ecl == tuple(
+            (item.scenario_id, item.ecl) for item in exact.scenario_results
+        )
+    assert totals[0].macro_policy_hash == policy.sha256
+
+
+def test_half_cent_ties_fall_back_to_decimal_half_even() -> None:
+    block = BaselineRiskBlock(
+        (date(2026, 1, 1),),
+        ("portfolio", "portfolio"),
+        np.asarray([1, 1]),
+        np.asarray([[10_000_000], [10_000_000]]),
+        np.asarray([[50_000_000], [50_000_000]]),
+        np.asarray([[10_010], [10_030]]),
+        np.asarray([[0], [0]]),
+        np.asarray([[0], [0]]),
+        np.asarray([[100_000_000], [100_000_000]]),
+    )
+    scenario_set = _neutral_scenario_set()
+    policy = load_macro_risk_policy()
+    result = calculate_scenario_ecl_block(block, scenario_set, policy)
+    exact = calculate_probability_weighted_scenario_ecl(
+        (BaselineRiskPeriod(date(2026, 1, 1), "0.10", "0.50", "100.10", "0", "0", "1"),),
+        scenario_set,
+        "portfolio",
+        policy,
+    )
+
+    assert result.decimal_fallback.tolist() == [True, True]
+    assert result.probability_weighted_cents.tolist() == [500, 502]
+    assert Decimal(int(result.probability_weighted_cents[0])) / 100 == (
+        exact.probability_weighted_ecl
+    )
+
+
+def test_block_rejects_misaligned_or_invalid_inputs() -> None:
+    contracts = _random_contracts(2)
+    shifted = replace(
+        contracts[0],
+        periods=tuple(
+            replace(period, reference_date=date(2027, index + 1, 1))
+            for index, period in enumerate(contracts[0].periods)
+        ),
+    )
+    with pytest.raises(DomainValidationError, match="align"):
+        stage1_risk_block([contracts[1], shifted])
+    with pytest.raises(DomainValidationError, match="between 0 and 1"):
+        BaselineRiskBlock(
+            (date(2026, 1, 1),),
+            ("portfolio",),
+            np.asarray([1]),
+            np.asarray([[100_000_001]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[1]]),
+        )
+    with pytest.raises(DomainValidationError, match="discount_factor"):
+        BaselineRiskBlock(
+            (date(2026, 1, 1),),
+            ("portfolio",),
+            np.asarray([1]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+            np.asarray([[0]]),
+        )
+
+
+def test_portfolio_sensitivities_equal_per_contract_sums_by_segment() -> None:
+    contracts = _random_contracts(120, seed=13)
+    contracts[0] = replace(
+        contracts[0],
+        periods=tuple(
+            replace(period, conditional_hazard="0.5", lifetime_lgd="1", drawn_ead="5000000000")
+            for period in contracts[0].periods
+        ),
+    )
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    sensitivity_policy = load_scenario_sensitivity_policy()
+    report = run_portfolio_sensitivities(
+        stage1_risk_block(contracts), scenario_set, policy, sensitivity_policy
+    )
+
+    expected: dict[str, list[ScenarioSensitivityReport]] = {}
+    for contract in contracts:
+        baseline = tuple(
+            BaselineRiskPeriod(
+                period.reference_date,
+                period.conditional_hazard,
+                period.lifetime_lgd,
+                period.drawn_ead,
+                period.undrawn_amount,
+                period.ccf,
+                effective_interest_discount_factor(
+                    contract.original_effective_interest_rate, month
+                ),
+            )
+            for month, period in enumerate(contract.periods, start=1)
+        )
+        expected.setdefault(contract.segment, []).append(
+            run_scenario_sensitivities(
+                baseline, scenario_set, contract.segment, policy, sensitivity_policy
+            )
+        )
+    singles = [item for reports in expected.values() for item in reports]
+
+    assert report.contract_count == 120 and report.decimal_fallback_rows >= 1
+    assert report.base_ecl == sum(item.base_ecl for item in singles)
+    assert report.stress_ecl == sum(item.stress_ecl for item in singles)
+    assert report.stress_delta == report.stress_ecl - report.base_ecl
+    assert [(item.case_id, item.kind) for item in report.results] == [
+        (item.case_id, item.kind) for item in singles[0].results
+    ]
+    for index, result in enumerate(report.results):
+        assert result.probability_weighted_ecl == sum(
+            item.results[index].probability_weighted_ecl for item in singles
+        )
+        assert result.delta_from_base == sum(
+            item.results[index].delta_from_base for item in singles
+        )
+        assert [segment.segment for segment in result.segments] == sorted(expected)
+        for segment in result.segments:
+            reports = expected[segment.segment]
+            assert segment.contract_count == len(reports)
+            assert segment.base_ecl == sum(item.base_ecl for item in reports)
+            assert segment.delta_from_base == sum(
+                item.results[index].delta_from_base for item in reports
+            )
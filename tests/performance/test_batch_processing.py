@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from concurrent.futures import Future
 from dataclasses import replace
+from datetime import date
 from decimal import Decimal
 from pathlib import Path
 from threading import Event
@@ -11,9 +12,34 @@ import pytest
 
 from scripts.performance_benchmark import synthetic_contracts
 from src.application.services import load_scenario_set
-from src.ecl.batch import BatchQueueFullError, BoundedBatchExecutor, PartitionedStage1Processor
+from src.domain.staging import Stage
+from src.ecl.batch import (
+    BatchECLRecord,
+    BatchQueueFullError,
+    BoundedBatchExecutor,
+    ExecutionMode,
+    PartitionedStage1Processor,
+    PersistentResultCache,
+    PortfolioECLProcessor,
+    PortfolioECLRecord,
+    ScenarioEngineMode,
+)
+from src.ecl.batch.persistent_cache import scenario_totals
 from src.ecl.batch.processor import VersionedResultCache, _cents_array
-from src.ecl.calculation import calculate_stage1_ecl
+from src.ecl.calculation import (
+    ResultDetail,
+    Stage1ECLResult,
+    Stage2ContractInput,
+    Stage2RiskPeriod,
+    calculate_stage1_ecl,
+    calculate_stage2_ecl,
+)
+from src.ecl.stage3 import (
+    Stage3CashFlowPeriod,
+    Stage3ContractInput,
+    Stage3ScenarioProjection,
+    calculate_stage3_ecl,
+)
 from src.infrastructure.database import DatabaseManager, DatabaseSettings
 from src.interfaces.api.jobs import JobStore
 from src.models.forward_looking import load_macro_risk_policy
@@ -36,6 +62,41 @@ def test_partitioned_processor_matches_canonical_and_streams_results() -> None:
     assert len(records) == 130
 
 
+def test_processor_detail_sets_cached_result_depth_for_drill_down() -> None:
+    contracts = list(synthetic_contracts(40, profiles=2))
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    cache = VersionedResultCache()
+    records: list[BatchECLRecord] = []
+    summary = PartitionedStage1Processor(scenario_set, policy, cache=cache).process(
+        contracts, sink=records.append
+    )
+    light = cache.get(records[0].profile_hash)
+    assert isinstance(light, Stage1ECLResult)
+    assert light.scenario_ecl.detail == ResultDetail.SCENARIOS
+    assert all(not item.periods for item in light.scenario_ecl.scenario_results)
+
+    totals = PartitionedStage1Processor(
+        scenario_set, policy, cache=cache, detail=ResultDetail.TOTALS
+    ).process(contracts)
+    assert totals.unique_profile_calculations == 0
+    audit = PartitionedStage1Processor(
+        scenario_set, policy, cache=cache, detail=ResultDetail.PERIODS
+    ).process(contracts)
+    assert audit.unique_profile_calculations == 2
+    assert audit.probability_weighted_ecl == totals.probability_weighted_ecl
+    assert audit.probability_weighted_ecl == summary.probability_weighted_ecl
+    drill_down = cache.get(records[0].profile_hash)
+    assert drill_down == calculate_stage1_ecl(contracts[0], scenario_set, policy)
+    with pytest.raises(ValueError, match="decimal engine"):
+        PartitionedStage1Processor(
+            scenario_set,
+            policy,
+            mode=ScenarioEngineMode.VECTORIZED,
+            detail=ResultDetail.PERIODS,
+        )
+
+
 def test_cache_key_changes_with_scenario_and_policy_versions() -> None:
     contract = next(synthetic_contracts(1))
     scenario_set = load_scenario_set(seed=91)
@@ -102,11 +163,13 @@ def test_bounded_queue_applies_backpressure_and_completes_concurrently() -> None
     second: Future[int] = queue.submit(blocked, 2)
     with pytest.raises(BatchQueueFullError, match="capacity"):
         queue.submit(blocked, 3)
+    assert queue.in_flight == 2
     release.set()
 
     assert first.result(timeout=2) == 1
     assert second.result(timeout=2) == 2
     queue.shutdown()
+    assert queue.in_flight == 0
 
 
 def test_bounded_queue_rejects_invalid_size_and_releases_slot_on_submit_failure(
@@ -123,6 +186,7 @@ def test_bounded_queue_rejects_invalid_size_and_releases_slot_on_submit_failure(
     with pytest.raises(RuntimeError, match="submit failed"):
         queue.submit(lambda: None)
     assert queue._slots.acquire(blocking=False)
+    assert queue.in_flight == 0
     queue._slots.release()
     queue.shutdown()
 
@@ -151,6 +215,34 @@ def test_interrupted_persisted_jobs_are_failed_for_explicit_resubmission(tmp_pat
     assert jobs.get(running)["status"] == "FAILED"
 
 
+def test_job_results_are_compressed_content_addressed_and_paged(tmp_path: Path) -> None:
+    database = DatabaseManager(DatabaseSettings(sqlite_path=tmp_path / "results.sqlite3"))
+    database.apply_migrations()
+    jobs = JobStore(database)
+    first, second = jobs.create("{}", 6), jobs.create("{}", 3)
+    chunk = [{"contract_id": f"C-{index}", "ecl": "1.00", "note": "x" * 200} for index in range(3)]
+    first_hash = jobs.append_results(first, 0, 0, chunk)
+    jobs.append_results(first, 1, 3, [{**item, "ecl": "2.00"} for item in chunk])
+    assert jobs.append_results(second, 0, 0, chunk) == first_hash
+    database.execute(
+        "INSERT INTO calculation_job_results (job_id, chunk_index, first_position, "
+        "result_count, result_hash, result_json, created_at) VALUES (?, 2, 6, 1, ?, ?, ?)",
+        (first, "0" * 64, json.dumps([{"contract_id": "C-legacy"}]), "2026-07-01T00:00:00Z"),
+    )
+    blobs = database.fetch_all("SELECT codec, decoded_bytes, payload FROM calculation_result_blobs")
+
+    assert len(blobs) == 2
+    assert all(blob["codec"] == "ndjson+zstd" for blob in blobs)
+    assert all(len(blob["payload"]) < blob["decoded_bytes"] / 4 for blob in blobs)
+    assert jobs.get(first)["has_legacy_result"] == 0
+    assert jobs.legacy_result(first) is None
+    page = jobs.results_page(first, 2, 5)
+    assert [item["contract_id"] for item in page] == ["C-2", "C-0", "C-1", "C-2", "C-legacy"]
+    assert [item["ecl"] for item in page[:2]] == ["1.00", "2.00"]
+    assert [json.loads(line) for line in jobs.iter_result_lines(second)] == chunk
+    assert len(list(jobs.iter_results(first))) == 7
+
+
 def test_committed_benchmark_proves_all_required_volumes_and_versions() -> None:
     evidence = json.loads(
         Path("evidence/performance/batch-benchmark.json").read_text(encoding="utf-8")
@@ -162,3 +254,297 @@ def test_committed_benchmark_proves_all_required_volumes_and_versions() -> None:
     assert results[1_000_000]["maximum_partition_size"] == 10_000
     assert results[1_000_000]["scenario_hash"] == results[10_000]["scenario_hash"]
     assert results[1_000_000]["macro_policy_hash"] == results[10_000]["macro_policy_hash"]
+
+
+def test_vectorized_mode_matches_decimal_mode_and_shares_profile_cache() -> None:
+    contracts = list(synthetic_contracts(300, profiles=17))
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    decimal_records: list[BatchECLRecord] = []
+    vectorized_records: list[BatchECLRecord] = []
+    shared_records: list[BatchECLRecord] = []
+    decimal = PartitionedStage1Processor(scenario_set, policy, partition_size=64).process(
+        contracts, sink=decimal_records.append
+    )
+    shared = VersionedResultCache()
+    vectorized = PartitionedStage1Processor(
+        scenario_set, policy, partition_size=64, cache=shared, mode=ScenarioEngineMode.VECTORIZED
+    ).process(contracts, sink=vectorized_records.append)
+    reused = PartitionedStage1Processor(
+        scenario_set, policy, partition_size=64, cache=shared
+    ).process(contracts, sink=shared_records.append)
+
+    assert vectorized.engine_mode == ScenarioEngineMode.VECTORIZED
+    assert vectorized.probability_weighted_ecl == decimal.probability_weighted_ecl
+    assert vectorized.stress_ecl == decimal.stress_ecl
+    assert vectorized.unique_profile_calculations == decimal.unique_profile_calculations == 17
+    assert vectorized_records == decimal_records
+    assert reused.engine_mode == ScenarioEngineMode.DECIMAL
+    assert (reused.unique_profile_calculations, reused.cache_hits) == (0, 85)
+    assert shared_records == decimal_records
+
+
+def test_process_pool_ships_partitions_and_reduces_in_submission_order() -> None:
+    contracts = list(synthetic_contracts(240, profiles=9))
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    thread_records: list[BatchECLRecord] = []
+    process_records: list[BatchECLRecord] = []
+    threaded = PartitionedStage1Processor(scenario_set, policy, partition_size=50).process(
+        contracts, sink=thread_records.append
+    )
+    pooled = PartitionedStage1Processor(
+        scenario_set,
+        policy,
+        partition_size=50,
+        workers=2,
+        mode=ScenarioEngineMode.VECTORIZED,
+        execution=ExecutionMode.PROCESS,
+    ).process(iter(contracts), sink=process_records.append)
+
+    assert pooled.execution_mode == ExecutionMode.PROCESS
+    assert pooled.partition_count == 5 and pooled.maximum_partition_size == 50
+    assert pooled.probability_weighted_ecl == threaded.probability_weighted_ecl
+    assert pooled.stress_ecl == threaded.stress_ecl
+    assert process_records == thread_records
+
+
+def test_decimal_process_pool_matches_thread_mode_and_counts_worker_calculations() -> None:
+    contracts = list(synthetic_contracts(240, profiles=9))
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    thread_records: list[BatchECLRecord] = []
+    process_records: list[BatchECLRecord] = []
+    threaded = PartitionedStage1Processor(scenario_set, policy, partition_size=50).process(
+        contracts, sink=thread_records.append
+    )
+    pooled = PartitionedStage1Processor(
+        scenario_set, policy, partition_size=50, workers=2, execution=ExecutionMode.PROCESS
+    ).process(iter(contracts), sink=process_records.append)
+
+    assert pooled.engine_mode == ScenarioEngineMode.DECIMAL
+    assert pooled.probability_weighted_ecl == threaded.probability_weighted_ecl
+    assert pooled.stress_ecl == threaded.stress_ecl
+    assert process_records == thread_records
+    # Each worker process keeps its own cache, so a profile is computed at most once per worker.
+    assert threaded.unique_profile_calculations == 9
+    assert 9 <= pooled.unique_profile_calculations <= 18
+    assert pooled.profile_reuses == 240 - pooled.unique_profile_calculations
+
+
+def test_persistent_cache_is_shared_across_runs_and_process_workers(tmp_path: Path) -> None:
+    path = tmp_path / "var" / "profile-cache.sqlite3"
+    contracts = list(synthetic_contracts(120, profiles=6))
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    cold_cache = PersistentResultCache(scenario_set, policy, path)
+    cold = PartitionedStage1Processor(
+        scenario_set, policy, partition_size=40, cache=cold_cache
+    ).process(contracts)
+    warm_cache = PersistentResultCache(scenario_set, policy, path)
+    warm = PartitionedStage1Processor(
+        scenario_set,
+        policy,
+        partition_size=40,
+        workers=2,
+        cache=warm_cache,
+        execution=ExecutionMode.PROCESS,
+    ).process(contracts)
+
+    assert (cold.cache_hits, cold.cache_misses, cold.cache_evictions) == (12, 6, 0)
+    assert warm.unique_profile_calculations == warm.cache_misses == 0
+    assert warm.cache_hits == 18
+    assert warm.probability_weighted_ecl == cold.probability_weighted_ecl
+    assert warm.stress_ecl == cold.stress_ecl
+    assert warm_cache.persisted_entries == 6
+
+    portfolio = [
+        *synthetic_contracts(4, profiles=2),
+        _stage2_contract(0, 1),
+        _stage3_contract(0, "40"),
+    ]
+    records: list[PortfolioECLRecord] = []
+    first = PortfolioECLProcessor(scenario_set, policy, cache=cold_cache).process(
+        portfolio, sink=records.append
+    )
+    reopened: list[PortfolioECLRecord] = []
+    second = PortfolioECLProcessor(
+        scenario_set, policy, cache=PersistentResultCache(scenario_set, policy, path)
+    ).process(portfolio, sink=reopened.append)
+    assert first.cache_misses == 2 and first.cache_hits == 2
+    assert second.unique_profile_calculations == 0 and second.cache_hits == 4
+    assert reopened == records
+    cold_cache.close()
+    warm_cache.close()
+
+
+def test_persistent_cache_evicts_by_size_and_invalidates_changed_versions(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "profile-cache.sqlite3"
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    with pytest.raises(ValueError, match="max entries"):
+        PersistentResultCache(scenario_set, policy, path, max_entries=0)
+    cache = PersistentResultCache(scenario_set, policy, path, capacity=1, max_entries=2)
+    summary = PartitionedStage1Processor(scenario_set, policy, cache=cache).process(
+        synthetic_contracts(4, profiles=4)
+    )
+    assert (summary.cache_misses, summary.cache_evictions) == (4, 2)
+    assert cache.persisted_entries == 2
+    cache.close()
+
+    changed_policy = replace(policy, sha256="e" * 64)
+    stale = PersistentResultCache(scenario_set, changed_policy, path)
+    assert stale.persisted_entries == 2
+    assert stale.invalidate() == 2
+    assert stale.persisted_entries == 0
+    stale.close()
+
+
+def test_persistent_cache_buffers_writes_until_the_partition_flush(tmp_path: Path) -> None:
+    path = tmp_path / "profile-cache.sqlite3"
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    contracts = list(synthetic_contracts(3, profiles=3))
+    totals = [
+        scenario_totals(calculate_stage1_ecl(contract, scenario_set, policy))
+        for contract in contracts
+    ]
+    cache = PersistentResultCache(scenario_set, policy, path, capacity=1, max_entries=2)
+    for key, value in zip("abc", totals, strict=True):
+        assert cache.put(key, value) == 0
+    assert cache.persisted_entries == 0
+    assert cache.get("a") == totals[0]
+    assert cache.flush() == 1
+    assert cache.persisted_entries == 2
+    assert cache.flush() == 0
+    reader = PersistentResultCache(scenario_set, policy, path)
+    assert (reader.get("a"), reader.get("b"), reader.get("c")) == (totals[0], None, totals[2])
+    reader.close()
+    cache.close()
+
+
+def test_persistent_cache_does_not_serve_totals_detail_to_scenario_runs(tmp_path: Path) -> None:
+    path = tmp_path / "profile-cache.sqlite3"
+    contracts = list(synthetic_contracts(4, profiles=2))
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    cache = PersistentResultCache(scenario_set, policy, path)
+    totals = PartitionedStage1Processor(
+        scenario_set, policy, cache=cache, detail=ResultDetail.TOTALS
+    ).process(contracts)
+    assert totals.unique_profile_calculations == 2
+    assert cache.persisted_entries == 0
+    cache.close()
+
+    records: list[BatchECLRecord] = []
+    reopened = PersistentResultCache(scenario_set, policy, path)
+    scenarios = PartitionedStage1Processor(
+        scenario_set, policy, cache=reopened, detail=ResultDetail.SCENARIOS
+    ).process(contracts, sink=records.append)
+    assert scenarios.unique_profile_calculations == 2
+    assert reopened.persisted_entries == 2
+    reopened.close()
+
+    again = PersistentResultCache(scenario_set, policy, path)
+    warm = PartitionedStage1Processor(
+        scenario_set, policy, cache=again, detail=ResultDetail.SCENARIOS
+    ).process(contracts)
+    persisted = again.get(records[0].profile_hash)
+    again.close()
+    assert warm.unique_profile_calculations == 0
+    assert persisted is not None
+    assert len(scenario_totals(persisted).scenario_ecl) == len(scenario_set.trajectories)
+    assert warm.probability_weighted_ecl == totals.probability_weighted_ecl
+
+
+def _stage2_contract(index: int, profile: int) -> Stage2ContractInput:
+    return Stage2ContractInput(
+        f"CTR-S2-{index:05d}",
+        date(2025, 12, 31),
+        "0.12",
+        18,
+        0,
+        "0",
+        tuple(
+            Stage2RiskPeriod(
+                date(2026 + (month - 1) // 12, (month - 1) % 12 + 1, 1),
+                Decimal("0.008") + Decimal(profile) / 1000,
+                "0.45",
+                str(max(200, 1500 - (month - 1) * 50)),
+                "300",
+                "0.50",
+            )
+            for month in range(1, 19)
+        ),
+    )
+
+
+def _stage3_contract(index: int, receipt: str) -> Stage3ContractInput:
+    return Stage3ContractInput(
+        f"CTR-S3-{index:05d}",
+        date(2025, 12, 31),
+        "1000",
+        "200",
+        "0.10",
+        tuple(
+            Stage3ScenarioProjection(
+                scenario_id,
+                (Stage3CashFlowPeriod(date(2026, 1, 1), "100", receipt),),
+            )
+            for scenario_id in ("upside", "base", "downside", "stress")
+        ),
+    )
+
+
+def test_portfolio_processor_routes_stages_reuses_profiles_and_streams_records() -> None:
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+    stage1 = list(synthetic_contracts(20, profiles=2))
+    stage2 = [_stage2_contract(index, index % 3) for index in range(12)]
+    stage3 = [_stage3_contract(index, ("40", "70")[index % 2]) for index in range(8)]
+    portfolio = [item for group in zip(stage1, stage2 + stage3, strict=True) for item in group]
+    records: list[PortfolioECLRecord] = []
+    cache = VersionedResultCache()
+    summary = PortfolioECLProcessor(
+        scenario_set, policy, partition_size=16, workers=2, cache=cache
+    ).process(portfolio, sink=records.append)
+    by_stage = {item.stage: item for item in summary.stages}
+    expected2 = sum(
+        (
+            calculate_stage2_ecl(item, scenario_set, policy).scenario_ecl.probability_weighted_ecl
+            for item in stage2
+        ),
+        Decimal("0"),
+    )
+    expected3 = sum(
+        (calculate_stage3_ecl(item, scenario_set).probability_weighted_ecl for item in stage3),
+        Decimal("0"),
+    )
+
+    assert summary.contract_count == 40 and summary.partition_count == 3
+    assert [item.contract_id for item in records] == [item.contract_id for item in portfolio]
+    assert by_stage[Stage.STAGE_1].contract_count == 20
+    assert by_stage[Stage.STAGE_1].unique_profile_calculations == 2
+    assert by_stage[Stage.STAGE_2].unique_profile_calculations == 3
+    assert by_stage[Stage.STAGE_3].unique_profile_calculations == 2
+    assert by_stage[Stage.STAGE_2].probability_weighted_ecl == expected2
+    assert by_stage[Stage.STAGE_3].probability_weighted_ecl == expected3
+    assert summary.probability_weighted_ecl == sum(
+        (item.probability_weighted_ecl for item in summary.stages), Decimal("0")
+    )
+    assert {record.stage for record in records} == set(Stage)
+
+    rerun = PortfolioECLProcessor(scenario_set, policy, cache=cache).process(portfolio)
+    assert rerun.unique_profile_calculations == 0
+    assert rerun.probability_weighted_ecl == summary.probability_weighted_ecl
+    audit = PortfolioECLProcessor(
+        scenario_set, policy, cache=cache, detail=ResultDetail.PERIODS
+    ).process(portfolio)
+    assert audit.unique_profile_calculations == summary.unique_profile_calculations
+    assert audit.stages == summary.stages
+    stage3_key = next(item.profile_hash for item in records if item.stage == Stage.STAGE_3)
+    assert cache.get(stage3_key) == calculate_stage3_ecl(stage3[0], scenario_set)
+    with pytest.raises(TypeError, match="unsupported portfolio contract"):
+        PortfolioECLProcessor(scenario_set, policy).process([object()])  # type: ignore[list-item]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from scripts.performance_benchmark import synthetic_contracts
+from src.application.services import load_scenario_set
+from src.domain.exceptions import DomainValidationError
+from src.ecl.batch import (
+    STAGE1_CONTRACT_SCHEMA,
+    STAGE1_PERIOD_SCHEMA,
+    BatchECLRecord,
+    ExecutionMode,
+    PartitionedStage1Processor,
+    ScenarioEngineMode,
+    read_stage1_parquet,
+    write_stage1_parquet,
+)
+from src.ecl.calculation import Stage1ContractInput, Stage1RiskPeriod
+from src.models.forward_looking import load_macro_risk_policy
+
+
+def _paths(tmp_path: Path) -> tuple[Path, Path]:
+    return tmp_path / "contracts.parquet", tmp_path / "periods.parquet"
+
+
+def test_parquet_batches_match_object_processing(tmp_path: Path) -> None:
+    contracts_path, periods_path = _paths(tmp_path)
+    contracts = list(synthetic_contracts(300, profiles=17))
+    assert write_stage1_parquet(contracts, contracts_path, periods_path, batch_size=70) == 300
+    scenario_set = load_scenario_set(seed=91)
+    policy = load_macro_risk_policy()
+
+    batches = list(read_stage1_parquet(contracts_path, periods_path, batch_size=64))
+    assert [len(batch) for batch in batches] == [64, 64, 64, 64, 44]
+    assert all(len(batch.profiles) == 17 for batch in batches)
+    assert batches[0].profiles[0] in contracts
+
+    expected: list[BatchECLRecord] = []
+    actual: list[BatchECLRecord] = []
+    reference = PartitionedStage1Processor(scenario_set, policy, partition_size=64).process(
+        contracts, sink=expected.append
+    )
+    columnar = PartitionedStage1Processor(
+        scenario_set, policy, mode=ScenarioEngineMode.VECTORIZED
+    ).process_profile_batches(batches, sink=actual.append)
+    assert actual == expected
+    assert columnar.contract_count == 300 and columnar.partition_count == 5
+    assert columnar.unique_profile_calculations == 17
+    assert columnar.probability_weighted_ecl == reference.probability_weighted_ecl
+    assert columnar.stress_ecl == reference.stress_ecl
+
+    pooled = PartitionedStage1Processor(
+        scenario_set, policy, workers=2, execution=ExecutionMode.PROCESS
+    ).process_profile_batches(read_stage1_parquet(contracts_path, periods_path, batch_size=100))
+    assert pooled.partition_count == 3
+    assert pooled.probability_weighted_ecl == reference.probability_weighted_ecl
+
+
+def _contract_table(**overrides: object) -> pa.Table:
+    columns: dict[str, object] = {
+        "contract_id": ["C-1", "C-2"],
+        "reporting_date": [date(2025, 12, 31)] * 2,
+        "original_effective_interest_rate": [Decimal("0.12")] * 2,
+        "segment": ["portfolio"] * 2,
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+def _period_table(**overrides: object) -> pa.Table:
+    columns: dict[str, object] = {
+        "contract_id": ["C-1", "C-1", "C-2"],
+        "reference_date": [date(2026, 1, 1), date(2026, 2, 1), date(2026, 1, 1)],
+        "conditional_hazard": [Decimal("0.0050000025"), Decimal("0.006"), Decimal("0.005")],
+        "lifetime_lgd": [Decimal("0.30")] * 3,
+        "drawn_ead": [Decimal("900.005"), Decimal("860"), Decimal("900")],
+        "undrawn_amount": [Decimal("100")] * 3,
+        "ccf": [Decimal("0.40")] * 3,
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+def _read(tmp_path: Path, contracts: pa.Table, periods: pa.Table) -> list[Stage1ContractInput]:
+    contracts_path, periods_path = _paths(tmp_path)
+    pq.write_table(contracts, contracts_path)
+    pq.write_table(periods, periods_path)
+    return [
+        batch.profiles[index]
+        for batch in read_stage1_parquet(contracts_path, periods_path, batch_size=1)
+        for index in batch.profile_index
+    ]
+
+
+def test_columnar_values_follow_decimal_rounding_and_contract_order(tmp_path: Path) -> None:
+    first, second = _read(tmp_path, _contract_table(), _period_table())
+    assert first == Stage1ContractInput(
+        "C-1",
+        date(2025, 12, 31),
+        "0.12",
+        (
+            Stage1RiskPeriod(date(2026, 1, 1), "0.0050000025", "0.30", "900.005", "100", "0.40"),
+            Stage1RiskPeriod(date(2026, 2, 1), "0.006", "0.30", "860", "100", "0.40"),
+        ),
+    )
+    assert first.periods[0].conditional_hazard == Decimal("0.00500000")
+    assert first.periods[0].drawn_ead == Decimal("900.00")
+    assert second.contract_id == "C-2" and len(second.periods) == 1
+    assert STAGE1_CONTRACT_SCHEMA.names == _contract_table().column_names
+    assert STAGE1_PERIOD_SCHEMA.names == _period_table().column_names
+
+
+@pytest.mark.parametrize(
+    ("contracts", "periods", "message"),
+    [
+        (_contract_table(segment=["portfolio", None]), _period_table(), "segment must not be null"),
+        (_contract_table(contract_id=["C-1", " "]), _period_table(), "contract_id must not be"),
+        (_contract_table(), _period_table(ccf=[0.4, 0.4, 0.4]), "binary floats"),
+        (_contract_table(), _period_table(lifetime_lgd=[Decimal("1.5")] * 3), "between 0 and 1"),
+        (_contract_table(), _period_table(drawn_ead=[Decimal("-1")] * 3), "non-negative"),
+        (_contract_table(), _period_table(contract_id=["C-2", "C-2", "C-1"]), "contract table"),
+        (_contract_table(contract_id=["C-1", "C-3"]), _period_table(), "contract table"),
+        (_contract_table().slice(0, 1), _period_table(), "absent from contracts"),
+        (
+            _contract_table(),
+            _period_table(reference_date=[date(2026, 2, 1), date(2026, 1, 1), date(2026, 1, 1)]),
+            "chronologically ordered",
+        ),
+        (
+            _contract_table(reporting_date=[date(2025, 12, 31), date(2026, 1, 1)]),
+            _period_table(),
+            "follow reporting date",
+        ),
+    ],
+)
+def test_columnar_loader_rejects_invalid_tables(
+    tmp_path: Path, contracts: pa.Table, periods: pa.Table, message: str
+) -> None:
+    with pytest.raises(DomainValidationError, match=message):
+        _read(tmp_path, contracts, periods)
+
+
+def test_columnar_loader_rejects_more_than_twelve_periods(tmp_path: Path) -> None:
+    periods = pa.table(
+        {
+            "contract_id": ["C-1"] * 13,
+            "reference_date": [date(2026 + month // 12, month % 12 + 1, 1) for month in range(13)],
+            **{
+                name: [Decimal("0.1")] * 13
+                for name in ("conditional_hazard", "lifetime_lgd", "drawn_ead", "undrawn_amount")
+            },
+            "ccf": [Decimal("0.1")] * 13,
+        }
+    )
+    with pytest.raises(DomainValidationError, match="one to twelve"):
+        _read(tmp_path, _contract_table().slice(0, 1), periods)
+    with pytest.raises(ValueError, match="batch size"):
+        next(read_stage1_parquet(*_paths(tmp_path), batch_size=0))
@@ -1,6 +1,9 @@
+import hashlib
+import zipfile
 from dataclasses import replace
 from datetime import date
 from decimal import Decimal
+from pathlib import Path
 from xml.etree import ElementTree as ET
 
 import pytest
@@ -14,6 +17,7 @@ from src.regulatory.doc3040 import (
     ConnectedIpoc,
     ConnectedIpocGroup,
     Doc3040Input,
+    DocumentTally,
     Guarantee,
     Header,
     MaturityValue,
@@ -25,6 +29,7 @@ from src.regulatory.doc3040 import (
     generate_xml_candidate,
     load_layout_registry,
     sourced,
+    write_xml_candidate,
 )
 from src.regulatory.doc3040.generator import _number
 
@@ -312,3 +317,72 @@ def test_connected_ipoc_groups_are_rendered() -> None:
         first.ipoc.value,
         second.ipoc.value,
     ]
+
+
+def numbered_client(number: int) -> Client:
+    code = f"{12345678900 + number}"
+    operation = replace(
+        base_operation(),
+        contract_code=sv(f"CONTRATO{number}", "contract_code"),
+        ipoc=sv(f"1234567802031{code}CONTRATO{number}", "ipoc"),
+    )
+    return replace(base_client(operation), code=sv(code, "client_code"))
+
+
+def test_streamed_candidate_matches_in_memory_bytes_and_zip_member(tmp_path: Path) -> None:
+    clients = tuple(numbered_client(number) for number in range(1, 4))
+    header = replace(base_header(), total_clients=sv(3, "total_clients"))
+    expected = generate_xml_candidate(
+        Doc3040Input(header=header, clients=clients, aggregations=(), connected_ipoc_groups=())
+    )
+    written = write_xml_candidate(header, iter(clients), tmp_path / "doc3040.xml")
+    content = written.path.read_bytes()
+    assert content == expected.content
+    assert written.sha256 == expected.sha256 == hashlib.sha256(content).hexdigest()
+    assert written.size_bytes == len(content)
+    assert (written.total_clients, written.total_operations) == (3, 3)
+
+    archives = [
+        write_xml_candidate(
+            header, iter(clients), tmp_path / f"{run}.zip", archive_member="doc3040.xml"
+        )
+        for run in ("first", "second")
+    ]
+    with zipfile.ZipFile(archives[0].path) as archive:
+        assert archive.read("doc3040.xml") == expected.content
+    assert archives[0].sha256 == expected.sha256
+    assert archives[0].path.read_bytes() == archives[1].path.read_bytes()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "doc3040.xml",
+        "first.zip",
+        "second.zip",
+    ]
+
+
+def test_streamed_candidate_applies_document_rules_without_leaving_a_file(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "doc3040.xml"
+    header = replace(base_header(), total_clients=sv(2, "total_clients"))
+    duplicate = replace(numbered_client(2), operations=numbered_client(1).operations)
+    with pytest.raises(DomainValidationError, match="IPOCs must be unique"):
+        write_xml_candidate(header, iter((numbered_client(1), duplicate)), path)
+    with pytest.raises(DomainValidationError, match="total_clients must reconcile"):
+        write_xml_candidate(header, iter((numbered_client(1),)), path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_document_tally_keeps_fixed_size_digests_and_checks_connected_ipocs() -> None:
+    header = replace(base_header(), total_clients=sv(2, "total_clients"))
+    tally = DocumentTally(header)
+    for client in (numbered_client(1), numbered_client(2)):
+        tally.add(client)
+    assert {len(value) for value in tally.client_codes | tally.ipocs} == {16}
+    assert tally.total_operations == 2
+    first, second = (
+        ConnectedIpoc(ipoc=numbered_client(number).operations[0].ipoc) for number in (1, 2)
+    )
+    unknown = ConnectedIpoc(ipoc=sv("DESCONHECIDO", "ipoc"))
+    tally.close((), (ConnectedIpocGroup(ipocs=(first, second)),))
+    with pytest.raises(DomainValidationError, match="connected IPOCs must exist"):
+        tally.close((), (ConnectedIpocGroup(ipocs=(first, unknown)),))
@@ -0,0 +1,144 @@
+import json
+from dataclasses import replace
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from src.domain.exceptions import DomainValidationError
+from src.regulatory.doc3040 import (
+    Aggregation,
+    MaturityValue,
+    PortfolioEclControl,
+    prevalidate_xml_file,
+    write_prevalidated_candidate,
+    write_xml_candidate,
+)
+from tests.regulatory.test_doc3040_generator import base_header, numbered_client, sv
+from tests.regulatory.test_doc3040_validation import reconciled_document
+
+
+def reconciled_clients(count: int):
+    accounting = reconciled_document().clients[0].operations[0].accounting_4966
+    return tuple(
+        replace(client, operations=(replace(client.operations[0], accounting_4966=accounting),))
+        for client in map(numbered_client, range(1, count + 1))
+    )
+
+
+def aggregation() -> Aggregation:
+    return Aggregation(
+        nature=sv("01", "aggregate_nature"),
+        modality=sv("0203", "aggregate_modality"),
+        resource_origin=sv("0100", "aggregate_origin"),
+        foreign_currency_link=sv("N", "foreign_currency_link"),
+        value_band=sv("4", "value_band"),
+        location=sv("35503", "location"),
+        client_type=sv("1", "aggregate_client_type"),
+        control_type=None,
+        performance=sv("01", "performance"),
+        special_characteristic=None,
+        provision=sv(Decimal("3"), "aggregate_provision"),
+        operation_count=sv(2, "operation_count"),
+        client_count=sv(2, "client_count"),
+        maturities=(
+            MaturityValue(
+                vertex=sv("v110", "aggregate_vertex"), amount=sv(Decimal("100"), "aggregate_amount")
+            ),
+        ),
+    )
+
+
+def portfolio_controls(clients) -> tuple[PortfolioEclControl, ...]:
+    values = [
+        PortfolioEclControl(client.operations[0].ipoc.value, Decimal("980"), Decimal("20"), "EV")
+        for client in clients
+    ]
+    values[1] = replace(values[1], ecl_amount=Decimal("21"))
+    values[-1] = replace(values[-1], ipoc="ORPHAN")
+    return tuple(values)
+
+
+def assert_matches_serial(tmp_path: Path, workers: int, partition_size: int, **options) -> None:
+    clients = reconciled_clients(7)
+    header = replace(base_header(), total_clients=sv(7, "total_clients"))
+    values = portfolio_controls(clients)
+    serial = write_xml_candidate(header, iter(clients), tmp_path / "serial.xml", **options)
+    expected = prevalidate_xml_file(serial.path, values)
+    sharded = write_prevalidated_candidate(
+        header,
+        iter(clients),
+        values,
+        tmp_path / "sharded.xml",
+        workers=workers,
+        partition_size=partition_size,
+        **options,
+    )
+    assert sharded.candidate.path.read_bytes() == serial.path.read_bytes()
+    assert replace(sharded.candidate, path=serial.path) == serial
+    assert sharded.report == expected
+    assert sharded.partitions == -(-7 // partition_size)
+    assert {issue.rule_id for issue in expected.errors} >= {
+        "LOCAL-PORTFOLIO-ECL",
+        "LOCAL-PORTFOLIO-CONTROL",
+        "LOCAL-CONTROL-ORPHAN",
+    }
+    assert {issue.path for issue in expected.errors} >= {
+        "/Doc3040/Cli[2]/Op/ContInstFinRes4966",
+        "/Doc3040/Cli[7]/Op",
+    }
+
+
+@pytest.mark.parametrize("partition_size", [1, 3, 64])
+def test_sharded_partitions_merge_into_the_serial_file_and_report(
+    tmp_path: Path, partition_size: int
+) -> None:
+    assert_matches_serial(tmp_path, 1, partition_size, aggregations=(aggregation(),))
+
+
+def test_process_pool_shards_match_the_serial_file_and_report(tmp_path: Path) -> None:
+    assert_matches_serial(tmp_path, 2, 3)
+
+
+def test_sharded_writer_fails_where_the_serial_writer_fails(tmp_path: Path) -> None:
+    header = replace(base_header(), total_clients=sv(3, "total_clients"))
+    duplicate = replace(numbered_client(3), code=numbered_client(1).code)
+    unrendered = replace(
+        numbered_client(4),
+        operations=(replace(numbered_client(4).operations[0], ipoc=sv("ARBITRARIO", "ipoc")),),
+    )
+    clients = (numbered_client(1), numbered_client(2), duplicate, unrendered)
+    with pytest.raises(DomainValidationError, match="client codes must be unique"):
+        write_prevalidated_candidate(
+            header, iter(clients), (), tmp_path / "doc3040.xml", partition_size=4
+        )
+    with pytest.raises(DomainValidationError, match="IPOC does not reconcile"):
+        write_prevalidated_candidate(
+            header, iter(clients[:2] + clients[3:]), (), tmp_path / "doc3040.xml"
+        )
+    with pytest.raises(ValueError, match="must be positive"):
+        write_prevalidated_candidate(header, (), (), tmp_path / "doc3040.xml", workers=0)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unscannable_shards_fall_back_to_one_pass_over_the_written_file(tmp_path: Path) -> None:
+    source = Path("config/regulatory/doc3040/domains/2026.07-supported-subset.json")
+    payload = json.loads(source.read_text(encoding="utf-8"))
+    payload["layout_version"] = "wrong"
+    domain_path = tmp_path / "domains.json"
+    domain_path.write_text(json.dumps(payload), encoding="utf-8")
+    clients = reconciled_clients(2)
+    header = replace(base_header(), total_clients=sv(2, "total_clients"))
+    result = write_prevalidated_candidate(
+        header,
+        iter(clients),
+        (),
+        tmp_path / "doc3040.zip",
+        archive_member="doc3040.xml",
+        domain_path=domain_path,
+    )
+    expected = prevalidate_xml_file(
+        result.candidate.path, (), archive_member="doc3040.xml", domain_path=domain_path
+    )
+    assert result.report == expected
+    assert [issue.rule_id for issue in expected.issues] == ["LAYOUT-RESOLUTION"]
@@ -1,5 +1,6 @@
 import copy
 import json
+import os
 from dataclasses import replace
 from decimal import Decimal
 from pathlib import Path
@@ -15,9 +16,17 @@ from src.regulatory.doc3040 import (
     generate_xml_candidate,
     load_layout_registry,
     prevalidate_xml,
+    prevalidate_xml_file,
+    write_xml_candidate,
+)
+from src.regulatory.doc3040.validation import _derived_schema, _load_domains
+from tests.regulatory.test_doc3040_generator import (
+    base_document,
+    base_header,
+    base_operation,
+    numbered_client,
+    sv,
 )
-from src.regulatory.doc3040.validation import _load_domains
-from tests.regulatory.test_doc3040_generator import base_document, base_operation, sv
 
 
 def reconciled_document(*, gross: Decimal = Decimal("980"), loss: Decimal = Decimal("20")):
@@ -276,3 +285,53 @@ def test_missing_accounting_and_invalid_decimals_are_reported() -> None:
     assert {"LOCAL-PORTFOLIO-GROSS", "LOCAL-PORTFOLIO-ECL"} <= {
         issue.rule_id for issue in report.errors
     }
+
+
+def test_streaming_pass_reports_indexed_paths_from_files_and_zip_members(tmp_path: Path) -> None:
+    accounting = reconciled_document().clients[0].operations[0].accounting_4966
+    clients = tuple(
+        replace(client, operations=(replace(client.operations[0], accounting_4966=accounting),))
+        for client in map(numbered_client, range(1, 4))
+    )
+    values = tuple(
+        PortfolioEclControl(client.operations[0].ipoc.value, Decimal("980"), Decimal("20"), "EV")
+        for client in clients
+    )
+    header = replace(base_header(), total_clients=sv(3, "total_clients"))
+    xml = write_xml_candidate(header, iter(clients), tmp_path / "doc3040.xml")
+    archive = write_xml_candidate(
+        header, iter(clients), tmp_path / "doc3040.zip", archive_member="doc3040.xml"
+    )
+    report = prevalidate_xml_file(xml.path, values)
+    assert report.passed
+    assert prevalidate_xml_file(archive.path, values, archive_member="doc3040.xml") == report
+
+    invalid = xml.path.read_bytes().replace(b'VarCamb="790"', b'VarCamb="X"')
+    issues = prevalidate_xml(invalid, values).errors
+    assert [(issue.field, issue.path) for issue in issues] == [
+        ("VarCamb", f"/Doc3040/Cli[{index}]/Op") for index in range(1, 4)
+    ]
+
+
+def test_compiled_schema_and_domain_sets_are_cached_until_the_file_changes(
+    tmp_path: Path,
+) -> None:
+    layout = load_layout_registry()[0]
+    assert _derived_schema(layout) is _derived_schema(layout)
+    path = tmp_path / "domains.json"
+    path.write_bytes(
+        Path("config/regulatory/doc3040/domains/2026.07-supported-subset.json").read_bytes()
+    )
+    first = _load_domains(layout, path)
+    assert _load_domains(layout, path) is first
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["domain_set_id"] = "edited"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert _load_domains(layout, path)[0] == "edited"
+
+
+def test_non_numeric_maturity_fails_reconciliation_instead_of_crashing() -> None:
+    content = generate_xml_candidate(reconciled_document()).content
+    report = prevalidate_xml(content.replace(b'v110="580.00"', b'v110="X"'), controls())
+    assert [issue.rule_id for issue in report.errors] == ["LOCAL-MATURITY-TOTAL"]
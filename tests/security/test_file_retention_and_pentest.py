@@ -152,6 +152,7 @@ def test_retention_purges_only_expired_ephemeral_records(tmp_path: Path) -> None
     jobs = JobStore(database)
     job_id = jobs.create("{}")
     jobs.failed(job_id, "EXPECTED")
+    jobs.append_results(job_id, 0, 0, [{"contract_id": "C-RETENTION"}])
     old = (datetime.now(UTC) - timedelta(days=60)).isoformat()
     database.execute("UPDATE security_sessions SET expires_at = ?", (old,))
     database.execute("UPDATE security_confirmations SET expires_at = ?", (old,))
@@ -172,6 +173,7 @@ def test_retention_purges_only_expired_ephemeral_records(tmp_path: Path) -> None
 
     assert (result.deleted_sessions, result.deleted_confirmations, result.deleted_jobs) == (1, 1, 1)
     assert database.fetch_one("SELECT user_id FROM security_users") is not None
+    assert database.fetch_one("SELECT blob_hash FROM calculation_result_blobs") is None
     assert database.fetch_one("SELECT event_id FROM audit_events")["event_id"] == event.event_id
 
 
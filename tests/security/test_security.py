@@ -24,7 +24,12 @@ from src.security.passwords import (
     validate_password,
     verify_password,
 )
-from src.security.rate_limit import RateLimiter, RateLimitExceeded
+from src.security.rate_limit import (
+    MemoryTokenBucketStore,
+    RateLimiter,
+    RateLimitExceeded,
+    SQLiteTokenBucketStore,
+)
 from src.security.rbac import Permission, Role, is_allowed
 from src.security.retention import RetentionPolicy
 from src.security.settings import SecurityConfigurationError, SecuritySettings
@@ -198,6 +203,48 @@ def test_rate_limiter_releases_key_after_window() -> None:
     limiter.check("user")
 
 
+def test_rate_limiter_refills_tokens_evenly_and_evicts_idle_keys() -> None:
+    now = [0.0]
+    store = MemoryTokenBucketStore(stripes=1)
+    limiter = RateLimiter(4, 8, clock=lambda: now[0], store=store)
+    for _ in range(4):
+        limiter.check("burst")
+    with pytest.raises(RateLimitExceeded):
+        limiter.check("burst")
+    now[0] = 2.0
+    limiter.check("burst")
+    with pytest.raises(RateLimitExceeded):
+        limiter.check("burst")
+    for index in range(2_000):
+        limiter.check(f"idle-{index}")
+    assert len(store) == 2_001
+    now[0] = 100.0
+    for index in range(1_000):
+        limiter.check(f"fresh-{index}")
+    assert len(store) < 1_100
+
+
+def test_sqlite_rate_limit_store_is_shared_between_workers(tmp_path: Path) -> None:
+    now = [1_000.0]
+    path = tmp_path / "rate-limit.sqlite3"
+    first = SQLiteTokenBucketStore(path, sweep_every=2)
+    second = SQLiteTokenBucketStore(path)
+    workers = [RateLimiter(2, 10, clock=lambda: now[0], store=store) for store in (first, second)]
+    workers[0].check("login:analyst")
+    workers[1].check("login:analyst")
+    with pytest.raises(RateLimitExceeded):
+        workers[0].check("login:analyst")
+    now[0] = 1_005.0
+    workers[0].check("login:analyst")
+    with pytest.raises(RateLimitExceeded):
+        workers[1].check("login:analyst")
+    now[0] = 1_100.0
+    workers[0].check("other")
+    assert len(second) == 1
+    first.close()
+    second.close()
+
+
 def test_api_requires_token_and_logout_revokes_session(tmp_path: Path) -> None:
     app = create_app(
         DatabaseSettings(sqlite_path=tmp_path / "api-security.sqlite3"),